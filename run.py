@@ -11,10 +11,19 @@
     python run.py video.mp4                          # 비디오 파일만 지정
     python run.py --video video.mp4                  # 명시적 플래그 사용
     python run.py video.mp4 --no-gpu                 # GPU 없이 실행
+    python run.py video.mp4 --profile night          # 저장된 설정 프로파일 적용
+    python run.py rtsp://192.168.0.10/live           # RTSP/HTTP 스트림
+    python run.py 0                                  # 카메라 장치
+    python run.py video.mp4 --export out.mp4         # GUI 없이 주석 영상 저장
+    python run.py --serve                            # 로컬 추론 서버 실행
+    python run.py video.mp4 --server 127.0.0.1:5055  # 추론 서버 사용
+    python run.py --probe-resources                  # 스레드 / CPU 분할 측정 후 저장
+    python run.py video.mp4 --probe-decoders         # 디코딩 백엔드 측정 후 저장
 """
 
 import sys
 import argparse
+from dataclasses import replace
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
@@ -37,6 +46,24 @@ def parse_arguments():
   python run.py my_video.mp4                    # 비디오만 지정
   python run.py --video my_video.mp4            # 명시적 플래그
   python run.py my_video.mp4 --no-gpu           # GPU 없이 실행
+  python run.py my_video.mp4 --profile night    # 설정 프로파일 적용
+  python run.py rtsp://192.168.0.10/live        # RTSP/HTTP 스트림 (자동 재연결)
+  python run.py 0                               # 카메라 장치 (/dev/video0)
+  python run.py my_video.mp4 --display opengl   # OpenGL 표시 (벡터 오버레이)
+  python run.py my_video.mp4 --export out.mp4   # GUI 없이 주석 영상 저장
+  python run.py my_video.mp4 --export out.mp4 --export-width 1280 --codec h264 --bitrate 4000
+  python run.py my_video.mp4 --export out.mp4 --overlay-data   # 그리기를 인코더 스레드로
+  python run.py my_video.mp4 --export out.mp4 --export-masks rle  # 마스크 사이드카 (out.masks.jsonl)
+  python run.py my_video.mp4 --export out.mp4 --decode-width 960 --export-detections
+                                                # 960px 로 분석, 박스는 원본 픽셀 좌표로 저장
+  python run.py my_video.mp4 --analyze          # 그리기 없이 분석 → 요약 리포트만
+  python run.py --serve                         # 추론 서버 (기본 127.0.0.1:5055)
+  python run.py --serve unix:/tmp/yolo.sock     # Unix 소켓 추론 서버
+  python run.py my_video.mp4 --server 127.0.0.1:5055   # 서버의 모델 공유
+  python run.py --probe-resources               # 이 머신에 맞는 스레드 / CPU 분할 저장
+  python run.py my_video.mp4 --resources auto   # 측정 없이 코어 수로 분할
+  python run.py my_video.mp4 --probe-decoders   # 가장 빠른 디코딩 백엔드 측정 / 저장
+  python run.py my_video.mp4 --decode ffmpeg --decode-width 960   # 분석 해상도로 디코딩
         """
     )
 
@@ -45,7 +72,7 @@ def parse_arguments():
         'video_file',
         nargs='?',
         default=None,
-        help='비디오 파일 경로 (선택사항)'
+        help='비디오 파일 경로 / 스트림 URL / 카메라 번호 (선택사항)'
     )
 
     # --video 플래그로도 받을 수 있게
@@ -62,6 +89,190 @@ def parse_arguments():
         help='GPU 사용 안함'
     )
 
+    parser.add_argument(
+        '--profile',
+        type=str,
+        default=None,
+        help=f'설정 프로파일 이름 ({APP_CONST.PROFILE_DIR}/<이름>.json)'
+    )
+
+    # 표시 방식
+    parser.add_argument(
+        '--display',
+        choices=['label', 'opengl'],
+        default=None,
+        help='비디오 표시 방식 (opengl: 텍스처 업로드 + 벡터 오버레이)'
+    )
+
+    parser.add_argument(
+        '--software-gl',
+        action='store_true',
+        help='GPU 없이 소프트웨어 OpenGL 래스터라이저 사용'
+    )
+
+    # 주석 영상 내보내기 (GUI 없이 실행)
+    parser.add_argument(
+        '--export',
+        type=str,
+        default=None,
+        metavar='OUT.mp4',
+        help='GUI 없이 전체 비디오를 처리해 주석 영상으로 저장'
+    )
+
+    parser.add_argument(
+        '--export-width',
+        type=int,
+        default=0,
+        help='내보내기 폭 (0: 원본, 높이는 비율 유지)'
+    )
+
+    parser.add_argument(
+        '--codec',
+        choices=['h264', 'hevc', 'mp4v', 'mjpeg'],
+        default='h264',
+        help='내보내기 코덱'
+    )
+
+    parser.add_argument(
+        '--bitrate',
+        type=int,
+        default=0,
+        help='내보내기 비트레이트 kbps (0: 인코더 기본값, ffmpeg 백엔드만)'
+    )
+
+    parser.add_argument(
+        '--encoder',
+        choices=['auto', 'ffmpeg', 'opencv'],
+        default='auto',
+        help='인코더 백엔드 (auto: ffmpeg 가 있으면 사용)'
+    )
+
+    parser.add_argument(
+        '--export-masks',
+        choices=['rle', 'polygon'],
+        default='',
+        help='Segmentation 마스크를 <출력>.masks.jsonl 에 함께 저장 (RLE / 외곽선 다각형)'
+    )
+
+    parser.add_argument(
+        '--export-detections',
+        action='store_true',
+        help='탐지 박스를 원본 픽셀 좌표로 <출력>.detections.jsonl 에 함께 저장'
+    )
+
+    parser.add_argument(
+        '--overlay-data',
+        action='store_true',
+        help='처리 스레드는 그리지 않고 오버레이 데이터만 전달 (표시 / 내보내기 시 렌더링)'
+    )
+
+    # 헤드리스 분석 (그리기 / 인코딩 없음)
+    parser.add_argument(
+        '--analyze',
+        action='store_true',
+        help=f'GUI 없이 전체 비디오를 분석해 요약 리포트만 저장 ({APP_CONST.REPORT_DIR}/)'
+    )
+
+    # 로컬 추론 서버
+    parser.add_argument(
+        '--serve',
+        nargs='?',
+        const=APP_CONST.INFERENCE_SERVER_ADDRESS,
+        default=None,
+        metavar='ADDRESS',
+        help=f'추론 서버 모드 (기본 {APP_CONST.INFERENCE_SERVER_ADDRESS}, unix:/경로 가능)'
+    )
+
+    parser.add_argument(
+        '--allow-remote',
+        action='store_true',
+        help=f'추론 서버를 루프백이 아닌 주소에서 열기 (클라이언트는 같은 키를 '
+             f'{APP_CONST.INFERENCE_KEY_ENV} 로 지정)'
+    )
+
+    parser.add_argument(
+        '--server',
+        type=str,
+        default=None,
+        metavar='ADDRESS',
+        help='로컬 모델 대신 추론 서버 사용'
+    )
+
+    parser.add_argument(
+        '--max-batch',
+        type=int,
+        default=APP_CONST.INFERENCE_MAX_BATCH,
+        help='추론 서버 최대 배치 프레임 수'
+    )
+
+    parser.add_argument(
+        '--max-wait-ms',
+        type=float,
+        default=APP_CONST.INFERENCE_MAX_WAIT_MS,
+        help='추론 서버 배치 대기 시간 (ms)'
+    )
+
+    # 스레드 수 / CPU 친화도
+    parser.add_argument(
+        '--resources',
+        type=str,
+        default=None,
+        metavar='NAME',
+        help=f'리소스 프로파일 ({APP_CONST.RESOURCE_PROFILE_DIR}/<이름>.json 또는 auto, '
+             f'지정하지 않으면 저장된 default 사용)'
+    )
+
+    parser.add_argument(
+        '--probe-resources',
+        action='store_true',
+        help='스레드 / CPU 분할 후보를 측정해 default 리소스 프로파일로 저장'
+    )
+
+    # 탐지 클래스 / 신뢰도
+    parser.add_argument(
+        '--classes',
+        type=str,
+        default=None,
+        help='탐지할 클래스 이름 (쉼표 구분, all: 모든 클래스, 기본: 도로 장면 클래스)'
+    )
+
+    parser.add_argument(
+        '--class-conf',
+        type=str,
+        nargs='+',
+        default=None,
+        metavar='NAME:CONF',
+        help="클래스별 신뢰도 임계값 (예: person:0.35 'traffic light:0.4')"
+    )
+
+    parser.add_argument(
+        '--max-det',
+        type=int,
+        default=None,
+        help='프레임당 최대 탐지 수 (0: 모델 기본값)'
+    )
+
+    # 파일 디코딩 백엔드
+    parser.add_argument(
+        '--decode',
+        choices=['auto', 'opencv', 'ffmpeg', 'pyav'],
+        default=None,
+        help='파일 디코딩 백엔드 (auto: --probe-decoders 측정 결과, 없으면 opencv)'
+    )
+
+    parser.add_argument(
+        '--decode-width',
+        type=int,
+        default=None,
+        help='분석 해상도 폭 - 디코딩 직후 이 폭으로 한 번 축소 (0: 원본, 높이는 비율 유지)'
+    )
+
+    parser.add_argument(
+        '--probe-decoders',
+        action='store_true',
+        help='비디오로 디코딩 백엔드를 측정해 default 리소스 프로파일에 저장'
+    )
+
     args = parser.parse_args()
 
     # video_file과 --video 중 하나라도 지정되면 사용
@@ -73,10 +284,167 @@ def parse_arguments():
     return args
 
 
+def export_video(args) -> bool:
+    """GUI 없이 주석 영상 내보내기"""
+    from src.core.video_processor import VideoProcessor
+    from src.models.export import ExportOptions
+
+    options = ExportOptions(
+        output_path=args.export,
+        width=args.export_width,
+        codec=args.codec,
+        bitrate_kbps=args.bitrate,
+        backend=args.encoder,
+        mask_format=args.export_masks,
+        export_detections=args.export_detections
+    )
+
+    processor = VideoProcessor()
+    processor.error_occurred.connect(lambda message: print(f"❌ {message}"))
+
+    try:
+        if not processor.load_video(args.video, build_index=False):
+            return False
+
+        result = processor.export_offline(options)
+    finally:
+        processor.cleanup()
+
+    if not result.success:
+        print(f"❌ 내보내기 실패: {result.error}")
+        return False
+
+    print(f"💾 저장 완료: {result.output_path} "
+          f"({result.frames_written} 프레임, 인코딩 {result.encode_fps:.1f} FPS)")
+    if result.mask_path:
+        print(f"🎭 마스크 저장: {result.mask_path}")
+    if result.detections_path:
+        print(f"📦 탐지 결과 저장: {result.detections_path}")
+    return True
+
+
+def analyze_video(args) -> bool:
+    """GUI / 그리기 없이 분석 → 요약 리포트 저장"""
+    from src.core.video_processor import VideoProcessor
+
+    processor = VideoProcessor()
+    processor.error_occurred.connect(lambda message: print(f"❌ {message}"))
+
+    try:
+        if not processor.load_video(args.video, build_index=False):
+            return False
+
+        summary = processor.analyze_offline()
+    finally:
+        processor.cleanup()
+
+    if summary is None:
+        return False
+
+    print(f"📊 분석 완료: {summary.frames} 프레임, "
+          f"추적 객체 {summary.total_tracks}개")
+    if summary.dropped_boxes:
+        dropped = ", ".join(f"{stage} {count}"
+                            for stage, count in summary.dropped_boxes.items())
+        print(f"   박스 {summary.raw_boxes}개 중 제외: {dropped}")
+    return True
+
+
+def apply_resources(args) -> None:
+    """리소스 프로파일 적용 (--resources, 없으면 저장된 default)"""
+    from src.core.resource_manager import ResourceManager
+
+    resources = ResourceManager()
+    profile = resources.load(args.resources or 'default')
+    if profile is None:
+        if args.resources:
+            print(f"⚠️  리소스 프로파일을 찾을 수 없습니다: {args.resources}")
+        return
+
+    resources.apply(profile)
+    print(f"🧵 리소스: {profile.describe()}")
+
+
+def probe_resources() -> None:
+    """스레드 / CPU 분할 측정 후 default 프로파일로 저장"""
+    from src.config.resources import ResourceProfile
+    from src.config.settings import SettingsManager
+    from src.core.resource_manager import ResourceProbe
+
+    cfg = SettingsManager().snapshot()
+    probe = ResourceProbe(imgsz=cfg.inference_imgsz,
+                          segmentation=cfg.segmentation_enabled)
+    print(f"🧵 리소스 분할 측정: CPU {len(probe.resources.cpus)}개, "
+          f"Segmentation {'사용' if cfg.segmentation_enabled else '미사용'}")
+
+    best = probe.run()
+    saved = probe.resources.load('default')
+    if saved is not None:
+        # 디코딩 백엔드 측정 결과는 유지
+        best = replace(best, decode_backend=saved.decode_backend)
+    path = ResourceProfile.path_for(best.name)
+    best.save(path)
+    print(f"💾 저장: {path}")
+
+
+def probe_decoders(args) -> None:
+    """디코딩 백엔드 측정 후 default 리소스 프로파일에 저장"""
+    from src.config.resources import ResourceProfile
+    from src.config.settings import SettingsManager
+    from src.core.frame_source import DecodeBenchmark, FrameSource
+    from src.core.resource_manager import ResourceManager
+
+    width = SettingsManager().get('decode_width')
+    print(f"🎞️  디코딩 백엔드 측정: {', '.join(FrameSource.backends())} "
+          f"(폭 {width or '원본'})")
+
+    best = DecodeBenchmark(args.video, width).run()
+    if best is None:
+        print(f"❌ 비디오를 디코딩할 수 없습니다: {args.video}")
+        return
+
+    profile = ResourceManager().load('default') or ResourceProfile()
+    profile = replace(profile, decode_backend=best)
+    path = ResourceProfile.path_for(profile.name)
+    profile.save(path)
+    print(f"💾 저장: {path}")
+
+
+def run_server(args) -> None:
+    """로컬 추론 서버 실행 (Ctrl+C 로 종료)"""
+    from src.core.inference_server import InferenceServer
+
+    try:
+        server = InferenceServer(
+            address=args.serve,
+            max_batch=args.max_batch,
+            max_wait_ms=args.max_wait_ms,
+            allow_remote=args.allow_remote
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        metrics = server.metrics()
+        print(f"\n추론 서버 종료: 요청 {metrics.requests}, 프레임 {metrics.frames}, "
+              f"평균 배치 {metrics.avg_batch_frames:.1f}, "
+              f"p95 {metrics.latency_p95_ms:.1f}ms, SLO 초과 {metrics.slo_misses}")
+
+
 def main():
     """메인 함수"""
     args = parse_arguments()
 
+    # 추론 서버 모드
+    if args.serve:
+        print(f"🚗 {APP_CONST.APP_NAME} v{APP_CONST.APP_VERSION} - 추론 서버")
+        apply_resources(args)
+        run_server(args)
+        return
+
     print(f"🚗 {APP_CONST.APP_NAME} v{APP_CONST.APP_VERSION}")
     print(f"📹 비디오: {args.video}")
     print(f"🖥️  GPU: {'비활성' if args.no_gpu else '활성'}")
@@ -86,11 +454,72 @@ def main():
     from src.config.settings import SettingsManager
     settings = SettingsManager()
 
+    if args.profile:
+        try:
+            loaded = settings.load_profile(args.profile)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        if loaded:
+            print(f"⚙️  프로파일: {args.profile}")
+        else:
+            print(f"⚠️  프로파일을 찾을 수 없습니다: {args.profile}")
+
     if args.no_gpu:
         settings.set('use_gpu', False)
 
+    if args.server:
+        settings.set('inference_server', args.server)
+        print(f"🧠 추론 서버: {args.server}")
+
+    if args.display:
+        settings.set('display_backend', args.display)
+
+    if args.overlay_data:
+        settings.set('overlay_as_data', True)
+
+    if args.classes is not None:
+        classes = () if args.classes.strip().lower() == 'all' else tuple(
+            name.strip() for name in args.classes.split(',') if name.strip()
+        )
+        settings.set('class_whitelist', classes)
+
+    if args.class_conf is not None:
+        settings.set('class_confidence', tuple(args.class_conf))
+
+    if args.max_det is not None:
+        settings.set('max_detections', args.max_det)
+
+    if args.decode:
+        settings.set('decode_backend', args.decode)
+
+    if args.decode_width is not None:
+        settings.set('decode_width', args.decode_width)
+
+    # 리소스 측정 모드 (프로파일의 Segmentation / imgsz 설정 기준)
+    if args.probe_resources:
+        probe_resources()
+        return
+
+    if args.probe_decoders:
+        probe_decoders(args)
+        return
+
+    apply_resources(args)
+
+    # 내보내기 / 분석 모드 (GUI 없음)
+    if args.export:
+        sys.exit(0 if export_video(args) else 1)
+
+    if args.analyze:
+        sys.exit(0 if analyze_video(args) else 1)
+
     # Qt 애플리케이션
     from PySide6.QtWidgets import QApplication
+    if args.software_gl:
+        # QApplication 생성 전에만 적용됨
+        from PySide6.QtCore import QCoreApplication, Qt
+        QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_UseSoftwareOpenGL)
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     app.setApplicationName(APP_CONST.APP_NAME)
@@ -0,0 +1,143 @@
+# ============================================================================
+# src/config/camera.py
+# 카메라 프로파일 (내부 파라미터 / 설치 높이) 및 클래스별 실제 폭
+# ============================================================================
+
+import json
+import numpy as np
+from dataclasses import dataclass, asdict, fields, replace
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+# 클래스별 실제 폭 (m, COCO 클래스명 기준)
+KNOWN_OBJECT_WIDTHS: Dict[str, float] = {
+    'person': 0.5,
+    'bicycle': 0.6,
+    'car': 1.8,
+    'motorcycle': 0.8,
+    'bus': 2.55,
+    'train': 3.0,
+    'truck': 2.5,
+    'traffic light': 0.35,
+    'fire hydrant': 0.3,
+    'stop sign': 0.75,
+    'parking meter': 0.3,
+    'bench': 1.5,
+    'dog': 0.3,
+    'horse': 0.6,
+    'cow': 0.7,
+}
+DEFAULT_OBJECT_WIDTH: float = 1.0
+
+
+@dataclass(frozen=True)
+class CameraProfile:
+    """카메라 프로파일 (기준 해상도 기준 픽셀 단위)"""
+    name: str = "default"
+    reference_width: int = 1920
+    reference_height: int = 1080
+    focal_length_x: float = 800.0
+    focal_length_y: float = 800.0
+    principal_x: Optional[float] = None  # None → 영상 중심
+    principal_y: Optional[float] = None
+    camera_height: float = 1.4           # 노면에서 카메라까지 (m)
+    pitch_deg: float = 0.0               # 아래쪽 기울기 (+)
+
+    ASPECT_TOLERANCE = 0.01     # 기준 / 프레임 종횡비 차이 허용 (상대값)
+
+    def scaled(self, width: int, height: int) -> 'CameraProfile':
+        """실제 프레임 해상도에 맞게 내부 파라미터 스케일
+
+        픽셀 종횡비를 유지하도록 fx / fy 에 같은 배율을 쓴다. 프레임 종횡비가
+        기준 해상도와 다르면(레터박스 / 잘린 스트림) 기준 화면 전체가 프레임
+        안에 중앙 정렬로 들어간다고 보고 경고한다 - 정확한 거리가 필요하면
+        그 해상도로 보정한 프로파일을 써야 한다.
+        """
+        sx = width / self.reference_width
+        sy = height / self.reference_height
+        scale = min(sx, sy)
+        if abs(sx / sy - 1.0) > self.ASPECT_TOLERANCE:
+            print(f"⚠️  카메라 프로파일 '{self.name}' 기준 해상도 "
+                  f"{self.reference_width}x{self.reference_height} 와 프레임 "
+                  f"{width}x{height} 의 종횡비가 다릅니다 - 중앙 정렬로 가정해 "
+                  f"같은 배율({scale:.3f})로 스케일합니다")
+
+        # 주점은 중심으로부터의 오프셋을 스케일 (종횡비가 같으면 cx * sx 와 동일)
+        cx, cy = self._center()
+        return replace(
+            self,
+            reference_width=width,
+            reference_height=height,
+            focal_length_x=self.focal_length_x * scale,
+            focal_length_y=self.focal_length_y * scale,
+            principal_x=(cx - self.reference_width / 2) * scale + width / 2,
+            principal_y=(cy - self.reference_height / 2) * scale + height / 2
+        )
+
+    def _center(self) -> Tuple[float, float]:
+        """주점 (None 이면 영상 중심)"""
+        cx = self.principal_x if self.principal_x is not None else self.reference_width / 2
+        cy = self.principal_y if self.principal_y is not None else self.reference_height / 2
+        return cx, cy
+
+    def project_ground(self, lateral: np.ndarray, forward: np.ndarray
+                       ) -> Tuple[np.ndarray, np.ndarray]:
+        """노면 좌표 (X: 우측 +, Z: 전방, m) → 이미지 좌표 (u, v)"""
+        cx, cy = self._center()
+        pitch = np.radians(self.pitch_deg)
+        cos_p, sin_p = np.cos(pitch), np.sin(pitch)
+
+        # 카메라 좌표계 (y 아래 +), 아래쪽으로 pitch 만큼 기울어짐
+        y_cam = self.camera_height * cos_p - forward * sin_p
+        z_cam = self.camera_height * sin_p + forward * cos_p
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            u = self.focal_length_x * lateral / z_cam + cx
+            v = self.focal_length_y * y_cam / z_cam + cy
+        return u, v
+
+    def ground_distance(self, rows: np.ndarray) -> np.ndarray:
+        """이미지 행(v) → 노면 전방 거리 Z (m), 지평선 위는 inf"""
+        _, cy = self._center()
+        pitch = np.radians(self.pitch_deg)
+        cos_p, sin_p = np.cos(pitch), np.sin(pitch)
+
+        ray_y = (np.asarray(rows, dtype=np.float64) - cy) / self.focal_length_y
+        down = ray_y * cos_p + sin_p
+        with np.errstate(divide='ignore', invalid='ignore'):
+            forward = self.camera_height * (cos_p - ray_y * sin_p) / down
+        return np.where(down > 1e-9, forward, np.inf)
+
+    def lateral_at(self, column: np.ndarray, forward: np.ndarray) -> np.ndarray:
+        """이미지 열(u) + 전방 거리 Z → 노면 횡방향 X (m)"""
+        cx, _ = self._center()
+        pitch = np.radians(self.pitch_deg)
+        z_cam = self.camera_height * np.sin(pitch) + forward * np.cos(pitch)
+        return (np.asarray(column, dtype=np.float64) - cx) * z_cam / self.focal_length_x
+
+    def save(self, path: Path) -> None:
+        """JSON 저장"""
+        Path(path).write_text(json.dumps(asdict(self), indent=2, ensure_ascii=False),
+                              encoding='utf-8')
+
+    @classmethod
+    def load(cls, path: Path) -> 'CameraProfile':
+        """JSON 로드 (알 수 없는 키는 무시)"""
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+    @classmethod
+    def for_video(cls, video_path: str) -> 'CameraProfile':
+        """비디오 옆 '<파일명>.camera.json' 이 있으면 사용, 없으면 기본값"""
+        try:
+            sidecar = Path(video_path).with_suffix('.camera.json')
+            if sidecar.is_file():
+                profile = cls.load(sidecar)
+                print(f"카메라 프로파일 로드: {sidecar.name}")
+                return profile
+        except (OSError, ValueError, TypeError) as e:
+            print(f"카메라 프로파일 로드 실패, 기본값 사용: {e}")
+
+        return cls()
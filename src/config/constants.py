@@ -28,6 +28,64 @@ class AppConstants:
     MAX_FRAME_BUFFER: int = 5
     FPS_UPDATE_INTERVAL: float = 1.0
 
+    # 캐시 / Seek
+    CACHE_DIR: str = ".video_cache"
+    PROFILE_DIR: str = "profiles"
+    RESOURCE_PROFILE_DIR: str = "profiles/resources"  # 스레드 / CPU 친화도 프로파일
+    SEEK_MAX_FORWARD_FRAMES: int = 90
+
+    # 라이브 스트림 (RTSP/HTTP/카메라)
+    STREAM_TIMEOUT_MSEC: int = 5000
+    STREAM_RECONNECT_MIN_SEC: float = 0.5
+    STREAM_RECONNECT_MAX_SEC: float = 10.0
+
+    # 영상 내보내기
+    EXPORT_QUEUE_SIZE: int = 32
+
+    # 프로세스 간 프레임 링 버퍼
+    FRAME_RING_SLOTS: int = 8
+
+    # 프레임 버퍼 풀 (해상도별 보관 개수)
+    BUFFER_POOL_MAX_FREE: int = 8
+
+    # 로컬 추론 서버 (동적 배치)
+    INFERENCE_SERVER_ADDRESS: str = "127.0.0.1:5055"
+    INFERENCE_KEY_ENV: str = "YOLO_INFERENCE_KEY"         # 인증 키 (다른 컴퓨터 클라이언트용)
+    INFERENCE_KEY_FILE: str = "~/.config/yolo-video/inference.key"  # 설치별 키 (0600, 없으면 생성)
+    INFERENCE_MAX_MESSAGE_BYTES: int = 256 * 1024 * 1024  # 수신 메시지 크기 상한
+    INFERENCE_MAX_BATCH: int = 8
+    INFERENCE_MAX_WAIT_MS: float = 5.0
+    BATCH_SLO_MS: float = 100.0          # 스트림별 지연 목표 기본값
+
+    # 썸네일 미리보기
+    THUMBNAIL_COUNT: int = 100
+    THUMBNAIL_WIDTH: int = 160
+
+    # 사전 스캔 (이벤트 타임라인)
+    SCAN_INTERVAL_SEC: float = 0.5
+    SCAN_WIDTH: int = 480
+    SCAN_IMGSZ: int = 320
+
+    # 타일 추론
+    TILE_NMS_IOU: float = 0.5
+
+    # 탐지 클래스 (도로 장면 관심 클래스, COCO 이름)
+    ROAD_CLASSES: Tuple[str, ...] = (
+        "person", "bicycle", "car", "motorcycle", "bus", "truck",
+        "traffic light", "stop sign"
+    )
+    MODEL_MAX_DET: int = 300        # 모델 NMS 기본 최대 박스 수 (max_detections=0 일 때)
+
+    # 추론 입력 크기 (32 배수 단계, 자동 조절 범위)
+    DEFAULT_IMGSZ: int = 640
+    IMGSZ_STEPS: Tuple[int, ...] = (320, 384, 448, 512, 576, 640, 768, 960, 1280)
+
+    # 누적 통계 (객체 추적 / 요약 리포트)
+    TRACK_IOU_THRESHOLD: float = 0.3
+    TRACK_MAX_MISSED: int = 10          # 이 프레임 수만큼 놓치면 트랙 종료
+    TRACK_MIN_HITS: int = 3             # 이보다 짧게 보인 트랙은 오탐으로 보고 제외
+    REPORT_DIR: str = "reports"
+
     # 거리 추정
     FOCAL_LENGTH: float = 800.0
     KNOWN_WIDTH: float = 1.8
@@ -36,6 +94,18 @@ class AppConstants:
     DANGER_DISTANCE: float = 5.0
     WARNING_DISTANCE: float = 10.0
 
+    # 위험 영역 (자차 / 인접 차선 격자, 충돌 예상 시간)
+    LANE_ZONE_OUTSIDE: int = 0
+    LANE_ZONE_EGO: int = 1
+    LANE_ZONE_ADJACENT: int = 2
+    DANGER_GRID_CELL: int = 8           # 격자 셀 크기 (px)
+    TTC_DANGER_SEC: float = 2.0         # 자차 차선에서 이보다 빨리 닿으면 위험
+    TTC_MAX_GAP_SEC: float = 1.0        # 이전 탐지와 이보다 멀면 이력을 끊음 (seek 등)
+    TTC_WINDOW_SEC: float = 0.5         # 거리 변화 기울기(최소제곱)를 구하는 구간
+    TTC_HISTORY: int = 16               # 객체별로 기억하는 최대 샘플 수
+    TTC_MIN_SAMPLES: int = 4            # 이보다 적게 이어진 객체는 TTC 없음
+    TTC_MIN_CLOSING_MPS: float = 1.0    # 이보다 느린 접근은 추정 잡음으로 보고 무시
+
     # 차선 감지
     LANE_ROI_TOP: float = 0.6
     LANE_ROI_LEFT: float = 0.1
@@ -51,6 +121,7 @@ class AppConstants:
 
     MIN_SLOPE: float = 0.5
     LANE_OFFSET_THRESHOLD: int = 50
+    LANE_OFFSET_THRESHOLD_M: float = 0.5
 
     # UI 설정
     WINDOW_WIDTH: int = 1600
@@ -59,6 +130,8 @@ class AppConstants:
     VIDEO_MIN_HEIGHT: int = 600
     STATS_MIN_WIDTH: int = 280
     STATS_MAX_WIDTH: int = 350
+    SUMMARY_REFRESH_MS: int = 1000      # 누적 통계 표시 갱신 주기
+    UI_REFRESH_HZ: float = 20.0         # 통계 / 프로그레스 바 최대 갱신 빈도
 
     PROGRESS_BAR_HEIGHT: int = 70
 
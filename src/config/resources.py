@@ -0,0 +1,95 @@
+# ============================================================================
+# src/config/resources.py
+# 리소스 프로파일 (torch / OpenCV 스레드 수, 단계별 CPU 친화도)
+# ============================================================================
+
+import json
+from dataclasses import dataclass, asdict, fields
+from pathlib import Path
+from typing import Sequence, Tuple
+
+from .constants import APP_CONST
+
+
+@dataclass(frozen=True)
+class ResourceProfile:
+    """스레드 수 / CPU 친화도 프로파일
+
+    기본값은 아무것도 바꾸지 않는다 (라이브러리 기본값, 친화도 없음).
+    단계: inference (프레임 처리 / 추론), worker (인코더 / 스트림 / 스캐너),
+    gui (Qt 메인 스레드).
+    """
+    name: str = "default"
+    torch_threads: int = 0                # intra-op 스레드 (0: 기본값)
+    torch_interop_threads: int = 0        # inter-op 스레드 (0: 기본값, 시작 시 한 번만)
+    opencv_threads: int = -1              # -1: 기본값, 0: OpenCV 내부 병렬 끔
+    inference_cpus: Tuple[int, ...] = ()  # 빈 값: 친화도 지정 안 함
+    worker_cpus: Tuple[int, ...] = ()
+    gui_cpus: Tuple[int, ...] = ()
+    decode_backend: str = ""              # 파일 디코딩 백엔드 측정 결과 (빈 값: opencv)
+
+    def cpus_for(self, stage: str) -> Tuple[int, ...]:
+        """단계별 CPU 목록"""
+        return getattr(self, f"{stage}_cpus")
+
+    @property
+    def has_affinity(self) -> bool:
+        return bool(self.inference_cpus or self.worker_cpus or self.gui_cpus)
+
+    def describe(self) -> str:
+        """한 줄 요약"""
+        def cpus(values: Tuple[int, ...]) -> str:
+            return ','.join(map(str, values)) if values else '-'
+
+        torch_threads = self.torch_threads or 'auto'
+        opencv_threads = 'auto' if self.opencv_threads < 0 else self.opencv_threads
+        decode = f", 디코딩 {self.decode_backend}" if self.decode_backend else ""
+        return (f"{self.name}: torch {torch_threads}, opencv {opencv_threads}, "
+                f"CPU 추론[{cpus(self.inference_cpus)}] "
+                f"작업[{cpus(self.worker_cpus)}] GUI[{cpus(self.gui_cpus)}]{decode}")
+
+    @classmethod
+    def auto(cls, cpus: Sequence[int]) -> 'ResourceProfile':
+        """측정 없이 코어 수로 정하는 분할
+
+        GUI / 보조 작업에 코어를 따로 남기고 나머지를 추론에 준다. OpenCV 는
+        프레임당 작은 연산이라 적은 스레드로도 충분하고, 기본값(코어 수)이면
+        torch 스레드와 경쟁한다.
+        """
+        cpus = tuple(sorted(cpus))
+        count = len(cpus)
+        if count < 4:
+            return cls(name="auto", torch_threads=count, opencv_threads=1)
+
+        reserved = 1 if count < 8 else 2
+        return cls(
+            name="auto",
+            torch_threads=count - reserved,
+            opencv_threads=2,
+            inference_cpus=cpus[reserved:],
+            worker_cpus=cpus[reserved - 1:reserved],
+            gui_cpus=cpus[:1],
+        )
+
+    @staticmethod
+    def path_for(name: str) -> Path:
+        """이름 → 프로파일 파일 경로"""
+        return Path(APP_CONST.RESOURCE_PROFILE_DIR) / f"{name}.json"
+
+    def save(self, path: Path) -> None:
+        """JSON 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(asdict(self), indent=2, ensure_ascii=False),
+                        encoding='utf-8')
+
+    @classmethod
+    def load(cls, path: Path) -> 'ResourceProfile':
+        """JSON 로드 (알 수 없는 키는 무시, CPU 목록은 tuple 로)"""
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+        known = {f.name for f in fields(cls)}
+        values = {k: v for k, v in data.items() if k in known}
+        for key in ('inference_cpus', 'worker_cpus', 'gui_cpus'):
+            if key in values:
+                values[key] = tuple(int(cpu) for cpu in values[key])
+        return cls(**values)
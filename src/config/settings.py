@@ -3,25 +3,84 @@
 # 설정 관리자
 # ============================================================================
 
-from typing import Any, Dict
-from dataclasses import dataclass, asdict
+import json
+import math
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, asdict, fields
 
+from .constants import APP_CONST
 
-@dataclass
+
+@dataclass(frozen=True)
 class DefaultSettings:
-    """기본 설정값"""
+    """기본 설정값 (불변 - 프레임별 스냅샷 타입으로도 사용)"""
     detection_enabled: bool = True
     segmentation_enabled: bool = False
     lane_detection_enabled: bool = True
     show_labels: bool = True
     show_distance: bool = True
     confidence_threshold: float = 0.5
+    class_whitelist: Tuple[str, ...] = APP_CONST.ROAD_CLASSES  # 빈 튜플: 모든 클래스
+    class_confidence: Tuple[str, ...] = ()  # 클래스별 신뢰도 ('person:0.35', 'traffic light:0.4')
+    max_detections: int = 100      # 프레임당 최대 탐지 수 (0: 모델 기본값)
     frame_skip: int = 0
     use_gpu: bool = True
+    motion_gate_enabled: bool = True
+    motion_threshold: float = 1.5
+    tiled_inference_enabled: bool = False
+    tile_band_top: float = 0.35
+    tile_band_bottom: float = 0.7
+    tile_columns: int = 3
+    tile_overlap: float = 0.2
+    tile_include_full_frame: bool = True
+    ground_plane_distance: bool = False
+    birdseye_lanes: bool = False
+    inference_imgsz: int = APP_CONST.DEFAULT_IMGSZ
+    auto_imgsz: bool = False
+    target_fps: float = 15.0
+    inference_server: str = ""   # 비어 있으면 로컬 추론 ('127.0.0.1:5055', 'unix:/tmp/yolo.sock')
+    memory_budget_mb: int = 0      # 0: 제한 없음 (지정 시 단계별 RSS 측정, 초과 시 풀 정리)
+    display_backend: str = "label"  # 'label' (QLabel + CPU 축소) | 'opengl' (텍스처 + 벡터 오버레이, 시작 시 적용)
+    overlay_as_data: bool = False  # 처리 스레드는 그리지 않고 오버레이 데이터만 전달 (표시 / 내보내기 시 렌더링)
+    decode_backend: str = "auto"   # 파일 디코딩: auto (측정 결과) / opencv / ffmpeg / pyav (로드 시 적용)
+    decode_width: int = 0          # 분석 해상도 폭 (0: 원본) - 디코딩 직후 한 번 축소, 파일 / 스트림 로드 시 적용
+
+
+# 프레임 처리에 사용하는 불변 설정 스냅샷
+SettingsSnapshot = DefaultSettings
+
+# 프로파일 값 검사: 숫자 범위 (min, max - None 이면 제한 없음) / 허용 문자열
+SETTING_RANGES: Dict[str, Tuple[Optional[float], Optional[float]]] = {
+    'confidence_threshold': (0.0, 1.0),
+    'max_detections': (0, None),
+    'frame_skip': (0, None),
+    'motion_threshold': (0.0, None),
+    'tile_band_top': (0.0, 1.0),
+    'tile_band_bottom': (0.0, 1.0),
+    'tile_columns': (1, None),
+    'tile_overlap': (0.0, 0.9),
+    'inference_imgsz': (32, None),
+    'target_fps': (0.0, None),
+    'memory_budget_mb': (0, None),
+    'decode_width': (0, None),
+}
+SETTING_CHOICES: Dict[str, Tuple[str, ...]] = {
+    'display_backend': ('label', 'opengl'),
+    'decode_backend': ('auto', 'opencv', 'ffmpeg', 'pyav'),
+}
+
+SettingsObserver = Callable[[Dict[str, Any], SettingsSnapshot], None]
 
 
 class SettingsManager:
-    """설정 관리자 (싱글톤)"""
+    """설정 관리자 (싱글톤)
+
+    - 쓰기(GUI 스레드)는 잠금 하에 적용 후 새 불변 스냅샷을 원자적으로 게시
+    - 읽기(처리 스레드)는 프레임마다 snapshot() 한 번으로 일관된 값 사용
+    - 모델 재로드 등 작업이 필요한 변경은 옵저버로 통지
+    """
 
     _instance = None
 
@@ -35,22 +94,188 @@ class SettingsManager:
         if self._initialized:
             return
 
+        self._lock = threading.RLock()
+        self._observers: List[Tuple[Optional[frozenset], SettingsObserver]] = []
+
         default = DefaultSettings()
         self._settings: Dict[str, Any] = asdict(default)
+        self._snapshot: SettingsSnapshot = default
         self._initialized = True
 
+    def snapshot(self) -> SettingsSnapshot:
+        """현재 설정 스냅샷 (불변, 잠금 없이 읽기)"""
+        return self._snapshot
+
     def get(self, key: str, default: Any = None) -> Any:
         return self._settings.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        self._settings[key] = value
+        self.update(**{key: value})
 
     def update(self, **kwargs) -> None:
-        self._settings.update(kwargs)
+        with self._lock:
+            changed = {
+                key: value for key, value in kwargs.items()
+                if key not in self._settings or self._settings[key] != value
+            }
+            if not changed:
+                return
+
+            settings = dict(self._settings)
+            settings.update(changed)
+            self._settings = settings
+            snapshot = self._publish()
+            observers = list(self._observers)
+
+        self._notify(observers, changed, snapshot)
 
     def reset(self) -> None:
         default = DefaultSettings()
-        self._settings = asdict(default)
+        self.update(**asdict(default))
 
     def to_dict(self) -> Dict[str, Any]:
         return self._settings.copy()
+
+    def _publish(self) -> SettingsSnapshot:
+        """알려진 필드로 새 스냅샷 생성 후 게시 (참조 교체는 원자적)"""
+        known = {f.name for f in fields(DefaultSettings)}
+        snapshot = DefaultSettings(**{
+            key: value for key, value in self._settings.items() if key in known
+        })
+        self._snapshot = snapshot
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # 옵저버
+    # ------------------------------------------------------------------
+
+    def subscribe(self, callback: SettingsObserver,
+                  keys: Optional[Iterable[str]] = None) -> SettingsObserver:
+        """설정 변경 통지 등록 (keys 지정 시 해당 키 변경만)"""
+        with self._lock:
+            key_set = frozenset(keys) if keys is not None else None
+            self._observers.append((key_set, callback))
+        return callback
+
+    def unsubscribe(self, callback: SettingsObserver) -> None:
+        """설정 변경 통지 해제"""
+        with self._lock:
+            self._observers = [
+                (keys, cb) for keys, cb in self._observers if cb != callback
+            ]
+
+    @staticmethod
+    def _notify(observers: list, changed: Dict[str, Any],
+                snapshot: SettingsSnapshot) -> None:
+        """변경된 키에 관심 있는 옵저버 호출"""
+        for keys, callback in observers:
+            if keys is not None and keys.isdisjoint(changed):
+                continue
+            try:
+                callback(changed, snapshot)
+            except Exception as e:
+                print(f"설정 옵저버 오류: {e}")
+
+    # ------------------------------------------------------------------
+    # 사용자 프로파일 (JSON)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _profile_path(name: str) -> Path:
+        """프로파일 파일 경로"""
+        profile_dir = Path(APP_CONST.PROFILE_DIR)
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        return profile_dir / f"{name}.json"
+
+    def list_profiles(self) -> List[str]:
+        """저장된 프로파일 이름 목록"""
+        profile_dir = Path(APP_CONST.PROFILE_DIR)
+        if not profile_dir.is_dir():
+            return []
+        return sorted(p.stem for p in profile_dir.glob("*.json"))
+
+    def save_profile(self, name: str) -> Path:
+        """현재 설정을 프로파일로 저장"""
+        path = self._profile_path(name)
+        data = asdict(self._snapshot)
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False),
+                        encoding='utf-8')
+        return path
+
+    def load_profile(self, name: str) -> bool:
+        """프로파일 적용 (알 수 없는 키 무시, 누락된 키는 현재값 유지)
+
+        값은 DefaultSettings 기본값의 타입으로 맞추고 범위를 검사한다.
+        잘못된 값이 하나라도 있으면 아무것도 적용하지 않고 ValueError.
+        """
+        path = self._profile_path(name)
+        if not path.exists():
+            return False
+
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            print(f"프로파일 로드 실패: {e}")
+            return False
+        if not isinstance(data, dict):
+            raise ValueError(f"프로파일 '{name}' 형식 오류: JSON 객체가 아닙니다")
+
+        defaults = asdict(DefaultSettings())
+        values = {}
+        errors = []
+        for key, value in data.items():
+            if key not in defaults:
+                continue
+            try:
+                values[key] = self.coerce(key, value, defaults[key])
+            except (TypeError, ValueError) as e:
+                errors.append(f"{key}={value!r}: {e}")
+
+        top = values.get('tile_band_top', self._settings['tile_band_top'])
+        bottom = values.get('tile_band_bottom', self._settings['tile_band_bottom'])
+        if not errors and top >= bottom:
+            errors.append(f"tile_band_top({top}) 은 tile_band_bottom({bottom}) 보다 작아야 합니다")
+
+        if errors:
+            raise ValueError(f"프로파일 '{name}' 값 오류 - " + "; ".join(errors))
+
+        self.update(**values)
+        return True
+
+    @staticmethod
+    def coerce(key: str, value: Any, default: Any) -> Any:
+        """설정 값을 기본값 타입으로 변환 후 범위 / 선택지 검사 (실패 시 ValueError)"""
+        if isinstance(default, bool):
+            if not isinstance(value, bool):
+                raise ValueError("true / false 여야 합니다")
+        elif isinstance(default, (int, float)):
+            if isinstance(value, bool):
+                raise ValueError("숫자여야 합니다")
+            number = float(value)       # 숫자 문자열 허용, 그 외 ValueError / TypeError
+            if not math.isfinite(number):
+                raise ValueError("유한한 숫자여야 합니다")
+            if isinstance(default, int):
+                if not number.is_integer():
+                    raise ValueError("정수여야 합니다")
+                value = int(number)
+            else:
+                value = number
+        elif isinstance(default, str):
+            if not isinstance(value, str):
+                raise ValueError("문자열이어야 합니다")
+        elif isinstance(default, tuple):
+            # JSON 배열 → 튜플 (불변 스냅샷 유지)
+            if not isinstance(value, (list, tuple)) or \
+                    not all(isinstance(v, str) for v in value):
+                raise ValueError("문자열 배열이어야 합니다")
+            value = tuple(value)
+
+        low, high = SETTING_RANGES.get(key, (None, None))
+        if low is not None and value < low:
+            raise ValueError(f"{low} 이상이어야 합니다")
+        if high is not None and value > high:
+            raise ValueError(f"{high} 이하여야 합니다")
+        choices = SETTING_CHOICES.get(key)
+        if choices is not None and value not in choices:
+            raise ValueError(f"{' / '.join(choices)} 중 하나여야 합니다")
+        return value
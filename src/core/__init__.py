@@ -5,11 +5,52 @@
 from .video_processor import VideoProcessor
 from .model_manager import ModelManager
 from .detection_engine import DetectionEngine
+from .class_filter import ClassFilter
+from .danger_zone import DangerZoneIndex
 from .lane_detector import LaneDetector
+from .frame_indexer import FrameIndexBuilder
+from .thumbnail_generator import ThumbnailGenerator
+from .timeline_scanner import TimelineScanner
+from .motion_gate import MotionGate
+from .distance_estimator import DistanceEstimator
+from .birdseye import BirdEyeView
+from .imgsz_tuner import ImgszTuner
+from .stream_reader import StreamReader
+from .frame_source import FrameSource, DecodeBenchmark
+from .video_exporter import VideoExporter
+from .resource_manager import ResourceManager, ResourceProbe
+from .batch_scheduler import MicroBatchScheduler
+from .inference_client import InferenceClient
+from .inference_server import InferenceServer
+from .inference_protocol import InferenceKey, WireCodec
+from .object_tracker import IoUTracker
+from .stats_aggregator import StatsAggregator
 
 __all__ = [
     'VideoProcessor',
     'ModelManager',
     'DetectionEngine',
+    'ClassFilter',
+    'DangerZoneIndex',
     'LaneDetector',
+    'FrameIndexBuilder',
+    'ThumbnailGenerator',
+    'TimelineScanner',
+    'MotionGate',
+    'DistanceEstimator',
+    'BirdEyeView',
+    'ImgszTuner',
+    'StreamReader',
+    'FrameSource',
+    'DecodeBenchmark',
+    'VideoExporter',
+    'ResourceManager',
+    'ResourceProbe',
+    'MicroBatchScheduler',
+    'InferenceClient',
+    'InferenceServer',
+    'InferenceKey',
+    'WireCodec',
+    'IoUTracker',
+    'StatsAggregator',
 ]
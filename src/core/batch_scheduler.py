@@ -0,0 +1,369 @@
+# ============================================================================
+# src/core/batch_scheduler.py
+# 여러 스트림 추론 요청 마이크로 배치 스케줄러
+# ============================================================================
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import numpy as np
+
+from ..config.constants import APP_CONST
+from ..models.stats import ServerMetrics, StreamSLOStats
+from .resource_manager import ResourceManager
+
+# (프레임 목록, 배치 키) → 프레임별 결과
+BatchRunner = Callable[[List[np.ndarray], tuple], List[Any]]
+
+
+@dataclass
+class _BatchItem:
+    """스트림 요청 (프레임 1장 이상)"""
+    stream_id: Hashable
+    frames: List[np.ndarray]
+    key: tuple
+    future: Future
+    arrived: float = field(default_factory=time.perf_counter)
+
+
+class _StreamState:
+    """스트림별 대기열 / SLO 집계"""
+
+    LATENCY_WINDOW = 1000
+
+    def __init__(self, stream_id: Hashable, slo_ms: float):
+        self.queue: deque = deque()
+        self.stats = StreamSLOStats(stream_id=stream_id, slo_ms=slo_ms)
+        self.latencies: deque = deque(maxlen=self.LATENCY_WINDOW)
+
+
+class MicroBatchScheduler:
+    """마이크로 배치 스케줄러
+
+    추론 서버의 클라이언트 연결(스트림)들이 submit() 으로 넣은 프레임을
+    하나의 공유 모델 호출로 묶는다. 여러 VideoProcessor 를 한 GPU 로 묶으려면
+    각 프로세스가 같은 추론 서버(run.py --serve)에 연결한다. 배치는 가장 오래 기다린 요청을 기준으로
+    max_wait_ms 또는 그 요청의 SLO 여유 시간(SLO - 예상 추론 시간) 중 먼저
+    오는 시점까지 모으고, max_batch 프레임을 넘지 않는다.
+
+    - 공정성: 스트림마다 대기열을 두고 라운드 로빈으로 한 요청씩 채운다.
+      요청을 몰아 넣는 스트림이 다른 스트림의 자리를 차지하지 않는다.
+    - 순서: 스트림 대기열은 FIFO 이고 배치는 한 스레드가 차례로 실행하므로
+      스트림별 결과는 제출 순서대로 완료된다.
+    - SLO: 도착 → 결과 지연을 스트림별 목표와 비교해 초과 횟수 / p50 / p95 집계.
+
+    배치 키(추론 파라미터 등)가 다른 요청은 같은 배치에 넣지 않는다.
+    """
+
+    EMA_ALPHA = 0.1
+
+    def __init__(self, run_batch: BatchRunner,
+                 max_batch: int = APP_CONST.INFERENCE_MAX_BATCH,
+                 max_wait_ms: float = APP_CONST.INFERENCE_MAX_WAIT_MS,
+                 slo_ms: float = APP_CONST.BATCH_SLO_MS):
+        self.run_batch = run_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.default_slo_ms = slo_ms
+
+        self._cond = threading.Condition()
+        self._streams: Dict[Hashable, _StreamState] = {}
+        self._order: List[Hashable] = []  # 라운드 로빈 순서
+        self._cursor = 0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._metrics = ServerMetrics()
+        self._latencies: deque = deque(maxlen=_StreamState.LATENCY_WINDOW)
+
+    # ------------------------------------------------------------------
+    # 실행 / 종료
+    # ------------------------------------------------------------------
+
+    def start(self) -> 'MicroBatchScheduler':
+        """배치 스레드 시작"""
+        with self._cond:
+            if self._running:
+                return self
+            self._running = True
+
+        self._thread = threading.Thread(target=self._loop, daemon=True,
+                                        name='MicroBatchScheduler')
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """배치 스레드 종료 (대기 중 요청은 실패 처리)"""
+        with self._cond:
+            self._running = False
+            pending = [item for state in self._streams.values()
+                       for item in state.queue]
+            for state in self._streams.values():
+                state.queue.clear()
+                state.stats.pending = 0
+            self._cond.notify_all()
+
+        for item in pending:
+            item.future.set_exception(RuntimeError("배치 스케줄러 종료"))
+
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # ------------------------------------------------------------------
+    # 스트림 / 요청
+    # ------------------------------------------------------------------
+
+    def register_stream(self, stream_id: Hashable,
+                        slo_ms: Optional[float] = None) -> None:
+        """스트림 등록 (이미 있으면 SLO 만 갱신)"""
+        slo_ms = slo_ms if slo_ms and slo_ms > 0 else self.default_slo_ms
+        with self._cond:
+            state = self._streams.get(stream_id)
+            if state is None:
+                self._streams[stream_id] = _StreamState(stream_id, slo_ms)
+                self._order.append(stream_id)
+            else:
+                state.stats.slo_ms = slo_ms
+
+    def unregister_stream(self, stream_id: Hashable) -> None:
+        """스트림 제거 (대기 중 요청은 취소)"""
+        with self._cond:
+            state = self._streams.pop(stream_id, None)
+            if state is None:
+                return
+            self._order.remove(stream_id)
+            pending = list(state.queue)
+
+        for item in pending:
+            item.future.cancel()
+
+    def submit(self, stream_id: Hashable, frames: List[np.ndarray],
+               key: tuple = ()) -> Future:
+        """프레임 제출 → 프레임별 결과 목록을 돌려줄 Future"""
+        future = Future()
+
+        with self._cond:
+            if not self._running:
+                raise RuntimeError("배치 스케줄러가 실행 중이 아닙니다")
+            if stream_id not in self._streams:
+                self._streams[stream_id] = _StreamState(stream_id,
+                                                        self.default_slo_ms)
+                self._order.append(stream_id)
+
+            state = self._streams[stream_id]
+            state.queue.append(_BatchItem(stream_id, list(frames), key, future))
+            state.stats.submitted += 1
+            state.stats.pending += 1
+
+            depth = self._queue_depth()
+            self._metrics.max_queue_depth = max(self._metrics.max_queue_depth,
+                                                depth)
+            self._cond.notify()
+
+        return future
+
+    # ------------------------------------------------------------------
+    # 배치 구성
+    # ------------------------------------------------------------------
+
+    def _queue_depth(self) -> int:
+        return sum(len(state.queue) for state in self._streams.values())
+
+    def _oldest(self) -> Optional[_BatchItem]:
+        """가장 오래 기다린 대기열 선두 요청"""
+        heads = [state.queue[0] for state in self._streams.values() if state.queue]
+        return min(heads, key=lambda item: item.arrived) if heads else None
+
+    def _ready_frames(self, key: tuple) -> int:
+        """같은 배치 키로 바로 묶을 수 있는 프레임 수 (스트림별 선두부터)"""
+        total = 0
+        for state in self._streams.values():
+            for item in state.queue:
+                if item.key != key:
+                    break
+                total += len(item.frames)
+        return total
+
+    def _deadline(self, oldest: _BatchItem) -> float:
+        """배치 마감 시각 (max_wait 와 SLO 여유 중 빠른 쪽)"""
+        slo = self._streams[oldest.stream_id].stats.slo_ms / 1000.0
+        slack = slo - self._metrics.inference_ms / 1000.0
+        return oldest.arrived + max(0.0, min(self.max_wait, slack))
+
+    def _collect(self, first: _BatchItem) -> List[_BatchItem]:
+        """가장 오래된 요청 + 라운드 로빈으로 같은 키 요청 채우기"""
+        self._streams[first.stream_id].queue.popleft()
+        batch = [first]
+        frames = len(first.frames)
+
+        count = len(self._order)
+        added = True
+        while added and frames < self.max_batch:
+            added = False
+            for offset in range(count):
+                stream_id = self._order[(self._cursor + offset) % count]
+                queue = self._streams[stream_id].queue
+                if not queue or queue[0].key != first.key:
+                    continue
+                if frames + len(queue[0].frames) > self.max_batch:
+                    continue
+                item = queue.popleft()
+                batch.append(item)
+                frames += len(item.frames)
+                added = True
+                if frames >= self.max_batch:
+                    break
+
+        # 다음 배치는 다음 스트림부터
+        self._cursor = (self._cursor + 1) % max(1, count)
+        for item in batch:
+            self._streams[item.stream_id].stats.pending -= 1
+        return batch
+
+    def _next_batch(self) -> Optional[List[_BatchItem]]:
+        """마감 시각 또는 max_batch 까지 대기 후 배치 구성"""
+        with self._cond:
+            while self._running:
+                oldest = self._oldest()
+                if oldest is None:
+                    self._cond.wait(0.5)
+                    continue
+
+                # 모든 스트림이 이미 대기 중이면 더 기다려도 배치가 커지지 않음
+                remaining = self._deadline(oldest) - time.perf_counter()
+                if (remaining <= 0 or
+                        self._ready_frames(oldest.key) >= self.max_batch or
+                        all(state.queue for state in self._streams.values())):
+                    return self._collect(oldest)
+                self._cond.wait(remaining)
+        return None
+
+    # ------------------------------------------------------------------
+    # 실행 / 결과 전달
+    # ------------------------------------------------------------------
+
+    def _loop(self) -> None:
+        ResourceManager().pin('inference')
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[_BatchItem]) -> None:
+        """배치 실행 후 요청별 결과 전달"""
+        frames = [frame for item in batch for frame in item.frames]
+        started = time.perf_counter()
+
+        try:
+            results = self.run_batch(frames, batch[0].key)
+            if len(results) != len(frames):
+                raise RuntimeError(f"배치 결과 수 불일치: {len(results)} != {len(frames)}")
+        except Exception as e:
+            with self._cond:
+                self._metrics.errors += len(batch)
+                for item in batch:
+                    state = self._streams.get(item.stream_id)
+                    if state is not None:
+                        state.stats.failed += 1
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            return
+
+        finished = time.perf_counter()
+        self._record_batch(batch, len(frames), started, finished)
+
+        offset = 0
+        for item in batch:
+            count = len(item.frames)
+            if not item.future.done():
+                item.future.set_result(results[offset:offset + count])
+            offset += count
+
+    def _record_batch(self, batch: List[_BatchItem], frames: int,
+                      started: float, finished: float) -> None:
+        """배치 / 스트림 지표 갱신"""
+        alpha = self.EMA_ALPHA
+        inference_ms = (finished - started) * 1000
+        wait_ms = float(np.mean([(started - item.arrived) * 1000 for item in batch]))
+
+        with self._cond:
+            m = self._metrics
+            first_batch = m.batches == 0
+            m.batches += 1
+            m.requests += len(batch)
+            m.frames += frames
+            if first_batch:
+                m.avg_batch_frames = frames
+                m.queue_wait_ms = wait_ms
+                m.inference_ms = inference_ms
+            else:
+                m.avg_batch_frames += alpha * (frames - m.avg_batch_frames)
+                m.queue_wait_ms += alpha * (wait_ms - m.queue_wait_ms)
+                m.inference_ms += alpha * (inference_ms - m.inference_ms)
+
+            for item in batch:
+                latency_ms = (finished - item.arrived) * 1000
+                self._latencies.append(latency_ms)
+
+                state = self._streams.get(item.stream_id)
+                if state is None:
+                    continue  # 처리 중 제거된 스트림
+                stats = state.stats
+                item_wait_ms = (started - item.arrived) * 1000
+                if stats.completed == 0:
+                    stats.queue_wait_ms = item_wait_ms
+                else:
+                    stats.queue_wait_ms += alpha * (item_wait_ms - stats.queue_wait_ms)
+                stats.completed += 1
+                stats.frames += len(item.frames)
+                state.latencies.append(latency_ms)
+                if latency_ms > stats.slo_ms:
+                    stats.slo_misses += 1
+                    m.slo_misses += 1
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> ServerMetrics:
+        """전체 배치 지표 (복사본, clients = 등록된 스트림 수)"""
+        with self._cond:
+            m = ServerMetrics(**vars(self._metrics))
+            m.clients = len(self._streams)
+            m.queue_depth = self._queue_depth()
+            latencies = list(self._latencies)
+
+        if latencies:
+            m.latency_p50_ms, m.latency_p95_ms = (
+                float(v) for v in np.percentile(latencies, [50, 95])
+            )
+        return m
+
+    def stream_stats(self) -> Dict[Hashable, StreamSLOStats]:
+        """스트림별 처리량 / SLO 통계 (복사본)"""
+        with self._cond:
+            snapshot = {
+                stream_id: (StreamSLOStats(**vars(state.stats)),
+                            list(state.latencies))
+                for stream_id, state in self._streams.items()
+            }
+
+        result = {}
+        for stream_id, (stats, latencies) in snapshot.items():
+            if latencies:
+                stats.latency_p50_ms, stats.latency_p95_ms = (
+                    float(v) for v in np.percentile(latencies, [50, 95])
+                )
+            result[stream_id] = stats
+        return result
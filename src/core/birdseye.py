@@ -0,0 +1,96 @@
+# ============================================================================
+# src/core/birdseye.py
+# 역원근(버드아이) 변환 - 해상도별 remap 맵 캐싱
+# ============================================================================
+
+import cv2
+import numpy as np
+from typing import Dict, Tuple
+
+from ..config.camera import CameraProfile
+
+
+class BirdEyeView:
+    """노면을 위에서 본 미터 단위 격자로 변환
+
+    출력 이미지의 열은 횡방향 X (-lateral_range ~ +lateral_range),
+    행은 전방 거리 Z (위쪽이 far, 아래쪽이 near)에 대응한다.
+    remap 맵은 카메라 프로파일로부터 해상도별로 한 번만 계산한다.
+    """
+
+    def __init__(self, profile: CameraProfile = None,
+                 lateral_range: float = 6.0,
+                 near: float = 4.0,
+                 far: float = 30.0,
+                 pixels_per_meter: float = 20.0):
+        self._profile = profile or CameraProfile()
+        self.lateral_range = lateral_range
+        self.near = near
+        self.far = far
+        self.pixels_per_meter = pixels_per_meter
+
+        self._maps: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
+        self._scaled: Dict[Tuple[int, int], CameraProfile] = {}
+
+    @property
+    def output_size(self) -> Tuple[int, int]:
+        """출력 크기 (width, height)"""
+        width = int(round(2 * self.lateral_range * self.pixels_per_meter))
+        height = int(round((self.far - self.near) * self.pixels_per_meter))
+        return width, height
+
+    def set_profile(self, profile: CameraProfile) -> None:
+        """카메라 프로파일 변경 (맵 캐시 초기화)"""
+        self._profile = profile
+        self._maps.clear()
+        self._scaled.clear()
+
+    def camera(self, width: int, height: int) -> CameraProfile:
+        """해상도별 스케일된 프로파일"""
+        key = (width, height)
+        cam = self._scaled.get(key)
+        if cam is None:
+            cam = self._profile.scaled(width, height)
+            self._scaled[key] = cam
+        return cam
+
+    def _get_maps(self, width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+        """해상도별 remap 맵 (고정소수점 변환, 캐시)"""
+        key = (width, height)
+        maps = self._maps.get(key)
+        if maps is None:
+            out_w, out_h = self.output_size
+            cols = np.arange(out_w, dtype=np.float64) + 0.5
+            rows = np.arange(out_h, dtype=np.float64) + 0.5
+
+            lateral = cols / self.pixels_per_meter - self.lateral_range
+            forward = self.far - rows / self.pixels_per_meter
+            lateral_grid, forward_grid = np.meshgrid(lateral, forward)
+
+            u, v = self.camera(width, height).project_ground(lateral_grid, forward_grid)
+            maps = cv2.convertMaps(u.astype(np.float32), v.astype(np.float32),
+                                   cv2.CV_16SC2)
+            self._maps[key] = maps
+        return maps
+
+    def warp(self, image: np.ndarray) -> np.ndarray:
+        """원본 프레임 → 버드아이 이미지"""
+        height, width = image.shape[:2]
+        map1, map2 = self._get_maps(width, height)
+        return cv2.remap(image, map1, map2, cv2.INTER_LINEAR,
+                         borderMode=cv2.BORDER_CONSTANT)
+
+    def to_ground(self, cols: np.ndarray, rows: np.ndarray
+                  ) -> Tuple[np.ndarray, np.ndarray]:
+        """버드아이 픽셀 → 노면 좌표 (X, Z) m"""
+        lateral = np.asarray(cols, dtype=np.float64) / self.pixels_per_meter - self.lateral_range
+        forward = self.far - np.asarray(rows, dtype=np.float64) / self.pixels_per_meter
+        return lateral, forward
+
+    def to_image(self, lateral: np.ndarray, forward: np.ndarray,
+                 width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+        """노면 좌표 (X, Z) → 원본 프레임 픽셀 (u, v)"""
+        return self.camera(width, height).project_ground(
+            np.asarray(lateral, dtype=np.float64),
+            np.asarray(forward, dtype=np.float64)
+        )
@@ -0,0 +1,100 @@
+# ============================================================================
+# src/core/class_filter.py
+# 탐지 클래스 화이트리스트 / 클래스별 신뢰도 / 최대 탐지 수
+# ============================================================================
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+Boxes = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class ClassFilter:
+    """모델 클래스 이름 기준 탐지 필터
+
+    화이트리스트는 추론 호출의 classes 인자로 넘겨 모델 NMS / 결과 파싱이
+    관심 클래스 박스만 다루게 하고, 추론 신뢰도는 허용 클래스 임계값 중
+    가장 낮은 값을 쓴다. 추론 뒤 apply() 가 클래스별 임계값과 최대 탐지 수를
+    적용하며 단계별로 버린 박스 수를 돌려준다. segmentation 마스크처럼 박스와
+    함께 걸러야 하는 결과는 select() 의 인덱스를 쓴다.
+    """
+
+    def __init__(self, names: Dict[int, str], whitelist: Sequence[str] = (),
+                 class_confidence: Sequence[str] = (), confidence: float = 0.5,
+                 max_detections: int = 0):
+        self.names = names
+        self.max_detections = max_detections
+
+        size = max(names) + 1 if names else 0
+        ids_by_name = {name: class_id for class_id, name in names.items()}
+
+        # 허용 클래스 (모델에 없는 이름은 무시, 하나도 없으면 전체 허용)
+        self.allowed = np.ones(size, dtype=bool)
+        self.class_ids: Optional[Tuple[int, ...]] = None
+        if whitelist:
+            known = [ids_by_name[name] for name in whitelist if name in ids_by_name]
+            unknown = [name for name in whitelist if name not in ids_by_name]
+            if unknown:
+                print(f"⚠️  모델에 없는 클래스 무시: {', '.join(unknown)}")
+            if known:
+                self.allowed[:] = False
+                self.allowed[known] = True
+                self.class_ids = tuple(sorted(set(known)))
+
+        # 클래스별 신뢰도 임계값 (비교는 모델 출력과 같은 float32)
+        thresholds = np.full(size, confidence, dtype=np.float64)
+        for name, value in self.parse_thresholds(class_confidence).items():
+            if name in ids_by_name:
+                thresholds[ids_by_name[name]] = value
+        self.thresholds = thresholds.astype(np.float32)
+
+        allowed_thresholds = thresholds[self.allowed]
+        self.confidence = (float(allowed_thresholds.min())
+                           if len(allowed_thresholds) else confidence)
+
+    @staticmethod
+    def parse_thresholds(entries: Sequence[str]) -> Dict[str, float]:
+        """'person:0.35' 목록 → {클래스 이름: 임계값} (이름에 공백 허용)"""
+        result = {}
+        for entry in entries:
+            name, _, value = entry.rpartition(':')
+            try:
+                result[name.strip()] = float(value)
+            except ValueError:
+                print(f"⚠️  클래스 신뢰도 형식 오류 무시: {entry!r} (이름:값)")
+        return result
+
+    def select(self, conf: np.ndarray,
+               cls: np.ndarray) -> Tuple[np.ndarray, Dict[str, int]]:
+        """추론 결과 중 남길 인덱스 (원래 순서) + 단계별 버린 수 (마스크 등 함께 거를 때)"""
+        dropped: Dict[str, int] = {}
+        index = np.arange(len(cls))
+        if len(cls) == 0:
+            return index, dropped
+
+        for stage in ('class', 'confidence'):
+            if stage == 'class':
+                keep = self.allowed[cls[index]]
+            else:
+                keep = conf[index] >= self.thresholds[cls[index]]
+            removed = len(keep) - int(np.count_nonzero(keep))
+            if removed:
+                dropped[stage] = removed
+                index = index[keep]
+
+        # 신뢰도 상위 max_detections 개 (원래 순서 유지)
+        if 0 < self.max_detections < len(index):
+            dropped['max_det'] = len(index) - self.max_detections
+            top = np.argsort(-conf[index], kind='stable')[:self.max_detections]
+            index = index[np.sort(top)]
+
+        return index, dropped
+
+    def apply(self, xyxy: np.ndarray, conf: np.ndarray,
+              cls: np.ndarray) -> Tuple[Boxes, Dict[str, int]]:
+        """추론 결과 필터 → ((xyxy, conf, cls), 단계별 버린 박스 수)"""
+        index, dropped = self.select(conf, cls)
+        if len(index) == len(cls):
+            return (xyxy, conf, cls), dropped
+        return (xyxy[index], conf[index], cls[index]), dropped
@@ -0,0 +1,201 @@
+# ============================================================================
+# src/core/danger_zone.py
+# 자차 / 인접 차선 위험 영역 격자 + 충돌 예상 시간 (TTC)
+# ============================================================================
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ..config.constants import APP_CONST
+from ..models.detection import LaneLines
+from ..utils.geometry import GeometryUtils
+
+
+class DangerZoneIndex:
+    """프레임별 차선 영역 격자
+
+    차선(없으면 ROI 사다리꼴)을 바닥 쪽으로 연장해 셀마다 자차 차선 /
+    인접 차선 / 바깥을 표시해 두고, 박스 하단 중심(노면 접점)이 속한 셀을
+    한 번의 인덱싱으로 읽는다. TTC 는 이전 프레임 탐지와 IoU 로 이어 붙인
+    짧은 거리 이력의 기울기로 구한다. 격자 크기는 프레임 크기로만 정해지므로
+    영역 판정은 객체 수가 늘어도 박스 수에 비례하는 배열 연산뿐이고, 이력
+    매칭은 프레임당 박스 수(max_detections 상한)끼리의 IoU 행렬 하나다.
+    """
+
+    def __init__(self, cell: int = APP_CONST.DANGER_GRID_CELL):
+        self.cell = cell
+        self.grid: Optional[np.ndarray] = None      # (rows, cols) uint8 영역 번호
+        self._grid_key: Optional[tuple] = None
+        # 이전 프레임 (xyxy, cls, 박스별 시각 이력, 거리 이력, 시각)
+        self._previous: Optional[tuple] = None
+
+    def reset(self) -> None:
+        """초기화 (새 소스 / seek)"""
+        self.grid = None
+        self._grid_key = None
+        self._previous = None
+
+    # ------------------------------------------------------------------
+    # 격자
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _default_lines(width: int, height: int) -> Tuple[tuple, tuple]:
+        """차선이 없을 때 자차 차선 경계 (차선 ROI 사다리꼴의 양 변)"""
+        (bottom_left, top_left, top_right, bottom_right), = \
+            GeometryUtils.create_roi_vertices(
+                width, height, APP_CONST.LANE_ROI_TOP,
+                APP_CONST.LANE_ROI_LEFT, APP_CONST.LANE_ROI_RIGHT
+            )
+        return ((*bottom_left, *top_left), (*bottom_right, *top_right))
+
+    @staticmethod
+    def _line_x(line: tuple, ys: np.ndarray) -> Optional[np.ndarray]:
+        """선분을 연장한 직선의 행별 x (수평선이면 None)"""
+        x1, y1, x2, y2 = (float(v) for v in line)
+        if y1 == y2:
+            return None
+        return x1 + (ys - y1) * (x2 - x1) / (y2 - y1)
+
+    def update(self, lanes: Optional[LaneLines],
+               frame_shape: Tuple[int, ...]) -> np.ndarray:
+        """차선 → 영역 격자 (차선 / 크기가 같으면 재사용)"""
+        height, width = frame_shape[:2]
+        left_line = lanes.left_lane if lanes is not None else None
+        right_line = lanes.right_lane if lanes is not None else None
+
+        key = (width, height, left_line, right_line)
+        if key == self._grid_key:
+            return self.grid
+
+        rows = -(-height // self.cell)
+        cols = -(-width // self.cell)
+        ys = (np.arange(rows) + 0.5) * self.cell
+        xs = (np.arange(cols) + 0.5) * self.cell
+
+        # 한쪽 차선만 있으면 다른 쪽은 기본 경계
+        default_left, default_right = self._default_lines(width, height)
+        left = self._line_x(left_line, ys) if left_line is not None else None
+        right = self._line_x(right_line, ys) if right_line is not None else None
+        if left is None:
+            left = self._line_x(default_left, ys)
+        if right is None:
+            right = self._line_x(default_right, ys)
+
+        # 행마다 [왼쪽, 오른쪽] 이 자차 차선, 양옆 차선 폭만큼이 인접 차선
+        lane_width = right - left
+        valid = (lane_width > 0)[:, None]
+        x = xs[None, :]
+        ego = valid & (x >= left[:, None]) & (x <= right[:, None])
+        adjacent = (valid & ~ego &
+                    (x >= (left - lane_width)[:, None]) &
+                    (x <= (right + lane_width)[:, None]))
+
+        grid = np.full((rows, cols), APP_CONST.LANE_ZONE_OUTSIDE, dtype=np.uint8)
+        grid[adjacent] = APP_CONST.LANE_ZONE_ADJACENT
+        grid[ego] = APP_CONST.LANE_ZONE_EGO
+
+        self.grid = grid
+        self._grid_key = key
+        return grid
+
+    def zones(self, xyxy: np.ndarray) -> np.ndarray:
+        """박스 (N, 4) → 하단 중심이 속한 영역 번호 (N,)"""
+        if len(xyxy) == 0 or self.grid is None:
+            return np.full(len(xyxy), APP_CONST.LANE_ZONE_OUTSIDE, dtype=np.uint8)
+
+        rows, cols = self.grid.shape
+        cx = (xyxy[:, 0] + xyxy[:, 2]) * 0.5
+        r = np.clip((xyxy[:, 3] // self.cell).astype(np.int64), 0, rows - 1)
+        c = np.clip((cx // self.cell).astype(np.int64), 0, cols - 1)
+        return self.grid[r, c]
+
+    # ------------------------------------------------------------------
+    # 충돌 예상 시간
+    # ------------------------------------------------------------------
+
+    def time_to_collision(self, xyxy: np.ndarray, class_ids: np.ndarray,
+                          distances: np.ndarray, timestamp: float,
+                          selected: Optional[np.ndarray] = None) -> np.ndarray:
+        """거리 이력의 최소제곱 기울기 → TTC (초, 접근하지 않으면 inf)
+
+        모든 박스를 이전 프레임과 이어 이력을 넘겨주고(옆 차선에서 끼어든
+        객체도 이어짐), selected 박스만 TTC 를 계산한다. 단안 거리 추정은
+        프레임마다 흔들리므로 TTC_WINDOW_SEC 안의 샘플이 TTC_MIN_SAMPLES 개
+        이상이고 접근 속도가 TTC_MIN_CLOSING_MPS 이상일 때만 유한한 값을 낸다.
+        """
+        count = len(xyxy)
+        history = APP_CONST.TTC_HISTORY
+        times = np.full((count, history), np.nan)
+        dists = np.full((count, history), np.nan)
+        times[:, -1] = timestamp
+        dists[:, -1] = distances
+
+        previous = self._previous
+        if previous is not None and count:
+            prev_xyxy, prev_cls, prev_times, prev_dists, prev_time = previous
+            dt = timestamp - prev_time
+            if len(prev_xyxy) and 0 < dt <= APP_CONST.TTC_MAX_GAP_SEC:
+                # 같은 클래스 중 IoU 가 가장 큰 이전 박스의 이력을 이어 받음
+                iou = GeometryUtils.iou_matrix(xyxy, prev_xyxy)
+                iou[class_ids[:, None] != prev_cls[None, :]] = 0.0
+                best = iou.argmax(axis=1)
+                matched = np.flatnonzero(
+                    iou[np.arange(count), best] >= APP_CONST.TRACK_IOU_THRESHOLD
+                )
+                times[matched, :-1] = prev_times[best[matched], 1:]
+                dists[matched, :-1] = prev_dists[best[matched], 1:]
+        self._previous = (xyxy, class_ids, times, dists, timestamp)
+
+        ttc = np.full(count, np.inf)
+        index = np.arange(count) if selected is None else np.flatnonzero(selected)
+        if len(index) == 0:
+            return ttc
+
+        # 창 안의 유효 샘플로 거리-시간 직선 맞춤 (행마다 한 번에)
+        t, d = times[index], dists[index]
+        valid = (np.isfinite(t) & np.isfinite(d) &
+                 (t >= timestamp - APP_CONST.TTC_WINDOW_SEC))
+        samples = valid.sum(axis=1)
+        enough = samples >= APP_CONST.TTC_MIN_SAMPLES
+        if not enough.any():
+            return ttc
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            n = np.maximum(samples, 1)
+            t_mean = np.where(valid, t, 0.0).sum(axis=1) / n
+            d_mean = np.where(valid, d, 0.0).sum(axis=1) / n
+            t_dev = np.where(valid, t - t_mean[:, None], 0.0)
+            d_dev = np.where(valid, d - d_mean[:, None], 0.0)
+            slope = (t_dev * d_dev).sum(axis=1) / (t_dev ** 2).sum(axis=1)
+
+            closing = -slope
+            current = d_mean + slope * (timestamp - t_mean)   # 맞춘 직선의 현재 거리
+            approaching = (enough & np.isfinite(closing) &
+                           (closing >= APP_CONST.TTC_MIN_CLOSING_MPS))
+        ttc[index[approaching]] = (np.maximum(current[approaching], 0.0) /
+                                   closing[approaching])
+        return ttc
+
+    # ------------------------------------------------------------------
+    # 분류
+    # ------------------------------------------------------------------
+
+    def classify(self, xyxy: np.ndarray, class_ids: np.ndarray,
+                 distances: np.ndarray, lanes: Optional[LaneLines],
+                 frame_shape: Tuple[int, ...], timestamp: float
+                 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """프레임 탐지 전체 → (영역 번호, TTC, 자차 경로 위험 여부)
+
+        TTC 는 자차 차선 박스만 계산한다 (나머지는 inf).
+        """
+        self.update(lanes, frame_shape)
+        zones = self.zones(xyxy)
+        in_path = zones == APP_CONST.LANE_ZONE_EGO
+        ttc = self.time_to_collision(xyxy, class_ids, distances, timestamp, in_path)
+
+        hazard = in_path & (
+            (distances < APP_CONST.DANGER_DISTANCE) | (ttc < APP_CONST.TTC_DANGER_SEC)
+        )
+        return zones, ttc, hazard
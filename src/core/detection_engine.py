@@ -3,112 +3,382 @@
 # 객체 탐지 엔진
 # ============================================================================
 
+import multiprocessing
+import time
 import cv2
 import numpy as np
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from ..models.detection import Detection
+from ..models.detection import Detection, LaneLines
 from ..models.stats import DetectionStats
 from ..utils.geometry import GeometryUtils
-from ..config.settings import SettingsManager
+from ..utils.drawing import DrawingUtils
+from ..utils.buffer_pool import BufferPool
+from ..config.constants import APP_CONST
+from ..config.settings import SettingsManager, SettingsSnapshot
+from ..config.camera import CameraProfile
+from .distance_estimator import DistanceEstimator
+from .inference_client import InferenceClient
+from .class_filter import ClassFilter
+from .danger_zone import DangerZoneIndex
 
 
 class DetectionEngine:
     """객체 탐지 엔진"""
 
+    REMOTE_RETRY_SEC = 5.0  # 추론 서버 연결 실패 후 재시도 간격
+
     def __init__(self, model_manager):
         self.model_manager = model_manager
         self.settings = SettingsManager()
+        self.distance_estimator = DistanceEstimator()
+        self.danger_zones = DangerZoneIndex()
+
+        # 원격 추론 서버 (settings.inference_server 지정 시)
+        self._remote: Optional[InferenceClient] = None
+        self._remote_retry_at = 0.0
+
+        # 모델별 클래스 필터 (클래스 이름 / 필터 설정이 같으면 재사용)
+        self._class_filters: Dict[str, Tuple[tuple, ClassFilter]] = {}
+
+    def set_camera_profile(self, profile: CameraProfile) -> None:
+        """거리 추정용 카메라 프로파일 설정"""
+        self.distance_estimator.set_profile(profile)
 
-    def detect_objects(self, frame: np.ndarray) -> Tuple[List[Detection], DetectionStats]:
-        """객체 탐지 실행"""
+    def detect_objects(self, frame: np.ndarray,
+                       cfg: Optional[SettingsSnapshot] = None,
+                       source_frame: Optional[np.ndarray] = None,
+                       lanes: Optional[LaneLines] = None,
+                       timestamp: Optional[float] = None
+                       ) -> Tuple[List[Detection], DetectionStats]:
+        """객체 탐지 실행 (cfg: 프레임 설정 스냅샷)
+
+        source_frame: 분석 해상도로 줄이기 전 원본 (타일 추론 시 밴드 타일을 여기서 자름)
+        lanes / timestamp: 자차 차선 판정 / TTC 용 (없으면 ROI 사다리꼴 / 현재 시각)
+        """
+        cfg = cfg or self.settings.snapshot()
         detections = []
         stats = DetectionStats()
 
-        if not self.settings.get('detection_enabled'):
+        if not cfg.detection_enabled:
             return detections, stats
 
+        # YOLO 추론 (화이트리스트 클래스만)
+        if cfg.tiled_inference_enabled:
+            boxes, class_filter, dropped = self._infer_tiled(frame, cfg, source_frame)
+        else:
+            boxes, class_filter, dropped = self._infer(frame, cfg)
+        stats.raw_boxes = len(boxes[2]) + sum(dropped.values())
+
+        # 클래스별 신뢰도 / 최대 탐지 수
+        (xyxy, confs, class_ids), filtered = class_filter.apply(*boxes)
+        dropped.update(filtered)
+        stats.dropped_boxes = dropped
+        names = class_filter.names
+
+        # 거리 추정 (프레임 전체 박스 한 번에)
+        distances = self.distance_estimator.estimate(
+            xyxy, class_ids, names, frame.shape,
+            use_ground_plane=cfg.ground_plane_distance
+        )
+
+        # 자차 / 인접 차선 분류 + TTC (프레임 전체 박스 한 번에)
+        zones, ttc, hazard = self.danger_zones.classify(
+            xyxy, class_ids, distances, lanes, frame.shape,
+            time.monotonic() if timestamp is None else timestamp
+        )
+
+        # 결과 파싱
+        object_counts = {}
+
+        for bbox, conf, cls_id, distance, zone, seconds, danger in zip(
+                xyxy, confs, class_ids, distances, zones, ttc, hazard):
+            detection = self._parse_detection(bbox, conf, cls_id, distance, names)
+            detection.lane_zone = int(zone)
+            detection.ttc = float(seconds)
+            detection.hazard = bool(danger)
+            detections.append(detection)
+
+            # 통계 수집
+            class_name = detection.class_name
+            object_counts[class_name] = object_counts.get(class_name, 0) + 1
+
+        in_path = zones == APP_CONST.LANE_ZONE_EGO
+        stats.total_objects = len(detections)
+        stats.object_counts = object_counts
+        stats.dangerous_objects = int(np.count_nonzero(hazard))
+        stats.in_path_objects = int(np.count_nonzero(in_path))
+        if stats.in_path_objects:
+            stats.min_ttc = float(ttc[in_path].min())
+
+        return detections, stats
+
+    # ------------------------------------------------------------------
+    # 추론 백엔드 (로컬 모델 / 원격 추론 서버)
+    # ------------------------------------------------------------------
+
+    def _remote_client(self, cfg: SettingsSnapshot) -> Optional[InferenceClient]:
+        """설정된 추론 서버 연결 (실패 시 재시도 간격 동안 로컬 추론)"""
+        address = cfg.inference_server
+        if self._remote is not None and self._remote.address != address:
+            self._remote.close()
+            self._remote = None
+
+        if not address or self._remote is not None:
+            return self._remote
+
+        if time.monotonic() < self._remote_retry_at:
+            return None
+
+        try:
+            self._remote = InferenceClient(address,
+                                           slo_ms=self._frame_budget_ms(cfg))
+            print(f"🧠 추론 서버 연결: {address} ({self._remote.device})")
+        except (OSError, EOFError, ValueError, RuntimeError,
+                multiprocessing.AuthenticationError) as e:
+            # 키 불일치 / 잘못된 응답도 로컬 추론으로 전환
+            print(f"⚠️  추론 서버 연결 실패, 로컬 추론 사용: {e}")
+            self._remote_retry_at = time.monotonic() + self.REMOTE_RETRY_SEC
+
+        return self._remote
+
+    def close(self) -> None:
+        """추론 서버 연결 종료"""
+        if self._remote is not None:
+            self._remote.close()
+            self._remote = None
+
+    @staticmethod
+    def _frame_budget_ms(cfg: SettingsSnapshot) -> float:
+        """스트림 지연 목표 (목표 FPS 의 프레임 간격)"""
+        if cfg.target_fps <= 0:
+            return APP_CONST.BATCH_SLO_MS
+        return 1000.0 / cfg.target_fps
+
+    def _drop_remote(self, error: Exception) -> None:
+        """원격 호출 실패 → 연결 해제 후 재시도 대기"""
+        print(f"⚠️  추론 서버 오류, 로컬 추론으로 전환: {error}")
+        try:
+            self._remote.close()
+        except OSError:
+            pass
+        self._remote = None
+        self._remote_retry_at = time.monotonic() + self.REMOTE_RETRY_SEC
+
+    def _get_class_filter(self, cfg: SettingsSnapshot, names: Dict[int, str],
+                          kind: str = 'detect') -> ClassFilter:
+        """모델 클래스 이름 + 설정 → 클래스 필터 (kind: 'detect' / 'segment', 바뀔 때만 다시 생성)"""
+        key = (id(names), cfg.class_whitelist, cfg.class_confidence,
+               cfg.confidence_threshold, cfg.max_detections)
+        cached = self._class_filters.get(kind)
+        if cached is None or cached[0] != key:
+            cached = (key, ClassFilter(
+                names, cfg.class_whitelist, cfg.class_confidence,
+                cfg.confidence_threshold, cfg.max_detections
+            ))
+            self._class_filters[kind] = cached
+        return cached[1]
+
+    def _detect_batch(self, frames: List[np.ndarray], cfg: SettingsSnapshot
+                      ) -> Tuple[List[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+                                 ClassFilter]:
+        """프레임 목록 탐지 → (프레임별 (xyxy, conf, cls), 클래스 필터)"""
+        remote = self._remote_client(cfg)
+        if remote is not None:
+            class_filter = self._get_class_filter(cfg, remote.names)
+            try:
+                return (remote.detect(frames, class_filter.confidence,
+                                      cfg.inference_imgsz,
+                                      classes=class_filter.class_ids,
+                                      max_det=class_filter.max_detections),
+                        class_filter)
+            except (OSError, EOFError, ConnectionError, RuntimeError, ValueError) as e:
+                self._drop_remote(e)
+
+        model = self.model_manager.detection_model
+        if model is None:
+            model = self.model_manager.load_detection_model()
+        class_filter = self._get_class_filter(cfg, model.names)
+        key = (class_filter.confidence, cfg.inference_imgsz,
+               class_filter.class_ids, class_filter.max_detections)
+        return self._run_local_batch(frames, key), class_filter
+
+    def _run_local_batch(self, frames: List[np.ndarray], key: tuple
+                         ) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """로컬 모델 배치 추론 (key: (conf, imgsz, classes, max_det))"""
+        conf, imgsz, classes, max_det = key
         model = self.model_manager.detection_model
         if model is None:
             model = self.model_manager.load_detection_model()
 
-        # YOLO 추론
         results = model(
-            frame,
-            conf=self.settings.get('confidence_threshold', 0.5),
+            frames,
+            conf=conf,
+            imgsz=imgsz,
+            classes=list(classes) if classes is not None else None,
+            max_det=max_det or APP_CONST.MODEL_MAX_DET,
             verbose=False,
             device=self.model_manager.device
         )
+        return [self._boxes_to_arrays(r.boxes) for r in results]
 
-        # 결과 파싱
-        object_counts = {}
+    def _infer(self, frame: np.ndarray, cfg: SettingsSnapshot
+               ) -> Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray], ClassFilter,
+                          Dict[str, int]]:
+        """전체 프레임 추론 → ((xyxy, conf, cls), 클래스 필터, 단계별 버린 박스 수)"""
+        boxes, class_filter = self._detect_batch([frame], cfg)
+        return boxes[0], class_filter, {}
 
-        for result in results:
-            boxes = result.boxes
-            for box in boxes:
-                detection = self._parse_detection(box, model.names)
-                detections.append(detection)
+    def _infer_tiled(self, frame: np.ndarray, cfg: SettingsSnapshot,
+                     source_frame: Optional[np.ndarray] = None
+                     ) -> Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray], ClassFilter,
+                                Dict[str, int]]:
+        """타일 추론 (SAHI 방식)
 
-                # 통계 수집
-                class_name = detection.class_name
-                object_counts[class_name] = object_counts.get(class_name, 0) + 1
+        지평선 밴드를 겹치는 타일로 잘라 전체 프레임(축소)과 함께 한 번의
+        배치 호출로 추론하고, 원본 좌표로 옮긴 뒤 클래스별 NMS 로 병합한다.
+        입력 크기를 키우지 않고 원거리 소형 객체 검출률을 높인다.
+        source_frame 이 있으면 밴드 타일은 원본 해상도에서 잘라 추론하고
+        박스를 분석 해상도 좌표로 되돌린다.
+        """
+        height, width = frame.shape[:2]
+        tiles = GeometryUtils.plan_tiles(
+            width, height,
+            band_top=cfg.tile_band_top,
+            band_bottom=cfg.tile_band_bottom,
+            columns=cfg.tile_columns,
+            overlap=cfg.tile_overlap
+        )
 
-                if detection.is_dangerous():
-                    stats.dangerous_objects += 1
+        # 타일별 (잘라낸 이미지, 오프셋, 배율) - 분석 좌표 = (박스 + 오프셋) / 배율
+        crops, mappings = [], []
+        if cfg.tile_include_full_frame:
+            crops.append(frame)
+            mappings.append((0, 0, 1.0, 1.0))
 
-        stats.total_objects = len(detections)
-        stats.object_counts = object_counts
+        scale_x = scale_y = 1.0
+        if source_frame is not None:
+            scale_x = source_frame.shape[1] / width
+            scale_y = source_frame.shape[0] / height
+        for x1, y1, x2, y2 in tiles:
+            if source_frame is None:
+                crops.append(frame[y1:y2, x1:x2])
+                mappings.append((x1, y1, 1.0, 1.0))
+            else:
+                sx1, sy1 = int(x1 * scale_x), int(y1 * scale_y)
+                sx2, sy2 = int(x2 * scale_x), int(y2 * scale_y)
+                crops.append(source_frame[sy1:sy2, sx1:sx2])
+                mappings.append((sx1, sy1, scale_x, scale_y))
 
-        return detections, stats
+        boxes, class_filter = self._detect_batch(crops, cfg)
+
+        all_xyxy, all_conf, all_cls = [], [], []
+        for (ox, oy, sx, sy), (xyxy, conf, cls) in zip(mappings, boxes):
+            offset = np.array([ox, oy, ox, oy], dtype=xyxy.dtype)
+            scale = np.array([sx, sy, sx, sy], dtype=xyxy.dtype)
+            all_xyxy.append((xyxy + offset) / scale)
+            all_conf.append(conf)
+            all_cls.append(cls)
 
-    def _parse_detection(self, box, class_names: dict) -> Detection:
-        """YOLO 박스를 Detection 객체로 변환"""
-        cls_id = int(box.cls[0])
-        conf = float(box.conf[0])
-        bbox = box.xyxy[0].cpu().numpy()
+        xyxy = np.concatenate(all_xyxy)
+        conf = np.concatenate(all_conf)
+        cls = np.concatenate(all_cls)
 
-        bbox_width = bbox[2] - bbox[0]
-        distance = GeometryUtils.estimate_distance(bbox_width)
+        keep = GeometryUtils.nms(xyxy, conf, cls, APP_CONST.TILE_NMS_IOU)
+        dropped = {'nms': len(cls) - len(keep)} if len(keep) < len(cls) else {}
+        return (xyxy[keep], conf[keep], cls[keep]), class_filter, dropped
+
+    @staticmethod
+    def _boxes_to_arrays(boxes) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """YOLO Boxes → numpy 배열 (xyxy, conf, cls)"""
+        return (
+            boxes.xyxy.cpu().numpy().reshape(-1, 4).astype(np.float32),
+            boxes.conf.cpu().numpy().reshape(-1).astype(np.float32),
+            boxes.cls.cpu().numpy().reshape(-1).astype(np.int64)
+        )
 
+    def _parse_detection(self, bbox: np.ndarray, conf: float, cls_id: int,
+                         distance: float, class_names: dict) -> Detection:
+        """박스 배열을 Detection 객체로 변환"""
         return Detection(
-            class_id=cls_id,
-            class_name=class_names[cls_id],
-            confidence=conf,
+            class_id=int(cls_id),
+            class_name=class_names[int(cls_id)],
+            confidence=float(conf),
             bbox=bbox,
-            distance=distance
+            distance=float(distance)
         )
 
-    def apply_segmentation(self, frame: np.ndarray) -> np.ndarray:
-        """Segmentation 적용"""
-        if not self.settings.get('segmentation_enabled'):
-            return frame
+    def predict_masks(self, frame: np.ndarray,
+                      cfg: Optional[SettingsSnapshot] = None) -> Optional[np.ndarray]:
+        """Segmentation 추론 → 프레임 해상도 bool 마스크 (N, H, W)"""
+        cfg = cfg or self.settings.snapshot()
+        if not cfg.segmentation_enabled:
+            return None
+
+        segmented = self._segment(frame, cfg)
+        if segmented is None:
+            return None
+
+        # 탐지와 같은 화이트리스트 / 클래스별 신뢰도 / 최대 수
+        masks, conf, cls, class_filter = segmented
+        keep, _ = class_filter.select(conf, cls)
+        if len(keep) == 0:
+            return None
+        if len(keep) < len(masks):
+            masks = masks[keep]
+
+        # 프레임 해상도 resize 는 풀의 작업 버퍼 하나로 (마스크마다 할당하지 않음)
+        size = (frame.shape[1], frame.shape[0])
+        pool = BufferPool()
+        scratch = pool.acquire(frame.shape[:2], np.float32)
+        result = np.empty((len(masks),) + frame.shape[:2], dtype=bool)
+        for mask, out in zip(masks, result):
+            resized = cv2.resize(mask, size, dst=scratch)
+            np.greater(resized, 0.5, out=out)
+        pool.release(scratch)
+        return result
+
+    def _segment(self, frame: np.ndarray, cfg: SettingsSnapshot
+                 ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, ClassFilter]]:
+        """Segmentation 추론 → (모델 해상도 마스크 (N, h, w), conf, cls, 클래스 필터)"""
+        remote = self._remote_client(cfg)
+        if remote is not None:
+            class_filter = self._get_class_filter(cfg, remote.names, 'segment')
+            try:
+                result = remote.segment(frame, class_filter.confidence,
+                                        cfg.inference_imgsz,
+                                        classes=class_filter.class_ids,
+                                        max_det=class_filter.max_detections)
+                return None if result is None else (*result, class_filter)
+            except (OSError, EOFError, ConnectionError, RuntimeError, ValueError) as e:
+                self._drop_remote(e)
 
         model = self.model_manager.segmentation_model
         if model is None:
             model = self.model_manager.load_segmentation_model()
+        class_filter = self._get_class_filter(cfg, model.names, 'segment')
 
         results = model(
             frame,
-            conf=self.settings.get('confidence_threshold', 0.5),
+            conf=class_filter.confidence,
+            imgsz=cfg.inference_imgsz,
+            classes=(list(class_filter.class_ids)
+                     if class_filter.class_ids is not None else None),
+            max_det=class_filter.max_detections or APP_CONST.MODEL_MAX_DET,
             verbose=False,
             device=self.model_manager.device
         )
 
         if results[0].masks is None:
-            return frame
-
-        # 마스크 오버레이
-        masks = results[0].masks.data.cpu().numpy()
-        overlay = frame.copy()
+            return None
+        _, conf, cls = self._boxes_to_arrays(results[0].boxes)
+        return results[0].masks.data.cpu().numpy(), conf, cls, class_filter
 
-        num_masks = len(masks)
-        colors = np.random.randint(0, 255, size=(num_masks, 3), dtype=np.uint8)
-
-        for i, mask in enumerate(masks):
-            mask_resized = cv2.resize(mask, (frame.shape[1], frame.shape[0]))
-            mask_bool = mask_resized > 0.5
-            overlay[mask_bool] = overlay[mask_bool] * 0.6 + colors[i] * 0.4
-
-        cv2.addWeighted(frame, 0.5, overlay, 0.5, 0, frame)
+    def apply_segmentation(self, frame: np.ndarray,
+                           cfg: Optional[SettingsSnapshot] = None) -> np.ndarray:
+        """Segmentation 적용"""
+        masks = self.predict_masks(frame, cfg)
+        if masks is not None:
+            DrawingUtils.draw_masks(frame, masks)
 
         return frame
@@ -0,0 +1,95 @@
+# ============================================================================
+# src/core/distance_estimator.py
+# 보정된 거리 추정 (클래스별 실제 폭 + 지면 평면, 벡터화)
+# ============================================================================
+
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+from ..config.camera import CameraProfile, KNOWN_OBJECT_WIDTHS, DEFAULT_OBJECT_WIDTH
+
+
+class DistanceEstimator:
+    """프레임 전체 박스를 한 번에 처리하는 거리 추정기
+
+    - 폭 기반: distance = 실제 폭(클래스별) * fx / 박스 폭(px)
+    - 지면 평면: 박스 하단 y → 행별 룩업 테이블 (CameraProfile.ground_distance)
+    """
+
+    def __init__(self, profile: Optional[CameraProfile] = None):
+        self._profile = profile or CameraProfile()
+        self._scaled: Dict[Tuple[int, int], CameraProfile] = {}
+        self._ground_luts: Dict[Tuple[int, int], np.ndarray] = {}
+        self._class_widths: Optional[np.ndarray] = None
+        self._class_names_id: Optional[int] = None
+
+    @property
+    def profile(self) -> CameraProfile:
+        """현재 카메라 프로파일"""
+        return self._profile
+
+    def set_profile(self, profile: CameraProfile) -> None:
+        """카메라 프로파일 변경 (캐시 초기화)"""
+        self._profile = profile
+        self._scaled.clear()
+        self._ground_luts.clear()
+
+    def scaled_profile(self, width: int, height: int) -> CameraProfile:
+        """해상도별 스케일된 프로파일 (캐시)"""
+        key = (width, height)
+        scaled = self._scaled.get(key)
+        if scaled is None:
+            scaled = self._profile.scaled(width, height)
+            self._scaled[key] = scaled
+        return scaled
+
+    def ground_lut(self, width: int, height: int) -> np.ndarray:
+        """행(y)별 지면 거리 (m), 지평선 위는 inf"""
+        key = (width, height)
+        lut = self._ground_luts.get(key)
+        if lut is None:
+            cam = self.scaled_profile(width, height)
+            lut = cam.ground_distance(np.arange(height, dtype=np.float64) + 0.5)
+            self._ground_luts[key] = lut
+        return lut
+
+    def class_widths(self, class_names: dict) -> np.ndarray:
+        """클래스 ID → 실제 폭 (m) 배열"""
+        if self._class_widths is None or self._class_names_id != id(class_names):
+            size = max(class_names) + 1 if class_names else 0
+            widths = np.full(size, DEFAULT_OBJECT_WIDTH, dtype=np.float64)
+            for cls_id, name in class_names.items():
+                widths[cls_id] = KNOWN_OBJECT_WIDTHS.get(name, DEFAULT_OBJECT_WIDTH)
+            self._class_widths = widths
+            self._class_names_id = id(class_names)
+        return self._class_widths
+
+    def estimate(self, xyxy: np.ndarray, class_ids: np.ndarray,
+                 class_names: dict, frame_shape: Tuple[int, ...],
+                 use_ground_plane: bool = False) -> np.ndarray:
+        """박스 배열 (N, 4) → 거리 배열 (N,)"""
+        if len(xyxy) == 0:
+            return np.empty(0, dtype=np.float64)
+
+        height, width = frame_shape[:2]
+        cam = self.scaled_profile(width, height)
+
+        # 폭 기반
+        known_widths = self.class_widths(class_names)[class_ids]
+        box_widths = (xyxy[:, 2] - xyxy[:, 0]).astype(np.float64)
+        with np.errstate(divide='ignore'):
+            distances = np.where(box_widths > 0,
+                                 known_widths * cam.focal_length_x / box_widths,
+                                 np.inf)
+
+        if not use_ground_plane:
+            return distances
+
+        # 지면 평면: 하단이 프레임에 잘리지 않은 박스만
+        bottoms = xyxy[:, 3].astype(np.int64)
+        valid = bottoms < height - 1
+        rows = np.clip(bottoms, 0, height - 1)
+        ground = self.ground_lut(width, height)[rows]
+        use_ground = valid & np.isfinite(ground)
+
+        return np.where(use_ground, ground, distances)
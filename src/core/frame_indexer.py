@@ -0,0 +1,115 @@
+# ============================================================================
+# src/core/frame_indexer.py
+# 키프레임 인덱스 생성 스레드 (디스크 캐시)
+# ============================================================================
+
+import cv2
+import numpy as np
+from PySide6.QtCore import QThread, Signal
+from typing import Callable, Optional
+
+from ..models.frame_index import FrameIndex
+from ..utils.cache import VideoCache
+from .resource_manager import ResourceManager
+
+
+class FrameIndexBuilder(QThread):
+    """키프레임 인덱스 백그라운드 생성기"""
+
+    index_ready = Signal(object)  # FrameIndex
+
+    CACHE_KIND = "frameindex"
+
+    def __init__(self, video_path: str):
+        super().__init__()
+        self.video_path = video_path
+
+    def run(self):
+        """스레드 실행"""
+        ResourceManager().pin('worker')
+        index = self.load_or_build(self.video_path, self.isInterruptionRequested)
+        if index is not None and not self.isInterruptionRequested():
+            self.index_ready.emit(index)
+
+    @classmethod
+    def load_cached(cls, video_path: str) -> Optional[FrameIndex]:
+        """캐시된 인덱스 로드 (없거나 키프레임 정보가 없으면 None)"""
+        if not VideoCache.is_cacheable(video_path):
+            return None
+
+        path = VideoCache.path_for(video_path, cls.CACHE_KIND)
+        if not path.exists():
+            return None
+
+        try:
+            index = FrameIndex.load(path, video_path)
+        except Exception as e:
+            print(f"프레임 인덱스 캐시 손상, 재생성: {e}")
+            return None
+
+        # 이전 버전이 저장한 키프레임 없는 인덱스는 다시 생성
+        return index if index.has_keyframes else None
+
+    @classmethod
+    def load_or_build(cls, video_path: str,
+                      should_stop: Callable[[], bool] = lambda: False
+                      ) -> Optional[FrameIndex]:
+        """캐시 로드, 없으면 생성 후 저장
+
+        키프레임을 얻지 못한 인덱스(raw 패킷 모드 미지원 백엔드 / 빌드)는
+        저장하지 않는다. OpenCV 가 바뀌면 다음 실행에서 다시 시도한다.
+        """
+        index = cls.load_cached(video_path)
+        if index is not None:
+            return index
+
+        index = cls.build(video_path, should_stop)
+        if (index is not None and index.has_keyframes and
+                VideoCache.is_cacheable(video_path)):
+            index.save(VideoCache.path_for(video_path, cls.CACHE_KIND))
+        return index
+
+    @staticmethod
+    def build(video_path: str,
+              should_stop: Callable[[], bool] = lambda: False
+              ) -> Optional[FrameIndex]:
+        """패킷 단위 스캔으로 인덱스 생성
+
+        FFmpeg 백엔드의 raw 모드(CAP_PROP_FORMAT=-1)에서는 디코딩 없이
+        패킷만 읽으므로 키프레임 플래그를 빠르게 얻을 수 있다.
+        지원되지 않으면 타임스탬프만 기록하고 키프레임은 비워둔다.
+        """
+        cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG)
+        if not cap.isOpened():
+            return None
+
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        key_prop = getattr(cv2, 'CAP_PROP_LRF_HAS_KEY_FRAME', None)
+        raw_mode = key_prop is not None and cap.set(cv2.CAP_PROP_FORMAT, -1)
+
+        keyframes = []
+        timestamps = []
+
+        try:
+            frame_number = 0
+            while cap.grab():
+                if should_stop():
+                    return None
+
+                timestamps.append(cap.get(cv2.CAP_PROP_POS_MSEC))
+                if raw_mode and cap.get(key_prop):
+                    keyframes.append(frame_number)
+                frame_number += 1
+        finally:
+            cap.release()
+
+        index = FrameIndex(
+            video_path=video_path,
+            total_frames=len(timestamps),
+            fps=fps,
+            keyframes=np.asarray(keyframes, dtype=np.int64),
+            timestamps_ms=np.asarray(timestamps, dtype=np.float64)
+        )
+        print(f"프레임 인덱스 생성: {index.total_frames} 프레임, "
+              f"키프레임 {len(keyframes)}개")
+        return index
@@ -0,0 +1,487 @@
+# ============================================================================
+# src/core/frame_source.py
+# 파일 디코딩 백엔드 (OpenCV / FFmpeg 파이프 / PyAV) 및 자동 측정
+# ============================================================================
+
+import shutil
+import subprocess
+import time
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+try:
+    import av
+except ImportError:  # PyAV 미설치
+    av = None
+
+from ..config.constants import APP_CONST
+from .resource_manager import ResourceManager
+
+Crop = Tuple[int, int, int, int]   # (x, y, w, h) 원본 픽셀 기준
+
+
+class FrameSource:
+    """파일 프레임 소스 공통 인터페이스
+
+    width 를 주면 분석 해상도로 줄여서 디코딩하고(높이는 비율 유지, 확대하지
+    않음), crop 을 주면 원본에서 그 영역만 잘라 낸 뒤 줄인다. read(buffer) 는
+    cv2.VideoCapture.read 처럼 크기가 맞는 버퍼를 주면 그 안에 채운다.
+    """
+
+    name = ""
+
+    def __init__(self, path: str, width: int = 0, crop: Optional[Crop] = None):
+        self.path = path
+        self.crop = crop
+        self.fps = 0.0
+        self.frame_count = 0
+        self.source_size = (0, 0)       # 원본 (width, height)
+        self.frame_size = (0, 0)        # 출력 (width, height)
+        self.position = 0               # 다음에 읽을 프레임 번호
+        self._target_width = width
+
+    @staticmethod
+    def is_available() -> bool:
+        return True
+
+    @staticmethod
+    def output_size(source_size: Tuple[int, int], width: int,
+                    crop: Optional[Crop]) -> Tuple[int, int]:
+        """원본 크기 / crop / 목표 폭 → 출력 크기 (줄일 때만 짝수로 맞춤)"""
+        src_w, src_h = crop[2:] if crop else source_size
+        if not 0 < width < src_w:
+            return src_w, src_h
+        height = max(2, round(src_h * width / src_w))
+        return width - width % 2, height - height % 2
+
+    @property
+    def scaled(self) -> bool:
+        return self.crop is not None or self.frame_size != self.source_size
+
+    def source_frame(self) -> Optional[np.ndarray]:
+        """마지막으로 읽은 프레임의 원본 해상도 이미지
+
+        축소하지 않았거나 백엔드가 원본을 남기지 않으면 None (다음 read 전까지 유효).
+        """
+        return None
+
+    def _set_metadata(self, fps: float, frame_count: int,
+                      source_size: Tuple[int, int]) -> None:
+        self.fps = fps or APP_CONST.DEFAULT_FPS
+        self.frame_count = frame_count
+        self.source_size = source_size
+        self.frame_size = self.output_size(source_size, self._target_width, self.crop)
+
+    def _output_buffer(self, buffer: Optional[np.ndarray]) -> np.ndarray:
+        """크기가 맞으면 주어진 버퍼, 아니면 새로 할당"""
+        shape = (self.frame_size[1], self.frame_size[0], 3)
+        if buffer is not None and buffer.shape == shape and buffer.dtype == np.uint8:
+            return buffer
+        return np.empty(shape, dtype=np.uint8)
+
+    def is_opened(self) -> bool:
+        raise NotImplementedError
+
+    def read(self, buffer: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        raise NotImplementedError
+
+    def grab(self) -> bool:
+        """프레임 하나 건너뛰기 (색변환 / 축소 생략)"""
+        raise NotImplementedError
+
+    def seek(self, frame_number: int) -> None:
+        raise NotImplementedError
+
+    def release(self) -> None:
+        raise NotImplementedError
+
+    # ------------------------------------------------------------------
+    # 백엔드 선택
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def backends() -> Dict[str, type]:
+        """이름 → 백엔드 클래스 (이 머신에서 쓸 수 있는 것만)"""
+        classes = (OpenCVFrameSource, FFmpegFrameSource, PyAVFrameSource)
+        return {cls.name: cls for cls in classes if cls.is_available()}
+
+    @staticmethod
+    def open(path: str, backend: str = 'auto', width: int = 0,
+             crop: Optional[Crop] = None) -> 'FrameSource':
+        """백엔드 이름('auto': 리소스 프로파일의 측정 결과, 없으면 opencv)으로 열기"""
+        if backend == 'auto':
+            backend = ResourceManager().profile.decode_backend or 'opencv'
+
+        available = FrameSource.backends()
+        if backend not in available:
+            print(f"⚠️  디코딩 백엔드 {backend} 를 사용할 수 없어 opencv 로 대체합니다")
+            backend = 'opencv'
+
+        source = available[backend](path, width, crop)
+        if backend != 'opencv' and not source.is_opened():
+            source.release()
+            print(f"⚠️  {backend} 로 열 수 없어 opencv 로 대체합니다")
+            source = OpenCVFrameSource(path, width, crop)
+        return source
+
+
+class OpenCVFrameSource(FrameSource):
+    """cv2.VideoCapture (축소 / crop 은 디코딩 후 cv2.resize)"""
+
+    name = 'opencv'
+
+    def __init__(self, path: str, width: int = 0, crop: Optional[Crop] = None):
+        super().__init__(path, width, crop)
+        self.cap = cv2.VideoCapture(path)
+        self._decoded: Optional[np.ndarray] = None
+        if self.cap.isOpened():
+            self._set_metadata(
+                self.cap.get(cv2.CAP_PROP_FPS),
+                int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+                (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                 int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+            )
+
+    def is_opened(self) -> bool:
+        return self.cap.isOpened()
+
+    def read(self, buffer: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        if not self.scaled:
+            ret, frame = self.cap.read(buffer)
+            if ret:
+                self.position += 1
+            return ret, frame if ret else None
+
+        # 원본 해상도 디코딩 버퍼는 재사용
+        ret, self._decoded = self.cap.read(self._decoded)
+        if not ret:
+            return False, None
+        self.position += 1
+
+        decoded = self._decoded
+        if self.crop is not None:
+            x, y, w, h = self.crop
+            decoded = decoded[y:y + h, x:x + w]
+        out = self._output_buffer(buffer)
+        cv2.resize(decoded, self.frame_size, dst=out, interpolation=cv2.INTER_AREA)
+        return True, out
+
+    def source_frame(self) -> Optional[np.ndarray]:
+        if self.crop is not None or not self.scaled:
+            return None
+        return self._decoded
+
+    def grab(self) -> bool:
+        if not self.cap.grab():
+            return False
+        self.position += 1
+        return True
+
+    def seek(self, frame_number: int) -> None:
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        self.position = frame_number
+
+    def release(self) -> None:
+        self.cap.release()
+
+
+class FFmpegFrameSource(FrameSource):
+    """ffmpeg 서브프로세스 → raw BGR 파이프
+
+    crop / 축소는 ffmpeg 의 멀티스레드 필터에서 처리하고, 파이프 출력은
+    호출자가 준 버퍼에 바로 읽어 들인다. Seek 은 해당 시각부터 프로세스를
+    다시 시작한다 (입력 측 -ss 는 키프레임에서 정확한 프레임까지 디코딩).
+    프로세스를 시작할 때 첫 프레임을 미리 읽어 두므로, ffmpeg 가 입력을 열지
+    못하면 is_opened() 가 False 가 되어 FrameSource.open 이 opencv 로 대체한다.
+    """
+
+    name = 'ffmpeg'
+
+    def __init__(self, path: str, width: int = 0, crop: Optional[Crop] = None):
+        super().__init__(path, width, crop)
+        self.process: Optional[subprocess.Popen] = None
+        self._scratch: Optional[np.ndarray] = None
+        self._pending: Optional[np.ndarray] = None   # 시작 시 미리 읽은 프레임
+
+        # 메타데이터는 OpenCV 로 읽음 (ffprobe 의존 없음)
+        cap = cv2.VideoCapture(path)
+        if cap.isOpened():
+            self._set_metadata(
+                cap.get(cv2.CAP_PROP_FPS),
+                int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+                (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                 int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+            )
+            if not self._start(0):
+                print(f"⚠️  ffmpeg 디코딩 시작 실패: {path}")
+        cap.release()
+
+    @staticmethod
+    def is_available() -> bool:
+        return shutil.which('ffmpeg') is not None
+
+    def _filters(self) -> str:
+        """crop → scale 필터 체인"""
+        filters = []
+        if self.crop is not None:
+            x, y, w, h = self.crop
+            filters.append(f"crop={w}:{h}:{x}:{y}")
+        if self.scaled:
+            width, height = self.frame_size
+            filters.append(f"scale={width}:{height}:flags=area")
+        return ','.join(filters)
+
+    def _start(self, frame_number: int) -> bool:
+        """frame_number 부터 디코딩하는 프로세스 시작 (첫 프레임을 못 읽으면 False)"""
+        self._stop()
+        cmd = ['ffmpeg', '-v', 'error', '-nostdin', '-threads', '0']
+        if frame_number > 0:
+            cmd += ['-ss', f'{frame_number / self.fps:.6f}']
+        cmd += ['-i', self.path, '-an', '-sn']
+        filters = self._filters()
+        if filters:
+            cmd += ['-vf', filters, '-filter_threads', '0']
+        cmd += ['-f', 'rawvideo', '-pix_fmt', 'bgr24', '-']
+
+        width, height = self.frame_size
+        try:
+            self.process = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                            bufsize=width * height * 3)
+        except OSError as e:
+            print(f"ffmpeg 실행 실패: {e}")
+            return False
+
+        # 프로세스가 떠도 입력을 못 열었을 수 있음 (오류는 ffmpeg stderr 로 출력)
+        pending = self._output_buffer(None)
+        if not self._read_into(pending):
+            self._stop()
+            return False
+        self._pending = pending
+        self.position = frame_number
+        return True
+
+    def _stop(self) -> None:
+        self._pending = None
+        if self.process is None:
+            return
+        self.process.stdout.close()
+        self.process.kill()
+        self.process.wait()
+        self.process = None
+
+    def _read_into(self, buffer: np.ndarray) -> bool:
+        """파이프에서 프레임 하나를 버퍼에 채움"""
+        view = memoryview(buffer).cast('B')
+        filled = 0
+        while filled < len(view):
+            count = self.process.stdout.readinto(view[filled:])
+            if not count:
+                return False
+            filled += count
+        self.position += 1
+        return True
+
+    def is_opened(self) -> bool:
+        return self.process is not None
+
+    def _take_pending(self) -> Optional[np.ndarray]:
+        """시작 시 미리 읽은 프레임 (있으면 한 번만)"""
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            self.position += 1
+        return pending
+
+    def read(self, buffer: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        if self.process is None:
+            return False, None
+        pending = self._take_pending()
+        if pending is not None:
+            out = self._output_buffer(buffer)
+            if out is buffer:
+                np.copyto(out, pending)
+                return True, out
+            return True, pending
+
+        out = self._output_buffer(buffer)
+        if not self._read_into(out):
+            return False, None
+        return True, out
+
+    def grab(self) -> bool:
+        if self.process is None:
+            return False
+        if self._take_pending() is not None:
+            return True
+        self._scratch = self._output_buffer(self._scratch)
+        return self._read_into(self._scratch)
+
+    def seek(self, frame_number: int) -> None:
+        self._start(frame_number)
+
+    def release(self) -> None:
+        self._stop()
+
+
+class PyAVFrameSource(FrameSource):
+    """PyAV (libav* 바인딩, 프레임 / 슬라이스 스레드 디코딩)
+
+    축소는 swscale 로 색변환과 함께 처리한다.
+    """
+
+    name = 'pyav'
+
+    def __init__(self, path: str, width: int = 0, crop: Optional[Crop] = None):
+        super().__init__(path, width, crop)
+        self.container = None
+        self.stream = None
+        self._frames = None
+        self._last = None
+        try:
+            self.container = av.open(path)
+            self.stream = self.container.streams.video[0]
+            self.stream.thread_type = 'AUTO'
+        except (av.error.FFmpegError, OSError, IndexError) as e:
+            print(f"PyAV 열기 실패: {e}")
+            self.release()
+            return
+
+        rate = self.stream.average_rate
+        context = self.stream.codec_context
+        self._set_metadata(float(rate) if rate else 0.0, self.stream.frames,
+                           (context.width, context.height))
+        self._frames = self.container.decode(self.stream)
+
+    @staticmethod
+    def is_available() -> bool:
+        return av is not None
+
+    def _next_frame(self):
+        """다음 디코딩 프레임 (끝이면 None)"""
+        try:
+            frame = next(self._frames)
+        except (StopIteration, av.error.FFmpegError):
+            return None
+        self.position += 1
+        return frame
+
+    def is_opened(self) -> bool:
+        return self._frames is not None
+
+    def read(self, buffer: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        if self._frames is None:
+            return False, None
+        frame = self._next_frame()
+        self._last = frame
+        if frame is None:
+            return False, None
+
+        out = self._output_buffer(buffer)
+        if self.crop is None:
+            width, height = self.frame_size
+            np.copyto(out, frame.to_ndarray(format='bgr24', width=width, height=height))
+        else:
+            x, y, w, h = self.crop
+            decoded = frame.to_ndarray(format='bgr24')[y:y + h, x:x + w]
+            cv2.resize(decoded, self.frame_size, dst=out, interpolation=cv2.INTER_AREA)
+        return True, out
+
+    def source_frame(self) -> Optional[np.ndarray]:
+        # 원본 해상도 색변환은 요청할 때만
+        if self._last is None or self.crop is not None or not self.scaled:
+            return None
+        return self._last.to_ndarray(format='bgr24')
+
+    def grab(self) -> bool:
+        self._last = None
+        return self._frames is not None and self._next_frame() is not None
+
+    def seek(self, frame_number: int) -> None:
+        """앞쪽 키프레임으로 이동 후 목표 프레임 직전까지 버림"""
+        if self._frames is None:
+            return
+        target_sec = frame_number / self.fps
+        self.container.seek(int(target_sec / self.stream.time_base),
+                            stream=self.stream, backward=True)
+
+        frames = self.container.decode(self.stream)
+        self._frames = iter(())
+        try:
+            for frame in frames:
+                if frame.time is None or frame.time >= target_sec - 0.5 / self.fps:
+                    # 목표 프레임은 다음 read 에서 돌려줌
+                    self._frames = self._chain(frame, frames)
+                    break
+        except av.error.FFmpegError as e:
+            print(f"PyAV Seek 실패: {e}")
+        self.position = frame_number
+
+    @staticmethod
+    def _chain(first, rest):
+        yield first
+        yield from rest
+
+    def release(self) -> None:
+        if self.container is not None:
+            self.container.close()
+            self.container = None
+        self._frames = None
+
+
+class DecodeBenchmark:
+    """디코딩 백엔드 자동 측정
+
+    쓸 수 있는 백엔드마다 같은 파일을 분석 해상도로 frames 장 읽어 (버퍼 재사용)
+    초당 프레임 수를 재고 가장 빠른 것을 고른다.
+    """
+
+    def __init__(self, path: str, width: int = 0, frames: int = 150, warmup: int = 10):
+        self.path = path
+        self.width = width
+        self.frames = frames
+        self.warmup = warmup
+
+    def measure(self, backend: str) -> float:
+        """백엔드 처리량 (프레임/초, 열 수 없으면 0)"""
+        source = FrameSource.backends()[backend](self.path, self.width)
+        try:
+            if not source.is_opened():
+                return 0.0
+
+            buffer = None
+            for _ in range(self.warmup):
+                ret, buffer = source.read(buffer)
+                if not ret:
+                    return 0.0
+
+            count = 0
+            start = time.perf_counter()
+            while count < self.frames:
+                ret, buffer = source.read(buffer)
+                if not ret:
+                    break
+                count += 1
+            elapsed = time.perf_counter() - start
+        finally:
+            source.release()
+
+        return count / elapsed if elapsed > 0 else 0.0
+
+    def run(self) -> Optional[str]:
+        """전체 백엔드 측정 → 가장 빠른 백엔드 이름 (모두 실패하면 None)"""
+        results: List[Tuple[float, str]] = []
+        for backend in FrameSource.backends():
+            fps = self.measure(backend)
+            results.append((fps, backend))
+            print(f"  {fps:8.1f} FPS  {backend}")
+
+        best_fps, best = max(results)
+        if best_fps <= 0:
+            return None
+
+        baseline = dict((name, fps) for fps, name in results).get('opencv', 0.0)
+        speedup = (f", opencv 대비 {best_fps / baseline:.2f}x"
+                   if best != 'opencv' and baseline > 0 else "")
+        print(f"✅ 선택: {best} ({best_fps:.1f} FPS{speedup})")
+        return best
@@ -0,0 +1,69 @@
+# ============================================================================
+# src/core/imgsz_tuner.py
+# 프레임 지연 기반 추론 입력 크기(imgsz) 자동 조절
+# ============================================================================
+
+from typing import Optional, Tuple
+
+from ..config.constants import APP_CONST
+from ..utils.performance import PerformanceMonitor
+
+
+class ImgszTuner:
+    """목표 FPS 를 맞추도록 imgsz 를 한 단계씩 조절 (히스테리시스)
+
+    평활 지연이 프레임 예산을 넘으면 한 단계 낮추고, 한 단계 올렸을 때의
+    예상 지연(면적 비례)이 예산 × headroom 이하일 때만 올린다. 두 경계 사이에서는
+    유지하므로 단계 사이를 오가며 진동하지 않는다.
+    """
+
+    def __init__(self, steps: Tuple[int, ...] = APP_CONST.IMGSZ_STEPS,
+                 initial: int = APP_CONST.DEFAULT_IMGSZ,
+                 headroom: float = 0.8,
+                 min_samples: int = 15):
+        self.steps = tuple(sorted(steps))
+        self.headroom = headroom
+        self.min_samples = min_samples
+        self._index = self._nearest_index(initial)
+
+    @property
+    def imgsz(self) -> int:
+        """현재 입력 크기"""
+        return self.steps[self._index]
+
+    def _nearest_index(self, imgsz: int) -> int:
+        """가장 가까운 단계 인덱스"""
+        return min(range(len(self.steps)),
+                   key=lambda i: abs(self.steps[i] - imgsz))
+
+    def reset(self, imgsz: Optional[int] = None) -> None:
+        """시작 크기 재설정 (수동 설정값 기준)"""
+        if imgsz is not None:
+            self._index = self._nearest_index(imgsz)
+
+    def update(self, monitor: PerformanceMonitor, target_fps: float) -> bool:
+        """측정된 지연으로 단계 조정 → 변경 여부
+
+        변경 후에는 monitor 의 지연 측정을 초기화해 새 크기의 지연이
+        min_samples 만큼 쌓일 때까지 판단을 보류한다.
+        """
+        if target_fps <= 0 or monitor.latency_samples < self.min_samples:
+            return False
+
+        budget_ms = 1000.0 / target_fps
+        latency = monitor.latency_ms
+        index = self._index
+
+        if latency > budget_ms and index > 0:
+            index -= 1
+        elif index < len(self.steps) - 1:
+            scale = self.steps[index + 1] / self.steps[index]
+            if latency * scale * scale <= budget_ms * self.headroom:
+                index += 1
+
+        if index == self._index:
+            return False
+
+        self._index = index
+        monitor.reset_latency()
+        return True
@@ -0,0 +1,148 @@
+# ============================================================================
+# src/core/inference_client.py
+# 로컬 추론 서버 클라이언트 (DetectionEngine 원격 백엔드)
+# ============================================================================
+
+import ipaddress
+import threading
+from multiprocessing.connection import Client, Connection
+from typing import Dict, List, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+from ..config.constants import APP_CONST
+from .inference_protocol import InferenceKey, WireCodec
+
+Boxes = Tuple[np.ndarray, np.ndarray, np.ndarray]  # (xyxy, conf, cls)
+
+
+class ServerAddress:
+    """서버 주소 문자열 변환 ('unix:/tmp/yolo.sock', '127.0.0.1:5055')"""
+
+    @staticmethod
+    def parse(address: str) -> Tuple[Union[str, Tuple[str, int]], str]:
+        """→ (multiprocessing.connection 주소, family)"""
+        if address.startswith("unix:"):
+            return address[len("unix:"):], 'AF_UNIX'
+
+        host, _, port = address.rpartition(':')
+        if not host or not port.isdigit():
+            raise ValueError(f"잘못된 서버 주소: {address} (예: 127.0.0.1:5055, unix:/tmp/yolo.sock)")
+        return (host, int(port)), 'AF_INET'
+
+    @staticmethod
+    def is_loopback(address: str) -> bool:
+        """같은 컴퓨터에서만 접속 가능한 주소인지 (unix 소켓 / 127.x / ::1 / localhost)"""
+        target, family = ServerAddress.parse(address)
+        if family == 'AF_UNIX':
+            return True
+        host = target[0].strip('[]')
+        if host == 'localhost':
+            return True
+        try:
+            return ipaddress.ip_address(host).is_loopback
+        except ValueError:
+            return False  # 호스트 이름 (외부 인터페이스일 수 있음)
+
+
+class InferenceClient:
+    """추론 서버 연결 (스레드 안전, 요청은 연결당 한 번에 하나)
+
+    전송량을 줄이기 위해 프레임을 모델 입력 크기(imgsz)로 먼저 축소해 보내고,
+    돌려받은 박스를 원본 좌표로 되돌린다. 모델은 어차피 imgsz 로 축소하므로
+    결과는 로컬 추론과 같다. 프레임 / 결과는 WireCodec (JSON 헤더 + 배열
+    원시 바이트)으로 주고받는다.
+    """
+
+    def __init__(self, address: str = APP_CONST.INFERENCE_SERVER_ADDRESS,
+                 authkey: Optional[bytes] = None,
+                 slo_ms: Optional[float] = None):
+        self.address = address
+        target, family = ServerAddress.parse(address)
+        self._conn: Connection = Client(target, family=family,
+                                        authkey=authkey or InferenceKey.load())
+        self._lock = threading.Lock()
+        self._request_id = 0
+
+        try:
+            info, _ = self._call('info', slo_ms=slo_ms)  # 서버 스트림 지연 목표
+        except BaseException:
+            self._conn.close()
+            raise
+        self.names: Dict[int, str] = {int(k): v for k, v in info['names'].items()}
+        self.device: str = info['device']
+
+    def _call(self, kind: str, arrays: List[np.ndarray] = (),
+              **params) -> Tuple[object, List[np.ndarray]]:
+        """요청 전송 후 응답 대기 → (결과 헤더 값, 배열 목록)"""
+        with self._lock:
+            self._request_id += 1
+            self._conn.send_bytes(WireCodec.encode(
+                {'id': self._request_id, 'kind': kind, 'params': params}, arrays
+            ))
+            header, payload = WireCodec.decode(
+                self._conn.recv_bytes(APP_CONST.INFERENCE_MAX_MESSAGE_BYTES)
+            )
+
+        if header.get('id') != self._request_id:
+            raise ConnectionError(f"응답 순서 오류: {header.get('id')} != {self._request_id}")
+        if not header.get('ok'):
+            raise RuntimeError(f"추론 서버 오류: {header.get('error')}")
+        return header.get('result'), payload
+
+    @staticmethod
+    def _shrink(frame: np.ndarray, imgsz: int) -> Tuple[np.ndarray, float]:
+        """긴 변을 imgsz 로 축소 → (프레임, 원본 대비 배율)"""
+        height, width = frame.shape[:2]
+        scale = imgsz / max(height, width)
+        if scale >= 1.0:
+            return frame, 1.0
+
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA), scale
+
+    def detect(self, frames: List[np.ndarray], conf: float, imgsz: int,
+               classes: Optional[Tuple[int, ...]] = None,
+               max_det: int = 0) -> List[Boxes]:
+        """프레임 목록 탐지 → 프레임별 (xyxy, conf, cls) (classes: 허용 클래스 ID)"""
+        shrunk = [self._shrink(frame, imgsz) for frame in frames]
+        _, arrays = self._call('detect', [f for f, _ in shrunk],
+                               conf=conf, imgsz=imgsz,
+                               classes=list(classes) if classes is not None else None,
+                               max_det=max_det)
+
+        # 프레임마다 (xyxy, conf, cls) 3 개씩
+        boxes = []
+        for i, (_, scale) in enumerate(shrunk):
+            xyxy, confs, cls = arrays[3 * i:3 * i + 3]
+            if scale != 1.0:
+                xyxy = xyxy / scale
+            boxes.append((xyxy.astype(np.float32), confs, cls))
+        return boxes
+
+    def segment(self, frame: np.ndarray, conf: float, imgsz: int,
+                classes: Optional[Tuple[int, ...]] = None, max_det: int = 0
+                ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Segmentation → (모델 해상도 마스크 (N, h, w) float32, conf, cls), 없으면 None"""
+        shrunk, _ = self._shrink(frame, imgsz)
+        result, arrays = self._call('segment', [shrunk], conf=conf, imgsz=imgsz,
+                                    classes=list(classes) if classes is not None else None,
+                                    max_det=max_det)
+        if not result['present'][0]:
+            return None
+        masks, confs, cls = arrays
+        return masks, confs, cls
+
+    def metrics(self) -> dict:
+        """서버 지표 (지연 / 큐 깊이 / 배치 크기)"""
+        return self._call('metrics')[0]
+
+    def stream_stats(self) -> dict:
+        """연결(스트림)별 처리량 / SLO 통계"""
+        return {int(k): v for k, v in self._call('streams')[0].items()}
+
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,128 @@
+# ============================================================================
+# src/core/inference_protocol.py
+# 추론 서버 인증 키 / 메시지 형식 (pickle 없이 헤더 + ndarray 원시 바이트)
+# ============================================================================
+
+import json
+import os
+import secrets
+import stat
+import struct
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from ..config.constants import APP_CONST
+
+
+class InferenceKey:
+    """설치별 추론 서버 인증 키
+
+    환경 변수(APP_CONST.INFERENCE_KEY_ENV)가 있으면 그 값을 쓰고, 없으면
+    사용자 설정 디렉터리의 키 파일(0600)을 읽는다. 파일이 없으면 무작위
+    키를 만들어 저장한다. 다른 컴퓨터의 클라이언트는 같은 키를 환경 변수로
+    넘겨받아야 한다.
+    """
+
+    @staticmethod
+    def path() -> Path:
+        return Path(APP_CONST.INFERENCE_KEY_FILE).expanduser()
+
+    @staticmethod
+    def load() -> bytes:
+        """인증 키 (없으면 생성)"""
+        value = os.environ.get(APP_CONST.INFERENCE_KEY_ENV, "").strip()
+        if value:
+            return value.encode('utf-8')
+
+        path = InferenceKey.path()
+        try:
+            return InferenceKey._read(path)
+        except FileNotFoundError:
+            pass
+
+        path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        key = secrets.token_hex(32)
+        try:
+            # O_EXCL: 동시에 두 프로세스가 만들면 먼저 만든 쪽 키 사용
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            return InferenceKey._read(path)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(key)
+        print(f"🔑 추론 서버 키 생성: {path}")
+        return key.encode('utf-8')
+
+    @staticmethod
+    def _read(path: Path) -> bytes:
+        """키 파일 읽기 (다른 사용자가 읽을 수 있으면 권한을 0600 으로 줄임)"""
+        mode = stat.S_IMODE(path.stat().st_mode)
+        if os.name == 'posix' and mode & 0o077:
+            print(f"⚠️  추론 서버 키 권한 {oct(mode)} → 0600: {path}")
+            os.chmod(path, 0o600)
+
+        key = path.read_text(encoding='utf-8').strip()
+        if not key:
+            raise ValueError(f"빈 추론 서버 키 파일: {path}")
+        return key.encode('utf-8')
+
+
+class WireCodec:
+    """메시지 = [헤더 길이 u32][JSON 헤더][배열 원시 바이트 ...]
+
+    헤더의 'arrays' 에 배열별 dtype / shape 를 적고, 받는 쪽은 허용된 dtype
+    인지와 바이트 수가 맞는지 확인한 뒤 np.frombuffer 로 복사 없이 읽는다.
+    임의 객체를 복원하는 pickle 을 쓰지 않으므로 인증된 연결이라도 수신
+    데이터로 코드가 실행되지 않는다.
+    """
+
+    DTYPES = frozenset(('uint8', 'bool', 'int32', 'int64', 'float32', 'float64'))
+    _LENGTH = struct.Struct('>I')
+
+    @staticmethod
+    def encode(header: dict, arrays: Sequence[np.ndarray] = ()) -> bytes:
+        arrays = [np.ascontiguousarray(a) for a in arrays]
+        for a in arrays:
+            if a.dtype.name not in WireCodec.DTYPES:
+                raise ValueError(f"전송할 수 없는 배열 형식: {a.dtype}")
+
+        header = dict(header, arrays=[[a.dtype.name, list(a.shape)] for a in arrays])
+        encoded = json.dumps(header, ensure_ascii=False).encode('utf-8')
+        return b"".join([WireCodec._LENGTH.pack(len(encoded)), encoded] +
+                        [a.tobytes() for a in arrays])
+
+    @staticmethod
+    def decode(data: bytes) -> Tuple[dict, List[np.ndarray]]:
+        """바이트 → (헤더, 배열 목록) - 형식이 맞지 않으면 ValueError"""
+        view = memoryview(data)
+        if len(view) < WireCodec._LENGTH.size:
+            raise ValueError("메시지가 너무 짧습니다")
+        (length,) = WireCodec._LENGTH.unpack_from(view)
+        offset = WireCodec._LENGTH.size + length
+        if offset > len(view):
+            raise ValueError("헤더 길이가 메시지보다 깁니다")
+
+        header = json.loads(bytes(view[WireCodec._LENGTH.size:offset]).decode('utf-8'))
+        if not isinstance(header, dict):
+            raise ValueError("헤더는 JSON 객체여야 합니다")
+
+        arrays = []
+        for spec in header.pop('arrays', []):
+            dtype_name, shape = spec
+            if dtype_name not in WireCodec.DTYPES:
+                raise ValueError(f"허용되지 않는 배열 형식: {dtype_name}")
+            shape = tuple(int(n) for n in shape)
+            if any(n < 0 for n in shape):
+                raise ValueError(f"잘못된 배열 크기: {shape}")
+            dtype = np.dtype(dtype_name)
+            size = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+            if offset + size > len(view):
+                raise ValueError("배열 데이터가 부족합니다")
+            arrays.append(np.frombuffer(view[offset:offset + size],
+                                        dtype=dtype).reshape(shape))
+            offset += size
+
+        if offset != len(view):
+            raise ValueError("메시지 끝에 남는 데이터가 있습니다")
+        return header, arrays
@@ -0,0 +1,258 @@
+# ============================================================================
+# src/core/inference_server.py
+# 로컬 추론 서버 (모델 공유 + 동적 배치)
+# ============================================================================
+
+import threading
+from concurrent.futures import CancelledError, Future
+from dataclasses import asdict
+from multiprocessing.connection import Connection, Listener
+from typing import List, Optional
+
+import numpy as np
+
+from ..config.constants import APP_CONST
+from ..models.stats import ServerMetrics
+from .batch_scheduler import MicroBatchScheduler
+from .inference_client import ServerAddress
+from .inference_protocol import InferenceKey, WireCodec
+from .model_manager import ModelManager
+
+
+class _ClientConnection:
+    """클라이언트 연결 (응답 전송 직렬화)"""
+
+    def __init__(self, conn: Connection, client_id: int):
+        self.conn = conn
+        self.client_id = client_id
+        self.lock = threading.Lock()
+
+    def reply(self, request_id: int, result=None,
+              arrays: List[np.ndarray] = ()) -> None:
+        self._send({'id': request_id, 'ok': True, 'result': result}, arrays)
+
+    def fail(self, request_id: int, error: str) -> None:
+        self._send({'id': request_id, 'ok': False, 'error': error})
+
+    def _send(self, header: dict, arrays: List[np.ndarray] = ()) -> None:
+        try:
+            data = WireCodec.encode(header, arrays)
+            with self.lock:
+                self.conn.send_bytes(data)
+        except (OSError, EOFError):
+            pass  # 클라이언트 종료
+
+
+class InferenceServer:
+    """로컬 추론 서버
+
+    모델을 한 번만 로드해 여러 뷰어 / 배치 작업이 공유한다. 연결마다 수신
+    스레드가 요청을 MicroBatchScheduler 에 넣고(연결 = 스트림), 스케줄러가
+    종류와 파라미터가 같은 요청을 max_wait_ms / max_batch 안에서 묶어 한 번에
+    추론한다. 부하가 낮으면 바로 처리되고 높을수록 배치가 커진다.
+
+    연결은 설치별 키(InferenceKey)로 인증하고, 메시지는 pickle 대신
+    WireCodec 으로 주고받는다. 루프백이 아닌 주소는 allow_remote 일 때만 연다.
+    """
+
+    LISTEN_BACKLOG = 64    # 기본값(1)이면 동시 접속 시 연결이 유실됨
+
+    def __init__(self, address: str = APP_CONST.INFERENCE_SERVER_ADDRESS,
+                 max_batch: int = APP_CONST.INFERENCE_MAX_BATCH,
+                 max_wait_ms: float = APP_CONST.INFERENCE_MAX_WAIT_MS,
+                 authkey: Optional[bytes] = None,
+                 allow_remote: bool = False):
+        if not allow_remote and not ServerAddress.is_loopback(address):
+            raise ValueError(f"루프백이 아닌 주소에서는 열 수 없습니다: {address} "
+                             f"(다른 컴퓨터에서 접속하려면 --allow-remote)")
+        self.address = address
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.authkey = authkey or InferenceKey.load()
+
+        self.model_manager = ModelManager()
+        self.scheduler = MicroBatchScheduler(self._run_batch, max_batch,
+                                             max_wait_ms)
+
+        self._running = False
+        self._stopped = threading.Event()
+        self._listener: Optional[Listener] = None
+        self._next_client_id = 0
+
+    # ------------------------------------------------------------------
+    # 실행 / 종료
+    # ------------------------------------------------------------------
+
+    def serve_forever(self) -> None:
+        """배치 스케줄러 / 연결 수락 시작 후 shutdown() 까지 대기"""
+        target, family = ServerAddress.parse(self.address)
+        self._listener = Listener(target, family=family,
+                                  backlog=self.LISTEN_BACKLOG,
+                                  authkey=self.authkey)
+        self._running = True
+
+        # 첫 요청 지연을 없애도록 미리 로드
+        self.model_manager.load_detection_model()
+
+        self.scheduler.start()
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        print(f"🧠 추론 서버 시작: {self.address} "
+              f"(배치 ≤{self.max_batch}, 대기 ≤{self.max_wait * 1000:.0f}ms, "
+              f"{self.model_manager.device})")
+
+        try:
+            while not self._stopped.wait(0.5):
+                pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """서버 종료"""
+        self._running = False
+        self._stopped.set()
+        self.scheduler.stop()
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+
+    def _accept_loop(self) -> None:
+        """연결 수락 → 연결별 수신 스레드"""
+        while self._running:
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError):
+                if not self._running:
+                    return
+                continue  # 인증 실패 등
+            except Exception as e:
+                print(f"연결 수락 실패: {e}")
+                continue
+
+            self._next_client_id += 1
+            client = _ClientConnection(conn, self._next_client_id)
+            threading.Thread(target=self._receive_loop, args=(client,),
+                             daemon=True).start()
+
+    def _receive_loop(self, client: _ClientConnection) -> None:
+        """클라이언트 요청 수신 (연결 하나 = 스케줄러 스트림 하나)"""
+        stream_id = client.client_id
+        self.scheduler.register_stream(stream_id)
+
+        try:
+            while self._running:
+                data = client.conn.recv_bytes(APP_CONST.INFERENCE_MAX_MESSAGE_BYTES)
+                try:
+                    header, frames = WireCodec.decode(data)
+                    request_id = int(header['id'])
+                    kind = header['kind']
+                    params = header.get('params') or {}
+                except (ValueError, KeyError, TypeError) as e:
+                    print(f"⚠️  잘못된 요청, 연결 종료 (클라이언트 {stream_id}): {e}")
+                    break
+
+                if kind == 'info':
+                    # 클라이언트가 알려준 지연 목표로 스트림 SLO 설정
+                    self.scheduler.register_stream(stream_id, params.get('slo_ms'))
+                    model = self.model_manager.load_detection_model()
+                    client.reply(request_id, {
+                        'names': {str(k): v for k, v in model.names.items()},
+                        'device': self.model_manager.device,
+                    })
+                elif kind == 'metrics':
+                    client.reply(request_id, asdict(self.metrics()))
+                elif kind == 'streams':
+                    client.reply(request_id, {
+                        str(sid): asdict(stats)
+                        for sid, stats in self.scheduler.stream_stats().items()
+                    })
+                elif kind in ('detect', 'segment'):
+                    try:
+                        key = self._batch_key(kind, params)
+                    except (ValueError, KeyError, TypeError) as e:
+                        client.fail(request_id, f"잘못된 파라미터: {e}")
+                        continue
+                    future = self.scheduler.submit(stream_id, frames, key=key)
+                    future.add_done_callback(
+                        lambda f, rid=request_id, k=kind: self._reply(client, rid, k, f)
+                    )
+                else:
+                    client.fail(request_id, f"알 수 없는 요청: {kind}")
+        except (OSError, EOFError):
+            pass
+        except RuntimeError:
+            pass  # 서버 종료 중 (스케줄러 정지)
+        finally:
+            client.conn.close()
+            self.scheduler.unregister_stream(stream_id)
+
+    @staticmethod
+    def _batch_key(kind: str, params: dict) -> tuple:
+        """요청 파라미터 → 배치 키 (JSON 값 형식 검증)"""
+        classes = params.get('classes')
+        if classes is not None:
+            classes = tuple(int(c) for c in classes)
+        return (kind, float(params['conf']), int(params['imgsz']),
+                classes, int(params.get('max_det') or 0))
+
+    @staticmethod
+    def _reply(client: _ClientConnection, request_id: int, kind: str,
+               future: Future) -> None:
+        """배치 결과 → 클라이언트 응답 (배열은 원시 바이트로)"""
+        try:
+            results = future.result()
+        except CancelledError:
+            return  # 연결 종료로 취소된 요청
+        except Exception as e:
+            client.fail(request_id, str(e))
+            return
+
+        if kind == 'segment':
+            # 마스크가 있는 프레임마다 (마스크, conf, cls) 3 개씩
+            client.reply(request_id, {'present': [r is not None for r in results]},
+                         [a for r in results if r is not None for a in r])
+        else:
+            client.reply(request_id, {'frames': len(results)},
+                         [a for boxes in results for a in boxes])
+
+    # ------------------------------------------------------------------
+    # 배치 추론 (스케줄러 스레드)
+    # ------------------------------------------------------------------
+
+    def _run_batch(self, frames: List[np.ndarray], key: tuple) -> list:
+        """배치 추론 → 프레임별 응답 payload"""
+        kind, conf, imgsz, classes, max_det = key
+        if kind == 'segment':
+            model = self.model_manager.load_segmentation_model()
+        else:
+            model = self.model_manager.load_detection_model()
+
+        results = model(
+            frames,
+            conf=conf,
+            imgsz=imgsz,
+            classes=list(classes) if classes is not None else None,
+            max_det=max_det or APP_CONST.MODEL_MAX_DET,
+            verbose=False,
+            device=self.model_manager.device
+        )
+
+        if kind == 'segment':
+            return [None if r.masks is None else
+                    (r.masks.data.cpu().numpy().astype(np.float32),
+                     r.boxes.conf.cpu().numpy().reshape(-1).astype(np.float32),
+                     r.boxes.cls.cpu().numpy().reshape(-1).astype(np.int64))
+                    for r in results]
+        return [
+            (r.boxes.xyxy.cpu().numpy().reshape(-1, 4).astype(np.float32),
+             r.boxes.conf.cpu().numpy().reshape(-1).astype(np.float32),
+             r.boxes.cls.cpu().numpy().reshape(-1).astype(np.int64))
+            for r in results
+        ]
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> ServerMetrics:
+        """현재 지표 (배치 스케줄러 집계)"""
+        return self.scheduler.metrics()
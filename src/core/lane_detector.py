@@ -7,8 +7,11 @@ import cv2
 import numpy as np
 from typing import Optional, Tuple
 
+from ..config.camera import CameraProfile
 from ..models.detection import LaneLines
+from ..utils.buffer_pool import BufferPool
 from ..utils.geometry import GeometryUtils
+from .birdseye import BirdEyeView
 
 
 class LaneDetector:
@@ -19,6 +22,11 @@ class LaneDetector:
         self._roi_vertices: Optional[np.ndarray] = None
         self._frame_shape: Optional[Tuple[int, int]] = None
 
+        # 전처리 작업 버퍼 (해상도별 풀에서 대여, 프레임마다 재사용)
+        self._pool = BufferPool()
+        self._gray: Optional[np.ndarray] = None
+        self._edges: Optional[np.ndarray] = None
+
         # 설정값
         self.canny_low = 50
         self.canny_high = 150
@@ -28,20 +36,33 @@ class LaneDetector:
         self.hough_max_line_gap = 150
         self.min_slope = 0.5
 
+        # 버드아이 모드
+        self.use_birdseye = False
+        self.birdseye = BirdEyeView()
+        self.max_lane_offset = 3.0    # 자차 기준 좌/우 차선 탐색 범위 (m)
+        self.max_lateral_slope = 0.3  # 버드아이에서 허용하는 차선 기울기 (dX/dZ)
+
+    def set_camera_profile(self, profile: CameraProfile) -> None:
+        """버드아이 변환용 카메라 프로파일 설정"""
+        self.birdseye.set_profile(profile)
+
     def detect(self, frame: np.ndarray) -> LaneLines:
         """차선 감지"""
+        if self.use_birdseye:
+            return self._detect_birdseye(frame)
+
         # ROI 마스크 초기화 (프레임 크기 변경 시)
         if (self._frame_shape is None or
                 self._frame_shape != frame.shape[:2]):
             self._initialize_roi(frame.shape)
 
-        # 전처리
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        blur = cv2.GaussianBlur(gray, (5, 5), 0)
-        edges = cv2.Canny(blur, self.canny_low, self.canny_high)
+        # 전처리 (작업 버퍼에 in-place)
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        cv2.GaussianBlur(gray, (5, 5), 0, dst=gray)
+        edges = cv2.Canny(gray, self.canny_low, self.canny_high, edges=self._edges)
 
         # ROI 적용
-        masked_edges = cv2.bitwise_and(edges, self._roi_mask)
+        masked_edges = cv2.bitwise_and(edges, self._roi_mask, dst=edges)
 
         # Hough Line Transform
         lines = cv2.HoughLinesP(
@@ -66,6 +87,95 @@ class LaneDetector:
 
         return LaneLines(left_lane=left_lane, right_lane=right_lane)
 
+    def _detect_birdseye(self, frame: np.ndarray) -> LaneLines:
+        """버드아이 영상에서 차선 감지 (미터 단위 오프셋)
+
+        ROI 를 작은 노면 격자로 remap 한 뒤 처리하므로 전체 프레임 Canny 보다
+        가볍고, 차선이 거의 수직선이 되어 좌/우 분리가 단순하다.
+        """
+        height, width = frame.shape[:2]
+        bev = self.birdseye.warp(frame)
+
+        gray = cv2.cvtColor(bev, cv2.COLOR_BGR2GRAY)
+        blur = cv2.GaussianBlur(gray, (5, 5), 0)
+        edges = cv2.Canny(blur, self.canny_low, self.canny_high)
+
+        ppm = self.birdseye.pixels_per_meter
+        lines = cv2.HoughLinesP(
+            edges,
+            rho=1,
+            theta=np.pi / 180,
+            threshold=20,
+            minLineLength=int(2 * ppm),
+            maxLineGap=int(3 * ppm)
+        )
+
+        if lines is None:
+            return LaneLines()
+
+        segments = lines.reshape(-1, 4).astype(np.float64)
+        x1, y1, x2, y2 = segments.T
+
+        # 노면 좌표로 변환 후 거의 평행한(종방향) 선분만 사용
+        lat1, fwd1 = self.birdseye.to_ground(x1, y1)
+        lat2, fwd2 = self.birdseye.to_ground(x2, y2)
+        along = np.abs(fwd2 - fwd1)
+        across = np.abs(lat2 - lat1)
+        longitudinal = across <= along * self.max_lateral_slope
+
+        mid = (lat1 + lat2) / 2
+        left = longitudinal & (mid < 0) & (mid > -self.max_lane_offset)
+        right = longitudinal & (mid > 0) & (mid < self.max_lane_offset)
+
+        left_fit = self._fit_ground_line(lat1[left], fwd1[left], lat2[left], fwd2[left])
+        right_fit = self._fit_ground_line(lat1[right], fwd1[right], lat2[right], fwd2[right])
+
+        # 이미지 좌표 차선 (기존 표시 방식: 하단 ~ ROI 상단)
+        cam = self.birdseye.camera(width, height)
+        fwd_bottom, fwd_top = cam.ground_distance(
+            np.array([height - 0.5, height * 0.6]))
+        if not np.isfinite(fwd_bottom):
+            return LaneLines()
+        fwd_top = min(fwd_top, self.birdseye.far)
+
+        lanes = LaneLines(
+            left_lane=self._project_lane(left_fit, fwd_bottom, fwd_top, width, height),
+            right_lane=self._project_lane(right_fit, fwd_bottom, fwd_top, width, height)
+        )
+
+        # 미터 단위 오프셋 (기준: 버드아이 최근접 거리)
+        if left_fit is not None and right_fit is not None:
+            near = self.birdseye.near
+            left_x = np.polyval(left_fit, near)
+            right_x = np.polyval(right_fit, near)
+            lanes.offset_m = float(-(left_x + right_x) / 2)
+            lanes.lane_width_m = float(right_x - left_x)
+
+        return lanes
+
+    @staticmethod
+    def _fit_ground_line(lat1: np.ndarray, fwd1: np.ndarray,
+                         lat2: np.ndarray, fwd2: np.ndarray) -> Optional[np.ndarray]:
+        """선분 끝점들로 X = a*Z + b 피팅"""
+        if len(lat1) == 0:
+            return None
+        forward = np.concatenate([fwd1, fwd2])
+        lateral = np.concatenate([lat1, lat2])
+        if np.ptp(forward) < 1e-6:
+            return None
+        return np.polyfit(forward, lateral, 1)
+
+    def _project_lane(self, fit: Optional[np.ndarray],
+                      fwd_bottom: float, fwd_top: float,
+                      width: int, height: int) -> Optional[Tuple[int, int, int, int]]:
+        """노면 차선 → 이미지 선분 (x1, y1, x2, y2)"""
+        if fit is None:
+            return None
+        forward = np.array([fwd_bottom, fwd_top])
+        lateral = np.polyval(fit, forward)
+        u, v = self.birdseye.to_image(lateral, forward, width, height)
+        return (int(u[0]), int(v[0]), int(u[1]), int(v[1]))
+
     def _initialize_roi(self, shape: Tuple[int, ...]) -> None:
         """ROI 초기화"""
         height, width = shape[:2]
@@ -74,6 +184,18 @@ class LaneDetector:
         self._roi_vertices = GeometryUtils.create_roi_vertices(width, height)
         self._roi_mask = GeometryUtils.create_roi_mask(shape, self._roi_vertices)
 
+        # 해상도가 바뀌면 작업 버퍼 교체
+        self.release_buffers()
+        self._gray = self._pool.acquire((height, width))
+        self._edges = self._pool.acquire((height, width))
+
+    def release_buffers(self) -> None:
+        """작업 버퍼 풀에 반환"""
+        for buffer in (self._gray, self._edges):
+            self._pool.release(buffer)
+        self._gray = None
+        self._edges = None
+
     def _separate_lanes(self, lines: np.ndarray) -> Tuple[list, list]:
         """좌/우 차선 분리"""
         left_lines = []
@@ -102,3 +224,4 @@ class LaneDetector:
         self._roi_mask = None
         self._roi_vertices = None
         self._frame_shape = None
+        self.release_buffers()
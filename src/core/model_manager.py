@@ -75,6 +75,15 @@ class ModelManager:
 
         return self._segmentation_model
 
+    def create_detection_model(self) -> YOLO:
+        """공유하지 않는 별도 Detection 모델 (백그라운드 작업용)"""
+        model = YOLO(self.detection_model_name)
+
+        if self._device.startswith('cuda'):
+            model.to(self._device)
+
+        return model
+
     def unload_models(self) -> None:
         """모델 언로드 (메모리 해제)"""
         self._detection_model = None
@@ -0,0 +1,74 @@
+# ============================================================================
+# src/core/motion_gate.py
+# 프레임 차분 기반 정지 장면 판별 (추론 스킵)
+# ============================================================================
+
+import cv2
+import numpy as np
+from typing import Optional, Tuple
+
+
+class MotionGate:
+    """저해상도 프레임 차분으로 정지 장면 판별
+
+    마지막으로 추론한 프레임(기준 프레임)과 비교하므로 천천히 변하는
+    장면에서도 차이가 누적되어 결국 재추론된다.
+    """
+
+    def __init__(self, threshold: float = 1.5,
+                 max_consecutive_skips: int = 15,
+                 size: Tuple[int, int] = (64, 36)):
+        self.threshold = threshold
+        self.max_consecutive_skips = max_consecutive_skips
+        self.size = size
+
+        self._reference: Optional[np.ndarray] = None
+        self._consecutive_skips = 0
+        self.last_score = 0.0
+
+        # 통계
+        self.total_frames = 0
+        self.skipped_frames = 0
+
+    @property
+    def skip_ratio(self) -> float:
+        """추론을 건너뛴 프레임 비율"""
+        if self.total_frames == 0:
+            return 0.0
+        return self.skipped_frames / self.total_frames
+
+    def is_static(self, frame: np.ndarray) -> bool:
+        """기준 프레임 대비 변화가 임계값 미만인지"""
+        small = cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        self.total_frames += 1
+
+        if self._reference is None:
+            self._reference = gray
+            return False
+
+        # 평균 절대 차이 (0~255)
+        self.last_score = cv2.norm(gray, self._reference, cv2.NORM_L1) / gray.size
+
+        if (self.last_score < self.threshold and
+                self._consecutive_skips < self.max_consecutive_skips):
+            self._consecutive_skips += 1
+            self.skipped_frames += 1
+            return True
+
+        # 추론 수행 → 기준 프레임 갱신
+        self._reference = gray
+        self._consecutive_skips = 0
+        return False
+
+    def invalidate(self) -> None:
+        """기준 프레임 무효화 (다음 프레임은 반드시 추론)"""
+        self._reference = None
+        self._consecutive_skips = 0
+
+    def reset(self) -> None:
+        """초기화 (통계 포함)"""
+        self.invalidate()
+        self.last_score = 0.0
+        self.total_frames = 0
+        self.skipped_frames = 0
@@ -0,0 +1,102 @@
+# ============================================================================
+# src/core/object_tracker.py
+# IoU 기반 경량 객체 추적 (체류 시간 집계용)
+# ============================================================================
+
+from typing import Dict, List
+
+import numpy as np
+
+from ..config.constants import APP_CONST
+from ..models.detection import Detection, Track
+from ..utils.geometry import GeometryUtils
+
+
+class IoUTracker:
+    """프레임 간 IoU 탐욕 매칭 추적
+
+    같은 클래스끼리 IoU 가 큰 쌍부터 이어 붙인다. max_missed 프레임 동안
+    매칭되지 않은 트랙은 종료되어 update() 반환값으로 넘어간다. 외형 특징 없이
+    박스만 쓰므로 가림 / 교차 시 ID 가 바뀔 수 있지만, 누적 통계에는 충분하다.
+    """
+
+    def __init__(self, iou_threshold: float = APP_CONST.TRACK_IOU_THRESHOLD,
+                 max_missed: int = APP_CONST.TRACK_MAX_MISSED):
+        self.iou_threshold = iou_threshold
+        self.max_missed = max_missed
+        self._tracks: Dict[int, Track] = {}
+        self._next_id = 0
+
+    @property
+    def active_tracks(self) -> List[Track]:
+        return list(self._tracks.values())
+
+    def update(self, detections: List[Detection], timestamp: float) -> List[Track]:
+        """탐지 결과 반영 → 종료된 트랙"""
+        tracks = list(self._tracks.values())
+        matched_tracks = set()
+        matched_detections = set()
+
+        if tracks and detections:
+            iou = GeometryUtils.iou_matrix(
+                np.stack([t.bbox for t in tracks]),
+                np.stack([d.bbox for d in detections])
+            )
+            # 다른 클래스끼리는 매칭하지 않음
+            same_class = (np.array([t.class_name for t in tracks])[:, None] ==
+                          np.array([d.class_name for d in detections])[None, :])
+            iou[~same_class] = 0.0
+
+            # IoU 큰 쌍부터 탐욕 매칭
+            for flat in np.argsort(-iou, axis=None):
+                ti, di = np.unravel_index(flat, iou.shape)
+                if iou[ti, di] < self.iou_threshold:
+                    break
+                if ti in matched_tracks or di in matched_detections:
+                    continue
+                matched_tracks.add(ti)
+                matched_detections.add(di)
+
+                track, detection = tracks[ti], detections[di]
+                track.bbox = np.asarray(detection.bbox, dtype=np.float64)
+                track.last_seen = timestamp
+                track.hits += 1
+                track.missed = 0
+                track.dangerous |= detection.hazard
+
+        # 놓친 트랙 → 일정 프레임 지나면 종료
+        finished = []
+        for ti, track in enumerate(tracks):
+            if ti in matched_tracks:
+                continue
+            track.missed += 1
+            if track.missed > self.max_missed:
+                finished.append(self._tracks.pop(track.track_id))
+
+        # 매칭되지 않은 탐지 → 새 트랙
+        for di, detection in enumerate(detections):
+            if di in matched_detections:
+                continue
+            self._next_id += 1
+            track = Track(
+                track_id=self._next_id,
+                class_name=detection.class_name,
+                bbox=np.asarray(detection.bbox, dtype=np.float64),
+                first_seen=timestamp,
+                last_seen=timestamp,
+                dangerous=detection.hazard,
+            )
+            self._tracks[track.track_id] = track
+
+        return finished
+
+    def flush(self) -> List[Track]:
+        """진행 중인 트랙 모두 종료 (영상 끝 / seek)"""
+        finished = list(self._tracks.values())
+        self._tracks.clear()
+        return finished
+
+    def reset(self) -> None:
+        """초기화"""
+        self._tracks.clear()
+        self._next_id = 0
@@ -0,0 +1,232 @@
+# ============================================================================
+# src/core/resource_manager.py
+# 스레드 수 / CPU 친화도 적용 및 자동 측정
+# ============================================================================
+
+import os
+import threading
+import time
+from dataclasses import replace
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+import torch
+
+from ..config.resources import ResourceProfile
+from .model_manager import ModelManager
+
+
+class ResourceManager:
+    """리소스 프로파일 적용 (싱글톤)
+
+    스레드 수는 프로세스 전체에 적용되고, 친화도는 각 스레드가 시작할 때
+    pin(단계) 로 자기 자신에게 적용한다 (Linux sched_setaffinity(0) 은 호출한
+    스레드만 바꾼다). torch intra-op 풀은 처음 추론하는 스레드에서 만들어지므로
+    추론 스레드의 친화도를 물려받는다.
+    """
+
+    STAGES = ('inference', 'worker', 'gui')
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._profile = ResourceProfile()
+        self._lock = threading.Lock()
+        self._interop_applied = False
+
+        # 프로파일 값이 '기본값'일 때 되돌릴 원래 값
+        self._default_torch_threads = torch.get_num_threads()
+        self._default_opencv_threads = cv2.getNumThreads()
+        self._all_cpus = self.available_cpus()
+        self._initialized = True
+
+    @property
+    def profile(self) -> ResourceProfile:
+        """현재 적용된 프로파일"""
+        return self._profile
+
+    @property
+    def cpus(self) -> Tuple[int, ...]:
+        """시작 시점에 쓸 수 있던 CPU 목록 (친화도 지정 전)"""
+        return self._all_cpus
+
+    @staticmethod
+    def available_cpus() -> Tuple[int, ...]:
+        """호출 스레드가 지금 쓸 수 있는 CPU 목록"""
+        if hasattr(os, 'sched_getaffinity'):
+            return tuple(sorted(os.sched_getaffinity(0)))
+        return tuple(range(os.cpu_count() or 1))
+
+    @staticmethod
+    def supports_affinity() -> bool:
+        """스레드 친화도 지정 가능 여부 (Linux)"""
+        return hasattr(os, 'sched_setaffinity')
+
+    def apply(self, profile: ResourceProfile, pin_gui: bool = True) -> None:
+        """스레드 수 적용 (pin_gui: 호출 스레드를 GUI 단계로 고정)"""
+        with self._lock:
+            self._profile = profile
+
+            torch.set_num_threads(profile.torch_threads or self._default_torch_threads)
+
+            if profile.torch_interop_threads > 0 and not self._interop_applied:
+                try:
+                    torch.set_num_interop_threads(profile.torch_interop_threads)
+                    self._interop_applied = True
+                except RuntimeError as e:
+                    # 병렬 작업이 이미 시작된 뒤에는 바꿀 수 없음
+                    print(f"⚠️  torch inter-op 스레드 설정 실패: {e}")
+
+            if profile.opencv_threads >= 0:
+                cv2.setNumThreads(profile.opencv_threads)
+            else:
+                cv2.setNumThreads(self._default_opencv_threads)
+
+        if profile.has_affinity and not self.supports_affinity():
+            print("⚠️  이 플랫폼은 CPU 친화도 지정을 지원하지 않습니다 (스레드 수만 적용)")
+
+        if pin_gui:
+            self.pin('gui')
+
+    def pin(self, stage: str) -> None:
+        """호출 스레드를 단계별 CPU 에 고정 (지정 없으면 전체 CPU)"""
+        if not self.supports_affinity():
+            return
+
+        cpus = self._profile.cpus_for(stage) or self._all_cpus
+        try:
+            os.sched_setaffinity(0, cpus)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  CPU 친화도 설정 실패 ({stage}: {cpus}): {e}")
+
+    def load(self, name: str) -> Optional[ResourceProfile]:
+        """'auto' 또는 저장된 프로파일 이름 → 프로파일 (없으면 None)"""
+        if name == 'auto':
+            return ResourceProfile.auto(self._all_cpus)
+
+        path = ResourceProfile.path_for(name)
+        if not path.is_file():
+            return None
+        try:
+            return ResourceProfile.load(path)
+        except (OSError, ValueError, TypeError) as e:
+            print(f"리소스 프로파일 로드 실패: {e}")
+            return None
+
+
+class ResourceProbe:
+    """스레드 / 친화도 분할 자동 측정
+
+    후보마다 실제 처리 스레드 작업(차선용 OpenCV 연산 + YOLO 추론, 선택적으로
+    Segmentation)을 반복하면서, 보조 스레드에서 인코딩 부하(축소 + JPEG)를
+    같이 돌려 프레임당 처리 시간 중앙값을 잰다. 가장 빠른 후보를 고른다.
+    """
+
+    def __init__(self, iterations: int = 15, warmup: int = 3,
+                 frame_size: Tuple[int, int] = (1280, 720),
+                 imgsz: int = 640, segmentation: bool = False):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.imgsz = imgsz
+        self.segmentation = segmentation
+        self.resources = ResourceManager()
+        self.model_manager = ModelManager()
+
+        width, height = frame_size
+        rng = np.random.default_rng(0)
+        self.frame = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+    def candidates(self) -> List[ResourceProfile]:
+        """측정할 후보 (라이브러리 기본값 + 예약 코어 / OpenCV 스레드 조합)"""
+        cpus = self.resources.cpus
+        count = len(cpus)
+        candidates = [ResourceProfile(name="library-default")]
+
+        for reserved in (0, 1, 2):
+            inference = count - reserved
+            if inference < 2 or (reserved and count < 4):
+                continue
+            for opencv_threads in (1, 2):
+                candidates.append(ResourceProfile(
+                    name=f"reserve{reserved}-cv{opencv_threads}",
+                    torch_threads=inference,
+                    opencv_threads=opencv_threads,
+                    inference_cpus=cpus[reserved:] if reserved else (),
+                    worker_cpus=cpus[:reserved],
+                    gui_cpus=cpus[:1] if reserved else (),
+                ))
+        return candidates
+
+    def _process(self, detector, segmenter) -> None:
+        """처리 스레드 1 프레임 작업"""
+        gray = cv2.cvtColor(self.frame, cv2.COLOR_BGR2GRAY)
+        blur = cv2.GaussianBlur(gray, (5, 5), 0)
+        cv2.Canny(blur, 50, 150)
+
+        detector(self.frame, imgsz=self.imgsz, verbose=False,
+                 device=self.model_manager.device)
+        if segmenter is not None:
+            segmenter(self.frame, imgsz=self.imgsz, verbose=False,
+                      device=self.model_manager.device)
+
+    def _encode_load(self, stop: threading.Event) -> None:
+        """보조 스레드 부하 (내보내기 / 스트리밍 인코딩)"""
+        self.resources.pin('worker')
+        height, width = self.frame.shape[:2]
+        size = (width // 2, height // 2)
+        while not stop.is_set():
+            small = cv2.resize(self.frame, size, interpolation=cv2.INTER_AREA)
+            cv2.imencode('.jpg', small)
+
+    def measure(self, profile: ResourceProfile) -> float:
+        """후보 적용 후 프레임당 처리 시간 중앙값 (ms)"""
+        self.resources.apply(profile, pin_gui=False)
+        self.resources.pin('inference')
+
+        detector = self.model_manager.load_detection_model()
+        segmenter = (self.model_manager.load_segmentation_model()
+                     if self.segmentation else None)
+
+        stop = threading.Event()
+        load = threading.Thread(target=self._encode_load, args=(stop,), daemon=True)
+        load.start()
+
+        timings = []
+        try:
+            for i in range(self.warmup + self.iterations):
+                start = time.perf_counter()
+                self._process(detector, segmenter)
+                if i >= self.warmup:
+                    timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            stop.set()
+            load.join()
+
+        return float(np.median(timings))
+
+    def run(self) -> ResourceProfile:
+        """전체 후보 측정 → 가장 빠른 프로파일 (이름 'default', 적용된 상태)"""
+        results = []
+        for profile in self.candidates():
+            elapsed_ms = self.measure(profile)
+            results.append((elapsed_ms, profile))
+            print(f"  {elapsed_ms:7.1f} ms  {profile.describe()}")
+
+        best_ms, best = min(results, key=lambda item: item[0])
+        baseline_ms = results[0][0]
+        print(f"✅ 선택: {best.name} ({best_ms:.1f} ms, 기본값 대비 "
+              f"{baseline_ms / best_ms:.2f}x)")
+
+        best = replace(best, name='default')
+        self.resources.apply(best)
+        return best
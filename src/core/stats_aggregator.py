@@ -0,0 +1,217 @@
+# ============================================================================
+# src/core/stats_aggregator.py
+# 영상 전체 누적 통계 (프레임 결과를 보관하지 않는 스트리밍 집계)
+# ============================================================================
+
+import json
+import threading
+from collections import defaultdict
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..config.constants import APP_CONST
+from ..models.detection import Detection, LaneLines, Track
+from ..models.stats import DetectionStats, VideoSummary
+from ..utils.streaming_stats import RunningMoments, TDigest
+from .object_tracker import IoUTracker
+
+
+class _EpisodeCounter:
+    """참/거짓 상태가 이어지는 구간의 횟수 / 길이 누적"""
+
+    def __init__(self):
+        self.durations = RunningMoments()
+        self._start: Optional[float] = None
+
+    def update(self, active: bool, timestamp: float) -> None:
+        if active and self._start is None:
+            self._start = timestamp
+        elif not active and self._start is not None:
+            self.durations.add(timestamp - self._start)
+            self._start = None
+
+    def close(self, timestamp: float) -> None:
+        """진행 중인 구간 종료 (영상 끝 / seek)"""
+        self.update(False, timestamp)
+
+    def totals(self, timestamp: float) -> tuple:
+        """(구간 수, 총 길이, 최대 길이) - 진행 중인 구간 포함"""
+        events, total, longest = self.durations.count, self.durations.total, 0.0
+        if self.durations.count:
+            longest = self.durations.max
+        if self._start is not None:
+            current = timestamp - self._start
+            events += 1
+            total += current
+            longest = max(longest, current)
+        return events, total, longest
+
+
+class StatsAggregator:
+    """영상 전체 누적 통계 (스레드 안전)
+
+    처리 스레드가 프레임마다 update() 하고, GUI 는 summary() 로 읽는다.
+    클래스별 탐지 수, 추적 기반 고유 객체 수 / 체류 시간, 위험 / 차선 이탈
+    구간, FPS / 처리 지연 분위수를 Welford 누적과 t-digest 로 유지하므로
+    메모리는 영상 길이와 무관하다 (진행 중인 트랙 수에만 비례).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.tracker = IoUTracker()
+        self.reset()
+
+    def reset(self) -> None:
+        """초기화 (새 소스 로드)"""
+        with self._lock:
+            self.tracker.reset()
+            self._frames = 0
+            self._first_timestamp: Optional[float] = None
+            self._last_timestamp = 0.0
+            self._span = 0.0    # seek 으로 끊긴 구간들의 누적 길이
+
+            self._track_counts: Dict[str, int] = defaultdict(int)
+            self._detection_counts: Dict[str, int] = defaultdict(int)
+            self._raw_boxes = 0
+            self._dropped_boxes: Dict[str, int] = defaultdict(int)
+            self._dwell: Dict[str, RunningMoments] = defaultdict(RunningMoments)
+            self._dwell_digest: Dict[str, TDigest] = defaultdict(TDigest)
+            self._dangerous_tracks = 0
+
+            self._danger = _EpisodeCounter()
+            self._departure = _EpisodeCounter()
+
+            self._fps = RunningMoments()
+            self._fps_digest = TDigest()
+            self._latency = RunningMoments()
+            self._latency_digest = TDigest()
+
+    def update(self, detections: List[Detection], lanes: LaneLines,
+               stats: DetectionStats, frame_width: int, timestamp: float) -> None:
+        """처리된 프레임 1개 반영 (timestamp: 영상 시각, 초)"""
+        departing = lanes.is_departing(
+            frame_width,
+            offset_threshold_px=APP_CONST.LANE_OFFSET_THRESHOLD,
+            offset_threshold_m=APP_CONST.LANE_OFFSET_THRESHOLD_M
+        )
+
+        with self._lock:
+            if self._first_timestamp is None:
+                self._first_timestamp = timestamp
+            self._last_timestamp = timestamp
+            self._frames += 1
+
+            for detection in detections:
+                self._detection_counts[detection.class_name] += 1
+            if not stats.inference_skipped:
+                self._raw_boxes += stats.raw_boxes
+                for stage, count in stats.dropped_boxes.items():
+                    self._dropped_boxes[stage] += count
+            for track in self.tracker.update(detections, timestamp):
+                self._finish_track(track)
+
+            self._danger.update(stats.dangerous_objects > 0, timestamp)
+            self._departure.update(departing, timestamp)
+
+            if stats.fps > 0:
+                self._fps.add(stats.fps)
+                self._fps_digest.add(stats.fps)
+            self._latency.add(stats.processing_time)
+            self._latency_digest.add(stats.processing_time)
+
+    def _finish_track(self, track: Track) -> None:
+        """종료된 트랙 집계 (짧은 트랙은 오탐으로 보고 제외)"""
+        if track.hits < APP_CONST.TRACK_MIN_HITS:
+            return
+        self._track_counts[track.class_name] += 1
+        self._dwell[track.class_name].add(track.dwell_sec)
+        self._dwell_digest[track.class_name].add(track.dwell_sec)
+        if track.dangerous:
+            self._dangerous_tracks += 1
+
+    def _close_segment(self) -> None:
+        """진행 중인 트랙 / 구간을 마지막 시각에서 종료"""
+        for track in self.tracker.flush():
+            self._finish_track(track)
+        self._danger.close(self._last_timestamp)
+        self._departure.close(self._last_timestamp)
+
+        if self._first_timestamp is not None:
+            self._span += self._last_timestamp - self._first_timestamp
+            self._first_timestamp = None
+
+    def mark_discontinuity(self) -> None:
+        """seek - 시각이 이어지지 않으므로 추적 / 구간을 끊음"""
+        with self._lock:
+            self._close_segment()
+
+    def finish(self, source: str = "") -> VideoSummary:
+        """영상 끝 - 진행 중인 트랙 / 구간을 닫고 최종 요약"""
+        with self._lock:
+            self._close_segment()
+        return self.summary(source)
+
+    def summary(self, source: str = "") -> VideoSummary:
+        """현재까지의 요약 (진행 중인 확정 트랙 / 구간 포함)"""
+        with self._lock:
+            track_counts = dict(self._track_counts)
+            for track in self.tracker.active_tracks:
+                if track.hits >= APP_CONST.TRACK_MIN_HITS:
+                    track_counts[track.class_name] = track_counts.get(track.class_name, 0) + 1
+
+            duration = self._span
+            if self._first_timestamp is not None:
+                duration += self._last_timestamp - self._first_timestamp
+
+            danger_events, danger_sec, _ = self._danger.totals(self._last_timestamp)
+            departure_events, departure_sec, departure_max = \
+                self._departure.totals(self._last_timestamp)
+
+            return VideoSummary(
+                source=source,
+                frames=self._frames,
+                duration_sec=duration,
+                track_counts=track_counts,
+                detection_counts=dict(self._detection_counts),
+                dwell_sec={
+                    name: {
+                        'mean': moments.mean,
+                        'p50': self._dwell_digest[name].quantile(0.5),
+                        'p95': self._dwell_digest[name].quantile(0.95),
+                        'max': moments.max,
+                    }
+                    for name, moments in self._dwell.items()
+                },
+                dangerous_tracks=self._dangerous_tracks,
+                danger_events=danger_events,
+                danger_sec=danger_sec,
+                departure_events=departure_events,
+                departure_sec=departure_sec,
+                departure_max_sec=departure_max,
+                fps_mean=self._fps.mean,
+                fps_p5=self._fps_digest.quantile(0.05),
+                latency_mean_ms=self._latency.mean,
+                latency_p50_ms=self._latency_digest.quantile(0.5),
+                latency_p95_ms=self._latency_digest.quantile(0.95),
+                latency_p99_ms=self._latency_digest.quantile(0.99),
+                latency_max_ms=self._latency.max if self._latency.count else 0.0,
+                raw_boxes=self._raw_boxes,
+                dropped_boxes=dict(self._dropped_boxes),
+            )
+
+    @staticmethod
+    def report_path(source: str) -> Path:
+        """소스 → 요약 리포트 경로 (reports/<이름>_summary.json)"""
+        stem = Path(source).stem if source else "stream"
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in stem)
+        return Path(APP_CONST.REPORT_DIR) / f"{safe or 'stream'}_summary.json"
+
+    @staticmethod
+    def save_report(summary: VideoSummary, path: Path) -> Path:
+        """요약 JSON 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(asdict(summary), indent=2, ensure_ascii=False),
+                        encoding='utf-8')
+        return path
@@ -0,0 +1,215 @@
+# ============================================================================
+# src/core/stream_reader.py
+# 라이브 스트림 수신 스레드 (최신 프레임만 전달, 자동 재연결)
+# ============================================================================
+
+import time
+import threading
+from dataclasses import replace
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+from PySide6.QtCore import QThread, Signal
+
+from ..config.constants import APP_CONST
+from ..models.stats import StreamStats
+from ..utils.performance import PerformanceMonitor
+from ..utils.video_source import VideoSource
+from ..utils.buffer_pool import BufferPool
+from .resource_manager import ResourceManager
+from .frame_source import FrameSource
+
+
+class StreamReader(QThread):
+    """RTSP/HTTP/카메라 수신 스레드
+
+    소스 속도로 grab() 을 계속 호출해 백엔드 버퍼를 비우고, 소비자가
+    read() 로 요청한 경우에만 가장 최근에 grab 한 프레임을 retrieve() 한다.
+    처리가 느려도 밀린 프레임을 순서대로 처리하지 않으므로 지연이 쌓이지 않는다.
+    연결이 끊기면 지수 백오프로 재연결한다.
+    width 를 주면 retrieve 직후 분석 해상도로 한 번 줄여서 전달한다.
+    """
+
+    connection_changed = Signal(bool)
+
+    def __init__(self, source: str, width: int = 0,
+                 reconnect_min_sec: float = APP_CONST.STREAM_RECONNECT_MIN_SEC,
+                 reconnect_max_sec: float = APP_CONST.STREAM_RECONNECT_MAX_SEC):
+        super().__init__()
+        self.source = source
+        self.width = width
+        self.reconnect_min_sec = reconnect_min_sec
+        self.reconnect_max_sec = reconnect_max_sec
+
+        # 소스 정보 (연결 후 갱신)
+        self.fps = 0.0
+        self.frame_size: Tuple[int, int] = (0, 0)
+
+        self._cond = threading.Condition()
+        self._stats = StreamStats()
+        self._wanted = False
+        self._frame: Optional[np.ndarray] = None
+        self._frame_time = 0.0
+        self._fps_monitor = PerformanceMonitor()
+
+        # retrieve() 출력 버퍼 재사용 (소비자가 release 하면 풀로 돌아옴)
+        self._pool = BufferPool()
+        self._frame_shape: Optional[Tuple[int, ...]] = None
+        self._decoded: Optional[np.ndarray] = None     # 축소 전 원본 (재사용)
+
+    @property
+    def stats(self) -> StreamStats:
+        """수신 통계 (복사본)"""
+        with self._cond:
+            return replace(self._stats)
+
+    @property
+    def is_connected(self) -> bool:
+        return self._stats.connected
+
+    def read(self, timeout_ms: int = 1000) -> Tuple[bool, Optional[np.ndarray]]:
+        """다음에 수신되는 최신 프레임 대기 (연결 끊김 / 타임아웃 시 False)"""
+        start = time.perf_counter()
+        deadline = start + timeout_ms / 1000.0
+
+        with self._cond:
+            stale, self._frame = self._frame, None
+            self._wanted = True
+            self._pool.release(stale)
+
+            while self._frame is None and not self.isInterruptionRequested():
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            frame = self._frame
+            self._frame = None
+            self._wanted = False
+
+            if frame is None:
+                return False, None
+
+            now = time.perf_counter()
+            self._stats.frames_delivered += 1
+            self._stats.frame_age_ms = (now - self._frame_time) * 1000
+            self._stats.read_wait_ms = (now - start) * 1000
+            return True, frame
+
+    def stop(self) -> None:
+        """수신 중단 (대기 중인 read() 도 깨움)"""
+        self.requestInterruption()
+        with self._cond:
+            self._cond.notify_all()
+        self.wait()
+
+    def run(self):
+        """연결 → 수신 → 끊기면 백오프 후 재연결"""
+        ResourceManager().pin('worker')
+        backoff = self.reconnect_min_sec
+        first_attempt = True
+
+        while not self.isInterruptionRequested():
+            if not first_attempt:
+                print(f"스트림 재연결 대기 {backoff:.1f}s: "
+                      f"{VideoSource.display_name(self.source)}")
+                self._sleep(backoff)
+                backoff = min(backoff * 2, self.reconnect_max_sec)
+                if self.isInterruptionRequested():
+                    break
+                with self._cond:
+                    self._stats.reconnects += 1
+            first_attempt = False
+
+            cap = VideoSource.open_capture(self.source)
+            if not cap.isOpened():
+                cap.release()
+                continue
+
+            self.fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+            self.frame_size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                               int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+            self._set_connected(True)
+
+            received = self._receive(cap)
+            cap.release()
+            self._set_connected(False)
+
+            # 한 프레임이라도 받았으면 정상 연결이었으므로 백오프 초기화
+            if received:
+                backoff = self.reconnect_min_sec
+
+    def _receive(self, cap: cv2.VideoCapture) -> int:
+        """grab 루프 → 수신한 프레임 수"""
+        received = 0
+        self._fps_monitor.reset()
+
+        while not self.isInterruptionRequested():
+            if not cap.grab():
+                break
+
+            grab_time = time.perf_counter()
+            received += 1
+            capture_fps = self._fps_monitor.update_fps()
+
+            with self._cond:
+                self._stats.frames_grabbed += 1
+                self._stats.capture_fps = capture_fps
+                wanted = self._wanted
+
+            # 요청이 있을 때만 디코딩 결과 변환 (버려지는 프레임은 grab 만)
+            if not wanted:
+                continue
+
+            frame = self._retrieve(cap)
+            if frame is None:
+                continue
+
+            with self._cond:
+                stale, self._frame = self._frame, frame
+                self._frame_time = grab_time
+                self._cond.notify_all()
+            self._pool.release(stale)  # 소비자가 가져가기 전에 교체된 프레임
+
+        return received
+
+    def _retrieve(self, cap: cv2.VideoCapture) -> Optional[np.ndarray]:
+        """grab 한 프레임 변환 → 풀 버퍼 (분석 폭이 원본보다 작으면 축소)"""
+        height, width = self.frame_size[1], self.frame_size[0]
+        if not 0 < self.width < width:
+            buffer = self._pool.acquire(self._frame_shape) if self._frame_shape else None
+            ret, frame = cap.retrieve(buffer)
+            if not ret:
+                self._pool.release(buffer)
+                return None
+            if frame is not buffer:
+                # 첫 프레임 / 해상도 변경 → OpenCV 가 새로 할당
+                self._pool.release(buffer)
+                self._frame_shape = frame.shape
+            return frame
+
+        ret, self._decoded = cap.retrieve(self._decoded)
+        if not ret:
+            return None
+        size = FrameSource.output_size((width, height), self.width, None)
+        frame = self._pool.acquire((size[1], size[0], 3))
+        cv2.resize(self._decoded, size, dst=frame, interpolation=cv2.INTER_AREA)
+        return frame
+
+    def _set_connected(self, connected: bool) -> None:
+        """연결 상태 변경 통지"""
+        with self._cond:
+            changed = self._stats.connected != connected
+            self._stats.connected = connected
+            if not connected:
+                self._cond.notify_all()
+
+        if changed:
+            self.connection_changed.emit(connected)
+
+    def _sleep(self, seconds: float) -> None:
+        """중단 요청을 확인하며 대기"""
+        end = time.perf_counter() + seconds
+        while not self.isInterruptionRequested() and time.perf_counter() < end:
+            self.msleep(50)
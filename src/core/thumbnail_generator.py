@@ -0,0 +1,147 @@
+# ============================================================================
+# src/core/thumbnail_generator.py
+# 썸네일 스프라이트 생성 스레드 (디스크 캐시)
+# ============================================================================
+
+import cv2
+import math
+import numpy as np
+from PySide6.QtCore import QThread, Signal
+from typing import Callable, Optional
+
+from ..config.constants import APP_CONST
+from ..models.frame_index import FrameIndex
+from ..models.thumbnails import ThumbnailStrip
+from ..utils.cache import VideoCache
+from .resource_manager import ResourceManager
+
+
+class ThumbnailGenerator(QThread):
+    """썸네일 스프라이트 백그라운드 생성기 (디코더/모델과 독립)"""
+
+    thumbnails_ready = Signal(object)  # ThumbnailStrip
+
+    CACHE_KIND = "thumbs"
+    CACHE_VERSION = 2           # 2: 키프레임이 아닌 목표 프레임 그대로
+
+    def __init__(self, video_path: str,
+                 frame_index: Optional[FrameIndex] = None,
+                 count: int = APP_CONST.THUMBNAIL_COUNT,
+                 width: int = APP_CONST.THUMBNAIL_WIDTH):
+        super().__init__()
+        self.video_path = video_path
+        self.frame_index = frame_index
+        self.count = count
+        self.width = width
+
+    def run(self):
+        """스레드 실행"""
+        ResourceManager().pin('worker')
+        strip = self.load_or_build(
+            self.video_path, self.frame_index,
+            self.count, self.width, self.isInterruptionRequested
+        )
+        if strip is not None and not self.isInterruptionRequested():
+            self.thumbnails_ready.emit(strip)
+
+    @classmethod
+    def load_or_build(cls, video_path: str,
+                      frame_index: Optional[FrameIndex] = None,
+                      count: int = APP_CONST.THUMBNAIL_COUNT,
+                      width: int = APP_CONST.THUMBNAIL_WIDTH,
+                      should_stop: Callable[[], bool] = lambda: False
+                      ) -> Optional[ThumbnailStrip]:
+        """캐시 로드, 없으면 생성 후 저장"""
+        cacheable = VideoCache.is_cacheable(video_path)
+        kind = f"{cls.CACHE_KIND}v{cls.CACHE_VERSION}_{count}x{width}"
+        path = VideoCache.path_for(video_path, kind) if cacheable else None
+
+        if path is not None and path.exists():
+            try:
+                return ThumbnailStrip.load(path)
+            except Exception as e:
+                print(f"썸네일 캐시 손상, 재생성: {e}")
+
+        strip = cls.build(video_path, frame_index, count, width, should_stop)
+        if strip is not None and strip.complete and path is not None:
+            strip.save(path)
+        return strip
+
+    @staticmethod
+    def build(video_path: str,
+              frame_index: Optional[FrameIndex] = None,
+              count: int = APP_CONST.THUMBNAIL_COUNT,
+              width: int = APP_CONST.THUMBNAIL_WIDTH,
+              should_stop: Callable[[], bool] = lambda: False
+              ) -> Optional[ThumbnailStrip]:
+        """균등 간격 프레임을 축소하여 스프라이트 생성
+
+        키프레임 인덱스가 있으면 목표 앞 키프레임으로 이동해 목표 프레임까지
+        grab 으로 전진한다 (현재 위치와 목표 사이에 키프레임이 없으면 이동 없이
+        전진). 긴 GOP 에서도 슬롯마다 정확한 시각의 프레임이 들어간다.
+        """
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            return None
+
+        try:
+            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            if frame_index is not None:
+                total_frames = frame_index.total_frames
+            if total_frames <= 0:
+                return None
+
+            src_w = cap.get(cv2.CAP_PROP_FRAME_WIDTH) or 16
+            src_h = cap.get(cv2.CAP_PROP_FRAME_HEIGHT) or 9
+            tile_w = width
+            tile_h = max(1, int(round(width * src_h / src_w)))
+
+            count = max(1, min(count, total_frames))
+            targets = np.linspace(0, total_frames - 1, count).astype(np.int64)
+            columns = int(math.ceil(math.sqrt(count)))
+            rows = int(math.ceil(count / columns))
+            sprite = np.zeros((rows * tile_h, columns * tile_w, 3), dtype=np.uint8)
+
+            frame_numbers = []
+            position = 0                # 다음에 읽을 프레임
+            use_index = frame_index is not None and frame_index.has_keyframes
+            for target in targets:
+                if should_stop():
+                    return None
+
+                target = int(target)
+                keyframe = frame_index.nearest_keyframe(target) if use_index else target
+                if not keyframe <= position <= target:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, keyframe)
+                    position = keyframe
+
+                ret = True
+                while ret and position < target:
+                    ret = cap.grab()
+                    position += 1
+                if ret:
+                    ret, frame = cap.read()
+                    position += 1
+                if not ret:
+                    break
+
+                tile = cv2.resize(frame, (tile_w, tile_h), interpolation=cv2.INTER_AREA)
+                row, col = divmod(len(frame_numbers), columns)
+                sprite[row * tile_h:(row + 1) * tile_h,
+                       col * tile_w:(col + 1) * tile_w] = tile
+                frame_numbers.append(target)
+        finally:
+            cap.release()
+
+        if not frame_numbers:
+            return None
+
+        return ThumbnailStrip(
+            sprite=sprite,
+            frame_numbers=np.asarray(frame_numbers, dtype=np.int64),
+            tile_width=tile_w,
+            tile_height=tile_h,
+            columns=columns,
+            total_frames=total_frames,
+            complete=len(frame_numbers) == count
+        )
@@ -0,0 +1,234 @@
+# ============================================================================
+# src/core/timeline_scanner.py
+# 사전 스캔 스레드 (저해상도 / 희소 프레임 이벤트 타임라인 생성)
+# ============================================================================
+
+import cv2
+import numpy as np
+from PySide6.QtCore import QThread, Signal
+from typing import Callable, Optional
+
+from ..config.constants import APP_CONST
+from ..config.settings import SettingsManager, SettingsSnapshot
+from ..config.camera import CameraProfile
+from ..models.frame_index import FrameIndex
+from ..models.timeline import EventTimeline
+from ..utils.cache import VideoCache
+from .distance_estimator import DistanceEstimator
+from .frame_indexer import FrameIndexBuilder
+from .lane_detector import LaneDetector
+from .class_filter import ClassFilter
+from .danger_zone import DangerZoneIndex
+from .model_manager import ModelManager
+from .resource_manager import ResourceManager
+
+
+class TimelineScanner(QThread):
+    """비디오 전체를 축소 파이프라인으로 훑어 이벤트 타임라인 생성"""
+
+    progress = Signal(int)             # 0~100
+    timeline_ready = Signal(object)    # EventTimeline
+
+    CACHE_KIND = "timeline"
+    CACHE_VERSION = 2                  # danger_counts 의미가 바뀌면 올림 (2: 자차 경로 + TTC)
+
+    def __init__(self, video_path: str,
+                 interval_sec: float = APP_CONST.SCAN_INTERVAL_SEC):
+        super().__init__()
+        self.video_path = video_path
+        self.interval_sec = interval_sec
+        self.settings = SettingsManager()
+        self.model_manager = ModelManager()
+        camera_profile = CameraProfile.for_video(video_path)
+        self.distance_estimator = DistanceEstimator(camera_profile)
+        self.camera_profile = camera_profile
+
+    def run(self):
+        """스레드 실행"""
+        ResourceManager().pin('worker')
+        # 스캔 도중 설정이 바뀌어도 결과는 시작 시점 설정의 캐시 키로 저장
+        cfg = self.settings.snapshot()
+        timeline = self.load_cached(cfg)
+        if timeline is None:
+            timeline = self.scan(self.isInterruptionRequested, cfg)
+            if timeline is not None and VideoCache.is_cacheable(self.video_path):
+                timeline.save(self._cache_path(cfg))
+
+        if timeline is not None and not self.isInterruptionRequested():
+            self.progress.emit(100)
+            self.timeline_ready.emit(timeline)
+
+    def _cache_path(self, cfg: SettingsSnapshot):
+        """캐시 경로 (형식 버전 / 스캔 간격 / 결과에 영향을 주는 설정별)"""
+        params = VideoCache.params_key(cfg.class_whitelist, cfg.class_confidence,
+                                       cfg.confidence_threshold, cfg.max_detections,
+                                       cfg.ground_plane_distance, cfg.birdseye_lanes)
+        kind = (f"{self.CACHE_KIND}v{self.CACHE_VERSION}_"
+                f"{int(self.interval_sec * 1000)}ms_{params}")
+        return VideoCache.path_for(self.video_path, kind)
+
+    def load_cached(self, cfg: Optional[SettingsSnapshot] = None
+                    ) -> Optional[EventTimeline]:
+        """캐시된 타임라인 로드 (cfg: 캐시 키 설정, 없으면 현재 설정)"""
+        if not VideoCache.is_cacheable(self.video_path):
+            return None
+
+        path = self._cache_path(cfg or self.settings.snapshot())
+        if not path.exists():
+            return None
+
+        try:
+            return EventTimeline.load(path)
+        except Exception as e:
+            print(f"타임라인 캐시 손상, 재스캔: {e}")
+            return None
+
+    def scan(self, should_stop: Callable[[], bool] = lambda: False,
+             cfg: Optional[SettingsSnapshot] = None) -> Optional[EventTimeline]:
+        """축소 파이프라인 실행
+
+        - 희소 프레임: interval_sec 간격 (사이 프레임은 _advance 로 건너뜀)
+        - 저해상도: SCAN_WIDTH 로 축소 후 SCAN_IMGSZ 로 추론
+        - 별도 모델 인스턴스: 재생 중인 VideoProcessor 와 충돌 없음
+        """
+        cap = cv2.VideoCapture(self.video_path)
+        if not cap.isOpened():
+            return None
+
+        model = self.model_manager.create_detection_model()
+        lane_detector = LaneDetector()
+        lane_detector.set_camera_profile(self.camera_profile)
+        cfg = cfg or self.settings.snapshot()
+        lane_detector.use_birdseye = cfg.birdseye_lanes
+        frame_index = FrameIndexBuilder.load_cached(self.video_path)
+        class_filter = ClassFilter(model.names, cfg.class_whitelist,
+                                   cfg.class_confidence, cfg.confidence_threshold,
+                                   cfg.max_detections)
+        danger_zones = DangerZoneIndex()
+
+        fps = cap.get(cv2.CAP_PROP_FPS) or APP_CONST.DEFAULT_FPS
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        stride = max(1, int(round(fps * self.interval_sec)))
+
+        frame_numbers = []
+        danger_counts = []
+        object_counts = []
+        lane_departures = []
+
+        try:
+            frame_number = 0
+            while True:
+                if should_stop():
+                    return None
+
+                ret, frame = cap.read()
+                if not ret:
+                    break
+
+                danger, objects, departure = self._analyze(
+                    frame, model, lane_detector, class_filter,
+                    danger_zones, frame_number / fps, cfg
+                )
+                frame_numbers.append(frame_number)
+                danger_counts.append(danger)
+                object_counts.append(objects)
+                lane_departures.append(departure)
+
+                if total_frames > 0 and len(frame_numbers) % 20 == 0:
+                    self.progress.emit(min(99, frame_number * 100 // total_frames))
+
+                # 다음 샘플까지 건너뜀
+                target = frame_number + stride
+                if 0 < total_frames <= target:
+                    frame_number = total_frames
+                    break
+                if not self._advance(cap, frame_number + 1, target, frame_index):
+                    break
+                frame_number = target
+        finally:
+            cap.release()
+
+        if not frame_numbers:
+            return None
+
+        print(f"사전 스캔 완료: {len(frame_numbers)} 샘플 (간격 {stride} 프레임)")
+        return EventTimeline(
+            frame_numbers=np.asarray(frame_numbers, dtype=np.int64),
+            danger_counts=np.asarray(danger_counts, dtype=np.int16),
+            object_counts=np.asarray(object_counts, dtype=np.int16),
+            lane_departures=np.asarray(lane_departures, dtype=bool),
+            total_frames=max(total_frames, frame_number)
+        )
+
+    @staticmethod
+    def _advance(cap: cv2.VideoCapture, position: int, target: int,
+                 frame_index: Optional[FrameIndex]) -> bool:
+        """다음에 읽을 프레임을 position → target 으로 이동
+
+        사이에 키프레임이 있으면(인덱스가 없으면 간격이 SEEK_MAX_FORWARD_FRAMES
+        를 넘으면) seek 해서 그 앞 GOP 를 디코딩하지 않고, 아니면 grab 으로 전진한다.
+        """
+        if frame_index is not None and frame_index.has_keyframes:
+            seek = frame_index.nearest_keyframe(target) > position
+        else:
+            seek = target - position > APP_CONST.SEEK_MAX_FORWARD_FRAMES
+
+        if seek:
+            return cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+        for _ in range(target - position):
+            if not cap.grab():
+                return False
+        return True
+
+    def _analyze(self, frame: np.ndarray, model, lane_detector: LaneDetector,
+                 class_filter: ClassFilter, danger_zones: DangerZoneIndex,
+                 timestamp: float, cfg: SettingsSnapshot) -> tuple:
+        """샘플 프레임 분석 → (자차 경로 위험 수, 객체 수, 차선 이탈)"""
+        src_width = frame.shape[1]
+        scale = APP_CONST.SCAN_WIDTH / src_width
+        if scale < 1.0:
+            frame = cv2.resize(frame, None, fx=scale, fy=scale,
+                               interpolation=cv2.INTER_AREA)
+        else:
+            scale = 1.0
+
+        lanes = lane_detector.detect(frame)
+
+        results = model(
+            frame,
+            conf=class_filter.confidence,
+            imgsz=APP_CONST.SCAN_IMGSZ,
+            classes=list(class_filter.class_ids) if class_filter.class_ids else None,
+            max_det=class_filter.max_detections or APP_CONST.MODEL_MAX_DET,
+            verbose=False,
+            device=self.model_manager.device
+        )
+
+        danger = 0
+        objects = 0
+        source_shape = (int(round(frame.shape[0] / scale)), src_width)
+        for result in results:
+            (xyxy, _, class_ids), _ = class_filter.apply(
+                result.boxes.xyxy.cpu().numpy().reshape(-1, 4),
+                result.boxes.conf.cpu().numpy().reshape(-1).astype(np.float32),
+                result.boxes.cls.cpu().numpy().reshape(-1).astype(np.int64)
+            )
+            objects += len(xyxy)
+
+            # 축소 전 해상도 좌표로 거리 추정
+            distances = self.distance_estimator.estimate(
+                xyxy / scale, class_ids, model.names, source_shape,
+                use_ground_plane=cfg.ground_plane_distance
+            )
+            # 차선 격자는 축소 프레임 좌표 (샘플 간격이 길면 TTC 없이 거리만)
+            _, _, hazard = danger_zones.classify(xyxy, class_ids, distances, lanes,
+                                                 frame.shape, timestamp)
+            danger += int(np.count_nonzero(hazard))
+
+        departure = lanes.is_departing(
+            frame.shape[1],
+            offset_threshold_px=APP_CONST.LANE_OFFSET_THRESHOLD * scale,
+            offset_threshold_m=APP_CONST.LANE_OFFSET_THRESHOLD_M
+        )
+
+        return danger, objects, departure
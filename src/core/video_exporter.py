@@ -0,0 +1,331 @@
+# ============================================================================
+# src/core/video_exporter.py
+# 주석 영상 내보내기 (별도 스레드 인코더 + bounded queue)
+# ============================================================================
+
+import json
+import queue
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+from PySide6.QtCore import QThread, Signal
+
+from ..config.constants import APP_CONST
+from ..config.settings import SettingsManager
+from ..models.export import ExportOptions, ExportResult
+from ..models.overlay import FrameOverlay
+from ..utils.drawing import DrawingUtils
+from ..utils.geometry import GeometryUtils
+from ..utils.mask_codec import MaskCodec
+from ..utils.performance import StageProfiler
+from ..utils.buffer_pool import BufferPool
+from .resource_manager import ResourceManager
+
+
+class _OpenCVWriter:
+    """cv2.VideoWriter 백엔드 (비트레이트 지정 불가)"""
+
+    def __init__(self, path: str, fourcc: str, fps: float, size: Tuple[int, int]):
+        self.writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*fourcc),
+                                      fps, size)
+        if not self.writer.isOpened() and fourcc != 'mp4v':
+            # H.264 등 인코더가 없는 빌드 → MPEG-4 Part 2 로 대체
+            print(f"⚠️  {fourcc} 인코더 없음, mp4v 로 대체")
+            self.writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'mp4v'),
+                                          fps, size)
+        if not self.writer.isOpened():
+            raise IOError(f"VideoWriter 를 열 수 없습니다: {path}")
+
+    def write(self, frame: np.ndarray) -> None:
+        self.writer.write(frame)
+
+    def close(self) -> None:
+        self.writer.release()
+
+
+class _FFmpegWriter:
+    """ffmpeg 파이프 백엔드 (raw BGR → 코덱 / 비트레이트 지정)"""
+
+    def __init__(self, path: str, encoder: str, fps: float,
+                 size: Tuple[int, int], bitrate_kbps: int):
+        width, height = size
+        cmd = [
+            'ffmpeg', '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'bgr24',
+            '-s', f'{width}x{height}', '-r', f'{fps:.3f}', '-i', '-',
+            '-c:v', encoder, '-pix_fmt', 'yuv420p',
+        ]
+        if bitrate_kbps > 0:
+            cmd += ['-b:v', f'{bitrate_kbps}k']
+        cmd.append(path)
+
+        self.process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+    def write(self, frame: np.ndarray) -> None:
+        self.process.stdin.write(np.ascontiguousarray(frame).tobytes())
+
+    def close(self) -> None:
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise IOError(f"ffmpeg 종료 코드 {self.process.returncode}")
+
+
+class VideoExporter(QThread):
+    """주석 프레임을 MP4 로 인코딩하는 스레드
+
+    처리 스레드는 submit() 으로 bounded queue 에 프레임을 넣기만 하고,
+    축소와 인코딩은 이 스레드에서 수행한다. 큐가 가득 차면 옵션에 따라
+    대기(오프라인 내보내기)하거나 프레임을 버린다(라이브 녹화).
+    pool 을 주면 제출한 프레임에 참조를 더하고 인코딩 후 반환한다.
+    오버레이 데이터를 함께 주면 픽셀에 그리는 작업도 이 스레드에서 한다.
+    mask_format 을 지정하면 프레임별 Segmentation 마스크를 RLE / 다각형으로,
+    export_detections 면 탐지 박스를 원본 픽셀 좌표로 JSON Lines 사이드카에
+    함께 기록한다.
+    """
+
+    export_finished = Signal(object)  # ExportResult
+
+    # 코덱 → (ffmpeg 인코더, OpenCV fourcc)
+    CODECS = {
+        'h264': ('libx264', 'avc1'),
+        'hevc': ('libx265', 'hvc1'),
+        'mp4v': ('mpeg4', 'mp4v'),
+        'mjpeg': ('mjpeg', 'MJPG'),
+    }
+
+    _STOP = object()
+
+    MASK_FORMATS = ('', 'rle', 'polygon')
+
+    def __init__(self, options: ExportOptions, fps: float,
+                 profiler: Optional[StageProfiler] = None,
+                 queue_size: int = APP_CONST.EXPORT_QUEUE_SIZE,
+                 pool: Optional[BufferPool] = None):
+        super().__init__()
+        if options.codec not in self.CODECS:
+            raise ValueError(f"지원하지 않는 코덱: {options.codec}")
+        if options.mask_format not in self.MASK_FORMATS:
+            raise ValueError(f"지원하지 않는 마스크 형식: {options.mask_format}")
+
+        self.options = options
+        self.fps = fps if fps > 0 else APP_CONST.DEFAULT_FPS
+        self.profiler = profiler or StageProfiler()
+        self.pool = pool
+        self.result = ExportResult(output_path=options.output_path)
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._finishing = False
+        self._failed = False
+
+    @property
+    def backend(self) -> str:
+        """실제 사용할 백엔드"""
+        if self.options.backend != 'auto':
+            return self.options.backend
+        return 'ffmpeg' if shutil.which('ffmpeg') else 'opencv'
+
+    def submit(self, frame: np.ndarray,
+               overlay: Optional[FrameOverlay] = None) -> bool:
+        """프레임 (+ 아직 그리지 않은 오버레이) 전달 → 버려졌으면 False"""
+        if self._finishing or self._failed:
+            return False
+
+        if self.pool is not None:
+            self.pool.retain(frame)
+
+        if self.options.drop_when_full:
+            try:
+                self._queue.put_nowait((frame, overlay))
+            except queue.Full:
+                self.result.frames_dropped += 1
+                self._release(frame)
+                return False
+        else:
+            self._queue.put((frame, overlay))
+        return True
+
+    def _release(self, frame: np.ndarray) -> None:
+        """제출 시 더한 풀 참조 반환"""
+        if self.pool is not None:
+            self.pool.release(frame)
+
+    def finish(self) -> ExportResult:
+        """남은 프레임 인코딩 후 종료 대기"""
+        if not self._finishing:
+            self._finishing = True
+            self._queue.put(self._STOP)
+        self.wait()
+        return self.result
+
+    def run(self):
+        ResourceManager().pin('worker')
+        writer = None
+        sidecars = {}
+        size = None
+        busy_sec = 0.0
+
+        try:
+            while True:
+                item = self._queue.get()
+                if item is self._STOP:
+                    break
+                frame, overlay = item
+
+                start = time.perf_counter()
+
+                if writer is None:
+                    height, width = frame.shape[:2]
+                    size = self.options.output_size(width, height)
+                    writer = self._open_writer(size)
+                    sidecars = self._open_sidecars()
+
+                submitted = frame
+                annotated = None
+                if overlay is not None and not overlay.burned_in and not overlay.is_empty:
+                    annotated = frame = self._render_overlay(frame, overlay)
+                if (frame.shape[1], frame.shape[0]) != size:
+                    frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+                writer.write(frame)
+                if sidecars and overlay is not None:
+                    # 범위 / 프레임 스킵 / 버린 프레임이 있어도 원본 프레임 번호로 기록
+                    frame_number = (overlay.frame_number if overlay.frame_number >= 0
+                                    else self.result.frames_written)
+                    self._write_sidecars(sidecars, frame_number, overlay)
+                self._release(submitted)
+                if annotated is not None:
+                    self._release(annotated)
+
+                elapsed = time.perf_counter() - start
+                busy_sec += elapsed
+                self.profiler.record('encode', elapsed * 1000)
+                self.result.frames_written += 1
+
+            if writer is not None:
+                writer.close()
+                writer = None
+
+        except Exception as e:
+            self.result.success = False
+            self.result.error = str(e)
+            print(f"❌ 내보내기 실패: {e}")
+            # 이후 프레임은 거부하고, 대기 중인 생산자가 막히지 않도록 큐 비움
+            self._failed = True
+            self._drain()
+
+        finally:
+            if writer is not None:
+                try:
+                    writer.close()
+                except Exception:
+                    pass
+            for sidecar in sidecars.values():
+                sidecar.close()
+
+        if busy_sec > 0:
+            self.result.encode_fps = self.result.frames_written / busy_sec
+
+        self.export_finished.emit(self.result)
+
+    def _render_overlay(self, frame: np.ndarray,
+                        overlay: FrameOverlay) -> np.ndarray:
+        """오버레이를 그린 사본 (원본 프레임은 표시 위젯과 공유될 수 있음)"""
+        start = time.perf_counter()
+        if self.pool is not None:
+            annotated = self.pool.acquire(frame.shape, frame.dtype)
+            np.copyto(annotated, frame)
+        else:
+            annotated = frame.copy()
+
+        cfg = SettingsManager().snapshot()
+        DrawingUtils.draw_overlay(annotated, overlay, cfg.show_labels, cfg.show_distance)
+        self.profiler.record('overlay', (time.perf_counter() - start) * 1000)
+        return annotated
+
+    def _open_sidecars(self) -> dict:
+        """결과 사이드카 파일 열기 → {'masks' / 'detections': 파일}"""
+        sidecars = {}
+        if self.options.mask_format:
+            sidecars['masks'] = open(self.options.mask_path, 'w', encoding='utf-8')
+            self.result.mask_path = self.options.mask_path
+        if self.options.export_detections:
+            sidecars['detections'] = open(self.options.detections_path, 'w',
+                                          encoding='utf-8')
+            self.result.detections_path = self.options.detections_path
+        return sidecars
+
+    def _write_sidecars(self, sidecars: dict, frame_number: int,
+                        overlay: FrameOverlay) -> None:
+        """프레임 결과 한 줄씩 기록 (결과가 없는 프레임은 생략)"""
+        start = time.perf_counter()
+        if 'masks' in sidecars and overlay.masks:
+            self._write_line(sidecars['masks'], frame_number, overlay,
+                             masks=self._mask_records(overlay))
+        if 'detections' in sidecars and overlay.detections:
+            self._write_line(sidecars['detections'], frame_number, overlay,
+                             detections=self._detection_records(overlay))
+        self.profiler.record('sidecar', (time.perf_counter() - start) * 1000)
+
+    @staticmethod
+    def _write_line(sidecar, frame_number: int, overlay: FrameOverlay, **records) -> None:
+        """JSON Lines 한 줄 (frame: 원본 프레임 번호, source_size: 좌표 기준 원본 크기)"""
+        source_size = overlay.source_size or overlay.frame_size
+        line = {'frame': frame_number, 'source_size': list(source_size), **records}
+        sidecar.write(json.dumps(line, separators=(',', ':')))
+        sidecar.write('\n')
+
+    def _mask_records(self, overlay: FrameOverlay) -> list:
+        """마스크 → 다각형(원본 픽셀 좌표) / RLE(분석 해상도, size 로 표시)"""
+        if self.options.mask_format == 'polygon':
+            scale_x, scale_y = overlay.source_scale
+            return [MaskCodec.polygons_to_dict(MaskCodec.scale_polygons(polygon, scale_x, scale_y))
+                    for polygon in MaskCodec.rle_to_polygons(overlay.masks)]
+        return [MaskCodec.rle_to_dict(rle) for rle in overlay.masks]
+
+    @staticmethod
+    def _detection_records(overlay: FrameOverlay) -> list:
+        """탐지 결과 (박스는 원본 픽셀 좌표)"""
+        boxes = GeometryUtils.scale_boxes(
+            np.array([d.bbox for d in overlay.detections], dtype=np.float64),
+            *overlay.source_scale
+        )
+        return [
+            {
+                'class': detection.class_name,
+                'confidence': round(detection.confidence, 4),
+                'bbox': [round(float(v), 1) for v in box],
+                'distance': round(detection.distance, 2),
+                'lane_zone': detection.lane_zone,
+                'ttc': round(detection.ttc, 2) if np.isfinite(detection.ttc) else None,
+                'hazard': detection.hazard,
+            }
+            for detection, box in zip(overlay.detections, boxes)
+        ]
+
+    def _open_writer(self, size: Tuple[int, int]):
+        """백엔드별 writer 생성"""
+        Path(self.options.output_path).parent.mkdir(parents=True, exist_ok=True)
+        encoder, fourcc = self.CODECS[self.options.codec]
+
+        if self.backend == 'ffmpeg':
+            return _FFmpegWriter(self.options.output_path, encoder, self.fps,
+                                 size, self.options.bitrate_kbps)
+
+        if self.options.bitrate_kbps > 0:
+            print("⚠️  OpenCV 백엔드는 비트레이트 지정을 지원하지 않습니다")
+        return _OpenCVWriter(self.options.output_path, fourcc, self.fps, size)
+
+    def _drain(self) -> None:
+        """큐에 남은 항목 제거"""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not self._STOP:
+                self._release(item[0])
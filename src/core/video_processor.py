@@ -3,30 +3,49 @@
 # 비디오 처리 스레드 (완전 수정 버전)
 # ============================================================================
 
-import cv2
 import numpy as np
-from PySide6.QtCore import QThread, Signal, QMutex, QMutexLocker
+from PySide6.QtCore import QThread, Signal, QMutex, QMutexLocker, QTimer
 from collections import deque
+from dataclasses import replace
 from typing import Optional
 import time
 
-from ..config.settings import SettingsManager
-from ..models.stats import DetectionStats
+from ..config.constants import APP_CONST
+from ..config.settings import SettingsManager, SettingsSnapshot
+from ..config.camera import CameraProfile
+from ..models.stats import DetectionStats, VideoSummary
 from ..models.detection import Detection, LaneLines
+from ..models.overlay import FrameOverlay
+from ..models.frame_index import FrameIndex
+from ..models.export import ExportOptions, ExportResult
 from .model_manager import ModelManager
+from .frame_indexer import FrameIndexBuilder
 from .detection_engine import DetectionEngine
 from .lane_detector import LaneDetector
+from .motion_gate import MotionGate
+from .imgsz_tuner import ImgszTuner
+from .stream_reader import StreamReader
+from .frame_source import FrameSource
+from .video_exporter import VideoExporter
+from .resource_manager import ResourceManager
+from .stats_aggregator import StatsAggregator
 from ..utils.drawing import DrawingUtils
-from ..utils.performance import PerformanceMonitor, Timer
+from ..utils.performance import PerformanceMonitor, Timer, StageProfiler, MemoryMonitor
+from ..utils.buffer_pool import BufferPool
+from ..utils.mask_codec import MaskCodec
+from ..utils.video_source import VideoSource
 
 
 class VideoProcessor(QThread):
     """비디오 처리 스레드"""
 
     # Signals
-    frame_ready = Signal(np.ndarray, list, int, DetectionStats)
+    frame_ready = Signal(np.ndarray, list, int, DetectionStats, object)  # + FrameOverlay
     video_finished = Signal()
     error_occurred = Signal(str)
+    frame_index_ready = Signal(object)  # FrameIndex
+    stream_status_changed = Signal(bool)  # 라이브 소스 연결 상태
+    export_finished = Signal(object)  # ExportResult
 
     def __init__(self):
         super().__init__()
@@ -37,12 +56,32 @@ class VideoProcessor(QThread):
         self.lane_detector = LaneDetector()
         self.settings = SettingsManager()
         self.performance_monitor = PerformanceMonitor()
+        self.profiler = StageProfiler()
+        self.stats_aggregator = StatsAggregator()
+        self.motion_gate = MotionGate()
+        self.imgsz_tuner = ImgszTuner(
+            initial=self.settings.snapshot().inference_imgsz
+        )
+
+        # 정지 장면에서 재사용할 마지막 추론 결과
+        self._last_results: Optional[tuple] = None
+
+        # 설정 변경 통지 → 처리 스레드에서 반영
+        self._results_dirty = False
+        self._lane_reset_pending = False
+        self._tuner_reset_pending = False
+        self.settings.subscribe(self._on_settings_changed)
 
         # 비디오 캡처
         self.video_path: Optional[str] = None
-        self.cap: Optional[cv2.VideoCapture] = None
+        self.cap: Optional[FrameSource] = None
+
+        # 라이브 소스 (RTSP/HTTP/카메라)
+        self.is_live = False
+        self.stream_reader: Optional[StreamReader] = None
 
         # 재생 상태
+        self._live_start = 0.0
         self.is_running = False
         self.is_paused = False
         self.current_frame_number = 0
@@ -53,108 +92,458 @@ class VideoProcessor(QThread):
         self.seek_to = -1
         self.mutex = QMutex()
 
+        # 키프레임 인덱스 (백그라운드 생성)
+        self.frame_index: Optional[FrameIndex] = None
+        self._index_builder: Optional[FrameIndexBuilder] = None
+
+        # 주석 영상 내보내기
+        self.exporter: Optional[VideoExporter] = None
+
+        # 표시 위젯이 오버레이를 벡터로 그리면 픽셀에 굽지 않음
+        self.vector_overlays = False
+
         # 프레임 버퍼
         self.frame_buffer = deque(maxlen=5)
 
-    def load_video(self, video_path: str) -> bool:
-        """비디오 로드"""
+        # 해상도별 프레임 버퍼 재사용 / 메모리 예산
+        self.buffer_pool = BufferPool()
+        self._frame_shape: Optional[tuple] = None
+        self._over_budget = False
+
+    def load_video(self, video_path: str, build_index: bool = True) -> bool:
+        """비디오 로드 (파일 경로 또는 스트림 URL / 카메라 장치)"""
+        self._stop_stream()
+        self.video_path = video_path
+        self.is_live = VideoSource.is_stream(video_path)
+
+        if self.is_live:
+            return self._load_stream(video_path)
+
         try:
-            self.video_path = video_path
-            self.cap = cv2.VideoCapture(video_path)
+            if self.cap is not None:
+                self.cap.release()
+            cfg = self.settings.snapshot()
+            self.cap = FrameSource.open(video_path, cfg.decode_backend, cfg.decode_width)
 
-            if not self.cap.isOpened():
+            if not self.cap.is_opened():
                 self.error_occurred.emit(f"비디오를 열 수 없습니다: {video_path}")
                 return False
 
-            self.total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+            self.total_frames = self.cap.frame_count
+            self.fps = self.cap.fps
             self.current_frame_number = 0
+            self._frame_shape = None
 
-            # 캐시 초기화
-            self.lane_detector.reset()
-            self.performance_monitor.reset()
+            # 카메라 프로파일 (비디오별) / 캐시 초기화
+            self._reset_source_state(CameraProfile.for_video(video_path))
+
+            # 키프레임 인덱스 (Seek 용 - 오프라인 내보내기에서는 불필요)
+            if build_index:
+                self._start_index_build(video_path)
 
-            print(f"비디오 로드 성공: {self.total_frames} 프레임, {self.fps:.2f} FPS")
+            width, height = self.cap.frame_size
+            print(f"비디오 로드 성공: {self.total_frames} 프레임, {self.fps:.2f} FPS, "
+                  f"{width}x{height} ({self.cap.name})")
             return True
 
         except Exception as e:
             self.error_occurred.emit(f"비디오 로드 실패: {str(e)}")
             return False
 
+    def _load_stream(self, source: str) -> bool:
+        """라이브 소스 수신 시작 (연결 실패 시 수신 스레드가 재시도)"""
+        if self.cap is not None:
+            self.cap.release()
+        self.cap = None
+        self.total_frames = 0
+        self.fps = 30.0
+        self.current_frame_number = 0
+
+        self._stop_index_build()
+        self.frame_index = None
+
+        self._reset_source_state(CameraProfile())
+
+        self.stream_reader = StreamReader(source, width=self.settings.get('decode_width'))
+        self.stream_reader.connection_changed.connect(self.stream_status_changed)
+        self.stream_reader.start()
+
+        print(f"스트림 연결 시작: {VideoSource.display_name(source)}")
+        return True
+
+    def _stop_stream(self) -> None:
+        """라이브 소스 수신 중단"""
+        if self.stream_reader is not None:
+            self.stream_reader.stop()
+            self.stream_reader = None
+
+    def _reset_source_state(self, camera_profile: CameraProfile) -> None:
+        """새 소스 로드 시 카메라 프로파일 적용 및 캐시 초기화"""
+        self.detection_engine.set_camera_profile(camera_profile)
+        self.lane_detector.set_camera_profile(camera_profile)
+
+        self.lane_detector.reset()
+        self.performance_monitor.reset()
+        self.profiler.reset()
+        self.stats_aggregator.reset()
+        self.motion_gate.reset()
+        self._reset_results()
+        self._frame_shape = None
+        self._live_start = time.monotonic()
+
+    def _start_index_build(self, video_path: str) -> None:
+        """키프레임 인덱스 로드 (캐시 없으면 백그라운드 생성)"""
+        self._stop_index_build()
+
+        self.frame_index = FrameIndexBuilder.load_cached(video_path)
+        if self.frame_index is not None:
+            self.frame_index_ready.emit(self.frame_index)
+            return
+
+        self._index_builder = FrameIndexBuilder(video_path)
+        self._index_builder.index_ready.connect(self._on_index_ready)
+        self._index_builder.start()
+
+    def _stop_index_build(self) -> None:
+        """진행 중인 인덱스 생성 중단"""
+        if self._index_builder is not None:
+            self._index_builder.requestInterruption()
+            self._index_builder.wait()
+            self._index_builder = None
+
+    def _on_index_ready(self, index: FrameIndex) -> None:
+        """인덱스 생성 완료"""
+        if index.video_path == self.video_path:
+            self.frame_index = index
+            self.frame_index_ready.emit(index)
+
     def seek_to_frame(self, frame_number: int) -> None:
-        """특정 프레임으로 이동"""
+        """특정 프레임으로 이동 (대기 중인 요청은 최신 요청으로 대체)"""
         with QMutexLocker(self.mutex):
             self.seek_to = frame_number
 
-    def process_frame(self, frame: np.ndarray) -> tuple:
-        """프레임 처리"""
-        if frame is None:
-            return frame, [], DetectionStats(), LaneLines()
+    # 변경 시 이전 추론 결과를 재사용하면 안 되는 설정
+    RESULT_SETTING_KEYS = frozenset({
+        'detection_enabled', 'segmentation_enabled', 'lane_detection_enabled',
+        'confidence_threshold', 'tiled_inference_enabled', 'tile_band_top',
+        'tile_band_bottom', 'tile_columns', 'tile_overlap',
+        'tile_include_full_frame', 'ground_plane_distance', 'birdseye_lanes',
+        'inference_imgsz',
+    })
 
-        timer = Timer()
-        stats = DetectionStats()
+    # 변경 시 차선 ROI / 캐시를 초기화해야 하는 설정
+    LANE_SETTING_KEYS = frozenset({'lane_detection_enabled', 'birdseye_lanes'})
 
-        with timer:
-            # 1. 차선 감지
-            lanes = self._process_lanes(frame)
+    # 변경 시 imgsz 자동 조절을 수동 설정값에서 다시 시작해야 하는 설정
+    IMGSZ_SETTING_KEYS = frozenset({'inference_imgsz', 'auto_imgsz', 'target_fps'})
+
+    def _on_settings_changed(self, changed: dict,
+                             snapshot: SettingsSnapshot) -> None:
+        """설정 변경 통지 (GUI 스레드) - 무거운 작업만 여기서 처리"""
+        if not self.RESULT_SETTING_KEYS.isdisjoint(changed):
+            self._results_dirty = True
+
+        if not self.LANE_SETTING_KEYS.isdisjoint(changed):
+            self._lane_reset_pending = True
 
-            # 2. 객체 탐지
-            detections, detection_stats = self._process_detections(frame)
-            stats = detection_stats
+        if not self.IMGSZ_SETTING_KEYS.isdisjoint(changed):
+            self._tuner_reset_pending = True
 
-            # 3. Segmentation
-            if self.settings.get('segmentation_enabled'):
-                frame = self.detection_engine.apply_segmentation(frame)
+        # 모델 로드 (체크박스 갱신 후 실행되도록 이벤트 루프에 위임)
+        # 추론 서버 사용 시 모델은 서버가 보유
+        if snapshot.inference_server:
+            return
+        if changed.get('segmentation_enabled'):
+            QTimer.singleShot(0, self.model_manager.load_segmentation_model)
+        if changed.get('detection_enabled') and self.is_running:
+            QTimer.singleShot(0, self.model_manager.load_detection_model)
+
+    def _apply_pending_changes(self, cfg: SettingsSnapshot) -> None:
+        """설정 변경에 따른 초기화 (처리 스레드)"""
+        if self._tuner_reset_pending:
+            self._tuner_reset_pending = False
+            self.imgsz_tuner.reset(cfg.inference_imgsz)
+            self.performance_monitor.reset_latency()
+
+        if self._lane_reset_pending:
+            self._lane_reset_pending = False
+            self.lane_detector.reset()
 
-            # 4. 시각화
-            self._visualize_results(frame, detections, lanes)
+        if self._results_dirty:
+            self._results_dirty = False
+            self._reset_results()
+
+    def process_frame(self, frame: np.ndarray,
+                      cfg: Optional[SettingsSnapshot] = None) -> tuple:
+        """프레임 처리 (cfg: 프레임 단위 설정 스냅샷)"""
+        if frame is None:
+            return frame, [], DetectionStats(), FrameOverlay((0, 0))
+
+        # 프레임 전체에서 일관된 설정 사용
+        cfg = cfg or self.settings.snapshot()
+        self._apply_pending_changes(cfg)
+        cfg = self._effective_settings(cfg)
+        self.profiler.track_memory = cfg.memory_budget_mb > 0
+        render = self._render_in_worker(cfg)
+
+        timer = Timer()
+
+        with timer:
+            # 0. 정지 장면 판별 → 이전 결과 재사용
+            skipped = self._should_reuse_results(frame, cfg)
+
+            mask_data = None
+            if skipped:
+                lanes, detections, stats, masks = self._reuse_results()
+            else:
+                # 1. 차선 감지
+                with self.profiler.measure('lanes'):
+                    lanes = self._process_lanes(frame, cfg)
+
+                # 2. 객체 탐지
+                with self.profiler.measure('detection'):
+                    detections, stats = self._process_detections(frame, cfg, lanes)
+
+                # 3. Segmentation
+                with self.profiler.measure('segmentation'):
+                    mask_data = self.detection_engine.predict_masks(frame, cfg)
+
+                masks = self._store_results(lanes, detections, stats, mask_data)
+
+            # 4. 시각화 (추론 스킵 시에도 새 프레임에 다시 그림)
+            #    오버레이 데이터 모드에서는 표시 / 내보내기 시점에 그림
+            overlay = self._build_overlay(frame, detections, lanes, masks, render)
+            if render:
+                with self.profiler.measure('draw'):
+                    if mask_data is None and masks[0]:
+                        mask_data = MaskCodec.decode_many(masks[0])
+                    self._visualize_results(frame, detections, lanes, cfg,
+                                            (mask_data, masks[1]))
 
         stats.processing_time = timer.get_elapsed_ms()
+        self.profiler.record('frame', stats.processing_time)
+        if self.profiler.track_memory:
+            stats.memory_mb = self._check_memory_budget(cfg)
+        stats.inference_skipped = skipped
+        stats.skip_ratio = self.motion_gate.skip_ratio
+        stats.imgsz = cfg.inference_imgsz
+
+        # 추론한 프레임의 지연만 imgsz 조절에 반영
+        if not skipped:
+            self._tune_imgsz(cfg, stats.processing_time)
+
+        return frame, detections, stats, overlay
+
+    def _check_memory_budget(self, cfg: SettingsSnapshot) -> float:
+        """현재 RSS (MB) - 예산 초과 시 보관 중인 풀 버퍼 해제"""
+        rss_mb = MemoryMonitor.rss_mb()
+        over_budget = rss_mb > cfg.memory_budget_mb
+
+        if over_budget:
+            freed = self.buffer_pool.trim()
+            if not self._over_budget:
+                print(f"⚠️  메모리 예산 초과: {rss_mb:.0f} MB > "
+                      f"{cfg.memory_budget_mb} MB (풀 버퍼 "
+                      f"{freed / (1024 * 1024):.1f} MB 해제)")
+
+        self._over_budget = over_budget
+        return rss_mb
+
+    def _read_frame(self) -> tuple:
+        """파일 프레임 읽기 (해상도가 정해지면 풀 버퍼에 디코딩)"""
+        buffer = None
+        if self._frame_shape is not None:
+            buffer = self.buffer_pool.acquire(self._frame_shape)
+
+        ret, frame = self.cap.read(buffer)
+
+        if not ret:
+            self.buffer_pool.release(buffer)
+            return False, None
+        if frame is not buffer:
+            # 첫 프레임 / 해상도 변경 → 디코더가 새로 할당
+            self.buffer_pool.release(buffer)
+            self._frame_shape = frame.shape
+        return True, frame
+
+    def _media_time(self) -> float:
+        """현재 프레임의 영상 시각 (초, 라이브 소스는 수신 시작 후 경과 시간)"""
+        if self.is_live:
+            return time.monotonic() - self._live_start
+        return self.current_frame_number / self.fps if self.fps > 0 else 0.0
+
+    def _aggregate(self, frame: np.ndarray, detections: list,
+                   lanes: LaneLines, stats: DetectionStats) -> None:
+        """누적 통계 반영 (프레임 결과는 보관하지 않음)"""
+        self.stats_aggregator.update(detections, lanes, stats,
+                                     frame.shape[1], self._media_time())
+
+    def save_report(self) -> Optional[VideoSummary]:
+        """진행 중인 트랙 / 구간을 닫고 요약 리포트 저장 (처리한 프레임이 없으면 생략)"""
+        source = self.video_path or ""
+        summary = self.stats_aggregator.finish(source)
+        if summary.frames == 0:
+            return None
+
+        path = StatsAggregator.report_path(source)
+        try:
+            StatsAggregator.save_report(summary, path)
+            print(f"📄 요약 리포트 저장: {path}")
+        except OSError as e:
+            print(f"요약 리포트 저장 실패: {e}")
+        return summary
+
+    def release_frame(self, frame: np.ndarray) -> None:
+        """frame_ready 로 받은 프레임 사용 완료 (버퍼 풀 반환)"""
+        self.buffer_pool.release(frame)
+
+    def _effective_settings(self, cfg: SettingsSnapshot) -> SettingsSnapshot:
+        """자동 조절 중이면 튜너의 입력 크기를 반영한 스냅샷"""
+        if not cfg.auto_imgsz:
+            return cfg
+        return replace(cfg, inference_imgsz=self.imgsz_tuner.imgsz)
+
+    def _tune_imgsz(self, cfg: SettingsSnapshot, latency_ms: float) -> None:
+        """프레임 지연 기록 후 목표 FPS 에 맞게 imgsz 단계 조정"""
+        self.performance_monitor.record_latency(latency_ms)
+        if not cfg.auto_imgsz:
+            return
 
-        return frame, detections, stats, lanes
+        previous = cfg.inference_imgsz
+        if self.imgsz_tuner.update(self.performance_monitor, cfg.target_fps):
+            print(f"⚙️  imgsz {previous} → {self.imgsz_tuner.imgsz} "
+                  f"(목표 {cfg.target_fps:.0f} FPS)")
+
+    def _should_reuse_results(self, frame: np.ndarray,
+                              cfg: SettingsSnapshot) -> bool:
+        """정지 장면이고 재사용 가능한 결과가 있는지"""
+        if not cfg.motion_gate_enabled:
+            self.motion_gate.invalidate()
+            return False
 
-    def _process_lanes(self, frame: np.ndarray) -> LaneLines:
+        # 재사용할 결과가 없으면 반드시 추론
+        if self._last_results is None:
+            self.motion_gate.invalidate()
+
+        self.motion_gate.threshold = cfg.motion_threshold
+        return self.motion_gate.is_static(frame)
+
+    def _store_results(self, lanes: LaneLines, detections: list,
+                       stats: DetectionStats,
+                       mask_data: Optional[np.ndarray]) -> tuple:
+        """재사용을 위한 추론 결과 보관 → (RLE 마스크, 색상)
+
+        마스크는 프레임 해상도 bool 배열 대신 RLE 로 보관한다.
+        """
+        encoded, colors = [], None
+        if mask_data is not None:
+            with self.profiler.measure('mask_encode'):
+                encoded = MaskCodec.encode_rle(mask_data)
+            colors = np.random.randint(0, 255, size=(len(mask_data), 3),
+                                       dtype=np.uint8)
+
+        masks = (encoded, colors)
+        self._last_results = (lanes, detections, stats, masks)
+        return masks
+
+    def _reuse_results(self) -> tuple:
+        """이전 추론 결과 (통계는 복사본)"""
+        lanes, detections, stats, masks = self._last_results
+        stats = replace(stats, object_counts=dict(stats.object_counts),
+                        dropped_boxes=dict(stats.dropped_boxes))
+        return lanes, detections, stats, masks
+
+    def _reset_results(self) -> None:
+        """재사용 결과 / 정지 판별 기준 초기화"""
+        self._last_results = None
+        self.motion_gate.invalidate()
+        self.detection_engine.danger_zones.reset()
+
+    def _process_lanes(self, frame: np.ndarray, cfg: SettingsSnapshot) -> LaneLines:
         """차선 처리"""
-        if not self.settings.get('lane_detection_enabled'):
+        if not cfg.lane_detection_enabled:
             return LaneLines()
 
-        lanes = self.lane_detector.detect(frame)
-        DrawingUtils.draw_lane_lines(frame, lanes)
-        DrawingUtils.draw_lane_warning(frame, lanes)
-
-        return lanes
-
-    def _process_detections(self, frame: np.ndarray) -> tuple:
-        """객체 탐지 처리"""
-        return self.detection_engine.detect_objects(frame)
+        self.lane_detector.use_birdseye = cfg.birdseye_lanes
+        return self.lane_detector.detect(frame)
+
+    def _process_detections(self, frame: np.ndarray, cfg: SettingsSnapshot,
+                            lanes: LaneLines) -> tuple:
+        """객체 탐지 처리 (타일 추론은 원본 해상도 프레임이 있으면 밴드를 거기서 자름)
+
+        감지된 차선으로 자차 / 인접 차선과 TTC 를 판정한다.
+        """
+        source_frame = None
+        if cfg.tiled_inference_enabled and self.cap is not None:
+            source_frame = self.cap.source_frame()
+        return self.detection_engine.detect_objects(frame, cfg, source_frame,
+                                                    lanes, self._media_time())
+
+    def _source_size(self, frame: np.ndarray) -> tuple:
+        """분석 해상도로 줄이기 전 원본 크기 (width, height)"""
+        if self.cap is not None:
+            return self.cap.source_size
+        if self.stream_reader is not None and self.stream_reader.frame_size[0] > 0:
+            return self.stream_reader.frame_size
+        return frame.shape[1], frame.shape[0]
+
+    def _render_in_worker(self, cfg: SettingsSnapshot) -> bool:
+        """처리 스레드에서 픽셀에 그릴지 (아니면 오버레이 데이터만 전달)"""
+        return not (cfg.overlay_as_data or self.vector_overlays)
+
+    def _build_overlay(self, frame: np.ndarray, detections: list,
+                       lanes: LaneLines, masks: tuple,
+                       burned_in: bool) -> FrameOverlay:
+        """프레임 주석 데이터 (마스크는 RLE, 그린 경우에도 내보내기 사이드카용으로 포함)"""
+        encoded, mask_colors = masks
+        return FrameOverlay(
+            frame_size=(frame.shape[1], frame.shape[0]),
+            source_size=self._source_size(frame),
+            detections=detections,
+            lanes=lanes,
+            masks=encoded,
+            mask_colors=mask_colors,
+            burned_in=burned_in,
+            frame_number=self.current_frame_number,
+        )
 
     def _visualize_results(self, frame: np.ndarray,
                            detections: list,
-                           lanes: LaneLines) -> None:
+                           lanes: LaneLines,
+                           cfg: SettingsSnapshot,
+                           masks: tuple = (None, None)) -> None:
         """결과 시각화"""
-        show_labels = self.settings.get('show_labels', True)
-        show_distance = self.settings.get('show_distance', True)
-
-        for detection in detections:
-            DrawingUtils.draw_detection_box(
-                frame, detection, show_labels, show_distance
-            )
+        mask_data, mask_colors = masks
+        DrawingUtils.draw_annotations(
+            frame, detections, lanes, mask_data, mask_colors,
+            cfg.show_labels, cfg.show_distance
+        )
 
     def run(self):
         """스레드 실행"""
         self.is_running = True
+        ResourceManager().pin('inference')
 
-        # 모델 로드
-        if self.settings.get('detection_enabled'):
+        # 모델 로드 (추론 서버 사용 시 생략)
+        cfg = self.settings.snapshot()
+        if cfg.detection_enabled and not cfg.inference_server:
             self.model_manager.load_detection_model()
 
-        if not self.cap or not self.cap.isOpened():
+        # stop() 이 참조를 지워도 루프가 안전하도록 지역 변수로 보관
+        reader = self.stream_reader
+
+        if self.is_live:
+            loaded = reader is not None
+        else:
+            loaded = self.cap is not None and self.cap.is_opened()
+
+        if not loaded:
             self.error_occurred.emit("비디오가 로드되지 않았습니다")
             return
 
         frame_delay = int(1000 / self.fps) if self.fps > 0 else 33
         frame_count = 0
-        frame_skip = self.settings.get('frame_skip', 0)
+        finished = False
 
         while self.is_running:
             # 일시정지
@@ -162,56 +551,242 @@ class VideoProcessor(QThread):
                 self.msleep(100)
                 continue
 
-            # Seek 처리
-            self._handle_seek()
-
             # 프레임 읽기
-            ret, frame = self.cap.read()
+            if self.is_live:
+                ret, frame = reader.read()
+                if not ret:
+                    # 재연결 중 / 수신 지연 - 수신 스레드가 재시도
+                    continue
+            else:
+                # Seek 처리
+                self._handle_seek()
 
-            if not ret:
-                self.video_finished.emit()
-                break
+                ret, frame = self._read_frame()
+
+                if not ret:
+                    finished = True
+                    break
+
+            # 프레임 단위 설정 스냅샷
+            cfg = self.settings.snapshot()
 
             # 프레임 스킵
+            frame_skip = cfg.frame_skip
             if frame_skip > 0 and frame_count % (frame_skip + 1) != 0:
                 frame_count += 1
                 self.current_frame_number += 1
+                self.buffer_pool.release(frame)
                 continue
 
             frame_count += 1
 
             # 프레임 처리
-            processed_frame, detections, stats, lanes = self.process_frame(frame)
+            processed_frame, detections, stats, overlay = self.process_frame(frame, cfg)
 
             # FPS 계산
             stats.fps = self.performance_monitor.update_fps()
 
-            # 결과 전송
+            # 라이브 소스: 수신 → 처리 완료까지 지연, 버려진 프레임
+            if self.is_live:
+                stream_stats = reader.stats
+                stats.stream_latency_ms = (stream_stats.frame_age_ms +
+                                           stats.processing_time)
+                stats.dropped_frames = stream_stats.frames_dropped
+
+            # 누적 통계
+            self._aggregate(processed_frame, detections, overlay.lanes, stats)
+            # 내보내기 (인코더 스레드 큐에 전달만)
+            exporter = self.exporter
+            if exporter is not None:
+                exporter.submit(processed_frame, overlay)
+
+            # 결과 전송 (수신 측이 release_frame() 으로 반환)
             self.frame_ready.emit(
                 processed_frame,
                 detections,
                 self.current_frame_number,
-                stats
+                stats,
+                overlay
             )
 
             self.current_frame_number += 1
 
-            # FPS 조절
-            self.msleep(frame_delay)
+            # FPS 조절 (라이브 소스는 수신 속도에 맞춰짐)
+            if not self.is_live:
+                self.msleep(frame_delay)
+
+        # 재생 종료 / 정지 시 누적 통계 리포트
+        self.save_report()
+        if finished:
+            self.video_finished.emit()
+
+    # ------------------------------------------------------------------
+    # 주석 영상 내보내기
+    # ------------------------------------------------------------------
+
+    def start_export(self, options: ExportOptions) -> bool:
+        """처리된 프레임 내보내기 시작 (재생 중 녹화 / 오프라인 공용)"""
+        self.stop_export()
+
+        # 프레임 스킵 시 출력 재생 속도 유지
+        fps = self.fps / (self.settings.snapshot().frame_skip + 1)
+
+        try:
+            exporter = VideoExporter(options, fps, profiler=self.profiler,
+                                     pool=self.buffer_pool)
+        except ValueError as e:
+            self.error_occurred.emit(str(e))
+            return False
+
+        exporter.export_finished.connect(self.export_finished)
+        exporter.start()
+        self.exporter = exporter
+        print(f"💾 내보내기 시작: {options.output_path} ({exporter.backend})")
+        return True
+
+    def stop_export(self) -> Optional[ExportResult]:
+        """남은 프레임 인코딩 후 내보내기 종료"""
+        exporter, self.exporter = self.exporter, None
+        if exporter is None:
+            return None
+        return exporter.finish()
+
+    def export_offline(self, options: ExportOptions) -> ExportResult:
+        """GUI 없이 비디오 전체를 처리해 내보내기 (run.py --export)"""
+        if self.is_live or self.cap is None or not self.cap.is_opened():
+            return ExportResult(options.output_path, success=False,
+                                error="로컬 비디오 파일만 내보낼 수 있습니다")
+
+        if not self.start_export(options):
+            return ExportResult(options.output_path, success=False,
+                                error="내보내기를 시작할 수 없습니다")
+
+        ResourceManager().pin('inference')  # 이 스레드가 처리 단계를 맡음
+        exporter = self.exporter
+
+        for frame, cfg in self._offline_frames():
+            processed_frame, detections, stats, overlay = self.process_frame(frame, cfg)
+            stats.fps = self.performance_monitor.update_fps()
+            self._aggregate(processed_frame, detections, overlay.lanes, stats)
+            submitted = exporter.submit(processed_frame, overlay)
+            self.buffer_pool.release(processed_frame)  # 인코더가 참조를 따로 가짐
+            if not submitted and not exporter.result.success:
+                break
+
+        result = self.stop_export()
+        print(self.profiler.report())
+        self.save_report()
+
+        pool_stats = self.buffer_pool.stats
+        print(f"♻️  버퍼 풀: 할당 {pool_stats.allocations}, 재사용 {pool_stats.reuses} "
+              f"({pool_stats.reuse_ratio * 100:.0f}%)")
+        return result
+
+    def analyze_offline(self) -> Optional[VideoSummary]:
+        """GUI / 내보내기 없이 분석만 (run.py --analyze) - 그리기 생략, 요약 리포트 저장"""
+        if self.is_live or self.cap is None or not self.cap.is_opened():
+            self.error_occurred.emit("로컬 비디오 파일만 분석할 수 있습니다")
+            return None
+
+        ResourceManager().pin('inference')
+
+        for frame, cfg in self._offline_frames():
+            # 픽셀을 쓰는 곳이 없으므로 오버레이를 그리지 않음
+            cfg = replace(cfg, overlay_as_data=True)
+            processed_frame, detections, stats, overlay = self.process_frame(frame, cfg)
+            stats.fps = self.performance_monitor.update_fps()
+            self._aggregate(processed_frame, detections, overlay.lanes, stats)
+            self.buffer_pool.release(processed_frame)
+
+        print(self.profiler.report())
+        return self.save_report()
+
+    def _offline_frames(self):
+        """파일 전체 프레임 순회 → (frame, cfg) (프레임 스킵 / 진행률 출력 포함)"""
+        frame_count = 0
+        last_percent = -1
+
+        while True:
+            ret, frame = self._read_frame()
+            if not ret:
+                return
+
+            cfg = self.settings.snapshot()
+            frame_skip = cfg.frame_skip
+            skip = frame_skip > 0 and frame_count % (frame_skip + 1) != 0
+            frame_count += 1
+            if skip:
+                self.current_frame_number += 1
+                self.buffer_pool.release(frame)
+                continue
+
+            # 처리 중에는 current_frame_number 가 이 프레임 번호 (재생 루프와 같음)
+            yield frame, cfg
+            self.current_frame_number += 1
+
+            if self.total_frames > 0:
+                percent = self.current_frame_number * 100 // self.total_frames
+                if percent // 10 != last_percent // 10:
+                    last_percent = percent
+                    print(f"  {percent}% ({self.current_frame_number}/{self.total_frames})")
 
     def _handle_seek(self) -> None:
-        """Seek 요청 처리"""
-        with QMutexLocker(self.mutex):
-            if self.seek_to >= 0:
-                if self.cap:
-                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, self.seek_to)
-                    self.current_frame_number = self.seek_to
-                    self.lane_detector.reset()
+        """Seek 요청 처리 (가장 최근 요청만 처리)"""
+        while True:
+            with QMutexLocker(self.mutex):
+                target = self.seek_to
                 self.seek_to = -1
 
+            if target < 0 or not self.cap:
+                return
+
+            if self._seek_accurate(target):
+                self.lane_detector.reset()
+                self._reset_results()
+                self.stats_aggregator.mark_discontinuity()
+                return
+
+    def _seek_accurate(self, target: int) -> bool:
+        """키프레임으로 이동 후 목표 프레임까지 전진 디코딩
+
+        Returns:
+            False - 전진 도중 새 Seek 요청이 들어와 중단됨
+        """
+        if self.total_frames > 0:
+            target = max(0, min(target, self.total_frames - 1))
+
+        current = self.current_frame_number
+        index = self.frame_index
+
+        if index is not None and index.has_keyframes:
+            keyframe = index.nearest_keyframe(target)
+            # 현재 위치와 목표 사이에 키프레임이 없으면 그대로 전진
+            if not (keyframe <= current <= target):
+                self.cap.seek(keyframe)
+                current = keyframe
+        elif not (0 <= target - current <= APP_CONST.SEEK_MAX_FORWARD_FRAMES):
+            # 인덱스 생성 전: 기존 방식
+            self.cap.seek(target)
+            current = target
+
+        while current < target:
+            # 새 요청 확인 (int 읽기는 원자적)
+            if self.seek_to >= 0:
+                self.current_frame_number = current
+                return False
+
+            # grab()은 색변환 없이 디코딩만 수행
+            if not self.cap.grab():
+                break
+            current += 1
+
+        self.current_frame_number = current
+        return True
+
     def stop(self) -> None:
         """스레드 정지"""
         self.is_running = False
+        self._stop_stream()
         if self.cap:
             self.cap.release()
             self.cap = None
@@ -219,4 +794,8 @@ class VideoProcessor(QThread):
     def cleanup(self) -> None:
         """리소스 정리"""
         self.stop()
+        self.stop_export()
+        self._stop_index_build()
+        self.detection_engine.close()
+        self.settings.unsubscribe(self._on_settings_changed)
         self.model_manager.unload_models()
\ No newline at end of file
@@ -2,7 +2,17 @@
 # src/models/__init__.py
 # ============================================================================
 
-from .stats import DetectionStats
-from .detection import Detection, LaneLines
+from .stats import (DetectionStats, StreamStats, ServerMetrics, StreamSLOStats,
+                    BufferPoolStats, VideoSummary)
+from .detection import Detection, LaneLines, Track
+from .frame_index import FrameIndex
+from .thumbnails import ThumbnailStrip
+from .timeline import EventTimeline
+from .export import ExportOptions, ExportResult
+from .overlay import RLEMask, PolygonMask, FrameOverlay
 
-__all__ = ['DetectionStats', 'Detection', 'LaneLines']
\ No newline at end of file
+__all__ = ['DetectionStats', 'StreamStats', 'ServerMetrics', 'StreamSLOStats',
+           'BufferPoolStats', 'VideoSummary', 'Detection', 'LaneLines', 'Track',
+           'FrameIndex', 'ThumbnailStrip', 'EventTimeline', 'ExportOptions',
+           'ExportResult', 'RLEMask', 'PolygonMask',
+           'FrameOverlay']
\ No newline at end of file
@@ -17,6 +17,9 @@ class Detection:
     confidence: float
     bbox: np.ndarray  # [x1, y1, x2, y2]
     distance: float
+    lane_zone: int = 0              # 0: 차선 밖 / 1: 자차 차선 / 2: 인접 차선 (APP_CONST.LANE_ZONE_*)
+    ttc: float = float('inf')       # 충돌 예상 시간 (초, 자차 차선 접근 객체만, 그 외 inf)
+    hazard: bool = False            # 자차 경로 위험 (자차 차선 + 위험 거리 또는 TTC)
 
     @property
     def center(self) -> Tuple[int, int]:
@@ -34,9 +37,9 @@ class Detection:
         """바운딩 박스 높이"""
         return int(self.bbox[3] - self.bbox[1])
 
-    def is_dangerous(self, threshold: float = 5.0) -> bool:
-        """위험 거리 판단"""
-        return self.distance < threshold
+    def is_dangerous(self) -> bool:
+        """자차 경로 위험 여부 (DangerZoneIndex 판정)"""
+        return self.hazard
 
 
 @dataclass
@@ -44,6 +47,8 @@ class LaneLines:
     """차선 정보"""
     left_lane: Tuple[int, int, int, int] | None = None
     right_lane: Tuple[int, int, int, int] | None = None
+    offset_m: float | None = None      # 차선 중심 대비 차량 횡방향 오프셋 (m, 우측 +)
+    lane_width_m: float | None = None  # 차선 폭 (m)
 
     def is_complete(self) -> bool:
         """양쪽 차선 모두 감지되었는지"""
@@ -57,3 +62,31 @@ class LaneLines:
         lane_center = (self.left_lane[0] + self.right_lane[0]) // 2
         frame_center = frame_width // 2
         return frame_center - lane_center
+
+    def is_departing(self, frame_width: int,
+                     offset_threshold_px: int = 50,
+                     offset_threshold_m: float = 0.5) -> bool:
+        """차선 이탈 여부 (미터 오프셋이 있으면 우선 사용)"""
+        if not self.is_complete():
+            return False
+        if self.offset_m is not None:
+            return abs(self.offset_m) > offset_threshold_m
+        return abs(self.get_center_offset(frame_width)) > offset_threshold_px
+
+
+@dataclass
+class Track:
+    """프레임 간 같은 객체로 이어진 탐지 (IoU 추적)"""
+    track_id: int
+    class_name: str
+    bbox: np.ndarray
+    first_seen: float               # 영상 시각 (초)
+    last_seen: float
+    hits: int = 1                   # 매칭된 프레임 수
+    missed: int = 0                 # 연속으로 놓친 프레임 수
+    dangerous: bool = False         # 한 번이라도 자차 경로 위험이었는지
+
+    @property
+    def dwell_sec(self) -> float:
+        """체류 시간 (처음 ~ 마지막으로 보인 시각)"""
+        return self.last_seen - self.first_seen
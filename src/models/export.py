@@ -0,0 +1,51 @@
+# ============================================================================
+# src/models/export.py
+# 주석 영상 내보내기 옵션 / 결과 데이터 모델
+# ============================================================================
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple
+
+
+@dataclass
+class ExportOptions:
+    """내보내기 옵션"""
+    output_path: str
+    width: int = 0               # 출력 폭 (0: 원본, 높이는 비율 유지)
+    codec: str = "h264"          # h264 / hevc / mp4v / mjpeg
+    bitrate_kbps: int = 0        # 0: 인코더 기본값 (ffmpeg 백엔드만 적용)
+    backend: str = "auto"        # auto / ffmpeg / opencv
+    drop_when_full: bool = False  # 큐가 가득 차면 대기 대신 프레임 버림 (라이브용)
+    mask_format: str = ""        # Segmentation 마스크 사이드카: '' (저장 안 함) / rle / polygon
+    export_detections: bool = False  # 탐지 박스 사이드카 (원본 픽셀 좌표)
+
+    @property
+    def mask_path(self) -> str:
+        """마스크 사이드카 경로 (out.mp4 → out.masks.jsonl)"""
+        return str(Path(self.output_path).with_suffix('.masks.jsonl'))
+
+    @property
+    def detections_path(self) -> str:
+        """탐지 사이드카 경로 (out.mp4 → out.detections.jsonl)"""
+        return str(Path(self.output_path).with_suffix('.detections.jsonl'))
+
+    def output_size(self, width: int, height: int) -> Tuple[int, int]:
+        """원본 크기 → 출력 크기 (짝수로 맞춤, 확대하지 않음)"""
+        if 0 < self.width < width:
+            height = round(height * self.width / width)
+            width = self.width
+        return width - width % 2, height - height % 2
+
+
+@dataclass
+class ExportResult:
+    """내보내기 결과"""
+    output_path: str
+    frames_written: int = 0
+    frames_dropped: int = 0
+    encode_fps: float = 0.0      # 인코더 스레드 처리량 (프레임/초)
+    mask_path: str = ""          # 저장한 마스크 사이드카 (없으면 빈 문자열)
+    detections_path: str = ""    # 저장한 탐지 사이드카
+    success: bool = True
+    error: str = ""
@@ -0,0 +1,61 @@
+# ============================================================================
+# src/models/frame_index.py
+# 키프레임 / 타임스탬프 인덱스 데이터 모델
+# ============================================================================
+
+from dataclasses import dataclass
+from pathlib import Path
+import numpy as np
+
+
+@dataclass
+class FrameIndex:
+    """비디오 키프레임 / 타임스탬프 인덱스"""
+    video_path: str
+    total_frames: int
+    fps: float
+    keyframes: np.ndarray      # 키프레임 번호 (오름차순)
+    timestamps_ms: np.ndarray  # 프레임별 PTS (ms)
+
+    @property
+    def has_keyframes(self) -> bool:
+        """실제 키프레임 정보 보유 여부"""
+        return len(self.keyframes) > 0
+
+    def nearest_keyframe(self, frame_number: int) -> int:
+        """frame_number 이하의 가장 가까운 키프레임"""
+        if not self.has_keyframes:
+            return frame_number
+
+        pos = int(np.searchsorted(self.keyframes, frame_number, side='right')) - 1
+        if pos < 0:
+            return int(self.keyframes[0])
+        return int(self.keyframes[pos])
+
+    def timestamp_of(self, frame_number: int) -> float:
+        """프레임 PTS (ms)"""
+        if 0 <= frame_number < len(self.timestamps_ms):
+            return float(self.timestamps_ms[frame_number])
+        return frame_number * 1000.0 / self.fps if self.fps > 0 else 0.0
+
+    def save(self, path: Path) -> None:
+        """npz 로 저장"""
+        np.savez_compressed(
+            path,
+            total_frames=np.int64(self.total_frames),
+            fps=np.float64(self.fps),
+            keyframes=self.keyframes.astype(np.int64),
+            timestamps_ms=self.timestamps_ms.astype(np.float64)
+        )
+
+    @classmethod
+    def load(cls, path: Path, video_path: str) -> 'FrameIndex':
+        """npz 에서 로드"""
+        with np.load(path) as data:
+            return cls(
+                video_path=video_path,
+                total_frames=int(data['total_frames']),
+                fps=float(data['fps']),
+                keyframes=data['keyframes'],
+                timestamps_ms=data['timestamps_ms']
+            )
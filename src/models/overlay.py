@@ -0,0 +1,96 @@
+# ============================================================================
+# src/models/overlay.py
+# 프레임 오버레이 데이터 (픽셀과 분리된 주석 정보)
+# ============================================================================
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .detection import Detection, LaneLines
+
+
+@dataclass
+class RLEMask:
+    """런 길이 인코딩 마스크
+
+    행 우선(row-major)으로 펼친 픽셀을 0 런부터 번갈아 센다
+    (counts = [0 개수, 1 개수, 0 개수, ...]).
+    """
+    height: int
+    width: int
+    counts: np.ndarray              # uint32
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.height, self.width
+
+    @property
+    def area(self) -> int:
+        """전경 픽셀 수 (홀수 번째 런의 합)"""
+        return int(self.counts[1::2].sum())
+
+
+@dataclass
+class PolygonMask:
+    """외곽선 다각형 마스크 (구멍은 표현하지 않음)
+
+    해상도와 무관하게 좌표만 바꿔 확대 / 축소할 수 있다.
+    """
+    height: int
+    width: int
+    polygons: List[np.ndarray] = field(default_factory=list)  # (K, 2) int32 (x, y)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.height, self.width
+
+    @property
+    def area(self) -> int:
+        """채워지는 픽셀 수 (경계 포함, polygon_iou / decode 와 같은 기준)
+
+        꼭짓점은 픽셀 중심이라 신발끈 공식은 경계 픽셀을 반씩 빼먹는다
+        (10x10 마스크가 81). 외곽 경계 상자 안에서만 fillPoly 로 센다.
+        """
+        if not self.polygons:
+            return 0
+        points = np.concatenate(self.polygons)
+        x0, y0 = points.min(axis=0)
+        x1, y1 = points.max(axis=0) + 1
+        canvas = np.zeros((int(y1 - y0), int(x1 - x0)), dtype=np.uint8)
+        offset = np.array([x0, y0], dtype=np.int32)
+        cv2.fillPoly(canvas, [p - offset for p in self.polygons], 1)
+        return int(np.count_nonzero(canvas))
+
+
+@dataclass
+class FrameOverlay:
+    """프레임에 그릴 주석 (박스 / 차선 / 마스크)
+
+    burned_in 이면 픽셀에 이미 그려져 있고, 아니면 표시 / 내보내기 시점에
+    현재 설정(레이블, 거리 표시)으로 그린다. 좌표는 분석 해상도(frame_size)
+    기준이고, source_size 는 분석 해상도로 줄이기 전 원본 크기다.
+    """
+    frame_size: Tuple[int, int]     # (width, height)
+    source_size: Optional[Tuple[int, int]] = None   # None: frame_size 와 같음
+    detections: List[Detection] = field(default_factory=list)
+    lanes: LaneLines = field(default_factory=LaneLines)
+    masks: List[RLEMask] = field(default_factory=list)
+    mask_colors: Optional[np.ndarray] = None    # (N, 3) BGR
+    burned_in: bool = False
+    frame_number: int = -1          # 원본 비디오 프레임 번호 (-1: 모름)
+
+    @property
+    def source_scale(self) -> Tuple[float, float]:
+        """분석 좌표 → 원본 픽셀 배율 (x, y)"""
+        if self.source_size is None or self.frame_size[0] == 0:
+            return 1.0, 1.0
+        return (self.source_size[0] / self.frame_size[0],
+                self.source_size[1] / self.frame_size[1])
+
+    @property
+    def is_empty(self) -> bool:
+        return (not self.detections and not self.masks and
+                self.lanes.left_lane is None and self.lanes.right_lane is None)
@@ -11,15 +11,139 @@ from typing import Dict
 class DetectionStats:
     """탐지 통계"""
     total_objects: int = 0
-    dangerous_objects: int = 0
+    dangerous_objects: int = 0      # 자차 경로 위험 객체 수
+    in_path_objects: int = 0        # 자차 차선 객체 수
+    min_ttc: float = float('inf')   # 자차 차선 객체 중 최소 TTC (초)
     fps: float = 0.0
     processing_time: float = 0.0
     object_counts: Dict[str, int] = field(default_factory=dict)
+    inference_skipped: bool = False
+    skip_ratio: float = 0.0
+    imgsz: int = 0
+    stream_latency_ms: float = 0.0
+    dropped_frames: int = 0
+    memory_mb: float = 0.0          # 프로세스 RSS (메모리 예산 지정 시)
+    raw_boxes: int = 0              # 모델이 돌려준 박스 수 (후처리 전)
+    dropped_boxes: Dict[str, int] = field(default_factory=dict)  # 단계별 버린 박스 수
 
     def reset(self) -> None:
         """통계 초기화"""
         self.total_objects = 0
         self.dangerous_objects = 0
+        self.in_path_objects = 0
+        self.min_ttc = float('inf')
         self.fps = 0.0
         self.processing_time = 0.0
-        self.object_counts.clear()
\ No newline at end of file
+        self.object_counts.clear()
+        self.inference_skipped = False
+        self.skip_ratio = 0.0
+        self.imgsz = 0
+        self.stream_latency_ms = 0.0
+        self.dropped_frames = 0
+        self.memory_mb = 0.0
+        self.raw_boxes = 0
+        self.dropped_boxes.clear()
+
+
+@dataclass
+class StreamStats:
+    """라이브 스트림 수신 통계"""
+    connected: bool = False
+    reconnects: int = 0
+    frames_grabbed: int = 0
+    frames_delivered: int = 0
+    capture_fps: float = 0.0
+    frame_age_ms: float = 0.0     # grab 시점 → 소비자 전달까지
+    read_wait_ms: float = 0.0     # 소비자가 새 프레임을 기다린 시간
+
+    @property
+    def frames_dropped(self) -> int:
+        """전달되지 않고 버려진 프레임 수"""
+        return max(0, self.frames_grabbed - self.frames_delivered)
+
+
+@dataclass
+class ServerMetrics:
+    """추론 서버 / 배치 스케줄러 지표"""
+    clients: int = 0
+    requests: int = 0
+    frames: int = 0
+    batches: int = 0
+    errors: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    avg_batch_frames: float = 0.0
+    queue_wait_ms: float = 0.0      # 도착 → 배치 시작 (평균)
+    inference_ms: float = 0.0       # 배치당 추론 시간 (평균)
+    latency_p50_ms: float = 0.0     # 도착 → 응답 (최근 요청)
+    latency_p95_ms: float = 0.0
+    slo_misses: int = 0             # 스트림 지연 목표를 넘긴 요청 수
+
+
+@dataclass
+class StreamSLOStats:
+    """배치 스케줄러 스트림별 처리 / 지연 목표(SLO) 통계"""
+    stream_id: int = 0
+    slo_ms: float = 0.0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    pending: int = 0
+    frames: int = 0                 # 처리된 프레임 수 (공정성 확인용)
+    slo_misses: int = 0
+    queue_wait_ms: float = 0.0      # 도착 → 배치 시작 (평균)
+    latency_p50_ms: float = 0.0     # 도착 → 결과 (최근 요청)
+    latency_p95_ms: float = 0.0
+
+    @property
+    def slo_attainment(self) -> float:
+        """지연 목표 안에 끝난 요청 비율"""
+        if self.completed == 0:
+            return 1.0
+        return 1.0 - self.slo_misses / self.completed
+
+
+@dataclass
+class BufferPoolStats:
+    """프레임 버퍼 풀 통계"""
+    allocations: int = 0            # 풀에 없어 새로 할당한 횟수
+    reuses: int = 0
+    free_buffers: int = 0
+    free_bytes: int = 0
+    trimmed_bytes: int = 0          # 메모리 예산 초과로 해제한 양 (누적)
+
+    @property
+    def reuse_ratio(self) -> float:
+        """요청 중 재사용 비율"""
+        total = self.allocations + self.reuses
+        return self.reuses / total if total else 0.0
+
+
+@dataclass
+class VideoSummary:
+    """영상 전체 누적 통계 (스트리밍 집계 결과)"""
+    source: str = ""
+    frames: int = 0
+    duration_sec: float = 0.0
+    track_counts: Dict[str, int] = field(default_factory=dict)      # 클래스별 고유 객체 수
+    detection_counts: Dict[str, int] = field(default_factory=dict)  # 클래스별 프레임 탐지 누적
+    dwell_sec: Dict[str, Dict[str, float]] = field(default_factory=dict)  # 클래스별 mean/p50/p95/max
+    dangerous_tracks: int = 0       # 한 번이라도 자차 경로 위험이었던 객체 수
+    danger_events: int = 0          # 위험 구간 시작 횟수
+    danger_sec: float = 0.0
+    departure_events: int = 0       # 차선 이탈 구간 수
+    departure_sec: float = 0.0
+    departure_max_sec: float = 0.0
+    fps_mean: float = 0.0
+    fps_p5: float = 0.0             # 하위 5% FPS
+    latency_mean_ms: float = 0.0
+    latency_p50_ms: float = 0.0
+    latency_p95_ms: float = 0.0
+    latency_p99_ms: float = 0.0
+    latency_max_ms: float = 0.0
+    raw_boxes: int = 0              # 모델이 돌려준 박스 누적 (추론한 프레임만)
+    dropped_boxes: Dict[str, int] = field(default_factory=dict)  # 단계별 버린 박스 누적
+
+    @property
+    def total_tracks(self) -> int:
+        return sum(self.track_counts.values())
@@ -0,0 +1,79 @@
+# ============================================================================
+# src/models/thumbnails.py
+# 썸네일 스프라이트 데이터 모델
+# ============================================================================
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+import cv2
+import numpy as np
+
+
+@dataclass
+class ThumbnailStrip:
+    """비디오 썸네일 스프라이트 (N개 축소 프레임을 격자로 배치)"""
+    sprite: np.ndarray         # (rows*tile_h, cols*tile_w, 3) BGR
+    frame_numbers: np.ndarray  # 썸네일별 실제 프레임 번호
+    tile_width: int
+    tile_height: int
+    columns: int
+    total_frames: int
+    complete: bool = True      # 모든 슬롯을 채웠는지 (중간에 읽기 실패하면 캐시하지 않음)
+
+    @property
+    def count(self) -> int:
+        """썸네일 개수"""
+        return len(self.frame_numbers)
+
+    def index_for_ratio(self, ratio: float) -> int:
+        """진행 비율(0~1) → 가장 가까운 썸네일 인덱스"""
+        target = ratio * max(self.total_frames - 1, 0)
+        pos = int(np.searchsorted(self.frame_numbers, target))
+        if pos <= 0:
+            return 0
+        if pos >= self.count:
+            return self.count - 1
+        before = self.frame_numbers[pos - 1]
+        after = self.frame_numbers[pos]
+        return pos - 1 if target - before <= after - target else pos
+
+    def get(self, index: int) -> Optional[np.ndarray]:
+        """썸네일 이미지 (스프라이트 뷰, 복사 없음)"""
+        if not 0 <= index < self.count:
+            return None
+        row, col = divmod(index, self.columns)
+        y = row * self.tile_height
+        x = col * self.tile_width
+        return self.sprite[y:y + self.tile_height, x:x + self.tile_width]
+
+    def save(self, path: Path, quality: int = 80) -> None:
+        """JPEG 인코딩된 스프라이트를 npz 로 저장"""
+        ok, encoded = cv2.imencode('.jpg', self.sprite,
+                                   [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not ok:
+            raise ValueError("스프라이트 인코딩 실패")
+
+        np.savez(
+            path,
+            sprite_jpeg=encoded,
+            frame_numbers=self.frame_numbers.astype(np.int64),
+            meta=np.array([self.tile_width, self.tile_height,
+                           self.columns, self.total_frames], dtype=np.int64)
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> 'ThumbnailStrip':
+        """npz 에서 로드"""
+        with np.load(path) as data:
+            sprite = cv2.imdecode(data['sprite_jpeg'], cv2.IMREAD_COLOR)
+            tile_width, tile_height, columns, total_frames = (
+                int(v) for v in data['meta'])
+            return cls(
+                sprite=sprite,
+                frame_numbers=data['frame_numbers'],
+                tile_width=tile_width,
+                tile_height=tile_height,
+                columns=columns,
+                total_frames=total_frames
+            )
@@ -0,0 +1,76 @@
+# ============================================================================
+# src/models/timeline.py
+# 이벤트 타임라인 데이터 모델
+# ============================================================================
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+import numpy as np
+
+
+@dataclass
+class EventTimeline:
+    """비디오 전체 이벤트 타임라인 (샘플 프레임 단위)"""
+    frame_numbers: np.ndarray    # 샘플 프레임 번호 (오름차순)
+    danger_counts: np.ndarray    # 위험 객체 수
+    object_counts: np.ndarray    # 전체 객체 수 (밀도)
+    lane_departures: np.ndarray  # 차선 이탈 여부 (bool)
+    total_frames: int
+
+    def __post_init__(self):
+        self._event_starts: Optional[np.ndarray] = None
+
+    @property
+    def count(self) -> int:
+        """샘플 개수"""
+        return len(self.frame_numbers)
+
+    @property
+    def event_mask(self) -> np.ndarray:
+        """이벤트(위험 또는 차선 이탈) 샘플 마스크"""
+        return (self.danger_counts > 0) | self.lane_departures
+
+    @property
+    def event_starts(self) -> np.ndarray:
+        """연속 이벤트 구간의 시작 프레임 번호"""
+        if self._event_starts is None:
+            mask = self.event_mask
+            starts = mask & ~np.concatenate(([False], mask[:-1]))
+            self._event_starts = self.frame_numbers[starts]
+        return self._event_starts
+
+    def next_event(self, frame_number: int) -> Optional[int]:
+        """frame_number 이후 다음 이벤트 시작 프레임"""
+        starts = self.event_starts
+        pos = int(np.searchsorted(starts, frame_number, side='right'))
+        return int(starts[pos]) if pos < len(starts) else None
+
+    def prev_event(self, frame_number: int) -> Optional[int]:
+        """frame_number 이전 이벤트 시작 프레임"""
+        starts = self.event_starts
+        pos = int(np.searchsorted(starts, frame_number, side='left')) - 1
+        return int(starts[pos]) if pos >= 0 else None
+
+    def save(self, path: Path) -> None:
+        """npz 로 저장"""
+        np.savez_compressed(
+            path,
+            frame_numbers=self.frame_numbers.astype(np.int64),
+            danger_counts=self.danger_counts.astype(np.int16),
+            object_counts=self.object_counts.astype(np.int16),
+            lane_departures=self.lane_departures.astype(bool),
+            total_frames=np.int64(self.total_frames)
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> 'EventTimeline':
+        """npz 에서 로드"""
+        with np.load(path) as data:
+            return cls(
+                frame_numbers=data['frame_numbers'],
+                danger_counts=data['danger_counts'],
+                object_counts=data['object_counts'],
+                lane_departures=data['lane_departures'],
+                total_frames=int(data['total_frames'])
+            )
@@ -4,24 +4,31 @@
 # ============================================================================
 
 import sys
-import cv2
 import numpy as np
 from pathlib import Path
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QFileDialog, QCheckBox, QGroupBox,
-    QSpinBox, QSplitter, QFrame
+    QSpinBox, QSplitter, QFrame, QInputDialog, QComboBox
 )
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtCore import Qt, QTimer, QRectF
+from PySide6.QtGui import QImage, QPainter, QPixmap
 
 from ..config.constants import APP_CONST, COLOR
 from ..config.settings import SettingsManager
 from ..core.video_processor import VideoProcessor
+from ..core.thumbnail_generator import ThumbnailGenerator
+from ..core.timeline_scanner import TimelineScanner
+from ..models.frame_index import FrameIndex
 from ..models.stats import DetectionStats
+from ..models.overlay import FrameOverlay
+from ..models.export import ExportOptions
+from ..utils.video_source import VideoSource
 from .widgets.progress_bar import MediaProgressBar
 from .widgets.stats_widget import StatsWidget
+from .widgets.overlay_painter import OverlayPainter
+from .widgets.video_surface import GLVideoSurface
 from .styles.theme import AppTheme
 
 
@@ -44,17 +51,37 @@ class MainWindow(QMainWindow):
         self.video_processor.frame_ready.connect(self.on_frame_ready)
         self.video_processor.video_finished.connect(self.on_video_finished)
         self.video_processor.error_occurred.connect(self.on_error)
+        self.video_processor.frame_index_ready.connect(self._on_frame_index_ready)
+        self.video_processor.stream_status_changed.connect(
+            self._on_stream_status_changed
+        )
+
+        # 썸네일 생성기
+        self.thumbnail_generator = None
+        self._thumbnail_source = None
+
+        # 사전 스캔
+        self.timeline_scanner = None
 
         # 현재 pixmap 캐싱
         self.current_pixmap = None
+
+        # 오버레이 데이터 모드의 표시 시점 렌더러
+        self.overlay_painter = OverlayPainter()
         self.video_path = video_path
 
         # UI 초기화
         self.setStyleSheet(AppTheme.get_main_stylesheet())
         self.init_ui()
+        self.settings.subscribe(self._sync_controls)
+
+        # 누적 통계 주기적 갱신 (프레임마다 집계하지 않음)
+        self.summary_timer = QTimer(self)
+        self.summary_timer.timeout.connect(self._refresh_summary)
+        self.summary_timer.start(APP_CONST.SUMMARY_REFRESH_MS)
 
         # 초기 비디오 로드
-        if Path(video_path).exists():
+        if VideoSource.is_available(video_path):
             QTimer.singleShot(100, lambda: self.load_and_play_video(video_path))
 
     def init_ui(self):
@@ -100,6 +127,12 @@ class MainWindow(QMainWindow):
         self.open_btn.clicked.connect(self.open_video)
         layout.addWidget(self.open_btn)
 
+        # 스트림 열기 (RTSP/HTTP/카메라)
+        self.stream_btn = QPushButton("🌐 스트림")
+        self.stream_btn.setFixedWidth(90)
+        self.stream_btn.clicked.connect(self.open_stream)
+        layout.addWidget(self.stream_btn)
+
         # 재생/일시정지
         self.play_btn = QPushButton("▶ 재생")
         self.play_btn.setFixedWidth(100)
@@ -112,6 +145,48 @@ class MainWindow(QMainWindow):
         self.stop_btn.clicked.connect(self.stop_video)
         layout.addWidget(self.stop_btn)
 
+        # 주석 영상 녹화 (처리된 프레임을 MP4 로 저장)
+        self.record_btn = QPushButton("⏺ 녹화")
+        self.record_btn.setFixedWidth(90)
+        self.record_btn.setCheckable(True)
+        self.record_btn.setToolTip("분석 결과가 그려진 영상을 파일로 저장")
+        self.record_btn.clicked.connect(self.toggle_recording)
+        layout.addWidget(self.record_btn)
+
+        # 설정 프로파일
+        self.save_profile_btn = QPushButton("💾")
+        self.save_profile_btn.setFixedWidth(40)
+        self.save_profile_btn.setToolTip("설정 프로파일 저장")
+        self.save_profile_btn.clicked.connect(self.save_profile)
+        layout.addWidget(self.save_profile_btn)
+
+        self.load_profile_btn = QPushButton("📂")
+        self.load_profile_btn.setFixedWidth(40)
+        self.load_profile_btn.setToolTip("설정 프로파일 불러오기")
+        self.load_profile_btn.clicked.connect(self.load_profile)
+        layout.addWidget(self.load_profile_btn)
+
+        layout.addSpacing(10)
+
+        # 사전 스캔 / 이벤트 이동
+        self.scan_btn = QPushButton("🔎 스캔")
+        self.scan_btn.setFixedWidth(80)
+        self.scan_btn.setToolTip("저해상도 사전 스캔으로 이벤트 타임라인 생성")
+        self.scan_btn.clicked.connect(self.start_timeline_scan)
+        layout.addWidget(self.scan_btn)
+
+        self.prev_event_btn = QPushButton("⏮")
+        self.prev_event_btn.setFixedWidth(40)
+        self.prev_event_btn.setToolTip("이전 이벤트")
+        self.prev_event_btn.clicked.connect(lambda: self.jump_to_event(forward=False))
+        layout.addWidget(self.prev_event_btn)
+
+        self.next_event_btn = QPushButton("⏭")
+        self.next_event_btn.setFixedWidth(40)
+        self.next_event_btn.setToolTip("다음 이벤트")
+        self.next_event_btn.clicked.connect(lambda: self.jump_to_event(forward=True))
+        layout.addWidget(self.next_event_btn)
+
         layout.addSpacing(20)
 
         # 구분선
@@ -152,6 +227,40 @@ class MainWindow(QMainWindow):
         )
         layout.addWidget(self.lane_check)
 
+        # 버드아이 차선 (미터 오프셋)
+        self.birdseye_check = QCheckBox("🦅 버드아이")
+        self.birdseye_check.setToolTip("역원근 변환 영상에서 차선 감지 (미터 단위 오프셋)")
+        self.birdseye_check.setChecked(self.settings.get('birdseye_lanes', False))
+        self.birdseye_check.stateChanged.connect(
+            lambda: self.settings.set('birdseye_lanes',
+                                      self.birdseye_check.isChecked())
+        )
+        layout.addWidget(self.birdseye_check)
+
+        # 정지 장면 추론 스킵
+        self.motion_gate_check = QCheckBox("💤 정지 스킵")
+        self.motion_gate_check.setToolTip("정지 장면에서는 이전 탐지 결과를 재사용")
+        self.motion_gate_check.setChecked(
+            self.settings.get('motion_gate_enabled', True)
+        )
+        self.motion_gate_check.stateChanged.connect(
+            lambda: self.settings.set('motion_gate_enabled',
+                                      self.motion_gate_check.isChecked())
+        )
+        layout.addWidget(self.motion_gate_check)
+
+        # 타일 추론 (원거리 소형 객체)
+        self.tiled_check = QCheckBox("🧩 타일 추론")
+        self.tiled_check.setToolTip("지평선 밴드를 타일로 나눠 원거리 객체 검출")
+        self.tiled_check.setChecked(
+            self.settings.get('tiled_inference_enabled', False)
+        )
+        self.tiled_check.stateChanged.connect(
+            lambda: self.settings.set('tiled_inference_enabled',
+                                      self.tiled_check.isChecked())
+        )
+        layout.addWidget(self.tiled_check)
+
         layout.addSpacing(10)
 
         # 레이블 표시
@@ -172,13 +281,25 @@ class MainWindow(QMainWindow):
         )
         layout.addWidget(self.distance_check)
 
+        # 지면 평면 거리 추정
+        self.ground_check = QCheckBox("📐 지면 거리")
+        self.ground_check.setToolTip("박스 하단 위치 + 카메라 높이로 거리 추정")
+        self.ground_check.setChecked(self.settings.get('ground_plane_distance', False))
+        self.ground_check.stateChanged.connect(
+            lambda: self.settings.set('ground_plane_distance',
+                                      self.ground_check.isChecked())
+        )
+        layout.addWidget(self.ground_check)
+
         layout.addSpacing(10)
 
         # 신뢰도
         layout.addWidget(QLabel("신뢰도:"))
         self.conf_spinbox = QSpinBox()
         self.conf_spinbox.setRange(10, 90)
-        self.conf_spinbox.setValue(50)
+        self.conf_spinbox.setValue(
+            int(round(self.settings.get('confidence_threshold', 0.5) * 100))
+        )
         self.conf_spinbox.setSuffix("%")
         self.conf_spinbox.setFixedWidth(70)
         self.conf_spinbox.valueChanged.connect(
@@ -192,13 +313,29 @@ class MainWindow(QMainWindow):
         layout.addWidget(QLabel("프레임 스킵:"))
         self.skip_spinbox = QSpinBox()
         self.skip_spinbox.setRange(0, 5)
-        self.skip_spinbox.setValue(0)
+        self.skip_spinbox.setValue(self.settings.get('frame_skip', 0))
         self.skip_spinbox.setFixedWidth(60)
         self.skip_spinbox.valueChanged.connect(
             lambda v: self.settings.set('frame_skip', v)
         )
         layout.addWidget(self.skip_spinbox)
 
+        layout.addSpacing(10)
+
+        # 추론 입력 크기 (자동: 목표 FPS 에 맞춰 조절)
+        layout.addWidget(QLabel("입력:"))
+        self.imgsz_combo = QComboBox()
+        self.imgsz_combo.addItem(self.IMGSZ_AUTO_TEXT)
+        for step in APP_CONST.IMGSZ_STEPS:
+            self.imgsz_combo.addItem(str(step))
+        self.imgsz_combo.setToolTip(
+            f"추론 입력 크기 (자동: 목표 {self.settings.get('target_fps'):.0f} FPS)"
+        )
+        self.imgsz_combo.setFixedWidth(80)
+        self._set_imgsz_combo(self.settings.snapshot())
+        self.imgsz_combo.currentTextChanged.connect(self._on_imgsz_changed)
+        layout.addWidget(self.imgsz_combo)
+
         layout.addStretch()
 
         group.setLayout(layout)
@@ -213,8 +350,20 @@ class MainWindow(QMainWindow):
         video_layout = QVBoxLayout(video_container)
         video_layout.setContentsMargins(0, 0, 0, 0)
 
-        self.video_label = QLabel()
-        self.video_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # OpenGL 표시: 텍스처로 올려 GPU 축소, 오버레이는 벡터로 그림
+        self.video_surface = None
+        if self.settings.get('display_backend') == 'opengl':
+            if GLVideoSurface.is_available():
+                self.video_surface = GLVideoSurface(self.video_processor.release_frame)
+                self.video_processor.vector_overlays = True
+            else:
+                print("⚠️  OpenGL 위젯을 사용할 수 없어 기본 표시로 전환합니다")
+
+        if self.video_surface is not None:
+            self.video_label = self.video_surface
+        else:
+            self.video_label = QLabel()
+            self.video_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.video_label.setStyleSheet(f"""
             background-color: #000000;
             border: 2px solid {COLOR.BORDER_COLOR};
@@ -240,41 +389,206 @@ class MainWindow(QMainWindow):
         return splitter
 
     def _on_segmentation_changed(self):
-        """Segmentation 옵션 변경"""
-        enabled = self.segmentation_check.isChecked()
-        self.settings.set('segmentation_enabled', enabled)
+        """Segmentation 옵션 변경 (모델 로드는 VideoProcessor 옵저버가 처리)"""
+        self.settings.set('segmentation_enabled',
+                          self.segmentation_check.isChecked())
+
+    IMGSZ_AUTO_TEXT = "자동"
+
+    def _on_imgsz_changed(self, text: str):
+        """추론 입력 크기 변경"""
+        if text == self.IMGSZ_AUTO_TEXT:
+            self.settings.set('auto_imgsz', True)
+        else:
+            self.settings.update(auto_imgsz=False, inference_imgsz=int(text))
 
-        if enabled:
-            QTimer.singleShot(0,
-                              self.video_processor.model_manager.load_segmentation_model
-                              )
+    def _set_imgsz_combo(self, snapshot):
+        """설정값을 입력 크기 콤보박스에 반영 (목록에 없는 크기는 추가)"""
+        if snapshot.auto_imgsz:
+            text = self.IMGSZ_AUTO_TEXT
+        else:
+            text = str(snapshot.inference_imgsz)
+            if self.imgsz_combo.findText(text) < 0:
+                self.imgsz_combo.addItem(text)
+
+        self.imgsz_combo.blockSignals(True)
+        self.imgsz_combo.setCurrentText(text)
+        self.imgsz_combo.blockSignals(False)
+
+    def _setting_controls(self) -> dict:
+        """설정 키 → 체크박스"""
+        return {
+            'detection_enabled': self.detection_check,
+            'segmentation_enabled': self.segmentation_check,
+            'lane_detection_enabled': self.lane_check,
+            'birdseye_lanes': self.birdseye_check,
+            'motion_gate_enabled': self.motion_gate_check,
+            'tiled_inference_enabled': self.tiled_check,
+            'show_labels': self.label_check,
+            'show_distance': self.distance_check,
+            'ground_plane_distance': self.ground_check,
+        }
+
+    def _sync_controls(self, changed: dict, snapshot):
+        """설정 변경(프로파일 로드 등)을 컨트롤에 반영"""
+        for key, check in self._setting_controls().items():
+            if key in changed and check.isChecked() != getattr(snapshot, key):
+                check.blockSignals(True)
+                check.setChecked(getattr(snapshot, key))
+                check.blockSignals(False)
+
+        spin_values = {
+            'confidence_threshold': (self.conf_spinbox,
+                                     int(round(snapshot.confidence_threshold * 100))),
+            'frame_skip': (self.skip_spinbox, snapshot.frame_skip),
+        }
+        for key, (spinbox, value) in spin_values.items():
+            if key in changed and spinbox.value() != value:
+                spinbox.blockSignals(True)
+                spinbox.setValue(value)
+                spinbox.blockSignals(False)
+
+        if 'auto_imgsz' in changed or 'inference_imgsz' in changed:
+            self._set_imgsz_combo(snapshot)
+
+    def save_profile(self):
+        """현재 설정을 프로파일로 저장"""
+        name, ok = QInputDialog.getText(self, "프로파일 저장", "프로파일 이름:")
+        if ok and name.strip():
+            path = self.settings.save_profile(name.strip())
+            self.status_label.setText(f"💾 프로파일 저장: {path}")
+
+    def load_profile(self):
+        """저장된 프로파일 불러오기"""
+        profiles = self.settings.list_profiles()
+        if not profiles:
+            self.status_label.setText("저장된 프로파일이 없습니다")
+            return
+
+        name, ok = QInputDialog.getItem(self, "프로파일 불러오기", "프로파일:",
+                                        profiles, 0, False)
+        if not ok:
+            return
+        try:
+            if self.settings.load_profile(name):
+                self.status_label.setText(f"📂 프로파일 적용: {name}")
+        except ValueError as e:
+            self.status_label.setText(f"❌ {e}")
 
     def load_video(self, file_path: str) -> bool:
-        """비디오 로드"""
-        if not Path(file_path).exists():
+        """비디오 로드 (파일 경로 또는 스트림 URL / 카메라 장치)"""
+        if not VideoSource.is_available(file_path):
             self.status_label.setText(f"❌ 파일을 찾을 수 없습니다: {file_path}")
             return False
 
-        # 기존 재생 중지
+        # 기존 재생 / 녹화 중지
         if self.video_processor.is_running:
             self.video_processor.stop()
             self.video_processor.wait()
+        self._stop_recording()
 
         self.video_path = file_path
 
+        # 다른 비디오면 기존 썸네일 / 타임라인 제거
+        if self._thumbnail_source != file_path:
+            self._stop_thumbnail_generator()
+            self._stop_timeline_scanner()
+            self._thumbnail_source = None
+            self.progress_bar.set_thumbnails(None)
+            self.progress_bar.set_timeline(None)
+
         if self.video_processor.load_video(file_path):
             self.progress_bar.set_total_frames(
                 self.video_processor.total_frames,
                 self.video_processor.fps
             )
 
-            self.status_label.setText(f"✅ 로드 완료: {Path(file_path).name}")
+            if self.video_processor.is_live:
+                self.status_label.setText(
+                    f"📡 연결 중: {VideoSource.display_name(file_path)}"
+                )
+            else:
+                self.status_label.setText(f"✅ 로드 완료: {Path(file_path).name}")
             self.play_btn.setEnabled(True)
             return True
         else:
             self.status_label.setText("❌ 비디오를 로드할 수 없습니다")
             return False
 
+    def _on_frame_index_ready(self, index: FrameIndex):
+        """키프레임 인덱스 준비 → 썸네일 생성 시작"""
+        if index.video_path == self._thumbnail_source:
+            return
+
+        self._stop_thumbnail_generator()
+        self._thumbnail_source = index.video_path
+        self.thumbnail_generator = ThumbnailGenerator(index.video_path, index)
+        self.thumbnail_generator.thumbnails_ready.connect(self._on_thumbnails_ready)
+        self.thumbnail_generator.start()
+
+    def _on_thumbnails_ready(self, thumbnails):
+        """썸네일 생성 완료"""
+        self.progress_bar.set_thumbnails(thumbnails)
+
+    def _stop_thumbnail_generator(self):
+        """썸네일 생성 중단"""
+        if self.thumbnail_generator is not None:
+            self.thumbnail_generator.requestInterruption()
+            self.thumbnail_generator.wait()
+            self.thumbnail_generator = None
+
+    def start_timeline_scan(self):
+        """사전 스캔 시작"""
+        if self.timeline_scanner is not None or not Path(self.video_path).exists():
+            return
+
+        self.timeline_scanner = TimelineScanner(self.video_path)
+        self.timeline_scanner.progress.connect(
+            lambda p: self.status_label.setText(f"🔎 사전 스캔 중... {p}%")
+        )
+        self.timeline_scanner.timeline_ready.connect(self._on_timeline_ready)
+        self.timeline_scanner.finished.connect(self._on_timeline_scan_finished)
+        self.scan_btn.setEnabled(False)
+        self.timeline_scanner.start()
+
+    def _on_timeline_ready(self, timeline):
+        """타임라인 생성 완료"""
+        self.progress_bar.set_timeline(timeline)
+        self.status_label.setText(
+            f"🔎 스캔 완료: 이벤트 {len(timeline.event_starts)}개"
+        )
+
+    def _on_timeline_scan_finished(self):
+        """스캔 스레드 종료"""
+        self.timeline_scanner = None
+        self.scan_btn.setEnabled(True)
+
+    def _stop_timeline_scanner(self):
+        """사전 스캔 중단"""
+        if self.timeline_scanner is not None:
+            self.timeline_scanner.blockSignals(True)
+            self.timeline_scanner.requestInterruption()
+            self.timeline_scanner.wait()
+            self.timeline_scanner = None
+            self.scan_btn.setEnabled(True)
+
+    def jump_to_event(self, forward: bool = True):
+        """다음/이전 이벤트로 이동"""
+        timeline = self.progress_bar.timeline
+        if timeline is None:
+            self.status_label.setText("🔎 먼저 사전 스캔을 실행하세요")
+            return
+
+        current = self.progress_bar.current_frame
+        target = timeline.next_event(current) if forward \
+            else timeline.prev_event(current)
+
+        if target is None:
+            self.status_label.setText("이동할 이벤트가 없습니다")
+            return
+
+        self.on_seek_requested(target)
+
     def load_and_play_video(self, file_path: str):
         """비디오 로드 및 자동 재생"""
         if self.load_video(file_path):
@@ -285,7 +599,9 @@ class MainWindow(QMainWindow):
         if not self.video_processor.is_running:
             self.video_processor.start()
             self.play_btn.setText("⏸ 일시정지")
-            self.status_label.setText(f"🎬 재생 중: {Path(self.video_path).name}")
+            self.status_label.setText(
+                f"🎬 재생 중: {VideoSource.display_name(self.video_path)}"
+            )
 
     def open_video(self):
         """비디오 파일 열기"""
@@ -297,6 +613,70 @@ class MainWindow(QMainWindow):
         if file_path:
             self.load_video(file_path)
 
+    def open_stream(self):
+        """스트림 URL / 카메라 장치 열기"""
+        source, ok = QInputDialog.getText(
+            self, "스트림 열기",
+            "RTSP/HTTP URL 또는 카메라 번호 (예: rtsp://host/live, "
+            "http://127.0.0.1:8080/stream.mjpg, 0):"
+        )
+        source = source.strip()
+        if not ok or not source:
+            return
+
+        if not VideoSource.is_stream(source):
+            self.status_label.setText(f"❌ 지원하지 않는 스트림 주소: {source}")
+            return
+
+        self.load_and_play_video(source)
+
+    def _on_stream_status_changed(self, connected: bool):
+        """라이브 소스 연결 상태 표시"""
+        name = VideoSource.display_name(self.video_path)
+        if connected:
+            self.status_label.setText(f"📡 연결됨: {name}")
+        else:
+            self.status_label.setText(f"📡 연결 끊김 - 재연결 중: {name}")
+
+    def toggle_recording(self):
+        """주석 영상 녹화 시작/종료"""
+        if not self.record_btn.isChecked():
+            self._stop_recording()
+            return
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "주석 영상 저장", "annotated.mp4", "MP4 Video (*.mp4)"
+        )
+        if not file_path:
+            self.record_btn.setChecked(False)
+            return
+
+        # 재생이 멈추지 않도록 인코더가 밀리면 프레임을 버림
+        options = ExportOptions(output_path=file_path, drop_when_full=True)
+        if self.video_processor.start_export(options):
+            self.record_btn.setText("⏹ 녹화 중")
+            self.status_label.setText(f"⏺ 녹화 중: {Path(file_path).name}")
+        else:
+            self.record_btn.setChecked(False)
+
+    def _stop_recording(self):
+        """녹화 종료 및 결과 표시"""
+        self.record_btn.setChecked(False)
+        self.record_btn.setText("⏺ 녹화")
+
+        result = self.video_processor.stop_export()
+        if result is None:
+            return
+
+        if result.success:
+            message = (f"💾 저장 완료: {Path(result.output_path).name} "
+                       f"({result.frames_written} 프레임, 드롭 {result.frames_dropped}, "
+                       f"인코딩 {result.encode_fps:.0f} FPS)")
+            self.status_label.setText(message)
+            print(message)
+        else:
+            self.status_label.setText(f"❌ 저장 실패: {result.error}")
+
     def toggle_play(self):
         """재생/일시정지"""
         if not self.video_processor.is_running:
@@ -314,6 +694,7 @@ class MainWindow(QMainWindow):
         if self.video_processor.is_running:
             self.video_processor.stop()
             self.video_processor.wait()
+        self._stop_recording()
 
         self.play_btn.setText("▶ 재생")
         self.progress_bar.set_current_frame(0)
@@ -321,23 +702,42 @@ class MainWindow(QMainWindow):
         self.video_label.setText("⏹ 비디오가 정지되었습니다")
 
         # 비디오 재로드
-        if Path(self.video_path).exists():
+        if VideoSource.is_available(self.video_path):
             self.video_processor.load_video(self.video_path)
 
     def on_frame_ready(self, processed_frame: np.ndarray,
                        detections: list,
                        frame_number: int,
-                       stats: DetectionStats):
+                       stats: DetectionStats,
+                       overlay: FrameOverlay):
         """처리된 프레임 표시"""
-        # BGR to RGB
-        rgb_frame = cv2.cvtColor(processed_frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_frame.shape
+        if self.video_surface is not None:
+            # 축소 / 오버레이는 표시 위젯이 그릴 때 처리
+            self.video_surface.set_frame(processed_frame, overlay)
+        else:
+            self._show_frame_pixmap(processed_frame, overlay)
+
+        # 프로그레스 바 업데이트
+        self.progress_bar.set_current_frame(frame_number)
+
+        # 통계 업데이트
+        self.stats_widget.update_stats(stats)
+
+    def _show_frame_pixmap(self, processed_frame: np.ndarray,
+                           overlay: FrameOverlay = None):
+        """QLabel 표시 (CPU 에서 축소)"""
+        # BGR 버퍼를 그대로 감싸 변환 (RGB 사본 없음)
+        h, w, ch = processed_frame.shape
         bytes_per_line = ch * w
 
-        q_image = QImage(rgb_frame.data, w, h, bytes_per_line,
-                         QImage.Format.Format_RGB888)
+        q_image = QImage(processed_frame.data, w, h, bytes_per_line,
+                         QImage.Format.Format_BGR888)
         pixmap = QPixmap.fromImage(q_image)
 
+        # pixmap 이 픽셀을 복사했으므로 프레임 버퍼 반환
+        del q_image
+        self.video_processor.release_frame(processed_frame)
+
         # 비율 유지하며 크기 조정
         label_size = self.video_label.size()
         scaled_pixmap = pixmap.scaled(
@@ -345,13 +745,24 @@ class MainWindow(QMainWindow):
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation
         )
-        self.video_label.setPixmap(scaled_pixmap)
 
-        # 프로그레스 바 업데이트
-        self.progress_bar.set_current_frame(frame_number)
+        # 오버레이 데이터 모드: 축소된 pixmap 위에 화면 좌표로 그림
+        if overlay is not None and not overlay.burned_in and not overlay.is_empty:
+            cfg = self.settings.snapshot()
+            painter = QPainter(scaled_pixmap)
+            self.overlay_painter.paint(
+                painter,
+                QRectF(0, 0, scaled_pixmap.width(), scaled_pixmap.height()),
+                overlay, cfg.show_labels, cfg.show_distance
+            )
+            painter.end()
 
-        # 통계 업데이트
-        self.stats_widget.update_stats(stats)
+        self.video_label.setPixmap(scaled_pixmap)
+
+    def _refresh_summary(self):
+        """영상 전체 누적 통계 표시"""
+        summary = self.video_processor.stats_aggregator.summary()
+        self.stats_widget.update_summary(summary)
 
     def on_seek_requested(self, frame_number: int):
         """재생 위치 이동"""
@@ -382,6 +793,9 @@ class MainWindow(QMainWindow):
             self.video_processor.stop()
             self.video_processor.wait()
 
+        self._stop_thumbnail_generator()
+        self._stop_timeline_scanner()
+        self.settings.unsubscribe(self._sync_controls)
         self.video_processor.cleanup()
         event.accept()
 
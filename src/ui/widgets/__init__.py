@@ -4,5 +4,10 @@
 
 from .progress_bar import MediaProgressBar
 from .stats_widget import StatsWidget
+from .thumbnail_preview import ThumbnailPreview
+from .refresh_throttle import RefreshThrottle
+from .overlay_painter import OverlayPainter
+from .video_surface import GLVideoSurface
 
-__all__ = ['MediaProgressBar', 'StatsWidget']
\ No newline at end of file
+__all__ = ['MediaProgressBar', 'StatsWidget', 'ThumbnailPreview', 'RefreshThrottle',
+           'OverlayPainter', 'GLVideoSurface']
\ No newline at end of file
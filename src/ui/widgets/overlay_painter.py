@@ -0,0 +1,150 @@
+# ============================================================================
+# src/ui/widgets/overlay_painter.py
+# 오버레이 데이터 → QPainter 벡터 그리기 (표시 시점 렌더링)
+# ============================================================================
+
+from typing import Optional
+
+import numpy as np
+from PySide6.QtCore import Qt, QPointF, QRectF
+from PySide6.QtGui import QColor, QFont, QImage, QPainter, QPen, QPolygonF
+
+from ...config.constants import APP_CONST
+from ...models.detection import Detection
+from ...models.overlay import FrameOverlay
+from ...utils.drawing import DrawingUtils
+from ...utils.mask_codec import MaskCodec
+
+
+def _qcolor(bgr, alpha: int = 255) -> QColor:
+    """OpenCV BGR 색상 → QColor"""
+    return QColor(int(bgr[2]), int(bgr[1]), int(bgr[0]), alpha)
+
+
+class OverlayPainter:
+    """FrameOverlay 를 화면 좌표로 그리는 QPainter 렌더러
+
+    프레임 좌표를 target 영역으로 옮겨 그리므로 선 두께 / 글자 크기가 표시
+    크기와 무관하게 일정하다. OpenGL 표시와 QLabel 표시(축소된 pixmap 위)가
+    함께 쓴다.
+    """
+
+    MASK_ALPHA = 51     # 픽셀 블렌딩(DrawingUtils.draw_masks)의 실효 불투명도 0.2
+
+    def __init__(self):
+        self.label_font = QFont('Segoe UI', 9, QFont.Weight.Bold)
+        self.warning_font = QFont('Segoe UI', 16, QFont.Weight.Bold)
+
+    @staticmethod
+    def mask_image(overlay: FrameOverlay) -> Optional[QImage]:
+        """마스크 → 색을 입힌 반투명 RGBA 이미지 (프레임 해상도)"""
+        if not overlay.masks:
+            return None
+
+        masks = MaskCodec.decode_many(overlay.masks)
+        colors = overlay.mask_colors
+        if colors is None:
+            colors = np.random.randint(0, 255, size=(len(masks), 3), dtype=np.uint8)
+
+        height, width = masks.shape[1:]
+        rgba = np.zeros((height, width, 4), dtype=np.uint8)
+        for mask, color in zip(masks, colors):
+            rgba[mask] = (color[2], color[1], color[0], OverlayPainter.MASK_ALPHA)
+
+        return QImage(rgba.data, width, height, width * 4,
+                      QImage.Format.Format_RGBA8888).copy()
+
+    def paint(self, painter: QPainter, target: QRectF, overlay: FrameOverlay,
+              show_labels: bool = True, show_distance: bool = True,
+              mask_image: Optional[QImage] = None) -> None:
+        """target: 프레임이 그려진 위젯 영역"""
+        frame_w, frame_h = overlay.frame_size
+        scale = target.width() / frame_w
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        self._paint_lanes(painter, target, scale, overlay, frame_w, frame_h)
+
+        if mask_image is None and overlay.masks:
+            mask_image = self.mask_image(overlay)
+        if mask_image is not None:
+            painter.drawImage(target, mask_image)
+
+        for detection in overlay.detections:
+            self._paint_detection(painter, target, scale, detection,
+                                  show_labels, show_distance)
+        painter.restore()
+
+    @staticmethod
+    def _map(target: QRectF, scale: float, x: float, y: float) -> QPointF:
+        """프레임 좌표 → 위젯 좌표"""
+        return QPointF(target.left() + x * scale, target.top() + y * scale)
+
+    def _paint_lanes(self, painter: QPainter, target: QRectF, scale: float,
+                     overlay: FrameOverlay, frame_w: int, frame_h: int) -> None:
+        """차선 영역 / 차선 / 중심선 / 이탈 경고"""
+        lanes = overlay.lanes
+
+        polygon = DrawingUtils.lane_polygon(lanes)
+        if polygon is not None:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(_qcolor(DrawingUtils.LANE_AREA_COLOR, 77))
+            painter.drawPolygon(QPolygonF([
+                self._map(target, scale, x, y) for x, y in polygon
+            ]))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+
+        for line, color in ((lanes.left_lane, DrawingUtils.LANE_LEFT_COLOR),
+                            (lanes.right_lane, DrawingUtils.LANE_RIGHT_COLOR)):
+            if line is None:
+                continue
+            painter.setPen(QPen(_qcolor(color), max(2.0, 8 * scale)))
+            painter.drawLine(self._map(target, scale, line[0], line[1]),
+                             self._map(target, scale, line[2], line[3]))
+
+        if not lanes.is_complete():
+            return
+
+        # 차량 중심선
+        center_x = frame_w // 2
+        painter.setPen(QPen(QColor(255, 255, 255), 2))
+        painter.drawLine(
+            self._map(target, scale, center_x, frame_h),
+            self._map(target, scale, center_x, frame_h * APP_CONST.LANE_ROI_TOP)
+        )
+
+        warning = DrawingUtils.lane_warning_text(
+            lanes, frame_w,
+            APP_CONST.LANE_OFFSET_THRESHOLD, APP_CONST.LANE_OFFSET_THRESHOLD_M
+        )
+        if warning is not None:
+            painter.setFont(self.warning_font)
+            painter.setPen(_qcolor(DrawingUtils.DANGER_COLOR))
+            painter.drawText(target.topLeft() + QPointF(20, 40), warning)
+
+    def _paint_detection(self, painter: QPainter, target: QRectF, scale: float,
+                         detection: Detection, show_label: bool,
+                         show_distance: bool) -> None:
+        """탐지 박스 (선 두께 / 글자 크기는 화면 기준 고정)"""
+        x1, y1, x2, y2 = detection.bbox
+        top_left = self._map(target, scale, x1, y1)
+        bottom_right = self._map(target, scale, x2, y2)
+        color = _qcolor(DrawingUtils.box_color(detection, APP_CONST.WARNING_DISTANCE))
+
+        painter.setPen(QPen(color, 2))
+        painter.drawRect(QRectF(top_left, bottom_right))
+
+        if not show_label:
+            return
+
+        label = DrawingUtils.box_label(detection, show_distance)
+        painter.setFont(self.label_font)
+        metrics = painter.fontMetrics()
+        text_w = metrics.horizontalAdvance(label) + 6
+        text_h = metrics.height() + 2
+
+        background = QRectF(top_left.x(), top_left.y() - text_h, text_w, text_h)
+        painter.fillRect(background, color)
+        painter.setPen(QColor(255, 255, 255))
+        painter.drawText(background, Qt.AlignmentFlag.AlignCenter, label)
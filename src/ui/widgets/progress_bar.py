@@ -4,10 +4,19 @@
 # ============================================================================
 
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel
-from PySide6.QtCore import Signal, Qt, QPoint
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QLinearGradient, QMouseEvent
+from PySide6.QtCore import Signal, Qt, QPoint, QRect
+from PySide6.QtGui import (
+    QPainter, QColor, QPen, QBrush, QLinearGradient, QMouseEvent,
+    QImage, QPixmap
+)
+from typing import Dict, Optional
+import numpy as np
 
 from ...config.constants import APP_CONST, COLOR
+from ...models.thumbnails import ThumbnailStrip
+from ...models.timeline import EventTimeline
+from .thumbnail_preview import ThumbnailPreview
+from .refresh_throttle import RefreshThrottle
 
 
 class MediaProgressBar(QWidget):
@@ -24,8 +33,24 @@ class MediaProgressBar(QWidget):
         self._total_frames = 0
         self._hover_position = -1
         self._is_hovering = False
+        self._is_dragging = False
+        self._last_seek_frame = -1
         self._fps = APP_CONST.DEFAULT_FPS
 
+        # 재생 위치 갱신 묶기 (진행 바 길이가 1px 이상 바뀔 때만 다시 그림)
+        self._painted_width = -1
+        self._refresh = RefreshThrottle(self._apply_current_frame, self)
+
+        # 썸네일 미리보기
+        self._thumbnails: Optional[ThumbnailStrip] = None
+        self._thumb_pixmaps: Dict[int, QPixmap] = {}
+        self._preview = ThumbnailPreview(self)
+
+        # 이벤트 타임라인 히트맵
+        self._timeline: Optional[EventTimeline] = None
+        self._heatmap_image: Optional[QImage] = None
+        self._heatmap_span = 1.0
+
         # 색상
         self.bg_color = QColor(COLOR.BG_MEDIUM)
         self.progress_start = QColor(COLOR.PROGRESS_START)
@@ -74,17 +99,94 @@ class MediaProgressBar(QWidget):
         self.update()
 
     def set_current_frame(self, frame_number: int):
-        """현재 프레임 설정"""
+        """현재 프레임 설정 (표시는 UI 갱신 주기에 맞춰 반영)"""
         self._current_frame = frame_number
-        current_sec = frame_number / self._fps if self._fps > 0 else 0
-        self.time_label.setText(self._format_time(current_sec))
+        self._refresh.request()
+
+    def _apply_current_frame(self):
+        """시간 / 진행 바 반영 - 바뀐 경우에만"""
+        current_sec = self._current_frame / self._fps if self._fps > 0 else 0
+        text = self._format_time(current_sec)
+        if self.time_label.text() != text:
+            self.time_label.setText(text)
+
+        if self._progress_width() != self._painted_width:
+            self.update()
+
+    def _progress_width(self) -> int:
+        """현재 위치의 진행 바 길이 (px)"""
+        if self._total_frames <= 0:
+            return 0
+        ratio = self._current_frame / self._total_frames
+        return int(self._get_progress_rect().width() * ratio)
+
+    def set_thumbnails(self, thumbnails: Optional[ThumbnailStrip]):
+        """호버 미리보기용 썸네일 설정"""
+        self._thumbnails = thumbnails
+        self._thumb_pixmaps.clear()
+        if thumbnails is None:
+            self._preview.hide()
+
+    @property
+    def current_frame(self) -> int:
+        """현재 프레임 번호"""
+        return self._current_frame
+
+    @property
+    def timeline(self) -> Optional[EventTimeline]:
+        """이벤트 타임라인"""
+        return self._timeline
+
+    def set_timeline(self, timeline: Optional[EventTimeline]):
+        """이벤트 타임라인 설정 (히트맵 이미지 1회 생성)"""
+        self._timeline = timeline
+        self._heatmap_image = None
+
+        if timeline is not None and timeline.count > 0:
+            self._heatmap_image = self._build_heatmap(timeline)
+
+            frames = timeline.frame_numbers
+            step = int(frames[1] - frames[0]) if timeline.count > 1 else 1
+            total = max(timeline.total_frames, 1)
+            self._heatmap_span = min(1.0, (int(frames[-1]) + step) / total)
+
         self.update()
 
+    @staticmethod
+    def _build_heatmap(timeline: EventTimeline) -> QImage:
+        """샘플별 색상 (N x 1 RGBA) - 그릴 때 Qt 가 확대"""
+        rgba = np.zeros((1, timeline.count, 4), dtype=np.uint8)
+
+        # 객체 밀도 (파랑)
+        density = timeline.object_counts.astype(np.float32)
+        if density.max() > 0:
+            density /= density.max()
+        rgba[0, :, :3] = QColor(COLOR.INFO_COLOR).getRgb()[:3]
+        rgba[0, :, 3] = (density * 140).astype(np.uint8)
+
+        # 차선 이탈 (주황)
+        departure = timeline.lane_departures.astype(bool)
+        rgba[0, departure, :3] = QColor(COLOR.WARNING_COLOR).getRgb()[:3]
+        rgba[0, departure, 3] = 200
+
+        # 위험 (빨강, 개수에 비례한 불투명도)
+        danger = timeline.danger_counts > 0
+        rgba[0, danger, :3] = QColor(COLOR.DANGER_COLOR).getRgb()[:3]
+        rgba[0, danger, 3] = np.clip(
+            150 + timeline.danger_counts[danger].astype(np.int32) * 35, 0, 255
+        ).astype(np.uint8)
+
+        h, w, ch = rgba.shape
+        return QImage(rgba.data, w, h, ch * w,
+                      QImage.Format.Format_RGBA8888).copy()
+
     def reset(self):
         """초기화"""
         self._current_frame = 0
         self._total_frames = 0
         self._hover_position = -1
+        self.set_thumbnails(None)
+        self.set_timeline(None)
         self.time_label.setText("00:00")
         self.duration_label.setText("00:00")
         self.update()
@@ -125,6 +227,14 @@ class MediaProgressBar(QWidget):
         painter.setBrush(QBrush(self.bg_color))
         painter.drawRoundedRect(bar_rect, 4, 4)
 
+        # 이벤트 히트맵 (바 위쪽 띠)
+        if self._heatmap_image is not None:
+            heat_rect = QRect(
+                bar_rect.left(), bar_rect.top() - 7,
+                int(bar_rect.width() * self._heatmap_span), 5
+            )
+            painter.drawImage(heat_rect, self._heatmap_image)
+
         # 호버 효과
         if self._is_hovering and self._hover_position >= 0:
             hover_width = int(bar_rect.width() * self._hover_position)
@@ -136,9 +246,9 @@ class MediaProgressBar(QWidget):
             painter.drawRoundedRect(hover_rect, 4, 4)
 
         # 진행 바
+        self._painted_width = self._progress_width()
         if self._total_frames > 0:
-            progress_ratio = self._current_frame / self._total_frames
-            progress_width = int(bar_rect.width() * progress_ratio)
+            progress_width = self._painted_width
 
             if progress_width > 0:
                 progress_rect_filled = bar_rect.adjusted(
@@ -169,17 +279,75 @@ class MediaProgressBar(QWidget):
                         handle_radius, handle_radius
                     )
 
+    def _ratio_at(self, pos: QPoint) -> float:
+        """위젯 좌표 → 진행 비율 (0~1)"""
+        progress_rect = self._get_progress_rect()
+        relative_x = pos.x() - progress_rect.left()
+        return max(0.0, min(1.0, relative_x / progress_rect.width()))
+
+    def _emit_seek(self, ratio: float):
+        """Seek 요청 (같은 프레임 중복 요청 제외)"""
+        new_frame = int(self._total_frames * ratio)
+        if new_frame != self._last_seek_frame:
+            self._last_seek_frame = new_frame
+            self.seek_requested.emit(new_frame)
+
+    def _thumbnail_pixmap(self, index: int) -> Optional[QPixmap]:
+        """썸네일 QPixmap (변환 결과 캐싱)"""
+        pixmap = self._thumb_pixmaps.get(index)
+        if pixmap is not None:
+            return pixmap
+
+        tile = self._thumbnails.get(index)
+        if tile is None:
+            return None
+
+        tile = np.ascontiguousarray(tile)
+        h, w, ch = tile.shape
+        q_image = QImage(tile.data, w, h, ch * w,
+                         QImage.Format.Format_BGR888)
+        pixmap = QPixmap.fromImage(q_image)
+        self._thumb_pixmaps[index] = pixmap
+        return pixmap
+
+    def _update_preview(self):
+        """호버 위치 썸네일 표시 (디코더/모델 사용 안함)"""
+        if (self._thumbnails is None or not self._is_hovering
+                or self._hover_position < 0):
+            self._preview.hide()
+            return
+
+        index = self._thumbnails.index_for_ratio(self._hover_position)
+        pixmap = self._thumbnail_pixmap(index)
+        if pixmap is None:
+            self._preview.hide()
+            return
+
+        progress_rect = self._get_progress_rect()
+        x = progress_rect.left() + int(progress_rect.width() * self._hover_position)
+        anchor = self.mapToGlobal(QPoint(x, progress_rect.top()))
+
+        hover_frame = int(self._total_frames * self._hover_position)
+        hover_sec = hover_frame / self._fps if self._fps > 0 else 0
+        self._preview.show_preview(pixmap, self._format_time(hover_sec), anchor)
+
     def mouseMoveEvent(self, event: QMouseEvent):
         """마우스 이동"""
         progress_rect = self._get_progress_rect()
-        if progress_rect.contains(event.pos()):
+        if self._is_dragging or progress_rect.contains(event.pos()):
             self._is_hovering = True
-            relative_x = event.pos().x() - progress_rect.left()
-            self._hover_position = max(0.0, min(1.0,
-                                                relative_x / progress_rect.width()))
+            self._hover_position = self._ratio_at(event.pos())
         else:
             self._is_hovering = False
             self._hover_position = -1
+
+        # 썸네일이 있으면 미리보기만, 없으면 드래그 중 연속 Seek
+        # (VideoProcessor 에서 최신 요청만 처리)
+        if (self._is_dragging and self._total_frames > 0
+                and self._thumbnails is None):
+            self._emit_seek(self._hover_position)
+
+        self._update_preview()
         self.update()
 
     def mousePressEvent(self, event: QMouseEvent):
@@ -187,14 +355,25 @@ class MediaProgressBar(QWidget):
         if event.button() == Qt.MouseButton.LeftButton:
             progress_rect = self._get_progress_rect()
             if progress_rect.contains(event.pos()) and self._total_frames > 0:
-                relative_x = event.pos().x() - progress_rect.left()
-                click_ratio = max(0.0, min(1.0,
-                                           relative_x / progress_rect.width()))
-                new_frame = int(self._total_frames * click_ratio)
-                self.seek_requested.emit(new_frame)
+                self._is_dragging = True
+                self._last_seek_frame = -1
+                self._emit_seek(self._ratio_at(event.pos()))
+
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        """마우스 놓음"""
+        if event.button() == Qt.MouseButton.LeftButton and self._is_dragging:
+            self._is_dragging = False
+            # 스크러빙 종료 시 최종 위치로 한 번만 Seek
+            if self._thumbnails is not None and self._total_frames > 0:
+                self._emit_seek(self._ratio_at(event.pos()))
+            if not self.rect().contains(event.pos()):
+                self.leaveEvent(event)
 
     def leaveEvent(self, event):
         """마우스 벗어남"""
+        if self._is_dragging:
+            return
         self._is_hovering = False
         self._hover_position = -1
+        self._preview.hide()
         self.update()
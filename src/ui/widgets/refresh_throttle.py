@@ -0,0 +1,35 @@
+# ============================================================================
+# src/ui/widgets/refresh_throttle.py
+# 위젯 갱신 묶기 (처리 FPS 와 무관한 고정 UI 갱신 주기)
+# ============================================================================
+
+from typing import Callable
+
+from PySide6.QtCore import QObject, QTimer
+
+from ...config.constants import APP_CONST
+
+
+class RefreshThrottle(QObject):
+    """갱신 요청을 모아 최대 UI_REFRESH_HZ 로 한 번씩 callback 호출
+
+    프레임마다 request() 해도 주기 안에 들어온 요청은 한 번의 callback 으로
+    합쳐진다. callback 은 가장 최근 상태를 읽어 그리면 된다.
+    """
+
+    def __init__(self, callback: Callable[[], None], parent: QObject = None,
+                 hz: float = APP_CONST.UI_REFRESH_HZ):
+        super().__init__(parent)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(int(1000 / hz))
+        self._timer.timeout.connect(callback)
+
+    def request(self) -> None:
+        """갱신 예약 (이미 예약되어 있으면 무시)"""
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def cancel(self) -> None:
+        """예약된 갱신 취소"""
+        self._timer.stop()
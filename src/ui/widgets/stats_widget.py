@@ -6,12 +6,39 @@
 from PySide6.QtWidgets import QFrame, QGridLayout, QLabel
 from PySide6.QtCore import Qt
 
+from typing import Optional
+
 from ...config.constants import COLOR
-from ...models.stats import DetectionStats
+from ...models.stats import DetectionStats, VideoSummary
+from .refresh_throttle import RefreshThrottle
 
 
 class StatsWidget(QFrame):
-    """실시간 통계 대시보드"""
+    """실시간 통계 대시보드
+
+    update_stats() 는 최신 통계만 보관하고, 실제 레이블 변경은 UI 갱신 주기
+    (UI_REFRESH_HZ) 로 묶어 바뀐 값만 반영한다. 처리 FPS 가 높아도 GUI 스레드가
+    프레임마다 스타일 / 레이아웃을 다시 계산하지 않는다.
+    """
+
+    STAT_STYLE = f"""
+        color: {COLOR.TEXT_PRIMARY};
+        font-size: 12px;
+        font-family: 'Segoe UI', Arial;
+        padding: 5px;
+        background-color: {COLOR.BG_LIGHT};
+        border-radius: 4px;
+    """
+
+    DANGER_STYLE = f"""
+        color: {COLOR.DANGER_COLOR};
+        font-size: 12px;
+        font-weight: bold;
+        font-family: 'Segoe UI', Arial;
+        padding: 5px;
+        background-color: #4a2020;
+        border-radius: 4px;
+    """
 
     def __init__(self):
         super().__init__()
@@ -23,6 +50,13 @@ class StatsWidget(QFrame):
                 border: 1px solid {COLOR.BORDER_COLOR};
             }}
         """)
+
+        # 갱신 묶기 / 마지막으로 반영한 상태
+        self._pending: Optional[DetectionStats] = None
+        self._danger_active = False
+        self._last_counts: Optional[dict] = None
+        self._refresh = RefreshThrottle(self._apply_stats, self)
+
         self._init_ui()
 
     def _init_ui(self):
@@ -46,11 +80,16 @@ class StatsWidget(QFrame):
         self.objects_label = self._create_stat_label("객체:", "0")
         self.danger_label = self._create_stat_label("위험:", "0")
         self.time_label = self._create_stat_label("처리:", "0ms")
+        self.skip_label = self._create_stat_label("추론 스킵:", "0%")
+        self.stream_label = self._create_stat_label("스트림 지연:", "-")
 
         layout.addWidget(self.fps_label, 1, 0)
         layout.addWidget(self.objects_label, 1, 1)
         layout.addWidget(self.danger_label, 2, 0)
         layout.addWidget(self.time_label, 2, 1)
+        layout.addWidget(self.skip_label, 3, 0, 1, 2)
+        layout.addWidget(self.stream_label, 4, 0, 1, 2)
+        self.stream_label.hide()
 
         # 상세 정보
         self.detail_label = QLabel("")
@@ -60,56 +99,120 @@ class StatsWidget(QFrame):
             font-family: 'Segoe UI', Arial;
         """)
         self.detail_label.setWordWrap(True)
-        layout.addWidget(self.detail_label, 3, 0, 1, 2)
+        layout.addWidget(self.detail_label, 5, 0, 1, 2)
 
-    def _create_stat_label(self, prefix: str, value: str) -> QLabel:
-        """통계 레이블 생성"""
-        label = QLabel(f"{prefix} {value}")
-        label.setStyleSheet(f"""
-            color: {COLOR.TEXT_PRIMARY};
-            font-size: 12px;
+        # 영상 전체 누적 통계
+        self.summary_label = QLabel("")
+        self.summary_label.setStyleSheet(f"""
+            color: {COLOR.TEXT_SECONDARY};
+            font-size: 11px;
             font-family: 'Segoe UI', Arial;
             padding: 5px;
             background-color: {COLOR.BG_LIGHT};
             border-radius: 4px;
         """)
+        self.summary_label.setWordWrap(True)
+        layout.addWidget(self.summary_label, 6, 0, 1, 2)
+        self.summary_label.hide()
+
+    def _create_stat_label(self, prefix: str, value: str) -> QLabel:
+        """통계 레이블 생성"""
+        label = QLabel(f"{prefix} {value}")
+        label.setStyleSheet(self.STAT_STYLE)
         return label
 
+    @staticmethod
+    def _set_text(label: QLabel, text: str) -> None:
+        """값이 바뀐 경우에만 텍스트 변경 (레이아웃 / 다시 그리기 방지)"""
+        if label.text() != text:
+            label.setText(text)
+
     def update_stats(self, stats: DetectionStats):
-        """통계 업데이트"""
-        self.fps_label.setText(f"FPS: {stats.fps:.1f}")
-        self.objects_label.setText(f"객체: {stats.total_objects}")
-
-        # 위험 객체 강조
-        if stats.dangerous_objects > 0:
-            self.danger_label.setText(f"⚠️ 위험: {stats.dangerous_objects}")
-            self.danger_label.setStyleSheet(f"""
-                color: {COLOR.DANGER_COLOR};
-                font-size: 12px;
-                font-weight: bold;
-                font-family: 'Segoe UI', Arial;
-                padding: 5px;
-                background-color: #4a2020;
-                border-radius: 4px;
-            """)
-        else:
-            self.danger_label.setText(f"위험: {stats.dangerous_objects}")
-            self.danger_label.setStyleSheet(f"""
-                color: {COLOR.TEXT_PRIMARY};
-                font-size: 12px;
-                font-family: 'Segoe UI', Arial;
-                padding: 5px;
-                background-color: {COLOR.BG_LIGHT};
-                border-radius: 4px;
-            """)
-
-        self.time_label.setText(f"처리: {stats.processing_time:.0f}ms")
+        """통계 업데이트 (최신 값만 보관, UI 갱신 주기에 맞춰 반영)"""
+        self._pending = stats
+        self._refresh.request()
 
-        # 상세 정보
-        if stats.object_counts:
-            detail_text = ", ".join([
-                f"{k}: {v}" for k, v in stats.object_counts.items()
-            ])
-            self.detail_label.setText(detail_text)
+    def _apply_stats(self):
+        """보관된 최신 통계 반영 - 바뀐 값만 변경"""
+        stats, self._pending = self._pending, None
+        if stats is None:
+            return
+
+        self._set_text(self.fps_label, f"FPS: {stats.fps:.1f}")
+        self._set_text(self.objects_label, f"객체: {stats.total_objects}")
+
+        # 위험 객체 강조 (스타일은 상태가 바뀔 때만 다시 계산)
+        danger = stats.dangerous_objects > 0
+        if danger != self._danger_active:
+            self._danger_active = danger
+            self.danger_label.setStyleSheet(
+                self.DANGER_STYLE if danger else self.STAT_STYLE
+            )
+        prefix = "⚠️ 위험" if danger else "위험"
+        ttc = f" · TTC {stats.min_ttc:.1f}s" if stats.min_ttc < float('inf') else ""
+        self._set_text(self.danger_label,
+                       f"{prefix}: {stats.dangerous_objects} / 경로 {stats.in_path_objects}{ttc}")
+
+        imgsz = f" @{stats.imgsz}" if stats.imgsz else ""
+        self._set_text(self.time_label, f"처리: {stats.processing_time:.0f}ms{imgsz}")
+
+        # 정지 장면 추론 스킵
+        marker = " 💤" if stats.inference_skipped else ""
+        self._set_text(self.skip_label,
+                       f"추론 스킵: {stats.skip_ratio * 100:.0f}%{marker}")
+
+        # 라이브 소스 지연 (수신 → 처리 완료) / 버려진 프레임
+        if stats.stream_latency_ms > 0:
+            self._set_text(
+                self.stream_label,
+                f"스트림 지연: {stats.stream_latency_ms:.0f}ms · "
+                f"드롭 {stats.dropped_frames}"
+            )
+            self.stream_label.setVisible(True)
         else:
-            self.detail_label.setText("탐지된 객체 없음")
\ No newline at end of file
+            self.stream_label.setVisible(False)
+
+        # 상세 정보 (클래스별 개수가 바뀐 경우에만 문자열 생성)
+        if stats.object_counts != self._last_counts:
+            self._last_counts = dict(stats.object_counts)
+            if stats.object_counts:
+                detail_text = ", ".join([
+                    f"{k}: {v}" for k, v in stats.object_counts.items()
+                ])
+            else:
+                detail_text = "탐지된 객체 없음"
+            self._set_text(self.detail_label, detail_text)
+
+    def update_summary(self, summary: VideoSummary):
+        """누적 통계 업데이트"""
+        if summary.frames == 0:
+            self.summary_label.setVisible(False)
+            return
+
+        minutes, seconds = divmod(int(summary.duration_sec), 60)
+        lines = [f"📈 누적 {minutes}:{seconds:02d} · {summary.frames} 프레임"]
+
+        if summary.track_counts:
+            counts = ", ".join(
+                f"{name} {count}" for name, count in
+                sorted(summary.track_counts.items(), key=lambda item: -item[1])
+            )
+            lines.append(f"고유 객체: {counts}")
+
+        lines.append(
+            f"위험 {summary.danger_events}회 ({summary.danger_sec:.1f}s) · "
+            f"차선 이탈 {summary.departure_events}회 ({summary.departure_sec:.1f}s)"
+        )
+        lines.append(
+            f"처리 p50 {summary.latency_p50_ms:.0f}ms · "
+            f"p95 {summary.latency_p95_ms:.0f}ms · "
+            f"p99 {summary.latency_p99_ms:.0f}ms"
+        )
+        if summary.dropped_boxes:
+            dropped = " · ".join(
+                f"{stage} {count}" for stage, count in summary.dropped_boxes.items()
+            )
+            lines.append(f"박스 {summary.raw_boxes}개 중 제외: {dropped}")
+
+        self._set_text(self.summary_label, "\n".join(lines))
+        self.summary_label.setVisible(True)
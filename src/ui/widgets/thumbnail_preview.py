@@ -0,0 +1,54 @@
+# ============================================================================
+# src/ui/widgets/thumbnail_preview.py
+# 프로그레스 바 호버 미리보기
+# ============================================================================
+
+from PySide6.QtWidgets import QFrame, QVBoxLayout, QLabel
+from PySide6.QtCore import Qt, QPoint
+from PySide6.QtGui import QPixmap
+
+from ...config.constants import COLOR
+
+
+class ThumbnailPreview(QFrame):
+    """썸네일 + 시간 표시 팝업"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.WindowType.ToolTip)
+        self.setStyleSheet(f"""
+            QFrame {{
+                background-color: {COLOR.BG_DARK};
+                border: 1px solid {COLOR.BORDER_LIGHT};
+                border-radius: 4px;
+            }}
+        """)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(3, 3, 3, 3)
+        layout.setSpacing(2)
+
+        self.image_label = QLabel()
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.image_label)
+
+        self.time_label = QLabel("00:00")
+        self.time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.time_label.setStyleSheet(f"""
+            color: {COLOR.TEXT_PRIMARY};
+            font-size: 11px;
+            border: none;
+            font-family: 'Segoe UI', Arial;
+        """)
+        layout.addWidget(self.time_label)
+
+    def show_preview(self, pixmap: QPixmap, time_text: str,
+                     anchor: QPoint) -> None:
+        """anchor(전역 좌표, 하단 중앙) 위에 미리보기 표시"""
+        if self.image_label.pixmap().cacheKey() != pixmap.cacheKey():
+            self.image_label.setPixmap(pixmap)
+        self.time_label.setText(time_text)
+        self.adjustSize()
+
+        self.move(anchor.x() - self.width() // 2, anchor.y() - self.height())
+        if not self.isVisible():
+            self.show()
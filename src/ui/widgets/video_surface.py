@@ -0,0 +1,138 @@
+# ============================================================================
+# src/ui/widgets/video_surface.py
+# OpenGL 비디오 표시 (텍스처 업로드 + 벡터 오버레이)
+# ============================================================================
+
+from typing import Callable, Optional
+
+import numpy as np
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QColor, QFont, QImage, QPainter
+
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # OpenGL 모듈 없는 빌드
+    QOpenGLWidget = None
+
+from ...config.settings import SettingsManager
+from ...models.overlay import FrameOverlay
+from .overlay_painter import OverlayPainter
+
+
+class GLVideoSurface(QOpenGLWidget or QWidget):
+    """OpenGL 비디오 표시 위젯
+
+    프레임은 QImage 로 감싸 그대로 텍스처로 올리고, 창 크기에 맞춘 축소 /
+    확대는 GPU(또는 소프트웨어 래스터라이저)가 그린다. 탐지 박스와 차선은
+    픽셀에 굽지 않고 화면 좌표의 벡터로 그리므로 표시 해상도가 분석 해상도와
+    무관하고, 레이블 / 거리 표시 설정 변경이 일시정지 중에도 바로 반영된다.
+
+    표시 중인 프레임 버퍼는 다음 프레임이 올 때 release_frame 으로 돌려준다.
+    """
+
+    BACKGROUND = QColor(0, 0, 0)
+
+    def __init__(self, release_frame: Optional[Callable[[np.ndarray], None]] = None,
+                 parent: QWidget = None):
+        super().__init__(parent)
+        self.settings = SettingsManager()
+        self._release_frame = release_frame
+        self._painter = OverlayPainter()
+
+        self._frame: Optional[np.ndarray] = None
+        self._image: Optional[QImage] = None
+        self._overlay: Optional[FrameOverlay] = None
+        self._mask_image: Optional[QImage] = None
+        self._message = ""
+        self._message_font = QFont('Segoe UI', 14)
+
+    @staticmethod
+    def is_available() -> bool:
+        """QOpenGLWidget 사용 가능 여부"""
+        return QOpenGLWidget is not None
+
+    # ------------------------------------------------------------------
+    # 프레임 / 메시지
+    # ------------------------------------------------------------------
+
+    def set_frame(self, frame: np.ndarray, overlay: Optional[FrameOverlay]) -> None:
+        """표시할 프레임 / 오버레이 교체 (프레임은 복사하지 않음)"""
+        previous = self._frame
+
+        h, w = frame.shape[:2]
+        self._frame = frame
+        self._image = QImage(frame.data, w, h, frame.strides[0],
+                             QImage.Format.Format_BGR888)
+        self._overlay = overlay if overlay is not None and not overlay.burned_in else None
+        # 마스크 이미지는 프레임당 한 번만 (창 크기 변경 시 재사용)
+        self._mask_image = (OverlayPainter.mask_image(self._overlay)
+                            if self._overlay is not None else None)
+        self._message = ""
+
+        if previous is not None and self._release_frame is not None:
+            self._release_frame(previous)
+        self.update()
+
+    def clear(self) -> None:
+        """프레임 / 메시지 지우기"""
+        self._image = None
+        self._overlay = None
+        self._mask_image = None
+        self._message = ""
+        frame, self._frame = self._frame, None
+        if frame is not None and self._release_frame is not None:
+            self._release_frame(frame)
+        self.update()
+
+    def setText(self, text: str) -> None:
+        """안내 문구 표시 (QLabel 과 같은 이름)"""
+        self.clear()
+        self._message = text
+        self.update()
+
+    # ------------------------------------------------------------------
+    # 그리기
+    # ------------------------------------------------------------------
+
+    def _target_rect(self) -> QRectF:
+        """비율 유지하며 위젯 중앙에 맞춘 영역"""
+        image_w, image_h = self._image.width(), self._image.height()
+        scale = min(self.width() / image_w, self.height() / image_h)
+        w, h = image_w * scale, image_h * scale
+        return QRectF((self.width() - w) / 2, (self.height() - h) / 2, w, h)
+
+    def paintGL(self):
+        self._paint()
+
+    def paintEvent(self, event):
+        # QOpenGLWidget 은 paintGL 로 그림 (일반 QWidget 대체 시에만 사용)
+        if QOpenGLWidget is None:
+            self._paint()
+        else:
+            super().paintEvent(event)
+
+    def _paint(self) -> None:
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.BACKGROUND)
+
+        if self._image is None:
+            if self._message:
+                painter.setPen(QColor(255, 255, 255))
+                painter.setFont(self._message_font)
+                painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter,
+                                 self._message)
+            painter.end()
+            return
+
+        # 텍스처 업로드 + 하드웨어 축소 (선형 필터)
+        target = self._target_rect()
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.drawImage(target, self._image)
+
+        if self._overlay is not None:
+            cfg = self.settings.snapshot()
+            self._painter.paint(painter, target, self._overlay,
+                                cfg.show_labels, cfg.show_distance,
+                                self._mask_image)
+        painter.end()
@@ -4,11 +4,26 @@
 
 from .drawing import DrawingUtils
 from .geometry import GeometryUtils
-from .performance import PerformanceMonitor, Timer
+from .performance import PerformanceMonitor, Timer, StageProfiler, MemoryMonitor
+from .cache import VideoCache
+from .video_source import VideoSource
+from .frame_ring import SharedFrameRing
+from .buffer_pool import BufferPool
+from .streaming_stats import RunningMoments, TDigest
+from .mask_codec import MaskCodec
 
 __all__ = [
     'DrawingUtils',
     'GeometryUtils',
     'PerformanceMonitor',
     'Timer',
+    'StageProfiler',
+    'MemoryMonitor',
+    'VideoCache',
+    'VideoSource',
+    'SharedFrameRing',
+    'BufferPool',
+    'RunningMoments',
+    'TDigest',
+    'MaskCodec',
 ]
\ No newline at end of file
@@ -0,0 +1,115 @@
+# ============================================================================
+# src/utils/buffer_pool.py
+# 해상도별 프레임 / 작업 버퍼 재사용 풀
+# ============================================================================
+
+import threading
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from ..config.constants import APP_CONST
+from ..models.stats import BufferPoolStats
+
+
+class BufferPool:
+    """해상도별 numpy 버퍼 풀 (싱글톤, 스레드 안전)
+
+    (shape, dtype) 별로 반환된 버퍼를 보관했다가 다음 acquire() 에 돌려준다.
+    프레임마다 수 MB 를 새로 할당 / 해제하지 않으므로 장시간 실행에서
+    할당기 churn 으로 인한 지연 튐과 메모리 증가를 줄인다.
+
+    여러 소비자(GUI 표시, 인코더)가 같은 프레임을 쓰면 retain() 으로 참조를
+    늘리고, 각자 release() 한다. 마지막 release() 에서 풀로 돌아간다.
+    반환되지 않은 버퍼는 일반 배열처럼 GC 로 해제된다 (풀은 빌려준 버퍼를
+    붙잡지 않음).
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.max_free = APP_CONST.BUFFER_POOL_MAX_FREE
+        self._lock = threading.Lock()
+        self._free: Dict[Tuple, List[np.ndarray]] = defaultdict(list)
+        self._free_ids = set()           # 중복 반환 방지
+        self._refs: Dict[int, int] = {}  # id → 추가 참조 수 (retain)
+        self._stats = BufferPoolStats()
+        self._initialized = True
+
+    @staticmethod
+    def _key(shape: Tuple[int, ...], dtype) -> Tuple:
+        return tuple(shape), np.dtype(dtype).str
+
+    def acquire(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """버퍼 대여 (내용은 이전 사용 값 - 덮어써서 사용)"""
+        key = self._key(shape, dtype)
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                array = free.pop()
+                self._free_ids.discard(id(array))
+                self._stats.reuses += 1
+                self._stats.free_buffers -= 1
+                self._stats.free_bytes -= array.nbytes
+                return array
+            self._stats.allocations += 1
+
+        return np.empty(shape, dtype=dtype)
+
+    def retain(self, array: np.ndarray) -> None:
+        """소비자 추가 (release 를 한 번 더 해야 풀로 돌아감)"""
+        with self._lock:
+            self._refs[id(array)] = self._refs.get(id(array), 0) + 1
+
+    def release(self, array: np.ndarray) -> None:
+        """버퍼 반환 (뷰 / 외부 배열 조각은 무시)"""
+        if array is None or array.base is not None or not array.flags.c_contiguous:
+            return
+
+        key = self._key(array.shape, array.dtype)
+        with self._lock:
+            refs = self._refs.get(id(array))
+            if refs:
+                if refs == 1:
+                    del self._refs[id(array)]
+                else:
+                    self._refs[id(array)] = refs - 1
+                return
+
+            if id(array) in self._free_ids:
+                return
+            free = self._free[key]
+            if len(free) >= self.max_free:
+                return  # 보관 한도 초과 → GC
+
+            free.append(array)
+            self._free_ids.add(id(array))
+            self._stats.free_buffers += 1
+            self._stats.free_bytes += array.nbytes
+
+    def trim(self) -> int:
+        """보관 중인 버퍼 모두 해제 → 해제한 바이트"""
+        with self._lock:
+            freed = self._stats.free_bytes
+            self._free.clear()
+            self._free_ids.clear()
+            self._stats.free_buffers = 0
+            self._stats.free_bytes = 0
+            self._stats.trimmed_bytes += freed
+        return freed
+
+    @property
+    def stats(self) -> BufferPoolStats:
+        """통계 (복사본)"""
+        with self._lock:
+            return BufferPoolStats(**vars(self._stats))
@@ -0,0 +1,43 @@
+# ============================================================================
+# src/utils/cache.py
+# 비디오별 디스크 캐시 경로 관리
+# ============================================================================
+
+import hashlib
+from pathlib import Path
+
+from ..config.constants import APP_CONST
+
+
+class VideoCache:
+    """비디오별 캐시 파일 경로 유틸리티"""
+
+    @staticmethod
+    def video_key(video_path: str) -> str:
+        """경로 + 크기 + 수정 시각 기반 캐시 키"""
+        path = Path(video_path).resolve()
+        stat = path.stat()
+        raw = f"{path}|{stat.st_size}|{stat.st_mtime_ns}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def params_key(*params) -> str:
+        """결과에 영향을 주는 설정 값들 → 짧은 해시 (캐시 종류 이름에 붙임)"""
+        return hashlib.sha1(repr(params).encode('utf-8')).hexdigest()[:8]
+
+    @staticmethod
+    def path_for(video_path: str, kind: str, ext: str = "npz") -> Path:
+        """캐시 파일 경로 (디렉터리는 자동 생성)"""
+        cache_dir = Path(APP_CONST.CACHE_DIR)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        stem = Path(video_path).stem
+        key = VideoCache.video_key(video_path)
+        return cache_dir / f"{stem}_{key}.{kind}.{ext}"
+
+    @staticmethod
+    def is_cacheable(video_path: str) -> bool:
+        """로컬 파일인지 (캐시 가능 여부)"""
+        try:
+            return Path(video_path).is_file()
+        except OSError:
+            return False
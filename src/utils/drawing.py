@@ -5,9 +5,12 @@
 
 import cv2
 import numpy as np
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 from ..models.detection import Detection, LaneLines
+from ..models.overlay import FrameOverlay
+from .buffer_pool import BufferPool
+from .mask_codec import MaskCodec
 
 
 class DrawingUtils:
@@ -21,23 +24,35 @@ class DrawingUtils:
     LANE_RIGHT_COLOR = (255, 0, 0)
     LANE_AREA_COLOR = (0, 255, 0)
 
+    @staticmethod
+    def box_color(detection: Detection,
+                  warning_threshold: float = 10.0) -> Tuple[int, int, int]:
+        """위험도에 따른 박스 색상 (BGR) - 경로 밖 근거리 객체는 경고색"""
+        if detection.hazard:
+            return DrawingUtils.DANGER_COLOR
+        if detection.distance < warning_threshold:
+            return DrawingUtils.WARNING_COLOR
+        return DrawingUtils.SAFE_COLOR
+
+    @staticmethod
+    def box_label(detection: Detection, show_distance: bool = True) -> str:
+        """박스 레이블 텍스트"""
+        label = f"{detection.class_name}: {detection.confidence:.2f}"
+        if show_distance and detection.distance < 100:
+            label += f" ({detection.distance:.1f}m)"
+        return label
+
     @staticmethod
     def draw_detection_box(frame: np.ndarray,
                            detection: Detection,
                            show_label: bool = True,
                            show_distance: bool = True,
-                           danger_threshold: float = 5.0,
                            warning_threshold: float = 10.0) -> None:
         """탐지 박스 그리기"""
         bbox = detection.bbox.astype(int)
 
-        # 거리에 따른 색상
-        if detection.distance < danger_threshold:
-            color = DrawingUtils.DANGER_COLOR
-        elif detection.distance < warning_threshold:
-            color = DrawingUtils.WARNING_COLOR
-        else:
-            color = DrawingUtils.SAFE_COLOR
+        # 자차 경로 위험 / 거리에 따른 색상
+        color = DrawingUtils.box_color(detection, warning_threshold)
 
         # 박스 그리기
         cv2.rectangle(frame,
@@ -47,9 +62,7 @@ class DrawingUtils:
 
         # 레이블
         if show_label:
-            label = f"{detection.class_name}: {detection.confidence:.2f}"
-            if show_distance and detection.distance < 100:
-                label += f" ({detection.distance:.1f}m)"
+            label = DrawingUtils.box_label(detection, show_distance)
 
             (text_width, text_height), _ = cv2.getTextSize(
                 label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 2)
@@ -64,22 +77,25 @@ class DrawingUtils:
                         cv2.FONT_HERSHEY_SIMPLEX,
                         0.5, (255, 255, 255), 2)
 
+    @staticmethod
+    def lane_polygon(lanes: LaneLines) -> Optional[np.ndarray]:
+        """양쪽 차선 사이 영역 다각형 (4 x 2, 한쪽이라도 없으면 None)"""
+        if not lanes.is_complete():
+            return None
+        return np.array([
+            [lanes.left_lane[0], lanes.left_lane[1]],
+            [lanes.left_lane[2], lanes.left_lane[3]],
+            [lanes.right_lane[2], lanes.right_lane[3]],
+            [lanes.right_lane[0], lanes.right_lane[1]]
+        ], dtype=np.int32)
+
     @staticmethod
     def draw_lane_lines(frame: np.ndarray, lanes: LaneLines) -> np.ndarray:
         """차선 그리기"""
-        overlay = frame.copy()
-
-        # 차선 영역 채우기
-        if lanes.is_complete():
-            points = np.array([
-                [lanes.left_lane[0], lanes.left_lane[1]],
-                [lanes.left_lane[2], lanes.left_lane[3]],
-                [lanes.right_lane[2], lanes.right_lane[3]],
-                [lanes.right_lane[0], lanes.right_lane[1]]
-            ], dtype=np.int32)
-
-            cv2.fillPoly(overlay, [points], DrawingUtils.LANE_AREA_COLOR)
-            cv2.addWeighted(frame, 0.7, overlay, 0.3, 0, frame)
+        # 차선 영역 채우기 (다각형 bbox 영역만 블렌딩)
+        points = DrawingUtils.lane_polygon(lanes)
+        if points is not None:
+            DrawingUtils._blend_polygon(frame, points, DrawingUtils.LANE_AREA_COLOR, 0.3)
 
         # 왼쪽 차선
         if lanes.left_lane is not None:
@@ -97,18 +113,50 @@ class DrawingUtils:
 
         return frame
 
+    @staticmethod
+    def _blend_polygon(frame: np.ndarray, points: np.ndarray,
+                       color: Tuple[int, int, int], alpha: float) -> None:
+        """다각형 내부를 color 와 alpha 비율로 블렌딩 (작업 버퍼는 풀에서)"""
+        height, width = frame.shape[:2]
+        x0, y0 = np.clip(points.min(axis=0), 0, (width, height))
+        x1, y1 = np.clip(points.max(axis=0) + 1, 0, (width, height))
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        pool = BufferPool()
+        scratch = pool.acquire(frame.shape, frame.dtype)
+        region = frame[y0:y1, x0:x1]
+        overlay = scratch[:y1 - y0, :x1 - x0]
+        np.copyto(overlay, region)
+        cv2.fillPoly(overlay, [points - (x0, y0)], color)
+        cv2.addWeighted(region, 1 - alpha, overlay, alpha, 0, region)
+        pool.release(scratch)
+
+    @staticmethod
+    def lane_warning_text(lanes: LaneLines, frame_width: int,
+                          offset_threshold: int = 50,
+                          offset_threshold_m: float = 0.5) -> Optional[str]:
+        """차선 이탈 경고 문구 (이탈이 아니면 None)"""
+        if not lanes.is_departing(frame_width, offset_threshold, offset_threshold_m):
+            return None
+        if lanes.offset_m is not None:
+            return f"차선 이탈! (오프셋: {lanes.offset_m:+.2f}m)"
+        offset = lanes.get_center_offset(frame_width)
+        return f"차선 이탈! (오프셋: {offset}px)"
+
     @staticmethod
     def draw_lane_warning(frame: np.ndarray, lanes: LaneLines,
                           offset_threshold: int = 50,
-                          top_ratio: float = 0.6) -> None:
+                          top_ratio: float = 0.6,
+                          offset_threshold_m: float = 0.5) -> None:
         """차선 이탈 경고"""
         if not lanes.is_complete():
             return
 
-        offset = lanes.get_center_offset(frame.shape[1])
-
-        if abs(offset) > offset_threshold:
-            warning_text = f"차선 이탈! (오프셋: {offset}px)"
+        warning_text = DrawingUtils.lane_warning_text(
+            lanes, frame.shape[1], offset_threshold, offset_threshold_m
+        )
+        if warning_text is not None:
             cv2.putText(frame, warning_text,
                         (50, 100),
                         cv2.FONT_HERSHEY_SIMPLEX,
@@ -119,4 +167,48 @@ class DrawingUtils:
         cv2.line(frame,
                  (center_x, frame.shape[0]),
                  (center_x, int(frame.shape[0] * top_ratio)),
-                 (255, 255, 255), 2)
\ No newline at end of file
+                 (255, 255, 255), 2)
+
+    @staticmethod
+    def draw_masks(frame: np.ndarray, masks: np.ndarray,
+                   colors: Optional[np.ndarray] = None) -> None:
+        """Segmentation 마스크 오버레이 (masks: N x H x W bool)"""
+        if colors is None:
+            colors = np.random.randint(0, 255, size=(len(masks), 3), dtype=np.uint8)
+
+        pool = BufferPool()
+        overlay = pool.acquire(frame.shape, frame.dtype)
+        np.copyto(overlay, frame)
+        for mask, color in zip(masks, colors):
+            overlay[mask] = overlay[mask] * 0.6 + color * 0.4
+
+        cv2.addWeighted(frame, 0.5, overlay, 0.5, 0, frame)
+        pool.release(overlay)
+
+    @staticmethod
+    def draw_annotations(frame: np.ndarray, detections: List[Detection],
+                         lanes: LaneLines,
+                         masks: Optional[np.ndarray] = None,
+                         mask_colors: Optional[np.ndarray] = None,
+                         show_labels: bool = True,
+                         show_distance: bool = True) -> None:
+        """차선 → 마스크 → 탐지 박스 순서로 그리기"""
+        DrawingUtils.draw_lane_lines(frame, lanes)
+        DrawingUtils.draw_lane_warning(frame, lanes)
+
+        if masks is not None and len(masks):
+            DrawingUtils.draw_masks(frame, masks, mask_colors)
+
+        for detection in detections:
+            DrawingUtils.draw_detection_box(
+                frame, detection, show_labels, show_distance
+            )
+
+    @staticmethod
+    def draw_overlay(frame: np.ndarray, overlay: FrameOverlay,
+                     show_labels: bool = True, show_distance: bool = True) -> None:
+        """오버레이 데이터를 픽셀에 그리기 (내보내기 시점 렌더링)"""
+        masks = MaskCodec.decode_many(overlay.masks) if overlay.masks else None
+        DrawingUtils.draw_annotations(frame, overlay.detections, overlay.lanes,
+                                      masks, overlay.mask_colors,
+                                      show_labels, show_distance)
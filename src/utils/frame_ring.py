@@ -0,0 +1,213 @@
+# ============================================================================
+# src/utils/frame_ring.py
+# 프로세스 간 프레임 전달용 공유 메모리 링 버퍼
+# ============================================================================
+
+import os
+import sys
+import time
+import queue
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from multiprocessing.context import BaseContext
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from ..config.constants import APP_CONST
+
+# 슬롯별 메타데이터 (공유 메모리 앞부분)
+SLOT_META_DTYPE = np.dtype([
+    ('seq', np.int64),
+    ('timestamp', np.float64),
+    ('height', np.int32),
+    ('width', np.int32),
+], align=True)
+
+
+class SharedFrameRing:
+    """공유 메모리 프레임 슬롯 링 버퍼
+
+    미리 할당한 고정 크기 슬롯에 프레임을 쓰고, 프로세스 사이에는
+    (슬롯 번호, 시퀀스, 작은 payload) 만 큐로 전달한다. 1080p 프레임(~6MB)을
+    pickle 로 복사하지 않으므로 디코딩 / 추론 / 렌더링을 별도 프로세스로
+    나눠도 프레임 전달 비용이 거의 없다.
+
+    슬롯 소유권은 빈 슬롯 큐로 관리한다:
+        생산자  acquire() → frame(slot) 에 기록 → publish(slot, seq, channel)
+        중간 단계 get(channel) → 슬롯에서 바로 처리 → publish(slot, ..., 다음 channel)
+        마지막  get(channel) → 사용 → release(slot)
+
+    Process 인자로 넘기면 자식 프로세스에서 같은 공유 메모리에 다시 연결된다.
+    인덱스 큐는 context(시작 방식)로 만들므로 자식도 같은 context 로 시작해야
+    한다. 공유 메모리는 생성한 프로세스만 unlink 한다 (fork 자식이 물려받은
+    객체를 닫아도 지우지 않음).
+    """
+
+    def __init__(self, frame_shape: Tuple[int, ...] = (1080, 1920, 3),
+                 slots: int = APP_CONST.FRAME_RING_SLOTS,
+                 dtype=np.uint8,
+                 channels: Iterable[str] = ('frames',),
+                 name: Optional[str] = None,
+                 context: Optional[BaseContext] = None):
+        self.frame_shape = tuple(frame_shape)
+        self.slots = slots
+        self.dtype = np.dtype(dtype)
+        self.channels = tuple(channels)
+
+        self.frame_bytes = int(np.prod(self.frame_shape)) * self.dtype.itemsize
+        self._meta_bytes = self._align(SLOT_META_DTYPE.itemsize * slots)
+
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True,
+            size=self._meta_bytes + self.frame_bytes * slots
+        )
+        self._owner_pid: Optional[int] = os.getpid()
+
+        # 인덱스 큐 (슬롯 번호만 오감)
+        context = context or mp.get_context()
+        self._free = context.Queue()
+        self._queues: Dict[str, Any] = {ch: context.Queue() for ch in self.channels}
+        for slot in range(slots):
+            self._free.put(slot)
+
+        self._map_views()
+        self._meta['seq'] = -1
+
+    @staticmethod
+    def _align(size: int, alignment: int = 64) -> int:
+        """캐시 라인 정렬"""
+        return (size + alignment - 1) // alignment * alignment
+
+    def _map_views(self) -> None:
+        """공유 메모리 위 numpy 뷰 생성"""
+        buf = self._shm.buf
+        self._meta = np.ndarray((self.slots,), dtype=SLOT_META_DTYPE, buffer=buf)
+        self._frames = np.ndarray((self.slots,) + self.frame_shape,
+                                  dtype=self.dtype, buffer=buf,
+                                  offset=self._meta_bytes)
+
+    @property
+    def name(self) -> str:
+        """공유 메모리 이름"""
+        return self._shm.name
+
+    # ------------------------------------------------------------------
+    # pickle (Process 인자 전달) → 자식에서 재연결
+    # ------------------------------------------------------------------
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in ('_shm', '_meta', '_frames'):
+            state.pop(key)
+        state['_owner_pid'] = None
+        state['_shm_name'] = self._shm.name
+        return state
+
+    def __setstate__(self, state):
+        shm_name = state.pop('_shm_name')
+        self.__dict__.update(state)
+        self._shm = self._attach(shm_name)
+        self._map_views()
+
+    @staticmethod
+    def _attach(name: str) -> shared_memory.SharedMemory:
+        """기존 공유 메모리 연결
+
+        multiprocessing 으로 시작한 자식은 부모의 resource_tracker 를 공유하므로
+        (fork/spawn/forkserver 모두) 등록 해제 없이 연결해도 자식 종료 시
+        삭제되지 않는다. 3.13+ 에서는 추적 자체를 끈다.
+        """
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name=name, track=False)
+        return shared_memory.SharedMemory(name=name)
+
+    # ------------------------------------------------------------------
+    # 슬롯 소유권
+    # ------------------------------------------------------------------
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[int]:
+        """빈 슬롯 확보 (timeout 내 없으면 None - 소비자가 밀린 상태)"""
+        try:
+            return self._free.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def frame(self, slot: int) -> np.ndarray:
+        """슬롯 전체 버퍼 (쓰기용, 복사 없음)"""
+        return self._frames[slot]
+
+    def publish(self, slot: int, seq: int,
+                shape: Optional[Tuple[int, ...]] = None,
+                channel: Optional[str] = None,
+                payload: Any = None,
+                timestamp: Optional[float] = None) -> None:
+        """슬롯을 다음 단계로 전달 (payload 는 탐지 결과 등 작은 객체만)"""
+        height, width = (shape or self.frame_shape)[:2]
+        meta = self._meta[slot]
+        meta['seq'] = seq
+        meta['height'] = height
+        meta['width'] = width
+        meta['timestamp'] = time.time() if timestamp is None else timestamp
+        self._queues[channel or self.channels[0]].put((slot, seq, payload))
+
+    def get(self, channel: Optional[str] = None,
+            timeout: Optional[float] = None) -> Optional[Tuple[int, int, np.ndarray, Any]]:
+        """다음 슬롯 수신 → (slot, seq, 프레임 뷰, payload), 없으면 None"""
+        try:
+            slot, seq, payload = self._queues[channel or self.channels[0]].get(
+                timeout=timeout
+            )
+        except queue.Empty:
+            return None
+
+        meta = self._meta[slot]
+        if meta['seq'] != seq:
+            # 슬롯이 이미 재사용됨 (release 순서 오류)
+            raise RuntimeError(f"슬롯 {slot} 시퀀스 불일치: {meta['seq']} != {seq}")
+
+        view = self._frames[slot][:meta['height'], :meta['width']]
+        return slot, seq, view, payload
+
+    def release(self, slot: int) -> None:
+        """슬롯 반환"""
+        self._free.put(slot)
+
+    def write(self, frame: np.ndarray, seq: int,
+              channel: Optional[str] = None, payload: Any = None,
+              timeout: Optional[float] = None) -> bool:
+        """프레임 복사 후 전달 (슬롯 부족 시 False)"""
+        height, width = frame.shape[:2]
+        if height > self.frame_shape[0] or width > self.frame_shape[1]:
+            raise ValueError(f"프레임 {frame.shape} 이 슬롯 크기 {self.frame_shape} 보다 큽니다")
+
+        slot = self.acquire(timeout)
+        if slot is None:
+            return False
+
+        self._frames[slot][:height, :width] = frame
+        self.publish(slot, seq, frame.shape, channel, payload)
+        return True
+
+    def timestamp_of(self, slot: int) -> float:
+        """슬롯 게시 시각"""
+        return float(self._meta[slot]['timestamp'])
+
+    # ------------------------------------------------------------------
+    # 해제
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """뷰 / 매핑 해제 (생성 프로세스면 공유 메모리 삭제)"""
+        self._meta = None
+        self._frames = None
+        self._shm.close()
+        if self._owner_pid == os.getpid():
+            self._owner_pid = None
+            self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
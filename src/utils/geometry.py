@@ -68,3 +68,74 @@ class GeometryUtils:
         x2 = int(poly[0] * y2 + poly[1])
 
         return (x1, y1, x2, y2)
+
+    @staticmethod
+    def plan_tiles(width: int, height: int,
+                   band_top: float = 0.35,
+                   band_bottom: float = 0.7,
+                   columns: int = 3,
+                   overlap: float = 0.2) -> List[Tuple[int, int, int, int]]:
+        """지평선 밴드를 겹치는 타일로 분할 → [(x1, y1, x2, y2), ...]"""
+        columns = max(1, columns)
+        y1 = int(height * band_top)
+        y2 = max(y1 + 1, int(height * band_bottom))
+
+        tile_width = width / (columns - (columns - 1) * overlap)
+        step = tile_width * (1 - overlap)
+
+        tiles = []
+        for i in range(columns):
+            x1 = int(round(i * step))
+            x2 = width if i == columns - 1 else int(round(x1 + tile_width))
+            tiles.append((x1, y1, min(x2, width), y2))
+        return tiles
+
+    @staticmethod
+    def scale_boxes(boxes: np.ndarray, scale_x: float, scale_y: float) -> np.ndarray:
+        """박스 (N, 4) 좌표 배율 적용 (분석 해상도 ↔ 원본 픽셀)"""
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        return boxes * np.array([scale_x, scale_y, scale_x, scale_y])
+
+    @staticmethod
+    def iou_matrix(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+        """두 박스 집합의 IoU 행렬 (len(a), len(b))"""
+        a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 4)
+        b = np.asarray(boxes_b, dtype=np.float64).reshape(-1, 4)
+
+        w = np.maximum(0.0, np.minimum(a[:, None, 2], b[None, :, 2]) -
+                       np.maximum(a[:, None, 0], b[None, :, 0]))
+        h = np.maximum(0.0, np.minimum(a[:, None, 3], b[None, :, 3]) -
+                       np.maximum(a[:, None, 1], b[None, :, 1]))
+        inter = w * h
+        area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+        area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+        return inter / (area_a[:, None] + area_b[None, :] - inter + 1e-9)
+
+    @staticmethod
+    def nms(boxes: np.ndarray, scores: np.ndarray, classes: np.ndarray,
+            iou_threshold: float = 0.5) -> np.ndarray:
+        """클래스별 NMS → 유지할 인덱스 (점수 내림차순)"""
+        if len(boxes) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        # 클래스마다 좌표를 떨어뜨려 한 번에 처리
+        offsets = classes.astype(np.float64)[:, None] * (float(boxes.max()) + 1.0)
+        shifted = boxes.astype(np.float64) + offsets
+        x1, y1, x2, y2 = shifted.T
+        areas = (x2 - x1) * (y2 - y1)
+
+        order = np.argsort(-scores)
+        keep = []
+        while order.size > 0:
+            i = order[0]
+            keep.append(i)
+            rest = order[1:]
+
+            w = np.maximum(0.0, np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest]))
+            h = np.maximum(0.0, np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest]))
+            inter = w * h
+            iou = inter / (areas[i] + areas[rest] - inter + 1e-9)
+
+            order = rest[iou <= iou_threshold]
+
+        return np.asarray(keep, dtype=np.int64)
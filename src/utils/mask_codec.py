@@ -0,0 +1,211 @@
+# ============================================================================
+# src/utils/mask_codec.py
+# Segmentation 마스크 압축 표현 (RLE / 외곽선 다각형)
+# ============================================================================
+
+from typing import List, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from ..models.overlay import PolygonMask, RLEMask
+
+
+class MaskCodec:
+    """bool 마스크 ↔ RLE / 다각형 변환 (마스크 여러 개를 한 번에 벡터 연산)
+
+    넓이와 IoU 는 RLE 의 런 구간에서 바로 계산하므로 원래 해상도로
+    복원하지 않는다.
+    """
+
+    # ------------------------------------------------------------------
+    # RLE
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def encode_rle(masks: np.ndarray) -> List[RLEMask]:
+        """(N, H, W) bool → RLE 목록"""
+        masks = np.asarray(masks, dtype=bool)
+        if masks.ndim == 2:
+            masks = masks[None]
+        count, height, width = masks.shape
+        if count == 0:
+            return []
+
+        # 전경이 있는 행 범위 안에서만 이웃 픽셀과 값이 다른 위치(런 경계)를 찾음
+        total = height * width
+        row_any = masks.any(axis=2)
+        result = []
+        for mask, rows in zip(masks, row_any):
+            filled = np.flatnonzero(rows)
+            if len(filled) == 0:
+                result.append(RLEMask(height, width, np.array([total], dtype=np.uint32)))
+                continue
+
+            begin, end = filled[0] * width, (filled[-1] + 1) * width
+            flat = mask.reshape(-1)[begin:end]
+            boundaries = np.flatnonzero(flat[1:] != flat[:-1]) + 1 + begin
+
+            # [0, (범위 시작), 경계..., (범위 끝), 전체] 의 차분이 런 길이
+            # 범위 가장자리 픽셀이 1 이면 그 위치도 경계 (첫 픽셀이 1 이면 0 길이 런부터)
+            head = [0, begin] if flat[0] else [0]
+            tail = [end, total] if flat[-1] and end < total else [total]
+            edges = np.concatenate((head, boundaries, tail))
+            counts = np.diff(edges).astype(np.uint32)
+            result.append(RLEMask(height, width, counts))
+        return result
+
+    @staticmethod
+    def decode_rle(rle: RLEMask) -> np.ndarray:
+        """RLE → (H, W) bool"""
+        values = (np.arange(len(rle.counts)) % 2).astype(bool)
+        return np.repeat(values, rle.counts).reshape(rle.height, rle.width)
+
+    @staticmethod
+    def decode_many(rles: Sequence[RLEMask]) -> np.ndarray:
+        """RLE 목록 → (N, H, W) bool (크기는 모두 같아야 함)"""
+        if not rles:
+            return np.zeros((0, 0, 0), dtype=bool)
+        return np.stack([MaskCodec.decode_rle(rle) for rle in rles])
+
+    @staticmethod
+    def _runs(rle: RLEMask) -> Tuple[np.ndarray, np.ndarray]:
+        """RLE → 전경 런의 (시작, 끝) 위치 배열 (끝은 제외)"""
+        edges = np.concatenate(([0], np.cumsum(rle.counts, dtype=np.int64)))
+        n = len(rle.counts)
+        return edges[1:n:2], edges[2:n + 1:2]
+
+    @staticmethod
+    def rle_intersection(a: RLEMask, b: RLEMask) -> int:
+        """두 RLE 의 겹치는 픽셀 수 (런 경계만으로 계산)"""
+        if a.shape != b.shape:
+            raise ValueError(f"마스크 크기가 다릅니다: {a.shape} vs {b.shape}")
+
+        starts_a, ends_a = MaskCodec._runs(a)
+        starts_b, ends_b = MaskCodec._runs(b)
+        if len(starts_a) == 0 or len(starts_b) == 0:
+            return 0
+
+        # 모든 경계로 나눈 구간마다 양쪽 런 안에 있는지 (시작 수 - 끝 수)
+        points = np.unique(np.concatenate((starts_a, ends_a, starts_b, ends_b)))
+        left = points[:-1]
+        in_a = (np.searchsorted(starts_a, left, 'right') -
+                np.searchsorted(ends_a, left, 'right')) > 0
+        in_b = (np.searchsorted(starts_b, left, 'right') -
+                np.searchsorted(ends_b, left, 'right')) > 0
+        return int(np.diff(points)[in_a & in_b].sum())
+
+    @staticmethod
+    def rle_iou(a: RLEMask, b: RLEMask) -> float:
+        """두 RLE 의 IoU"""
+        intersection = MaskCodec.rle_intersection(a, b)
+        union = a.area + b.area - intersection
+        return intersection / union if union > 0 else 0.0
+
+    @staticmethod
+    def rle_iou_matrix(a: Sequence[RLEMask], b: Sequence[RLEMask]) -> np.ndarray:
+        """RLE 목록 간 IoU 행렬 (len(a), len(b))"""
+        result = np.zeros((len(a), len(b)), dtype=np.float32)
+        for i, mask_a in enumerate(a):
+            for j, mask_b in enumerate(b):
+                result[i, j] = MaskCodec.rle_iou(mask_a, mask_b)
+        return result
+
+    # ------------------------------------------------------------------
+    # 외곽선 다각형
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def encode_polygons(masks: np.ndarray, epsilon: float = 1.0) -> List[PolygonMask]:
+        """(N, H, W) bool → 외곽선 다각형 목록 (epsilon: 단순화 허용 오차 px)"""
+        masks = np.asarray(masks, dtype=bool)
+        if masks.ndim == 2:
+            masks = masks[None]
+        height, width = masks.shape[1:]
+
+        result = []
+        for mask in masks:
+            contours, _ = cv2.findContours(mask.view(np.uint8), cv2.RETR_EXTERNAL,
+                                           cv2.CHAIN_APPROX_SIMPLE)
+            polygons = []
+            for contour in contours:
+                if epsilon > 0:
+                    contour = cv2.approxPolyDP(contour, epsilon, True)
+                if len(contour) >= 3:
+                    polygons.append(contour.reshape(-1, 2).astype(np.int32))
+            result.append(PolygonMask(height, width, polygons))
+        return result
+
+    @staticmethod
+    def decode_polygons(polygon: PolygonMask) -> np.ndarray:
+        """다각형 → (H, W) bool"""
+        canvas = np.zeros(polygon.shape, dtype=np.uint8)
+        if polygon.polygons:
+            cv2.fillPoly(canvas, polygon.polygons, 1)
+        return canvas.view(bool)
+
+    @staticmethod
+    def rle_to_polygons(rles: Sequence[RLEMask],
+                        epsilon: float = 1.0) -> List[PolygonMask]:
+        """RLE 목록 → 다각형 목록"""
+        if not rles:
+            return []
+        return MaskCodec.encode_polygons(MaskCodec.decode_many(rles), epsilon)
+
+    @staticmethod
+    def scale_polygons(polygon: PolygonMask, scale_x: float,
+                       scale_y: float) -> PolygonMask:
+        """다각형 좌표 배율 적용 (분석 해상도 → 원본 픽셀)"""
+        if scale_x == 1.0 and scale_y == 1.0:
+            return polygon
+        scale = np.array([scale_x, scale_y])
+        return PolygonMask(
+            round(polygon.height * scale_y), round(polygon.width * scale_x),
+            [np.round(points * scale).astype(np.int32) for points in polygon.polygons]
+        )
+
+    @staticmethod
+    def polygon_iou(a: PolygonMask, b: PolygonMask) -> float:
+        """두 다각형 마스크의 IoU (두 외곽의 합친 경계 상자 안에서만 채워 계산)"""
+        if not a.polygons or not b.polygons:
+            return 0.0
+
+        points = np.concatenate(a.polygons + b.polygons)
+        x0, y0 = points.min(axis=0)
+        x1, y1 = points.max(axis=0) + 1
+        size = (int(y1 - y0), int(x1 - x0))
+
+        canvas_a = np.zeros(size, dtype=np.uint8)
+        canvas_b = np.zeros(size, dtype=np.uint8)
+        offset = np.array([x0, y0], dtype=np.int32)
+        cv2.fillPoly(canvas_a, [p - offset for p in a.polygons], 1)
+        cv2.fillPoly(canvas_b, [p - offset for p in b.polygons], 1)
+
+        intersection = np.count_nonzero(canvas_a & canvas_b)
+        union = np.count_nonzero(canvas_a | canvas_b)
+        return intersection / union if union > 0 else 0.0
+
+    # ------------------------------------------------------------------
+    # 직렬화 (JSON)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def rle_to_dict(rle: RLEMask) -> dict:
+        return {'size': [rle.height, rle.width], 'counts': rle.counts.tolist()}
+
+    @staticmethod
+    def rle_from_dict(data: dict) -> RLEMask:
+        height, width = data['size']
+        return RLEMask(height, width, np.asarray(data['counts'], dtype=np.uint32))
+
+    @staticmethod
+    def polygons_to_dict(polygon: PolygonMask) -> dict:
+        return {'size': [polygon.height, polygon.width],
+                'polygons': [p.reshape(-1).tolist() for p in polygon.polygons]}
+
+    @staticmethod
+    def polygons_from_dict(data: dict) -> PolygonMask:
+        height, width = data['size']
+        return PolygonMask(height, width, [
+            np.asarray(p, dtype=np.int32).reshape(-1, 2) for p in data['polygons']
+        ])
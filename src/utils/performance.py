@@ -3,20 +3,34 @@
 # 성능 측정 유틸리티
 # ============================================================================
 
+import os
+import sys
 import time
-from typing import Optional
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+try:
+    import psutil
+except ImportError:  # 선택 의존성
+    psutil = None
 
 
 class PerformanceMonitor:
     """성능 모니터"""
 
     FPS_UPDATE_INTERVAL = 1.0  # 1초마다 FPS 업데이트 (클래스 상수로 직접 정의)
+    LATENCY_SMOOTHING = 0.2    # 프레임 지연 지수 이동 평균 계수
 
     def __init__(self):
         self.last_fps_time = time.time()
         self.fps_counter = 0
         self.current_fps = 0.0
 
+        # 프레임 처리 지연 (ms, 지수 이동 평균)
+        self.latency_ms = 0.0
+        self.latency_samples = 0
+
     def update_fps(self) -> float:
         """FPS 업데이트"""
         self.fps_counter += 1
@@ -31,11 +45,27 @@ class PerformanceMonitor:
 
         return self.current_fps
 
+    def record_latency(self, latency_ms: float) -> float:
+        """프레임 처리 지연 기록 → 평활된 지연 (ms)"""
+        if self.latency_samples == 0:
+            self.latency_ms = latency_ms
+        else:
+            alpha = self.LATENCY_SMOOTHING
+            self.latency_ms += alpha * (latency_ms - self.latency_ms)
+        self.latency_samples += 1
+        return self.latency_ms
+
+    def reset_latency(self) -> None:
+        """지연 측정 초기화"""
+        self.latency_ms = 0.0
+        self.latency_samples = 0
+
     def reset(self) -> None:
         """초기화"""
         self.last_fps_time = time.time()
         self.fps_counter = 0
         self.current_fps = 0.0
+        self.reset_latency()
 
 
 class Timer:
@@ -54,4 +84,105 @@ class Timer:
 
     def get_elapsed_ms(self) -> float:
         """경과 시간 (밀리초)"""
-        return self.elapsed
\ No newline at end of file
+        return self.elapsed
+
+
+class MemoryMonitor:
+    """프로세스 메모리 (RSS) 측정"""
+
+    _PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+    _process = None  # psutil.Process (fork 후 다시 생성)
+
+    @staticmethod
+    def rss_bytes() -> int:
+        """현재 RSS (psutil → /proc → 최대 RSS 순으로 대체)"""
+        if psutil is not None:
+            process = MemoryMonitor._process
+            if process is None or process.pid != os.getpid():
+                process = MemoryMonitor._process = psutil.Process()
+            return process.memory_info().rss
+
+        try:
+            with open('/proc/self/statm', 'rb') as f:
+                return int(f.read().split()[1]) * MemoryMonitor._PAGE_SIZE
+        except (OSError, IndexError, ValueError):
+            pass
+
+        try:
+            import resource
+        except ImportError:
+            return 0
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024  # macOS 는 바이트
+
+    @staticmethod
+    def rss_mb() -> float:
+        """현재 RSS (MB)"""
+        return MemoryMonitor.rss_bytes() / (1024 * 1024)
+
+
+class StageProfiler:
+    """파이프라인 단계별 처리 시간 / 처리량 (스레드 안전)
+
+    단계마다 횟수, 평균/최대 시간과 단계 단독 처리량(1000 / 평균 ms)을 집계한다.
+    인코더처럼 별도 스레드에서 도는 단계도 같은 객체에 기록할 수 있다.
+    track_memory 가 켜져 있으면 단계가 끝날 때 RSS 를 읽어 단계별 최대값도 남긴다.
+    """
+
+    def __init__(self, track_memory: bool = False):
+        self.track_memory = track_memory
+        self._lock = threading.Lock()
+        # stage -> [count, total_ms, max_ms, peak_rss_bytes]
+        self._stages: Dict[str, list] = {}
+
+    @contextmanager
+    def measure(self, stage: str):
+        """with 블록 실행 시간을 stage 로 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            rss = MemoryMonitor.rss_bytes() if self.track_memory else 0
+            self.record(stage, (time.perf_counter() - start) * 1000, rss)
+
+    def record(self, stage: str, elapsed_ms: float, rss_bytes: int = 0) -> None:
+        """단계 시간 (및 단계 종료 시 RSS) 기록"""
+        with self._lock:
+            entry = self._stages.setdefault(stage, [0, 0.0, 0.0, 0])
+            entry[0] += 1
+            entry[1] += elapsed_ms
+            entry[2] = max(entry[2], elapsed_ms)
+            entry[3] = max(entry[3], rss_bytes)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """단계별 {count, avg_ms, max_ms, fps, peak_rss_mb}"""
+        with self._lock:
+            stages = {name: list(entry) for name, entry in self._stages.items()}
+
+        result = {}
+        for name, (count, total_ms, max_ms, peak_rss) in stages.items():
+            avg_ms = total_ms / count if count else 0.0
+            result[name] = {
+                'count': count,
+                'avg_ms': avg_ms,
+                'max_ms': max_ms,
+                'fps': 1000.0 / avg_ms if avg_ms > 0 else 0.0,
+                'peak_rss_mb': peak_rss / (1024 * 1024),
+            }
+        return result
+
+    def report(self) -> str:
+        """사람이 읽기 쉬운 요약"""
+        lines = []
+        for name, s in self.summary().items():
+            line = (f"{name:>12}: {s['avg_ms']:7.2f}ms 평균, {s['max_ms']:7.2f}ms 최대, "
+                    f"{s['fps']:7.1f} FPS ({s['count']}회)")
+            if s['peak_rss_mb'] > 0:
+                line += f", RSS 최대 {s['peak_rss_mb']:.1f}MB"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """초기화"""
+        with self._lock:
+            self._stages.clear()
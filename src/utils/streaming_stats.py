@@ -0,0 +1,145 @@
+# ============================================================================
+# src/utils/streaming_stats.py
+# 스트리밍 누적 통계 (고정 메모리 평균 / 분산 / 분위수)
+# ============================================================================
+
+import math
+from typing import List
+
+import numpy as np
+
+
+class RunningMoments:
+    """평균 / 분산 / 최소 / 최대 누적 (Welford 온라인 알고리즘)"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """값 추가"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def variance(self) -> float:
+        """표본 분산"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def total(self) -> float:
+        return self.mean * self.count
+
+    def reset(self) -> None:
+        """초기화"""
+        self.__init__()
+
+
+class TDigest:
+    """분위수 근사 (merging t-digest)
+
+    값을 버퍼에 모았다가 정렬 병합으로 centroid 를 만든다. centroid 크기는
+    k1 스케일 함수로 제한되어 양 끝(p5, p99)이 중앙보다 촘촘하므로 꼬리 분위수가
+    정확하다. 메모리는 compression 에 비례하고 입력 수와 무관하다.
+    """
+
+    def __init__(self, compression: float = 100.0):
+        self.compression = compression
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._means = np.empty(0)
+        self._weights = np.empty(0)
+        self._buffer: List[float] = []
+        self._buffer_size = int(compression * 5)
+
+    def add(self, value: float) -> None:
+        """값 추가"""
+        self._buffer.append(value)
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) >= self._buffer_size:
+            self._compress()
+
+    def _k_to_q(self, k: float) -> float:
+        """k1 스케일 역함수"""
+        k = min(k, self.compression / 4)
+        return (math.sin(k * 2 * math.pi / self.compression) + 1) / 2
+
+    def _q_to_k(self, q: float) -> float:
+        """k1 스케일 함수 (δ/2π · asin(2q - 1))"""
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _compress(self) -> None:
+        """버퍼 + 기존 centroid 정렬 병합"""
+        if not self._buffer:
+            return
+
+        means = np.concatenate([self._means, self._buffer])
+        weights = np.concatenate([self._weights, np.ones(len(self._buffer))])
+        self._buffer.clear()
+
+        order = np.argsort(means, kind='mergesort')
+        means = means[order]
+        weights = weights[order]
+        total = weights.sum()
+
+        merged_means, merged_weights = [], []
+        cur_mean, cur_weight = means[0], weights[0]
+        weight_so_far = 0.0
+        limit = total * self._k_to_q(self._q_to_k(0.0) + 1)
+
+        for mean, weight in zip(means[1:], weights[1:]):
+            if weight_so_far + cur_weight + weight <= limit:
+                cur_weight += weight
+                cur_mean += (mean - cur_mean) * weight / cur_weight
+            else:
+                merged_means.append(cur_mean)
+                merged_weights.append(cur_weight)
+                weight_so_far += cur_weight
+                limit = total * self._k_to_q(self._q_to_k(weight_so_far / total) + 1)
+                cur_mean, cur_weight = mean, weight
+
+        merged_means.append(cur_mean)
+        merged_weights.append(cur_weight)
+        self._means = np.asarray(merged_means)
+        self._weights = np.asarray(merged_weights)
+
+    def quantile(self, q: float) -> float:
+        """q 분위수 (0~1, 값이 없으면 0)"""
+        self._compress()
+        if self.count == 0:
+            return 0.0
+        if len(self._means) == 1:
+            return float(self._means[0])
+
+        q = min(max(q, 0.0), 1.0)
+        target = q * self._weights.sum()
+
+        # centroid 중심의 누적 가중치 사이를 선형 보간 (양 끝은 min / max 로)
+        centers = np.cumsum(self._weights) - self._weights / 2
+        positions = np.concatenate([[0.0], centers, [self._weights.sum()]])
+        values = np.concatenate([[self.min], self._means, [self.max]])
+        return float(np.interp(target, positions, values))
+
+    @property
+    def centroids(self) -> int:
+        """보관 중인 centroid 수 (메모리 확인용)"""
+        self._compress()
+        return len(self._means)
+
+    def reset(self) -> None:
+        """초기화"""
+        self.__init__(self.compression)
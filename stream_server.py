@@ -0,0 +1,159 @@
+# ============================================================================
+# stream_server.py (프로젝트 루트)
+# 로컬 테스트용 MJPEG 스트림 서버 (비디오 파일을 반복 송출)
+# ============================================================================
+
+"""
+라이브 스트림 대체 서버 - 비디오 파일을 원본 FPS 로 반복 재생하며
+HTTP MJPEG(multipart/x-mixed-replace) 로 송출한다.
+
+사용법:
+    python stream_server.py demo.mp4                      # http://127.0.0.1:8080/stream.mjpg
+    python stream_server.py demo.mp4 --port 9000 --width 960
+    python run.py http://127.0.0.1:8080/stream.mjpg       # 분석기에서 수신
+
+재연결 테스트는 서버를 종료했다가 다시 실행하면 된다.
+"""
+
+import sys
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+import cv2
+
+BOUNDARY = "frame"
+
+
+class FrameBroadcaster(threading.Thread):
+    """비디오 파일을 반복 재생하며 최신 JPEG 프레임을 공유"""
+
+    def __init__(self, video_path: str, width: int = 0, quality: int = 80):
+        super().__init__(daemon=True)
+        self.video_path = video_path
+        self.width = width
+        self.quality = quality
+
+        self._cond = threading.Condition()
+        self._jpeg: Optional[bytes] = None
+        self._seq = 0
+
+    def run(self):
+        cap = cv2.VideoCapture(self.video_path)
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        interval = 1.0 / fps
+        next_time = time.perf_counter()
+
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                # 끝나면 처음부터 다시
+                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                continue
+
+            if self.width and frame.shape[1] != self.width:
+                height = int(frame.shape[0] * self.width / frame.shape[1])
+                frame = cv2.resize(frame, (self.width, height),
+                                   interpolation=cv2.INTER_AREA)
+
+            ok, buffer = cv2.imencode(
+                '.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, self.quality]
+            )
+            if ok:
+                with self._cond:
+                    self._jpeg = buffer.tobytes()
+                    self._seq += 1
+                    self._cond.notify_all()
+
+            # 원본 FPS 유지
+            next_time += interval
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_time = time.perf_counter()
+
+    def wait_frame(self, last_seq: int, timeout: float = 2.0):
+        """last_seq 이후의 새 프레임 대기 → (seq, jpeg)"""
+        with self._cond:
+            self._cond.wait_for(lambda: self._seq != last_seq, timeout)
+            return self._seq, self._jpeg
+
+
+def make_handler(broadcaster: FrameBroadcaster):
+    """요청 핸들러 클래스 생성"""
+
+    class StreamHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] not in ('/', '/stream.mjpg'):
+                self.send_error(404)
+                return
+
+            self.send_response(200)
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Content-Type',
+                             f'multipart/x-mixed-replace; boundary={BOUNDARY}')
+            self.end_headers()
+
+            seq = -1
+            try:
+                while True:
+                    seq, jpeg = broadcaster.wait_frame(seq)
+                    if jpeg is None:
+                        continue
+                    self.wfile.write(
+                        f"--{BOUNDARY}\r\n"
+                        f"Content-Type: image/jpeg\r\n"
+                        f"Content-Length: {len(jpeg)}\r\n\r\n".encode('ascii')
+                    )
+                    self.wfile.write(jpeg)
+                    self.wfile.write(b"\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def log_message(self, format, *args):
+            print(f"[{self.address_string()}] {format % args}")
+
+    return StreamHandler
+
+
+def parse_arguments():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description='로컬 MJPEG 스트림 서버')
+    parser.add_argument('video', help='송출할 비디오 파일')
+    parser.add_argument('--host', default='127.0.0.1', help='바인드 주소')
+    parser.add_argument('--port', type=int, default=8080, help='포트')
+    parser.add_argument('--width', type=int, default=0,
+                        help='송출 폭 (0: 원본)')
+    parser.add_argument('--quality', type=int, default=80, help='JPEG 품질')
+    return parser.parse_args()
+
+
+def main():
+    """메인 함수"""
+    args = parse_arguments()
+
+    if not Path(args.video).exists():
+        print(f"❌ 파일을 찾을 수 없습니다: {args.video}")
+        sys.exit(1)
+
+    broadcaster = FrameBroadcaster(args.video, args.width, args.quality)
+    broadcaster.start()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(broadcaster))
+    server.daemon_threads = True
+    print(f"📡 MJPEG 송출: http://{args.host}:{args.port}/stream.mjpg")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n서버를 종료합니다.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
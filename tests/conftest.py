@@ -0,0 +1,10 @@
+# ============================================================================
+# tests/conftest.py
+# 저장소 루트를 import 경로에 추가 (pytest 를 어디서 실행해도 src 패키지 사용)
+# ============================================================================
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
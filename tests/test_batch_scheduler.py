@@ -0,0 +1,70 @@
+# ============================================================================
+# tests/test_batch_scheduler.py
+# 여러 스트림 마이크로 배치 - 스트림별 순서 / 배치 키 분리 / 종료
+# ============================================================================
+
+import threading
+
+import numpy as np
+import pytest
+
+from src.core.batch_scheduler import MicroBatchScheduler
+
+
+class _Runner:
+    """프레임 값(스트림, 순번)을 그대로 돌려주며 배치 크기 / 키 기록"""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, frames, key):
+        self.batches.append((len(frames), key))
+        return [(int(f[0]), int(f[1]), key) for f in frames]
+
+
+def test_streams_get_results_in_submit_order():
+    runner = _Runner()
+    scheduler = MicroBatchScheduler(runner, max_batch=4, max_wait_ms=5).start()
+    results = {}
+
+    def produce(stream):
+        futures = [scheduler.submit(stream, [np.array([stream, i])], key=('k',))
+                   for i in range(30)]
+        results[stream] = [f.result(timeout=5)[0] for f in futures]
+
+    try:
+        threads = [threading.Thread(target=produce, args=(s,)) for s in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+    finally:
+        scheduler.stop()
+
+    for stream in range(3):
+        assert [r[:2] for r in results[stream]] == [(stream, i) for i in range(30)]
+    assert all(size <= 4 for size, _ in runner.batches)
+    assert sum(size for size, _ in runner.batches) == 90
+    assert scheduler.metrics().frames == 90
+
+
+def test_different_keys_are_not_batched_together():
+    runner = _Runner()
+    scheduler = MicroBatchScheduler(runner, max_batch=8, max_wait_ms=20).start()
+    try:
+        a = scheduler.submit('a', [np.array([0, 0])], key=(0.5, 640))
+        b = scheduler.submit('b', [np.array([1, 0])], key=(0.25, 640))
+        assert a.result(timeout=5)[0][2] == (0.5, 640)
+        assert b.result(timeout=5)[0][2] == (0.25, 640)
+    finally:
+        scheduler.stop()
+    assert all(size == 1 for size, _ in runner.batches)
+
+
+def test_stop_fails_pending_and_rejects_new_requests():
+    scheduler = MicroBatchScheduler(_Runner())
+    scheduler.start()
+    scheduler.stop()
+    assert not scheduler.running
+    with pytest.raises(RuntimeError):
+        scheduler.submit('a', [np.array([0, 0])])
@@ -0,0 +1,51 @@
+# ============================================================================
+# tests/test_birdseye.py
+# 버드아이 변환 - remap 맵 캐싱 / 노면 좌표 대응
+# ============================================================================
+
+import numpy as np
+
+from src.config.camera import CameraProfile
+from src.core.birdseye import BirdEyeView
+
+
+def test_output_size_follows_range_and_scale():
+    bev = BirdEyeView(lateral_range=5.0, near=2.0, far=22.0, pixels_per_meter=10.0)
+    assert bev.output_size == (100, 200)
+
+
+def test_maps_cached_per_resolution_and_cleared_on_profile_change():
+    bev = BirdEyeView()
+    maps = bev._get_maps(1280, 720)
+    assert bev._get_maps(1280, 720) is maps
+    assert bev._get_maps(640, 360) is not maps
+    assert bev.camera(1280, 720) is bev.camera(1280, 720)
+
+    bev.set_profile(CameraProfile(pitch_deg=3.0))
+    assert not bev._maps and not bev._scaled
+    assert bev._get_maps(1280, 720) is not maps
+
+
+def test_warp_moves_ground_point_to_its_metric_cell():
+    """노면 (X, Z) 에 찍은 점은 버드아이 이미지의 해당 격자 위치로 간다"""
+    bev = BirdEyeView(lateral_range=6.0, near=4.0, far=30.0, pixels_per_meter=10.0)
+    width, height = 1280, 720
+    lateral, forward = 1.5, 8.0
+
+    u, v = bev.to_image(lateral, forward, width, height)
+    frame = np.zeros((height, width), dtype=np.uint8)
+    frame[int(v) - 6:int(v) + 7, int(u) - 6:int(u) + 7] = 255
+
+    warped = bev.warp(frame)
+    assert warped.shape[::-1] == bev.output_size
+    rows, cols = np.nonzero(warped > 128)
+    got_lateral, got_forward = bev.to_ground(cols.mean(), rows.mean())
+    assert abs(got_lateral - lateral) < 0.3
+    assert abs(got_forward - forward) < 0.5
+
+
+def test_to_ground_inverts_grid_layout():
+    bev = BirdEyeView(lateral_range=6.0, near=4.0, far=30.0, pixels_per_meter=20.0)
+    lateral, forward = bev.to_ground(np.array([0, 240]), np.array([0, 520]))
+    assert np.allclose(lateral, [-6.0, 6.0])
+    assert np.allclose(forward, [30.0, 4.0])
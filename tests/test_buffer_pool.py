@@ -0,0 +1,87 @@
+# ============================================================================
+# tests/test_buffer_pool.py
+# 버퍼 풀 - 재사용 / retain·release 참조 / 보관 한도 / 메모리 예산 정리
+# ============================================================================
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from src.config.settings import SettingsSnapshot
+from src.core.video_processor import VideoProcessor
+from src.utils.buffer_pool import BufferPool
+from src.utils.performance import MemoryMonitor, StageProfiler
+
+
+@pytest.fixture
+def pool():
+    pool = BufferPool()
+    pool.trim()
+    yield pool
+    pool.trim()
+
+
+def test_released_buffer_is_reused_per_shape_and_dtype(pool):
+    before = pool.stats
+    frame = pool.acquire((36, 64, 3))
+    pool.release(frame)
+    assert pool.acquire((36, 64, 3)) is frame
+    assert pool.acquire((36, 64, 3), np.float32) is not frame
+    assert pool.acquire((36, 64)) is not frame
+
+    stats = pool.stats
+    assert stats.reuses - before.reuses == 1
+    assert stats.allocations - before.allocations == 3
+
+
+def test_retained_buffer_returns_after_last_release(pool):
+    frame = pool.acquire((36, 64, 3))
+    pool.retain(frame)                      # 표시 + 인코더 두 소비자
+    pool.release(frame)
+    assert pool.stats.free_buffers == 0     # 아직 한 소비자가 사용 중
+    pool.release(frame)
+    assert pool.stats.free_buffers == 1
+    pool.release(frame)                     # 중복 반환은 무시
+    assert pool.stats.free_buffers == 1
+    assert pool.acquire((36, 64, 3)) is frame
+
+
+def test_views_are_ignored_and_free_list_is_bounded(pool):
+    frame = pool.acquire((36, 64, 3))
+    pool.release(frame[:10])
+    pool.release(frame[:, :, 0])
+    assert pool.stats.free_buffers == 0
+
+    buffers = [pool.acquire((8, 8)) for _ in range(pool.max_free + 3)]
+    for buffer in buffers:
+        pool.release(buffer)
+    assert pool.stats.free_buffers == pool.max_free
+    assert pool.trim() == pool.max_free * 64
+    assert pool.stats.free_buffers == 0 and pool.stats.free_bytes == 0
+
+
+def test_memory_budget_trims_pool(pool, monkeypatch):
+    processor = VideoProcessor()
+    pool.release(pool.acquire((100, 100, 3)))
+    monkeypatch.setattr(MemoryMonitor, 'rss_mb', staticmethod(lambda: 900.0))
+
+    cfg = replace(SettingsSnapshot(), memory_budget_mb=1000)
+    assert processor._check_memory_budget(cfg) == 900.0
+    assert pool.stats.free_buffers == 1
+
+    cfg = replace(cfg, memory_budget_mb=500)
+    processor._check_memory_budget(cfg)
+    assert pool.stats.free_buffers == 0
+    assert processor._over_budget
+
+
+def test_stage_profiler_records_peak_rss(monkeypatch):
+    readings = iter([100 * 1024 * 1024, 300 * 1024 * 1024, 200 * 1024 * 1024])
+    monkeypatch.setattr(MemoryMonitor, 'rss_bytes', staticmethod(lambda: next(readings)))
+    profiler = StageProfiler(track_memory=True)
+    for _ in range(3):
+        with profiler.measure('detect'):
+            pass
+    summary = profiler.summary()['detect']
+    assert summary['count'] == 3 and summary['peak_rss_mb'] == 300.0
@@ -0,0 +1,32 @@
+# ============================================================================
+# tests/test_class_filter.py
+# 화이트리스트 / 클래스별 신뢰도 / 최대 탐지 수
+# ============================================================================
+
+import numpy as np
+
+from src.core.class_filter import ClassFilter
+
+NAMES = {0: 'person', 1: 'bicycle', 2: 'car'}
+
+
+def test_select_matches_apply():
+    class_filter = ClassFilter(NAMES, ['person', 'car'], ['person:0.6'], 0.3, 2)
+    conf = np.array([0.5, 0.9, 0.4, 0.7, 0.35], dtype=np.float32)
+    cls = np.array([0, 1, 2, 0, 2])
+    xyxy = np.arange(20, dtype=np.float32).reshape(5, 4)
+
+    index, dropped = class_filter.select(conf, cls)
+    assert index.tolist() == [2, 3]                 # 원래 순서 유지
+    assert dropped == {'class': 1, 'confidence': 1, 'max_det': 1}
+    assert class_filter.confidence == 0.3
+
+    (kept_xyxy, kept_conf, kept_cls), _ = class_filter.apply(xyxy, conf, cls)
+    np.testing.assert_array_equal(kept_xyxy, xyxy[index])
+    assert kept_cls.tolist() == [2, 0]
+
+
+def test_empty_results():
+    index, dropped = ClassFilter(NAMES).select(np.zeros(0, np.float32),
+                                               np.zeros(0, np.int64))
+    assert len(index) == 0 and dropped == {}
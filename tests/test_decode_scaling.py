@@ -0,0 +1,104 @@
+# ============================================================================
+# tests/test_decode_scaling.py
+# 분석 해상도 디코딩 - 출력 크기 / 원본 프레임 / 원본 픽셀 좌표 변환
+# ============================================================================
+
+import json
+
+import cv2
+import numpy as np
+import pytest
+
+from src.core.frame_source import FrameSource, OpenCVFrameSource
+from src.core.video_exporter import VideoExporter
+from src.models.export import ExportOptions
+from src.models.overlay import FrameOverlay
+from src.utils.geometry import GeometryUtils
+from src.utils.mask_codec import MaskCodec
+
+
+@pytest.mark.parametrize("source, width, crop, expected", [
+    ((1920, 1080), 0, None, (1920, 1080)),         # 축소 안 함
+    ((1920, 1080), 2560, None, (1920, 1080)),      # 확대하지 않음
+    ((1920, 1080), 960, None, (960, 540)),
+    ((1920, 1080), 641, None, (640, 360)),         # 짝수로 맞춤
+    ((1920, 1080), 640, (0, 0, 1280, 720), (640, 360)),
+])
+def test_output_size(source, width, crop, expected):
+    assert FrameSource.output_size(source, width, crop) == expected
+
+
+@pytest.fixture
+def video(tmp_path):
+    """왼쪽 절반 검정 / 오른쪽 절반 흰색 128x96 영상"""
+    path = str(tmp_path / "clip.avi")
+    frame = np.zeros((96, 128, 3), dtype=np.uint8)
+    frame[:, 64:] = 255
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 10.0, (128, 96))
+    for _ in range(3):
+        writer.write(frame)
+    writer.release()
+    return path
+
+
+def test_scaled_read_keeps_source_frame(video):
+    source = OpenCVFrameSource(video, width=64)
+    try:
+        assert source.source_size == (128, 96) and source.frame_size == (64, 48)
+        ret, frame = source.read()
+        assert ret and frame.shape == (48, 64, 3)
+        full = source.source_frame()
+        assert full.shape == (96, 128, 3)
+        assert frame[:, 40:].mean() > 200 and full[:, 80:].mean() > 200
+        assert frame[:, :24].mean() < 50 and full[:, :48].mean() < 50
+    finally:
+        source.release()
+
+    unscaled = OpenCVFrameSource(video)
+    try:
+        assert unscaled.read()[0] and unscaled.source_frame() is None
+    finally:
+        unscaled.release()
+
+
+def test_boxes_and_polygons_map_to_source_pixels():
+    overlay = FrameOverlay(frame_size=(640, 360), source_size=(1920, 1080))
+    assert overlay.source_scale == (3.0, 3.0)
+    assert FrameOverlay(frame_size=(640, 360)).source_scale == (1.0, 1.0)
+
+    boxes = GeometryUtils.scale_boxes(np.array([[10, 20, 30, 40]]), *overlay.source_scale)
+    assert boxes.tolist() == [[30.0, 60.0, 90.0, 120.0]]
+
+    mask = np.zeros((1, 36, 64), dtype=bool)
+    mask[0, 10:20, 8:24] = True
+    polygon = MaskCodec.encode_polygons(mask)[0]
+    scaled = MaskCodec.scale_polygons(polygon, 2.0, 2.0)
+    assert scaled.shape == (72, 128)
+    assert MaskCodec.scale_polygons(polygon, 1.0, 1.0) is polygon
+    points = np.concatenate(scaled.polygons)
+    assert points.min(axis=0).tolist() == [16, 20]
+    assert points.max(axis=0).tolist() == [46, 38]
+
+
+def test_polygon_sidecar_uses_source_pixels(tmp_path):
+    options = ExportOptions(str(tmp_path / "out.avi"), codec='mjpeg',
+                            backend='opencv', mask_format='polygon')
+    exporter = VideoExporter(options, 10.0)
+    exporter.start()
+
+    mask = np.zeros((1, 48, 64), dtype=bool)
+    mask[0, 10:20, 8:24] = True
+    overlay = FrameOverlay(frame_size=(64, 48), source_size=(256, 192),
+                           masks=MaskCodec.encode_rle(mask), burned_in=True,
+                           frame_number=0)
+    assert exporter.submit(np.zeros((48, 64, 3), dtype=np.uint8), overlay)
+    assert exporter.finish().success
+
+    with open(options.mask_path, encoding='utf-8') as f:
+        row = json.loads(f.readline())
+    assert row['source_size'] == [256, 192]
+    record = row['masks'][0]
+    assert record['size'] == [192, 256]
+    points = np.asarray(record['polygons'][0]).reshape(-1, 2)
+    assert points.min(axis=0).tolist() == [32, 40]
+    assert points.max(axis=0).tolist() == [92, 76]
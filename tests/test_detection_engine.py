@@ -0,0 +1,12 @@
+# ============================================================================
+# tests/test_detection_engine.py
+# 탐지 엔진 - 종료 / 추론 서버 연결 실패 처리
+# ============================================================================
+
+from src.core.detection_engine import DetectionEngine
+
+
+def test_close_without_server():
+    engine = DetectionEngine(None)
+    engine.close()
+    engine.close()      # 두 번 닫아도 문제 없음
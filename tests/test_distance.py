@@ -0,0 +1,63 @@
+# ============================================================================
+# tests/test_distance.py
+# 카메라 프로파일 스케일 / 클래스별 폭 + 지면 평면 거리 추정
+# ============================================================================
+
+import numpy as np
+import pytest
+
+from src.config.camera import CameraProfile
+from src.core.distance_estimator import DistanceEstimator
+
+NAMES = {0: 'person', 2: 'car', 5: 'bus'}
+PROFILE = CameraProfile(reference_width=1920, reference_height=1080,
+                        focal_length_x=1000.0, focal_length_y=1000.0,
+                        principal_x=980.0, principal_y=540.0, pitch_deg=2.0)
+
+
+def test_same_aspect_scales_like_resize(capsys):
+    cam = PROFILE.scaled(960, 540)
+    assert cam.focal_length_x == cam.focal_length_y == 500.0
+    assert (cam.principal_x, cam.principal_y) == (490.0, 270.0)
+    assert "종횡비" not in capsys.readouterr().out
+
+
+def test_different_aspect_keeps_square_pixels_and_warns(capsys):
+    cam = PROFILE.scaled(640, 480)      # 16:9 기준 → 4:3 프레임 (레터박스)
+    assert "종횡비" in capsys.readouterr().out
+    assert cam.focal_length_x == cam.focal_length_y == pytest.approx(1000 / 3)
+    # 중심 오프셋(+20px)도 같은 배율, 중앙 정렬
+    assert cam.principal_x == pytest.approx(320 + 20 / 3)
+    assert cam.principal_y == pytest.approx(240)
+
+
+def test_width_distance_per_class():
+    estimator = DistanceEstimator(PROFILE)
+    xyxy = np.array([[0, 0, 100, 50],      # person 0.5m
+                     [0, 0, 180, 90],      # car 1.8m
+                     [0, 0, 0, 10]], float)   # 폭 0
+    distances = estimator.estimate(xyxy, np.array([0, 2, 2]), NAMES, (1080, 1920))
+    np.testing.assert_allclose(distances[:2], [5.0, 10.0])
+    assert np.isinf(distances[2])
+
+    # 절반 해상도 프레임의 절반 크기 박스는 같은 거리
+    half = estimator.estimate(xyxy[:2] / 2, np.array([0, 2]), NAMES, (540, 960))
+    np.testing.assert_allclose(half, [5.0, 10.0])
+
+
+def test_ground_plane_matches_projection():
+    estimator = DistanceEstimator(PROFILE)
+    cam = estimator.scaled_profile(1920, 1080)
+    forward = np.array([8.0, 20.0])
+    _, rows = cam.project_ground(np.zeros(2), forward)
+    bottoms = np.floor(rows)
+    xyxy = np.stack([np.full(2, 900.0), bottoms - 50, np.full(2, 1000.0), bottoms], axis=1)
+
+    distances = estimator.estimate(xyxy, np.array([2, 2]), NAMES, (1080, 1920),
+                                   use_ground_plane=True)
+    np.testing.assert_allclose(distances, forward, rtol=0.05)
+
+    # 하단이 프레임 끝에 잘린 박스는 폭 기반
+    clipped = np.array([[900.0, 900.0, 1080.0, 1079.0]])
+    assert estimator.estimate(clipped, np.array([2]), NAMES, (1080, 1920),
+                              use_ground_plane=True)[0] == pytest.approx(10.0)
@@ -0,0 +1,52 @@
+# ============================================================================
+# tests/test_frame_indexer.py
+# 키프레임 인덱스 캐시 - 키프레임 없는 인덱스는 저장 / 재사용하지 않음
+# ============================================================================
+
+import numpy as np
+import pytest
+
+from src.core.frame_indexer import FrameIndexBuilder
+from src.models.frame_index import FrameIndex
+from src.utils.cache import VideoCache
+
+
+@pytest.fixture
+def video(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)     # CACHE_DIR 는 작업 디렉터리 기준
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(b"\0" * 16)
+    return str(path)
+
+
+def _index(video_path, keyframes):
+    return FrameIndex(video_path=video_path, total_frames=30, fps=30.0,
+                      keyframes=np.asarray(keyframes, dtype=np.int64),
+                      timestamps_ms=np.arange(30) * (1000 / 30))
+
+
+def _cache_path(video_path):
+    return VideoCache.path_for(video_path, FrameIndexBuilder.CACHE_KIND)
+
+
+def test_index_without_keyframes_is_not_cached(video, monkeypatch):
+    monkeypatch.setattr(FrameIndexBuilder, 'build',
+                        staticmethod(lambda path, should_stop=None: _index(path, [])))
+    index = FrameIndexBuilder.load_or_build(video)
+    assert index is not None and not index.has_keyframes
+    assert not _cache_path(video).exists()
+
+
+def test_index_with_keyframes_is_cached(video, monkeypatch):
+    monkeypatch.setattr(FrameIndexBuilder, 'build',
+                        staticmethod(lambda path, should_stop=None: _index(path, [0, 15])))
+    FrameIndexBuilder.load_or_build(video)
+    assert _cache_path(video).exists()
+
+    cached = FrameIndexBuilder.load_cached(video)
+    assert cached.keyframes.tolist() == [0, 15]
+
+
+def test_stale_cache_without_keyframes_is_ignored(video):
+    _index(video, []).save(_cache_path(video))
+    assert FrameIndexBuilder.load_cached(video) is None
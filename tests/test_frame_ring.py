@@ -0,0 +1,93 @@
+# ============================================================================
+# tests/test_frame_ring.py
+# 공유 메모리 프레임 링 - 슬롯 소유권 / 시퀀스 검사 / 프로세스 간 전달 / 해제
+# ============================================================================
+
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from src.utils.frame_ring import SharedFrameRing
+
+SHAPE = (48, 64, 3)
+FRAMES = 300
+
+
+def _frame(seq: int) -> np.ndarray:
+    return np.full(SHAPE, seq % 251, dtype=np.uint8)
+
+
+def _produce(ring: SharedFrameRing, count: int) -> None:
+    """자식 프로세스: 프레임 기록 후 게시"""
+    for seq in range(count):
+        slot = ring.acquire(timeout=10)
+        assert slot is not None
+        ring.frame(slot)[:] = _frame(seq)
+        ring.publish(slot, seq, payload={'seq': seq})
+    ring.close()
+
+
+def test_acquire_publish_get_release():
+    with SharedFrameRing(SHAPE, slots=2, channels=('decoded', 'detected')) as ring:
+        slot = ring.acquire(timeout=1)
+        ring.frame(slot)[:] = 7
+        ring.publish(slot, 0, (32, 40, 3), channel='decoded', payload='boxes')
+
+        got_slot, seq, view, payload = ring.get('decoded', timeout=1)
+        assert (got_slot, seq, payload) == (slot, 0, 'boxes')
+        assert view.shape == (32, 40, 3) and (view == 7).all()
+
+        # 다음 단계로 넘긴 뒤 마지막 단계가 반환
+        ring.publish(got_slot, seq, view.shape, channel='detected')
+        assert ring.get('detected', timeout=1)[1] == 0
+        ring.release(got_slot)
+
+        # 두 슬롯 모두 다시 확보 가능, 세 번째는 없음
+        assert {ring.acquire(timeout=1), ring.acquire(timeout=1)} == {0, 1}
+        assert ring.acquire(timeout=0.05) is None
+        assert ring.get('decoded', timeout=0.05) is None
+
+
+def test_stale_sequence_is_detected():
+    with SharedFrameRing(SHAPE, slots=1) as ring:
+        ring.write(_frame(1), seq=1)
+        # 소비 전에 슬롯이 재사용됨 (release 순서 오류)
+        ring.publish(0, 2)
+        with pytest.raises(RuntimeError):
+            ring.get(timeout=1)
+
+
+def test_oversized_frame_is_rejected():
+    with SharedFrameRing(SHAPE, slots=1) as ring:
+        with pytest.raises(ValueError):
+            ring.write(np.zeros((SHAPE[0] + 1, SHAPE[1], 3), np.uint8), seq=0)
+
+
+@pytest.mark.parametrize('method', [m for m in ('fork', 'spawn', 'forkserver')
+                                    if m in mp.get_all_start_methods()])
+def test_frames_cross_processes_and_shm_is_removed(method):
+    context = mp.get_context(method)
+    ring = SharedFrameRing(SHAPE, slots=4, context=context)
+    name = ring.name
+    child = context.Process(target=_produce, args=(ring, FRAMES))
+    child.start()
+    try:
+        for expected in range(FRAMES):
+            slot, seq, view, payload = ring.get(timeout=10)
+            assert seq == expected and payload == {'seq': seq}
+            assert view[0, 0, 0] == seq % 251 and view[-1, -1, -1] == seq % 251
+            ring.release(slot)
+        child.join(timeout=10)
+        assert child.exitcode == 0
+
+        # 자식 종료로 공유 메모리가 사라지지 않음
+        shared_memory.SharedMemory(name=name).close()
+    finally:
+        if child.is_alive():
+            child.terminate()
+        ring.close()
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
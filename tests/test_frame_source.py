@@ -0,0 +1,102 @@
+# ============================================================================
+# tests/test_frame_source.py
+# ffmpeg 파이프 백엔드 - 시작 실패 시 opencv 대체 / 미리 읽은 첫 프레임
+# ============================================================================
+
+import os
+import sys
+
+import cv2
+import numpy as np
+import pytest
+
+from src.core.frame_source import FFmpegFrameSource, FrameSource, OpenCVFrameSource
+
+pytestmark = pytest.mark.skipif(os.name != 'posix', reason="셸 스크립트 ffmpeg")
+
+# OpenCV 로 디코딩해 bgr24 를 내보내는 ffmpeg 대역 (-ss 지원)
+FAKE_FFMPEG = """#!{python}
+import sys, cv2
+args = sys.argv[1:]
+cap = cv2.VideoCapture(args[args.index('-i') + 1])
+if '-ss' in args:
+    cap.set(cv2.CAP_PROP_POS_MSEC, float(args[args.index('-ss') + 1]) * 1000)
+while True:
+    ok, frame = cap.read()
+    if not ok:
+        break
+    sys.stdout.buffer.write(frame.tobytes())
+"""
+
+BROKEN_FFMPEG = """#!/bin/sh
+echo "Invalid data found when processing input" >&2
+exit 1
+"""
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 10.0, (64, 48))
+    for i in range(12):
+        writer.write(np.full((48, 64, 3), i * 20, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def _install(tmp_path, monkeypatch, script):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    ffmpeg = bin_dir / "ffmpeg"
+    ffmpeg.write_text(script.format(python=sys.executable))
+    ffmpeg.chmod(0o755)
+    monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+
+def test_failed_ffmpeg_falls_back_to_opencv(tmp_path, monkeypatch, video):
+    _install(tmp_path, monkeypatch, BROKEN_FFMPEG)
+
+    source = FFmpegFrameSource(video)
+    assert not source.is_opened()
+    assert source.read() == (False, None)
+    source.release()
+
+    source = FrameSource.open(video, 'ffmpeg')
+    try:
+        assert isinstance(source, OpenCVFrameSource)
+        assert source.read()[0]
+    finally:
+        source.release()
+
+
+def test_first_frame_is_not_lost(tmp_path, monkeypatch, video):
+    _install(tmp_path, monkeypatch, FAKE_FFMPEG)
+
+    reference = OpenCVFrameSource(video)
+    expected = []
+    while True:
+        ret, frame = reference.read()
+        if not ret:
+            break
+        expected.append(frame.copy())
+    reference.release()
+
+    source = FrameSource.open(video, 'ffmpeg')
+    try:
+        assert isinstance(source, FFmpegFrameSource) and source.is_opened()
+        buffer = np.empty((48, 64, 3), dtype=np.uint8)
+        ret, frame = source.read(buffer)
+        assert ret and frame is buffer and source.position == 1
+        np.testing.assert_array_equal(frame, expected[0])
+
+        assert source.grab() and source.position == 2
+        ret, frame = source.read()
+        np.testing.assert_array_equal(frame, expected[2])
+
+        source.seek(5)
+        assert source.position == 5
+        ret, frame = source.read(buffer)
+        assert ret and source.position == 6
+        np.testing.assert_array_equal(frame, expected[5])
+    finally:
+        source.release()
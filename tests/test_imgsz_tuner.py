@@ -0,0 +1,62 @@
+# ============================================================================
+# tests/test_imgsz_tuner.py
+# imgsz 자동 조절 - 예산 초과 시 하향 / 여유 있을 때만 상향 / 진동 없음
+# ============================================================================
+
+from src.core.imgsz_tuner import ImgszTuner
+from src.utils.performance import PerformanceMonitor
+
+
+def _feed(tuner, monitor, latency_ms, target_fps, frames):
+    """같은 지연을 frames 번 기록하며 update → 크기 변화 이력"""
+    history = []
+    for _ in range(frames):
+        monitor.record_latency(latency_ms(tuner.imgsz))
+        if tuner.update(monitor, target_fps):
+            history.append(tuner.imgsz)
+    return history
+
+
+def test_waits_for_samples_before_deciding():
+    tuner = ImgszTuner(initial=640, min_samples=5)
+    monitor = PerformanceMonitor()
+    for _ in range(4):
+        monitor.record_latency(500.0)
+        assert not tuner.update(monitor, 30.0)
+    monitor.record_latency(500.0)
+    assert tuner.update(monitor, 30.0)
+    assert tuner.imgsz == 576
+    assert monitor.latency_samples == 0         # 새 크기 지연은 처음부터 측정
+
+
+def test_converges_without_oscillation():
+    """지연이 면적에 비례하는 모델: 예산 안에 드는 가장 큰 단계에서 멈춘다"""
+    tuner = ImgszTuner(initial=1280, min_samples=3)
+    monitor = PerformanceMonitor()
+
+    def latency(size):
+        return 30.0 * (size / 640) ** 2          # 640 → 30ms
+
+    history = _feed(tuner, monitor, latency, target_fps=25.0, frames=200)   # 예산 40ms
+    assert history == [960, 768, 640]
+    assert latency(tuner.imgsz) <= 40.0
+    # 768 은 예상 43ms > 32ms(예산 80%) 라 다시 올리지 않음
+    assert _feed(tuner, monitor, latency, 25.0, 100) == []
+
+
+def test_steps_up_when_headroom_allows():
+    tuner = ImgszTuner(initial=320, min_samples=3)
+    monitor = PerformanceMonitor()
+    history = _feed(tuner, monitor, lambda size: 10.0 * (size / 320) ** 2,
+                    target_fps=10.0, frames=200)     # 예산 100ms
+    assert history[0] == 384 and tuner.imgsz == 768   # 960 예상 90ms > 80ms
+
+
+def test_no_tuning_without_target_and_reset_snaps_to_step():
+    tuner = ImgszTuner(initial=700, min_samples=1)
+    assert tuner.imgsz == 640
+    monitor = PerformanceMonitor()
+    monitor.record_latency(1000.0)
+    assert not tuner.update(monitor, 0.0)
+    tuner.reset(1000)
+    assert tuner.imgsz == 960
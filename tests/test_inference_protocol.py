@@ -0,0 +1,209 @@
+# ============================================================================
+# tests/test_inference_protocol.py
+# 추론 서버 메시지 형식 / 인증 키 / 바인드 주소 제한
+# ============================================================================
+
+import json
+import os
+import stat
+import struct
+import threading
+import time
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from src.config.settings import SettingsManager
+from src.core.detection_engine import DetectionEngine
+from src.core.inference_client import InferenceClient, ServerAddress
+from src.core.inference_protocol import InferenceKey, WireCodec
+from src.core.inference_server import InferenceServer
+
+
+class _Tensor:
+    def __init__(self, array):
+        self.array = np.asarray(array)
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self.array
+
+
+class _Boxes:
+    def __init__(self, xyxy, conf, cls):
+        self.xyxy, self.conf, self.cls = _Tensor(xyxy), _Tensor(conf), _Tensor(cls)
+
+
+class _Masks:
+    def __init__(self, data):
+        self.data = _Tensor(data)
+
+
+class _Result:
+    def __init__(self, boxes, masks=None):
+        self.boxes = boxes
+        self.masks = masks
+
+
+class _FakeDetector:
+    """프레임마다 중앙 박스 하나를 돌려주는 모델"""
+    names = {0: 'person', 2: 'car'}
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, frames, **kwargs):
+        self.calls.append(kwargs)
+        results = []
+        for frame in frames:
+            h, w = frame.shape[:2]
+            results.append(_Result(_Boxes([[w * 0.25, h * 0.25, w * 0.75, h * 0.75]],
+                                          [0.9], [2])))
+        return results
+
+
+class _FakeSegmenter(_FakeDetector):
+    """프레임마다 person / car 마스크 두 개를 돌려주는 모델"""
+
+    def __call__(self, frames, **kwargs):
+        self.calls.append(kwargs)
+        return [_Result(_Boxes([[0, 0, 8, 8], [8, 8, 16, 16]], [0.3, 0.9], [0, 2]),
+                        _Masks(np.ones((2, 16, 16), dtype=np.float32)))
+                for _ in frames]
+
+
+def test_wire_codec_round_trip():
+    frame = np.random.randint(0, 255, (36, 64, 3), dtype=np.uint8)
+    boxes = np.random.rand(5, 4).astype(np.float32)
+    data = WireCodec.encode({'id': 3, 'kind': 'detect'}, [frame, boxes])
+
+    header, arrays = WireCodec.decode(data)
+    assert header == {'id': 3, 'kind': 'detect'}
+    np.testing.assert_array_equal(arrays[0], frame)
+    np.testing.assert_array_equal(arrays[1], boxes)
+
+
+def test_wire_codec_rejects_objects_and_bad_lengths():
+    with pytest.raises(ValueError):
+        WireCodec.encode({}, [np.array([object()])])
+
+    data = WireCodec.encode({'id': 1}, [np.zeros(10, dtype=np.float32)])
+    with pytest.raises(ValueError):
+        WireCodec.decode(data[:-4])
+    with pytest.raises(ValueError):
+        WireCodec.decode(data + b"x")
+
+    header = json.dumps({'id': 1, 'arrays': [['object', [1]]]}).encode()
+    forged = struct.pack('>I', len(header)) + header + b"\0" * 8
+    with pytest.raises(ValueError):
+        WireCodec.decode(forged)
+
+
+def test_loopback_addresses():
+    assert ServerAddress.is_loopback("127.0.0.1:5055")
+    assert ServerAddress.is_loopback("localhost:5055")
+    assert ServerAddress.is_loopback("unix:/tmp/yolo.sock")
+    assert not ServerAddress.is_loopback("0.0.0.0:5055")
+    assert not ServerAddress.is_loopback("192.168.0.10:5055")
+
+
+def test_server_refuses_remote_bind_without_flag():
+    with pytest.raises(ValueError):
+        InferenceServer("0.0.0.0:5055", authkey=b"k")
+
+
+def test_key_file_created_private(tmp_path, monkeypatch):
+    monkeypatch.delenv('YOLO_INFERENCE_KEY', raising=False)
+    path = tmp_path / "inference.key"
+    monkeypatch.setattr(InferenceKey, 'path', staticmethod(lambda: path))
+
+    key = InferenceKey.load()
+    assert len(key) == 64
+    assert InferenceKey.load() == key
+    if os.name == 'posix':
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    monkeypatch.setenv('YOLO_INFERENCE_KEY', 'from-env')
+    assert InferenceKey.load() == b'from-env'
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="unix 소켓")
+def test_detect_round_trip(tmp_path, monkeypatch):
+    address = f"unix:{tmp_path / 'yolo.sock'}"
+    detector = _FakeDetector()
+    segmenter = _FakeSegmenter()
+    server = InferenceServer(address, max_wait_ms=1, authkey=b"test-key")
+    monkeypatch.setattr(server.model_manager, 'load_detection_model',
+                        lambda *args, **kwargs: detector)
+    monkeypatch.setattr(server.model_manager, 'load_segmentation_model',
+                        lambda *args, **kwargs: segmenter)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    client = None
+    try:
+        for _ in range(100):
+            if os.path.exists(tmp_path / 'yolo.sock'):
+                break
+            time.sleep(0.02)
+        client = InferenceClient(address, authkey=b"test-key")
+        assert client.names == {0: 'person', 2: 'car'}
+
+        frames = [np.zeros((100, 200, 3), dtype=np.uint8)] * 2
+        boxes = client.detect(frames, 0.4, 640, classes=(2,), max_det=10)
+        assert len(boxes) == 2
+        xyxy, conf, cls = boxes[0]
+        np.testing.assert_allclose(xyxy, [[50, 25, 150, 75]])
+        assert cls.tolist() == [2]
+        assert detector.calls[-1]['classes'] == [2]
+        assert detector.calls[-1]['max_det'] == 10
+
+        # segmentation 도 같은 classes / max_det 를 넘기고 마스크별 conf / cls 를 받음
+        masks, conf, cls = client.segment(frames[0], 0.25, 640, classes=(0, 2), max_det=5)
+        assert masks.shape == (2, 16, 16)
+        assert cls.tolist() == [0, 2]
+        np.testing.assert_allclose(conf, [0.3, 0.9])
+        assert segmenter.calls[-1]['classes'] == [0, 2]
+        assert segmenter.calls[-1]['max_det'] == 5
+    finally:
+        if client is not None:
+            client.close()
+        server.shutdown()
+        thread.join(timeout=5)
+
+
+def _wait_for(path):
+    for _ in range(100):
+        if os.path.exists(path):
+            return
+        time.sleep(0.02)
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="unix 소켓")
+def test_wrong_key_falls_back_to_local(tmp_path, monkeypatch):
+    """키가 다르면 AuthenticationError 가 새지 않고 로컬 추론으로 전환"""
+    address = f"unix:{tmp_path / 'yolo.sock'}"
+    server = InferenceServer(address, max_wait_ms=1, authkey=b"server-key")
+    monkeypatch.setattr(server.model_manager, 'load_detection_model',
+                        lambda *args, **kwargs: _FakeDetector())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        _wait_for(tmp_path / 'yolo.sock')
+        monkeypatch.setenv('YOLO_INFERENCE_KEY', 'wrong-key')
+        engine = DetectionEngine(None)
+        cfg = replace(SettingsManager().snapshot(), inference_server=address)
+        assert engine._remote_client(cfg) is None
+        assert engine._remote_retry_at > time.monotonic()
+
+        # 서버는 계속 동작
+        monkeypatch.setenv('YOLO_INFERENCE_KEY', 'server-key')
+        engine._remote_retry_at = 0.0
+        assert engine._remote_client(cfg) is not None
+        engine.close()
+    finally:
+        server.shutdown()
+        thread.join(timeout=5)
@@ -0,0 +1,56 @@
+# ============================================================================
+# tests/test_mask_codec.py
+# RLE / 다각형 마스크 - 왕복 변환 / 넓이 / IoU
+# ============================================================================
+
+import numpy as np
+import pytest
+
+from src.utils.mask_codec import MaskCodec
+
+
+def _square(size, top, left, side):
+    mask = np.zeros(size, dtype=bool)
+    mask[top:top + side, left:left + side] = True
+    return mask
+
+
+def test_rle_round_trip_and_area():
+    rng = np.random.default_rng(0)
+    masks = rng.random((4, 30, 40)) > 0.6
+    masks[1] = False                      # 빈 마스크
+    masks[2, 0, 0] = masks[2, -1, -1] = True   # 첫 / 마지막 픽셀이 전경
+    masks[3] = True                       # 전체가 전경
+
+    rles = MaskCodec.encode_rle(masks)
+    np.testing.assert_array_equal(MaskCodec.decode_many(rles), masks)
+    assert [r.area for r in rles] == [int(m.sum()) for m in masks]
+
+    restored = MaskCodec.rle_from_dict(MaskCodec.rle_to_dict(rles[0]))
+    np.testing.assert_array_equal(MaskCodec.decode_rle(restored), masks[0])
+
+
+def test_rle_iou_matches_pixels():
+    rng = np.random.default_rng(1)
+    a, b = rng.random((2, 25, 35)) > 0.5
+    expected = (a & b).sum() / (a | b).sum()
+    rle_a, rle_b = MaskCodec.encode_rle(np.stack([a, b]))
+    assert MaskCodec.rle_iou(rle_a, rle_b) == pytest.approx(expected)
+    assert MaskCodec.rle_iou_matrix([rle_a], [rle_a, rle_b])[0, 0] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize('side', [4, 10, 23])
+def test_polygon_area_counts_filled_pixels(side):
+    mask = _square((40, 40), 5, 7, side)
+    polygon, = MaskCodec.encode_polygons(mask)
+    assert polygon.area == side * side
+    assert polygon.area == MaskCodec.decode_polygons(polygon).sum()
+
+
+def test_polygon_iou_consistent_with_area():
+    a, = MaskCodec.encode_polygons(_square((40, 40), 0, 0, 10))
+    b, = MaskCodec.encode_polygons(_square((40, 40), 5, 5, 10))
+    # 겹침 5x5 = 25, 합집합 100 + 100 - 25
+    assert MaskCodec.polygon_iou(a, b) == pytest.approx(25 / 175)
+    assert MaskCodec.polygon_iou(a, a) == pytest.approx(1.0)
+    assert MaskCodec.encode_polygons(np.zeros((8, 8), bool))[0].area == 0
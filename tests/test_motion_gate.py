@@ -0,0 +1,53 @@
+# ============================================================================
+# tests/test_motion_gate.py
+# 프레임 차분 정지 장면 판별
+# ============================================================================
+
+import numpy as np
+
+from src.core.motion_gate import MotionGate
+
+
+def _frame(level, noise=None):
+    frame = np.full((360, 640, 3), level, dtype=np.uint8)
+    if noise is not None:
+        frame = np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+    return frame
+
+
+def test_static_frames_skip_until_limit():
+    gate = MotionGate(threshold=1.5, max_consecutive_skips=3)
+    results = [gate.is_static(_frame(100)) for _ in range(9)]
+    # 첫 프레임은 추론, 이후 3 번 스킵마다 한 번 강제 추론
+    assert results == [False, True, True, True, False, True, True, True, False]
+    assert gate.skip_ratio == 6 / 9
+
+
+def test_sensor_noise_is_static_but_motion_is_not():
+    rng = np.random.default_rng(0)
+    gate = MotionGate(threshold=1.5, max_consecutive_skips=100)
+    gate.is_static(_frame(100))
+    noise = rng.integers(-2, 3, (360, 640, 3), dtype=np.int16)
+    assert gate.is_static(_frame(100, noise))     # 축소하면 잡음은 평균으로 사라짐
+
+    moved = _frame(100)
+    moved[100:260, 200:440] = 220                 # 화면의 1/6 이 크게 바뀜
+    assert not gate.is_static(moved)
+    assert gate.last_score > 1.5
+
+
+def test_slow_drift_accumulates_against_reference():
+    """기준 프레임과 비교하므로 천천히 밝아지는 장면도 결국 재추론"""
+    gate = MotionGate(threshold=1.5, max_consecutive_skips=100)
+    results = [gate.is_static(_frame(100 + i // 2)) for i in range(10)]
+    assert results[1] and not all(results[1:])
+
+
+def test_invalidate_forces_inference():
+    gate = MotionGate()
+    gate.is_static(_frame(50))
+    assert gate.is_static(_frame(50))
+    gate.invalidate()
+    assert not gate.is_static(_frame(50))
+    gate.reset()
+    assert gate.total_frames == 0 and gate.skip_ratio == 0.0
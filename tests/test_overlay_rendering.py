@@ -0,0 +1,79 @@
+# ============================================================================
+# tests/test_overlay_rendering.py
+# 오버레이 데이터 모드 - 표시 / 내보내기 시점 렌더링이 픽셀 렌더링과 같은지
+# ============================================================================
+
+from dataclasses import replace
+
+import numpy as np
+
+from src.config.settings import SettingsSnapshot
+from src.core.video_exporter import VideoExporter
+from src.core.video_processor import VideoProcessor
+from src.models.detection import Detection, LaneLines
+from src.models.export import ExportOptions
+from src.models.overlay import FrameOverlay
+from src.utils.drawing import DrawingUtils
+from src.utils.mask_codec import MaskCodec
+
+
+def _scene():
+    """프레임 + 탐지 / 차선 / 마스크 (마스크 색 고정)"""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (180, 320, 3), dtype=np.uint8)
+    detections = [Detection(2, 'car', 0.9, np.array([40.0, 60.0, 120.0, 110.0]), 8.0),
+                  Detection(0, 'person', 0.7, np.array([200.0, 50.0, 230.0, 120.0]), 30.0)]
+    lanes = LaneLines(left_lane=(60, 180, 140, 110), right_lane=(280, 180, 190, 110))
+    masks = np.zeros((2, 180, 320), dtype=bool)
+    masks[0, 60:110, 40:120] = True
+    masks[1, 50:120, 200:230] = True
+    colors = np.array([[255, 0, 0], [0, 0, 255]], dtype=np.uint8)
+    return frame, detections, lanes, masks, colors
+
+
+def test_overlay_data_renders_same_pixels_as_worker():
+    frame, detections, lanes, masks, colors = _scene()
+
+    burned = frame.copy()
+    DrawingUtils.draw_annotations(burned, detections, lanes, masks, colors)
+
+    overlay = FrameOverlay(frame_size=(320, 180), detections=detections, lanes=lanes,
+                           masks=MaskCodec.encode_rle(masks), mask_colors=colors)
+    deferred = frame.copy()
+    DrawingUtils.draw_overlay(deferred, overlay)
+
+    assert np.array_equal(burned, deferred)
+    assert not np.array_equal(burned, frame)
+
+
+def test_exporter_draws_on_copy(tmp_path):
+    frame, detections, lanes, masks, colors = _scene()
+    original = frame.copy()
+    overlay = FrameOverlay(frame_size=(320, 180), detections=detections, lanes=lanes,
+                           masks=MaskCodec.encode_rle(masks), mask_colors=colors)
+
+    exporter = VideoExporter(ExportOptions(str(tmp_path / "out.avi")), 30.0)
+    annotated = exporter._render_overlay(frame, overlay)
+
+    assert annotated is not frame
+    assert np.array_equal(frame, original)      # 표시 위젯과 공유하는 원본은 그대로
+    expected = original.copy()
+    DrawingUtils.draw_overlay(expected, overlay)
+    assert np.array_equal(annotated, expected)
+    assert exporter.profiler.summary()['overlay']['count'] == 1
+
+
+def test_worker_renders_only_without_data_mode():
+    processor = VideoProcessor()
+    cfg = SettingsSnapshot()
+    assert processor._render_in_worker(cfg)
+    assert not processor._render_in_worker(replace(cfg, overlay_as_data=True))
+    processor.vector_overlays = True            # OpenGL 표시는 항상 데이터 경로
+    assert not processor._render_in_worker(cfg)
+
+
+def test_overlay_is_empty_without_annotations():
+    assert FrameOverlay(frame_size=(320, 180)).is_empty
+    _, detections, lanes, _, _ = _scene()
+    assert not FrameOverlay(frame_size=(320, 180), lanes=lanes).is_empty
+    assert not FrameOverlay(frame_size=(320, 180), detections=detections).is_empty
@@ -0,0 +1,76 @@
+# ============================================================================
+# tests/test_resource_manager.py
+# 리소스 프로파일 - 자동 분할 / 저장 / 로드 / 스레드 친화도 적용
+# ============================================================================
+
+import os
+import threading
+
+import cv2
+import pytest
+
+from src.config.resources import ResourceProfile
+from src.core.resource_manager import ResourceManager
+
+
+@pytest.mark.parametrize("count, torch_threads, inference, worker, gui", [
+    (2, 2, (), (), ()),
+    (6, 5, (1, 2, 3, 4, 5), (0,), (0,)),
+    (16, 14, tuple(range(2, 16)), (1,), (0,)),
+])
+def test_auto_profile_reserves_cores(count, torch_threads, inference, worker, gui):
+    profile = ResourceProfile.auto(range(count))
+    assert profile.torch_threads == torch_threads
+    assert (profile.inference_cpus, profile.worker_cpus, profile.gui_cpus) == \
+        (inference, worker, gui)
+    assert not set(profile.inference_cpus) & set(profile.gui_cpus)
+
+
+def test_profile_round_trip_and_lookup(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    profile = ResourceProfile(name="bench", torch_threads=3, opencv_threads=1,
+                              inference_cpus=(1, 2, 3), gui_cpus=(0,))
+    profile.save(ResourceProfile.path_for("bench"))
+
+    manager = ResourceManager()
+    assert manager.load("bench") == profile
+    assert manager.load("missing") is None
+    assert manager.load("auto") == ResourceProfile.auto(manager.cpus)
+
+    ResourceProfile.path_for("broken").write_text("{", encoding='utf-8')
+    assert manager.load("broken") is None
+
+
+def test_apply_sets_and_restores_opencv_threads():
+    manager = ResourceManager()
+    default = manager._default_opencv_threads
+    try:
+        manager.apply(ResourceProfile(opencv_threads=1), pin_gui=False)
+        assert cv2.getNumThreads() == 1
+        manager.apply(ResourceProfile(), pin_gui=False)
+        assert cv2.getNumThreads() == default
+    finally:
+        manager.apply(ResourceProfile(), pin_gui=False)
+
+
+@pytest.mark.skipif(not ResourceManager.supports_affinity(), reason="Linux 전용")
+def test_pin_affects_calling_thread_only():
+    manager = ResourceManager()
+    cpus = manager.cpus
+    manager.apply(ResourceProfile(worker_cpus=cpus[-1:]), pin_gui=False)
+    pinned = []
+
+    def worker():
+        manager.pin('worker')
+        pinned.append(tuple(sorted(os.sched_getaffinity(0))))
+        manager.pin('inference')                  # 지정 없음 → 전체 CPU
+        pinned.append(tuple(sorted(os.sched_getaffinity(0))))
+
+    try:
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert pinned == [cpus[-1:], cpus]
+        assert tuple(sorted(os.sched_getaffinity(0))) == cpus
+    finally:
+        manager.apply(ResourceProfile(), pin_gui=False)
@@ -0,0 +1,84 @@
+# ============================================================================
+# tests/test_settings.py
+# 설정 스냅샷 / 옵저버 / 프로파일 값 검사
+# ============================================================================
+
+import json
+from dataclasses import asdict
+
+import pytest
+
+from src.config.constants import APP_CONST
+from src.config.settings import DefaultSettings, SettingsManager
+
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)     # PROFILE_DIR 는 작업 디렉터리 기준
+    manager = SettingsManager()
+    manager.reset()
+    yield manager
+    manager.reset()
+
+
+def _write_profile(name, data):
+    path = SettingsManager._profile_path(name)
+    path.write_text(json.dumps(data), encoding='utf-8')
+
+
+def test_snapshot_is_replaced_and_observers_notified(settings):
+    seen = []
+    callback = settings.subscribe(lambda changed, snap: seen.append((changed, snap)),
+                                  keys=['confidence_threshold'])
+    try:
+        before = settings.snapshot()
+        settings.set('confidence_threshold', 0.3)
+        settings.set('frame_skip', 2)          # 관심 없는 키
+        settings.set('confidence_threshold', 0.3)   # 값이 같으면 통지 없음
+    finally:
+        settings.unsubscribe(callback)
+
+    assert before.confidence_threshold == 0.5
+    assert settings.snapshot().confidence_threshold == 0.3
+    assert [changed for changed, _ in seen] == [{'confidence_threshold': 0.3}]
+    assert seen[0][1].frame_skip == 0
+
+
+def test_profile_round_trip_coerces_types(settings):
+    settings.update(class_whitelist=('car', 'bus'), inference_imgsz=512)
+    settings.save_profile('road')
+    settings.reset()
+
+    assert settings.load_profile('road')
+    snap = settings.snapshot()
+    assert snap.class_whitelist == ('car', 'bus') and snap.inference_imgsz == 512
+
+    _write_profile('strings', {'confidence_threshold': "0.4", 'max_detections': 20.0,
+                               'unknown_key': 1})
+    assert settings.load_profile('strings')
+    assert settings.snapshot().confidence_threshold == 0.4
+    assert type(settings.snapshot().max_detections) is int
+
+
+@pytest.mark.parametrize('data', [
+    {'confidence_threshold': "high"},
+    {'confidence_threshold': 1.5},
+    {'inference_imgsz': -640},
+    {'inference_imgsz': 640.5},
+    {'frame_skip': True},
+    {'detection_enabled': "yes"},
+    {'class_whitelist': "car"},
+    {'decode_backend': "gstreamer"},
+    {'tile_band_top': 0.8, 'tile_band_bottom': 0.5},
+])
+def test_invalid_profile_rejected_without_applying(settings, data):
+    _write_profile('bad', dict(data, frame_skip=data.get('frame_skip', 3)))
+    with pytest.raises(ValueError) as error:
+        settings.load_profile('bad')
+    assert "bad" in str(error.value)
+    assert settings.snapshot() == DefaultSettings()
+
+
+def test_missing_profile(settings):
+    assert not settings.load_profile('nope')
+    assert asdict(settings.snapshot())['inference_imgsz'] == APP_CONST.DEFAULT_IMGSZ
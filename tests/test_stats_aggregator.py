@@ -0,0 +1,116 @@
+# ============================================================================
+# tests/test_stats_aggregator.py
+# 영상 전체 누적 통계 - 분위수 / Welford 누적 / 추적 / 체류 시간 / 위험 구간
+# ============================================================================
+
+import json
+
+import numpy as np
+import pytest
+
+from src.core.stats_aggregator import StatsAggregator
+from src.models.detection import Detection, LaneLines
+from src.models.stats import DetectionStats
+from src.utils.streaming_stats import RunningMoments, TDigest
+
+
+@pytest.mark.parametrize("dist", ["normal", "lognormal", "uniform"])
+def test_tdigest_quantiles_match_numpy(dist):
+    rng = np.random.default_rng(1)
+    values = {
+        "normal": lambda: rng.normal(33.0, 4.0, 50_000),
+        "lognormal": lambda: rng.lognormal(3.0, 0.5, 50_000),
+        "uniform": lambda: rng.uniform(0.0, 100.0, 50_000),
+    }[dist]()
+
+    digest = TDigest()
+    for value in values:
+        digest.add(float(value))
+
+    spread = values.max() - values.min()
+    for q in (0.01, 0.05, 0.5, 0.95, 0.99):
+        estimate = digest.quantile(q)
+        assert estimate == pytest.approx(np.percentile(values, q * 100), abs=0.01 * spread)
+        assert abs(np.mean(values <= estimate) - q) < 0.002   # 순위 오차
+    assert digest.quantile(0.0) == values.min() and digest.quantile(1.0) == values.max()
+    assert digest.centroids < 200            # 입력 수와 무관한 크기
+
+
+def test_running_moments_match_numpy():
+    values = np.random.default_rng(2).normal(1e6, 3.0, 10_000)  # 큰 평균에서도 안정
+    moments = RunningMoments()
+    for value in values:
+        moments.add(float(value))
+    assert moments.mean == pytest.approx(values.mean())
+    assert moments.variance == pytest.approx(values.var(ddof=1), rel=1e-6)
+    assert (moments.min, moments.max) == (values.min(), values.max())
+
+
+def _detection(name, x, hazard=False):
+    return Detection(class_id=0, class_name=name, confidence=0.9,
+                     bbox=np.array([x, 100.0, x + 100.0, 200.0]), distance=10.0,
+                     hazard=hazard)
+
+
+def _run(aggregator, frames=100, fps=10.0):
+    """car 0~4.9초, person 2 프레임(오탐), truck 6~8.9초 (7.0~7.4초 위험)"""
+    latencies = np.random.default_rng(3).gamma(4.0, 8.0, frames)
+    for i in range(frames):
+        detections = []
+        if i < 50:
+            detections.append(_detection("car", 100.0 + i))
+        if i in (10, 11):
+            detections.append(_detection("person", 800.0))
+        if 60 <= i < 90:
+            detections.append(_detection("truck", 400.0, hazard=70 <= i < 75))
+
+        stats = DetectionStats()
+        stats.fps = fps
+        stats.processing_time = float(latencies[i])
+        stats.dangerous_objects = sum(d.hazard for d in detections)
+        aggregator.update(detections, LaneLines(), stats, 1280, i / fps)
+    return latencies
+
+
+def test_summary_tracks_dwell_and_danger():
+    aggregator = StatsAggregator()
+    latencies = _run(aggregator)
+    summary = aggregator.finish("drive.mp4")
+
+    assert summary.frames == 100
+    assert summary.duration_sec == pytest.approx(9.9)
+    assert summary.track_counts == {"car": 1, "truck": 1}     # 2 프레임 person 제외
+    assert summary.detection_counts == {"car": 50, "person": 2, "truck": 30}
+    assert summary.dwell_sec["car"]["mean"] == pytest.approx(4.9)
+    assert summary.dwell_sec["truck"]["max"] == pytest.approx(2.9)
+    assert summary.dangerous_tracks == 1
+    assert summary.danger_events == 1
+    assert summary.danger_sec == pytest.approx(0.5)
+    assert summary.departure_events == 0
+
+    assert summary.fps_mean == pytest.approx(10.0)
+    assert summary.latency_mean_ms == pytest.approx(latencies.mean())
+    assert summary.latency_max_ms == pytest.approx(latencies.max())
+    for q, value in ((50, summary.latency_p50_ms), (95, summary.latency_p95_ms)):
+        assert value == pytest.approx(np.percentile(latencies, q), rel=0.02)
+
+
+def test_seek_splits_tracks_and_duration(tmp_path):
+    aggregator = StatsAggregator()
+    for i in range(10):
+        aggregator.update([_detection("car", 100.0)], LaneLines(), DetectionStats(),
+                          1280, i / 10)
+    aggregator.mark_discontinuity()
+    for i in range(10):
+        aggregator.update([_detection("car", 100.0)], LaneLines(), DetectionStats(),
+                          1280, 60 + i / 10)
+    summary = aggregator.summary()
+    assert summary.track_counts == {"car": 2}     # 같은 자리여도 seek 뒤는 새 트랙
+    assert summary.duration_sec == pytest.approx(1.8)
+
+    path = StatsAggregator.save_report(summary, tmp_path / "summary.json")
+    assert json.loads(path.read_text(encoding="utf-8"))["track_counts"] == {"car": 2}
+    assert StatsAggregator.report_path("/data/my clip.mp4").name == "my_clip_summary.json"
+
+    aggregator.reset()
+    assert aggregator.summary().frames == 0
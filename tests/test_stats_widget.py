@@ -0,0 +1,98 @@
+# ============================================================================
+# tests/test_stats_widget.py
+# 통계 패널 / 프로그레스 바 - 갱신 묶기 / 바뀐 값만 반영 (offscreen Qt)
+# ============================================================================
+
+import time
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from src.models.stats import DetectionStats
+from src.ui.widgets.progress_bar import MediaProgressBar
+from src.ui.widgets.refresh_throttle import RefreshThrottle
+from src.ui.widgets.stats_widget import StatsWidget
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+def _wait(app, seconds):
+    """이벤트 루프를 돌리며 대기 (타이머 처리)"""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        app.processEvents()
+        time.sleep(0.005)
+
+
+def _stats(fps=30.0, objects=None, dangerous=0):
+    stats = DetectionStats()
+    stats.fps = fps
+    stats.object_counts = dict(objects or {})
+    stats.total_objects = sum(stats.object_counts.values())
+    stats.dangerous_objects = dangerous
+    return stats
+
+
+def test_throttle_coalesces_requests(qapp):
+    calls = []
+    throttle = RefreshThrottle(lambda: calls.append(1), hz=20.0)
+    for _ in range(100):
+        throttle.request()
+    assert calls == []
+    _wait(qapp, 0.15)
+    assert calls == [1]
+
+    throttle.request()
+    throttle.cancel()
+    _wait(qapp, 0.1)
+    assert calls == [1]
+
+
+def test_stats_widget_shows_latest_stats_once_per_tick(qapp):
+    widget = StatsWidget()
+    applied = []
+    original = widget._apply_stats
+    widget._refresh._timer.timeout.disconnect()
+    widget._refresh._timer.timeout.connect(lambda: (applied.append(1), original()))
+
+    for i in range(60):
+        widget.update_stats(_stats(fps=float(i), objects={"car": i % 3}))
+    assert widget.fps_label.text() == "FPS: 0.0"      # 아직 반영 전
+    _wait(qapp, 0.15)
+    assert applied == [1]
+    assert widget.fps_label.text() == "FPS: 59.0"
+    assert widget.detail_label.text() == "car: 2"
+
+
+def test_stats_widget_restyles_only_on_danger_change(qapp):
+    widget = StatsWidget()
+    styles = []
+    widget.danger_label.setStyleSheet = styles.append
+
+    for dangerous in (0, 1, 2, 2, 0, 0):
+        widget._pending = _stats(dangerous=dangerous)
+        widget._apply_stats()
+    assert styles == [StatsWidget.DANGER_STYLE, StatsWidget.STAT_STYLE]
+    assert widget.danger_label.text().startswith("위험: 0")
+
+
+def test_progress_bar_repaints_only_when_position_moves(qapp):
+    bar = MediaProgressBar()
+    bar.resize(800, bar.height())
+    bar.set_total_frames(300, 30.0)
+    repaints = []
+    bar.update = lambda: repaints.append(bar._progress_width())
+
+    for frame in range(1, 61):
+        bar.set_current_frame(frame)
+    assert bar.time_label.text() == "00:00"
+    _wait(qapp, 0.15)
+    assert bar.time_label.text() == "00:02"
+    assert len(repaints) == 1
+
+    bar._painted_width = bar._progress_width()      # paintEvent 가 그린 상태
+    bar._apply_current_frame()                      # 같은 위치 → 다시 그리지 않음
+    assert len(repaints) == 1
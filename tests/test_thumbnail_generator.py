@@ -0,0 +1,54 @@
+# ============================================================================
+# tests/test_thumbnail_generator.py
+# 썸네일 스프라이트 - 긴 GOP 에서 정확한 프레임 / 불완전한 스트립 캐시 안 함
+# ============================================================================
+
+import cv2
+import numpy as np
+import pytest
+
+from src.core.thumbnail_generator import ThumbnailGenerator
+from src.models.frame_index import FrameIndex
+
+FRAMES = 120
+
+
+def _level(frame_number):
+    return frame_number * 2 + 10
+
+
+@pytest.fixture
+def video(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)     # CACHE_DIR 는 작업 디렉터리 기준
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 30.0, (64, 48))
+    for i in range(FRAMES):
+        writer.write(np.full((48, 64, 3), _level(i), dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def _index(video, total_frames=FRAMES, keyframes=(0, 60)):
+    return FrameIndex(video_path=video, total_frames=total_frames, fps=30.0,
+                      keyframes=np.asarray(keyframes, dtype=np.int64),
+                      timestamps_ms=np.zeros(0))
+
+
+def test_long_gop_slots_get_their_own_frames(video):
+    strip = ThumbnailGenerator.build(video, _index(video), count=8, width=32)
+    expected = np.linspace(0, FRAMES - 1, 8).astype(np.int64)
+
+    assert strip.complete
+    assert strip.frame_numbers.tolist() == expected.tolist()
+    for i, frame_number in enumerate(expected):
+        assert abs(strip.get(i).mean() - _level(frame_number)) < 4
+
+
+def test_partial_strip_is_not_cached(video):
+    # 인덱스가 실제보다 긴 길이를 주장 → 뒤쪽 슬롯 읽기 실패
+    index = _index(video, total_frames=FRAMES * 2)
+    strip = ThumbnailGenerator.load_or_build(video, index, count=8, width=32)
+    assert strip is not None and not strip.complete and strip.count < 8
+
+    cached = ThumbnailGenerator.load_or_build(video, _index(video), count=8, width=32)
+    assert cached.complete and cached.count == 8
@@ -0,0 +1,92 @@
+# ============================================================================
+# tests/test_tiled_inference.py
+# 타일 추론 - 타일 배치 / 원본 좌표 변환 / NMS 병합
+# ============================================================================
+
+from dataclasses import replace
+
+import numpy as np
+
+from src.config.settings import SettingsSnapshot
+from src.core.detection_engine import DetectionEngine
+from src.utils.geometry import GeometryUtils
+
+
+def test_plan_tiles_cover_band_with_overlap():
+    tiles = GeometryUtils.plan_tiles(1280, 720, band_top=0.35, band_bottom=0.7,
+                                     columns=3, overlap=0.2)
+    assert len(tiles) == 3
+    assert tiles[0][0] == 0 and tiles[-1][2] == 1280
+    assert all((y1, y2) == (int(720 * 0.35), int(720 * 0.7)) for _, y1, _, y2 in tiles)
+    for (_, _, right, _), (left, _, _, _) in zip(tiles, tiles[1:]):
+        assert right > left                       # 이웃 타일은 겹침
+    widths = [x2 - x1 for x1, _, x2, _ in tiles]
+    assert max(widths) - min(widths) <= 2
+
+
+def test_nms_merges_duplicates_per_class():
+    boxes = np.array([[0, 0, 10, 10], [1, 1, 11, 11], [1, 1, 11, 11]], dtype=np.float32)
+    scores = np.array([0.9, 0.8, 0.7], dtype=np.float32)
+    classes = np.array([0, 0, 1])
+    keep = GeometryUtils.nms(boxes, scores, classes, 0.5)
+    assert sorted(keep.tolist()) == [0, 2]        # 다른 클래스는 겹쳐도 유지
+
+
+def _engine_returning(per_crop):
+    """크롭마다 같은 (로컬 좌표) 박스를 돌려주는 엔진, 받은 크롭 기록"""
+    engine = DetectionEngine(None)
+    seen = []
+
+    def detect_batch(crops, cfg):
+        seen.extend(crops)
+        return [per_crop(crop) for crop in crops], 'filter'
+
+    engine._detect_batch = detect_batch
+    return engine, seen
+
+
+def test_tile_boxes_map_back_to_frame_and_merge():
+    cfg = replace(SettingsSnapshot(), tiled_inference_enabled=True, tile_columns=2,
+                  tile_overlap=0.5, tile_include_full_frame=False)
+    frame = np.zeros((400, 600, 3), dtype=np.uint8)
+
+    def one_box(crop):
+        return (np.array([[10, 10, 30, 30]], dtype=np.float32),
+                np.array([0.9], dtype=np.float32), np.array([2]))
+
+    engine, seen = _engine_returning(one_box)
+    (xyxy, conf, cls), class_filter, dropped = engine._infer_tiled(frame, cfg)
+
+    tiles = GeometryUtils.plan_tiles(600, 400, cfg.tile_band_top, cfg.tile_band_bottom,
+                                     2, 0.5)
+    assert [c.shape[:2] for c in seen] == [(y2 - y1, x2 - x1) for x1, y1, x2, y2 in tiles]
+    expected = sorted([x1 + 10, y1 + 10, x1 + 30, y1 + 30] for x1, y1, _, _ in tiles)
+    assert sorted(xyxy.tolist()) == expected
+    assert class_filter == 'filter' and dropped == {}
+
+
+def test_source_frame_tiles_are_scaled_back():
+    """원본 해상도에서 자른 타일의 박스는 분석 해상도 좌표로 돌아온다"""
+    cfg = replace(SettingsSnapshot(), tiled_inference_enabled=True, tile_columns=1,
+                  tile_overlap=0.0, tile_include_full_frame=True)
+    frame = np.zeros((360, 640, 3), dtype=np.uint8)
+    source = np.zeros((720, 1280, 3), dtype=np.uint8)
+
+    def box_in_crop(crop):
+        if crop.shape[1] == 1280:                 # 원본 밴드 타일
+            box = [100, 20, 200, 120]
+        else:                                     # 축소 전체 프레임 - 같은 물체
+            box = [50, 126 + 10, 100, 126 + 60]
+        return (np.array([box], dtype=np.float32),
+                np.array([0.8 if crop.shape[1] == 1280 else 0.6], dtype=np.float32),
+                np.array([0]))
+
+    engine, seen = _engine_returning(box_in_crop)
+    (xyxy, conf, cls), _, dropped = engine._infer_tiled(frame, cfg, source)
+
+    assert seen[0] is frame and seen[1].shape[1] == 1280
+    band_top = int(360 * cfg.tile_band_top)
+    sy1 = int(band_top * 2.0)
+    assert np.allclose(xyxy, [[50, (sy1 + 20) / 2, 100, (sy1 + 120) / 2]])
+    assert conf.tolist() == [np.float32(0.8)]
+    assert dropped == {'nms': 1}
@@ -0,0 +1,154 @@
+# ============================================================================
+# tests/test_timeline_scanner.py
+# 사전 스캔 - 희소 샘플 이동 / 캐시 키
+# ============================================================================
+
+from dataclasses import replace
+
+import cv2
+import numpy as np
+import pytest
+
+from src.config.settings import SettingsManager
+from src.core import timeline_scanner
+from src.core.timeline_scanner import TimelineScanner
+
+FRAMES = 300
+FPS = 30.0
+_VideoCapture = cv2.VideoCapture
+
+
+class _Empty:
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return np.zeros((0,), dtype=np.float32)
+
+
+class _Boxes:
+    xyxy = conf = cls = _Empty()
+
+
+class _Result:
+    boxes = _Boxes()
+
+
+class _FakeModel:
+    """탐지 없음, 입력 프레임 밝기만 기록"""
+    names = {0: 'person', 2: 'car'}
+
+    def __init__(self):
+        self.levels = []
+
+    def __call__(self, frame, **kwargs):
+        self.levels.append(float(frame.mean()))
+        return [_Result()]
+
+
+class _CountingCapture:
+    """cv2.VideoCapture 대역 - grab / seek 횟수 기록"""
+    instances = []
+
+    def __init__(self, path):
+        self.cap = _VideoCapture(path)
+        self.grabs = 0
+        self.seeks = []
+        _CountingCapture.instances.append(self)
+
+    def grab(self):
+        self.grabs += 1
+        return self.cap.grab()
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            self.seeks.append(int(value))
+        return self.cap.set(prop, value)
+
+    def __getattr__(self, name):
+        return getattr(self.cap, name)
+
+
+def _level(frame_number):
+    return (frame_number * 4) % 200 + 20
+
+
+@pytest.fixture
+def video(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)     # CACHE_DIR 는 작업 디렉터리 기준
+    path = str(tmp_path / "drive.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), FPS, (64, 48))
+    for i in range(FRAMES):
+        writer.write(np.full((48, 64, 3), _level(i), dtype=np.uint8))
+    writer.release()
+    return path
+
+
+@pytest.fixture
+def model(monkeypatch):
+    fake = _FakeModel()
+    monkeypatch.setattr(timeline_scanner.ModelManager, 'create_detection_model',
+                        lambda self: fake)
+    return fake
+
+
+def _scanner(video, interval_sec):
+    return TimelineScanner(video, interval_sec=interval_sec)
+
+
+def test_long_interval_seeks_instead_of_decoding(video, model, monkeypatch):
+    _CountingCapture.instances.clear()
+    monkeypatch.setattr(timeline_scanner.cv2, 'VideoCapture', _CountingCapture)
+
+    timeline = _scanner(video, 4.0).scan()      # 간격 120 프레임 > SEEK_MAX_FORWARD_FRAMES
+    assert timeline.frame_numbers.tolist() == [0, 120, 240]
+    assert timeline.total_frames == FRAMES
+
+    cap = _CountingCapture.instances[-1]
+    assert cap.grabs == 0 and cap.seeks == [120, 240]
+    # seek 후 읽은 프레임이 목표 프레임
+    for level, frame_number in zip(model.levels, timeline.frame_numbers):
+        assert abs(level - _level(frame_number)) < 4
+
+
+def test_short_interval_grabs_forward(video, model, monkeypatch):
+    _CountingCapture.instances.clear()
+    monkeypatch.setattr(timeline_scanner.cv2, 'VideoCapture', _CountingCapture)
+
+    timeline = _scanner(video, 0.5).scan()      # 간격 15 프레임
+    assert timeline.frame_numbers.tolist() == list(range(0, FRAMES, 15))
+    cap = _CountingCapture.instances[-1]
+    assert cap.seeks == [] and cap.grabs == (len(timeline.frame_numbers) - 1) * 14
+    for level, frame_number in zip(model.levels, timeline.frame_numbers):
+        assert abs(level - _level(frame_number)) < 4
+
+
+def test_cache_key_follows_filter_settings(video, model):
+    scanner = _scanner(video, 0.5)
+    cfg = SettingsManager().snapshot()
+    assert scanner._cache_path(cfg) == scanner._cache_path(replace(cfg))
+    for change in ({'class_whitelist': ('person',)},
+                   {'class_confidence': ('car:0.7',)},
+                   {'confidence_threshold': cfg.confidence_threshold + 0.1},
+                   {'max_detections': 3}):
+        assert scanner._cache_path(replace(cfg, **change)) != scanner._cache_path(cfg)
+    assert _scanner(video, 1.0)._cache_path(cfg) != scanner._cache_path(cfg)
+
+
+def test_result_saved_under_settings_at_scan_start(video, model, monkeypatch):
+    settings = SettingsManager()
+    start = settings.snapshot()
+    scanner = _scanner(video, 4.0)
+    original_scan = scanner.scan
+
+    def scan_while_settings_change(should_stop, cfg):
+        # 스캔 도중 사용자가 설정을 바꿈
+        monkeypatch.setattr(settings, '_snapshot', replace(start, max_detections=1))
+        return original_scan(should_stop, cfg)
+
+    monkeypatch.setattr(scanner, 'scan', scan_while_settings_change)
+    scanner.run()
+
+    assert scanner._cache_path(start).exists()
+    assert not scanner._cache_path(settings.snapshot()).exists()
+    assert scanner.load_cached(start).frame_numbers.tolist() == [0, 120, 240]
@@ -0,0 +1,42 @@
+# ============================================================================
+# tests/test_video_exporter.py
+# 내보내기 사이드카 - 원본 프레임 번호 / 원본 픽셀 좌표
+# ============================================================================
+
+import json
+
+import numpy as np
+
+from src.core.video_exporter import VideoExporter
+from src.models.detection import Detection
+from src.models.export import ExportOptions
+from src.models.overlay import FrameOverlay
+
+
+def _overlay(frame_number):
+    detection = Detection(2, 'car', 0.9, np.array([10.0, 20.0, 30.0, 40.0]), 12.0)
+    return FrameOverlay(frame_size=(64, 48), source_size=(128, 96),
+                        detections=[detection], burned_in=True,
+                        frame_number=frame_number)
+
+
+def test_sidecar_rows_use_source_frame_numbers(tmp_path):
+    options = ExportOptions(str(tmp_path / "out.avi"), codec='mjpeg',
+                            backend='opencv', export_detections=True)
+    exporter = VideoExporter(options, 30.0)
+    exporter.start()
+
+    # 범위 시작 10, 프레임 스킵 1 → 원본 10, 12, 14 (출력 0, 1, 2)
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    for frame_number in (10, 12, 14):
+        assert exporter.submit(frame.copy(), _overlay(frame_number))
+    # 프레임 번호를 모르는 오버레이는 출력 순번
+    assert exporter.submit(frame.copy(), _overlay(-1))
+    result = exporter.finish()
+
+    assert result.success and result.frames_written == 4
+    with open(options.detections_path, encoding='utf-8') as f:
+        rows = [json.loads(line) for line in f]
+    assert [row['frame'] for row in rows] == [10, 12, 14, 3]
+    assert rows[0]['source_size'] == [128, 96]
+    assert rows[0]['detections'][0]['bbox'] == [20.0, 40.0, 60.0, 80.0]
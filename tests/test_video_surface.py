@@ -0,0 +1,69 @@
+# ============================================================================
+# tests/test_video_surface.py
+# OpenGL 표시 - 프레임 버퍼 반환 / 비율 유지 영역 / 벡터 오버레이 좌표 (offscreen Qt)
+# ============================================================================
+
+import numpy as np
+import pytest
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QColor, QImage, QPainter
+from PySide6.QtWidgets import QApplication
+
+from src.models.detection import Detection, LaneLines
+from src.models.overlay import FrameOverlay
+from src.ui.widgets.overlay_painter import OverlayPainter
+from src.ui.widgets.video_surface import GLVideoSurface
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+def _overlay(burned_in=False, distance=5.0):
+    detection = Detection(class_id=2, class_name="car", confidence=0.9,
+                          bbox=np.array([100.0, 100.0, 200.0, 160.0]), distance=distance)
+    return FrameOverlay(frame_size=(640, 360), detections=[detection],
+                        lanes=LaneLines(), burned_in=burned_in)
+
+
+def test_surface_returns_replaced_frames(qapp):
+    released = []
+    surface = GLVideoSurface(release_frame=released.append)
+    first = np.zeros((360, 640, 3), dtype=np.uint8)
+    second = np.zeros((360, 640, 3), dtype=np.uint8)
+
+    surface.set_frame(first, _overlay())
+    assert released == [] and surface._overlay is not None
+    surface.set_frame(second, _overlay(burned_in=True))
+    assert released == [first]
+    assert surface._overlay is None               # 픽셀에 이미 그려진 오버레이는 다시 그리지 않음
+
+    surface.setText("영상을 불러오세요")
+    assert released == [first, second]
+    assert surface._image is None and surface._message
+
+
+def test_target_rect_keeps_aspect_ratio(qapp):
+    surface = GLVideoSurface()
+    surface.resize(400, 400)
+    surface.set_frame(np.zeros((360, 640, 3), dtype=np.uint8), None)
+    assert surface._target_rect() == QRectF(0, 87.5, 400, 225)
+
+
+def test_overlay_drawn_in_widget_coordinates(qapp):
+    """분석 해상도 박스가 2 배 표시 영역의 해당 위치에 화면 기준 두께로 그려진다"""
+    image = QImage(1280, 800, QImage.Format.Format_RGB32)
+    image.fill(QColor(0, 0, 0))
+    target = QRectF(0, 40, 1280, 720)
+
+    painter = QPainter(image)
+    OverlayPainter().paint(painter, target, _overlay(distance=5.0), show_labels=False)
+    painter.end()
+
+    warning = QColor(255, 165, 0).rgb()           # 경로 밖 근거리 → 경고색
+    column = [image.pixel(300, y) == warning for y in range(230, 370)]
+    rows = [y for y, hit in zip(range(230, 370), column) if hit]
+    # 위 / 아래 변 (y=100, 160 → 200, 320 + 40) 만 칠해지고 두께는 화면 기준 2px
+    assert rows == [239, 240, 359, 360]
+    assert image.pixel(199, 300) == warning       # 왼쪽 변 (x=100 → 200)
@@ -122,17 +122,54 @@ def check_imports():
     modules = [
         ('src.config.constants', 'APP_CONST, COLOR'),
         ('src.config.settings', 'SettingsManager'),
-        ('src.models.stats', 'DetectionStats'),
-        ('src.models.detection', 'Detection, LaneLines'),
+        ('src.config.camera', 'CameraProfile'),
+        ('src.config.resources', 'ResourceProfile'),
+        ('src.models.stats', 'DetectionStats, StreamStats, ServerMetrics, '
+                             'StreamSLOStats, BufferPoolStats, VideoSummary'),
+        ('src.models.detection', 'Detection, LaneLines, Track'),
+        ('src.models.frame_index', 'FrameIndex'),
+        ('src.models.thumbnails', 'ThumbnailStrip'),
+        ('src.models.timeline', 'EventTimeline'),
+        ('src.models.export', 'ExportOptions, ExportResult'),
+        ('src.models.overlay', 'RLEMask, PolygonMask, FrameOverlay'),
         ('src.utils.geometry', 'GeometryUtils'),
         ('src.utils.drawing', 'DrawingUtils'),
-        ('src.utils.performance', 'PerformanceMonitor'),
+        ('src.utils.performance', 'PerformanceMonitor, StageProfiler, MemoryMonitor'),
+        ('src.utils.cache', 'VideoCache'),
+        ('src.utils.video_source', 'VideoSource'),
+        ('src.utils.frame_ring', 'SharedFrameRing'),
+        ('src.utils.buffer_pool', 'BufferPool'),
+        ('src.utils.streaming_stats', 'RunningMoments, TDigest'),
+        ('src.utils.mask_codec', 'MaskCodec'),
         ('src.core.model_manager', 'ModelManager'),
         ('src.core.lane_detector', 'LaneDetector'),
+        ('src.core.class_filter', 'ClassFilter'),
+        ('src.core.danger_zone', 'DangerZoneIndex'),
+        ('src.core.motion_gate', 'MotionGate'),
+        ('src.core.imgsz_tuner', 'ImgszTuner'),
+        ('src.core.stream_reader', 'StreamReader'),
+        ('src.core.frame_source', 'FrameSource, DecodeBenchmark'),
+        ('src.core.video_exporter', 'VideoExporter'),
+        ('src.core.resource_manager', 'ResourceManager, ResourceProbe'),
+        ('src.core.batch_scheduler', 'MicroBatchScheduler'),
+        ('src.core.inference_client', 'InferenceClient'),
+        ('src.core.inference_server', 'InferenceServer'),
+        ('src.core.inference_protocol', 'InferenceKey, WireCodec'),
+        ('src.core.object_tracker', 'IoUTracker'),
+        ('src.core.stats_aggregator', 'StatsAggregator'),
+        ('src.core.distance_estimator', 'DistanceEstimator'),
+        ('src.core.birdseye', 'BirdEyeView'),
+        ('src.core.frame_indexer', 'FrameIndexBuilder'),
+        ('src.core.thumbnail_generator', 'ThumbnailGenerator'),
+        ('src.core.timeline_scanner', 'TimelineScanner'),
         ('src.core.detection_engine', 'DetectionEngine'),
         ('src.core.video_processor', 'VideoProcessor'),
+        ('src.ui.widgets.refresh_throttle', 'RefreshThrottle'),
         ('src.ui.widgets.progress_bar', 'MediaProgressBar'),
+        ('src.ui.widgets.overlay_painter', 'OverlayPainter'),
+        ('src.ui.widgets.video_surface', 'GLVideoSurface'),
         ('src.ui.widgets.stats_widget', 'StatsWidget'),
+        ('src.ui.widgets.thumbnail_preview', 'ThumbnailPreview'),
         ('src.ui.main_window', 'MainWindow'),
     ]
 